@@ -132,6 +132,35 @@ class LoggingConfig:
     DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
+# ============================================================================
+# Parallel Extraction
+# ============================================================================
+
+# Worker processes parsing pages in parallel (--workers N). With 1, pages are
+# parsed one after another in the calling process.
+EXTRACTION_WORKERS = 1
+
+
+# ============================================================================
+# Extraction Cache
+# ============================================================================
+
+# Extracted records are cached in the data directory, keyed by the page content,
+# the extractor source code and the parser backend (see extraction_cache.py).
+# Pages unchanged since an earlier run are not parsed again (--no-cache to
+# disable). The name sorts before the timestamped session directories.
+EXTRACTION_CACHE = True
+EXTRACTION_CACHE_DIR_NAME = ".extraction_cache"
+
+# Entries older than this are extracted again. Records with fields relative to
+# the day of the run (e.g. the latest follow-up date not after today) are keyed
+# by that day as well, so they never lag behind a fresh extraction.
+EXTRACTION_CACHE_MAX_AGE_DAYS = 35
+
+# Size limit of the cache of each extractor; the oldest entries go first
+EXTRACTION_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+
 # ============================================================================
 # HTML Parsing Configuration
 # ============================================================================
@@ -0,0 +1,280 @@
+"""
+On-disk cache of extracted records, shared by the extractor processors.
+
+Most pages are byte-identical from one scrape session to the next, yet every
+run used to parse all of them again. A record is now stored under a key made
+of the page content, the other inputs of its extraction (e.g. the row of the
+responses list CSV), the source code of the extractors and the parser
+backend. A later run with the same key reuses the record instead of parsing
+the page; changing any extractor module, the canonical HTML form or the
+backend gives new keys.
+
+Entries are JSON files in data/.extraction_cache/<extractor>/, sharded by
+the first two hex digits of the key. Entries older than
+EXTRACTION_CACHE_MAX_AGE_DAYS are extracted again, and evict() removes them
+and then the oldest entries above EXTRACTION_CACHE_MAX_BYTES.
+
+A cached record is the record a fresh extraction would give. Fields relative
+to the day of the run (e.g. the latest follow-up date not after today) make
+that day a key input, and run timestamps such as created_timestamp of the
+initiatives are set again when a record is reused.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, Type
+
+from .consts import (
+    EXTRACTION_CACHE,
+    EXTRACTION_CACHE_DIR_NAME,
+    EXTRACTION_CACHE_MAX_AGE_DAYS,
+    EXTRACTION_CACHE_MAX_BYTES,
+)
+from ..scraper.scraper_shared import page_io, soup_factory
+from ..scraper.scraper_shared.page_io import read_page
+from ..scraper.scraper_shared.soup_factory import get_parser_backend
+
+ENTRY_SUFFIX = ".json"
+
+
+@lru_cache(maxsize=None)
+def extractor_code_version() -> str:
+    """
+    Return a digest of the source code records depend on.
+
+    Covers every module of the extractor package, plus page_io (canonical
+    HTML form) and soup_factory of the shared scraper modules.
+    """
+    extractor_dir = Path(__file__).parent
+    sources = sorted(extractor_dir.rglob("*.py"))
+    sources += [Path(page_io.__file__), Path(soup_factory.__file__)]
+
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update(source.relative_to(extractor_dir.parent).as_posix().encode())
+        digest.update(source.read_bytes())
+
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """Reuse the records of pages extracted by earlier runs."""
+
+    def __init__(
+        self,
+        data_dir: Path,
+        extractor: str,
+        record_type: Type,
+        logger: Optional[logging.Logger] = None,
+        enabled: bool = EXTRACTION_CACHE,
+        max_age_days: float = EXTRACTION_CACHE_MAX_AGE_DAYS,
+        max_bytes: int = EXTRACTION_CACHE_MAX_BYTES,
+    ):
+        """
+        Initialize the cache of one extractor.
+
+        Args:
+            data_dir: Data directory holding the timestamped sessions
+            extractor: Name of the extractor, its subdirectory in the cache
+            record_type: Dataclass of the cached records
+            logger: Logger of the calling processor (defaults to module logger)
+            enabled: With False, every page is extracted and nothing is stored
+            max_age_days: Entries older than this are extracted again
+            max_bytes: Size limit of the cache of this extractor
+        """
+        self.root = Path(data_dir) / EXTRACTION_CACHE_DIR_NAME / extractor
+        self.record_type = record_type
+        self.logger = logger or logging.getLogger(__name__)
+        self.enabled = enabled
+        self.max_age_seconds = max_age_days * 24 * 60 * 60
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, page_path: Path, inputs: Any = None) -> str:
+        """
+        Return the cache key of a page.
+
+        Args:
+            page_path: Page file, plain or compressed
+            inputs: Other inputs of the extraction, JSON-serializable
+
+        Returns:
+            SHA-256 hex digest of everything the record depends on
+        """
+        digest = hashlib.sha256()
+        digest.update(extractor_code_version().encode())
+        digest.update(get_parser_backend().encode())
+        digest.update(json.dumps(inputs, sort_keys=True, default=str).encode())
+
+        # Decompressed, so the key does not depend on how the page is stored
+        digest.update(read_page(page_path).encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def entry_path(self, key: str) -> Path:
+        """Return the path of an entry, sharded by the first two hex digits."""
+
+        return self.root / key[:2] / f"{key}{ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached record of a key, or None if missing or expired.
+
+        Args:
+            key: Key returned by key()
+        """
+        entry = self.entry_path(key)
+
+        try:
+            if time.time() - entry.stat().st_mtime > self.max_age_seconds:
+                return None
+
+            with open(entry, encoding="utf-8") as f:
+                return self.record_type(**json.load(f))
+
+        except FileNotFoundError:
+            return None
+
+        except (OSError, ValueError, TypeError) as e:
+            # Unreadable, or written for another version of the record
+            self.logger.debug(f"Ignoring extraction cache entry {entry}: {e}")
+            return None
+
+    def put(self, key: str, record: Any) -> None:
+        """
+        Store the record of a key.
+
+        Args:
+            key: Key returned by key()
+            record: Extracted record (a record_type instance)
+        """
+        entry = self.entry_path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+
+        # Written under a temporary name, so readers never see partial entries.
+        # Dates are stored as str(), the form the CSV writers give them
+        temp_path = entry.with_name(f"{entry.name}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(dataclasses.asdict(record), f, ensure_ascii=False, default=str)
+
+        os.replace(temp_path, entry)
+
+    def extract(
+        self,
+        items: Sequence[Any],
+        page_path: Callable[[Any], Path],
+        inputs: Callable[[Any], Any],
+        extract_items: Callable[[List[Any]], List[Optional[Any]]],
+        reuse: Optional[Callable[[Any], Any]] = None,
+    ) -> List[Optional[Any]]:
+        """
+        Return the record of every item, extracting only the cache misses.
+
+        Args:
+            items: Items to extract, e.g. page paths or (path, metadata) tasks
+            page_path: Returns the page file of an item
+            inputs: Returns the other inputs of the extraction of an item
+            extract_items: Extracts a list of items, records in item order
+                           (None for pages that failed)
+            reuse: Returns a cached record with the run values of this run,
+                   e.g. its extraction timestamp
+
+        Returns:
+            Records in the order of items
+        """
+        items = list(items)
+
+        if not self.enabled:
+            return extract_items(items)
+
+        records: List[Optional[Any]] = [None] * len(items)
+        keys = {}
+
+        for index, item in enumerate(items):
+            try:
+                key = self.key(page_path(item), inputs(item))
+            except (OSError, ValueError) as e:
+                # Left to the extraction, which reports unreadable pages
+                self.logger.debug(f"No extraction cache key for {item}: {e}")
+                continue
+
+            records[index] = self.get(key)
+
+            if records[index] is None:
+                keys[index] = key
+            elif reuse is not None:
+                records[index] = reuse(records[index])
+
+        missing = [index for index, record in enumerate(records) if record is None]
+        self.hits += len(items) - len(missing)
+        self.misses += len(missing)
+
+        extracted = extract_items([items[index] for index in missing])
+
+        for index, record in zip(missing, extracted):
+            records[index] = record
+
+            # Failed pages are not cached, so the next run tries them again
+            if record is not None and index in keys:
+                self.put(keys[index], record)
+
+        return records
+
+    def evict(self) -> None:
+        """Remove expired entries, then the oldest ones above the size limit."""
+
+        if not self.enabled or not self.root.exists():
+            return
+
+        now = time.time()
+        entries = []
+        removed = 0
+
+        for entry in self.root.glob(f"*/*{ENTRY_SUFFIX}"):
+            stat = entry.stat()
+
+            if now - stat.st_mtime > self.max_age_seconds:
+                entry.unlink()
+                removed += 1
+            else:
+                entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total_bytes = sum(size for _, size, _ in entries)
+
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total_bytes <= self.max_bytes:
+                break
+
+            entry.unlink()
+            total_bytes -= size
+            removed += 1
+
+        if removed:
+            self.logger.info(f"Extraction cache: removed {removed} old entries")
+
+    def hit_ratio(self) -> float:
+        """Return the share of pages reused from the cache in this run."""
+
+        looked_up = self.hits + self.misses
+
+        return self.hits / looked_up if looked_up else 0.0
+
+    def log_summary(self) -> None:
+        """Log how many pages were reused from the cache in this run."""
+
+        if not self.enabled:
+            self.logger.info("Extraction cache disabled, all pages extracted")
+            return
+
+        self.logger.info(
+            f"Extraction cache: {self.hits} of {self.hits + self.misses} pages "
+            f"reused ({self.hit_ratio():.1%} hit ratio), {self.misses} extracted"
+        )
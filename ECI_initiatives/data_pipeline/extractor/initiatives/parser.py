@@ -18,6 +18,7 @@ from bs4 import BeautifulSoup
 # Local
 from .model import ECIInitiativeDetailsRecord
 from .const import URLConfig, FilePatterns, ContentLimits
+from ...scraper.scraper_shared.page_io import logical_page_path, read_page_soup
 
 
 class ECIHTMLParser:
@@ -36,12 +37,12 @@ class ECIHTMLParser:
         """Parse a single ECI HTML file and extract initiative data"""
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            # Parsed as stored, whether the page was saved raw, prettified or compressed
+            soup = read_page_soup(file_path)
 
-            soup = BeautifulSoup(content, "html.parser")
-
-            reg_number = self._extract_registration_number(file_path.name)
+            reg_number = self._extract_registration_number(
+                logical_page_path(file_path).name
+            )
             timeline_data = self._extract_timeline_data(soup)
             title = self._extract_title(soup)
             url = self._construct_url(reg_number)
@@ -9,13 +9,17 @@ import csv
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional
-from dataclasses import asdict
+from dataclasses import asdict, replace
 import logging
 
 # Local
 from .model import ECIInitiativeDetailsRecord
 from .parser import ECIHTMLParser
 from .initiatives_logger import InitiativesExtractorLogger
+from ..consts import EXTRACTION_CACHE, EXTRACTION_WORKERS
+from ..extraction_cache import ExtractionCache
+from ..parallel import process_files
+from ...scraper.scraper_shared.page_io import glob_pages, logical_page_path
 from .const import (
     SCRIPT_DIR,
     DirectoryStructure,
@@ -27,13 +31,21 @@ from .const import (
 class ECIDataProcessor:
     """Main processor for ECI data extraction"""
 
-    def __init__(self, data_root: str = None, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        data_root: str = None,
+        logger: Optional[logging.Logger] = None,
+        workers: int = EXTRACTION_WORKERS,
+        use_cache: bool = EXTRACTION_CACHE,
+    ):
         """
         Initialize the data processor
 
         Args:
             data_root: Root directory for ECI data. If None, uses default from const
             logger: Optional logger instance. If None, will be initialized in run()
+            workers: Number of processes parsing pages in parallel
+            use_cache: Reuse the records of pages extracted by earlier runs
         """
         if data_root is None:
             data_root = DirectoryStructure.DATA_DIR_NAME
@@ -42,6 +54,8 @@ class ECIDataProcessor:
         # Logger can be passed or initialized later
         self.logger = logger
         self.parser = None
+        self.workers = workers
+        self.use_cache = use_cache
 
     def find_latest_scrape_session(self) -> Optional[Path]:
         """Find the most recent scraping session directory"""
@@ -74,18 +88,48 @@ class ECIDataProcessor:
             )
             return initiatives
 
-        # Process each year directory
+        # Collect the HTML files of each year directory
+        html_files = []
         for year_dir in sorted(initiative_pages_dir.iterdir()):
             if not year_dir.is_dir():
                 continue
 
-            self.logger.info(f"Processing year: {year_dir.name}")
-
-            # Process each HTML file in the year directory
-            for html_file in sorted(year_dir.glob(FilePatterns.HTML_FILE_PATTERN)):
-                initiative = self.parser.parse_html_file(html_file)
-                if initiative:
-                    initiatives.append(initiative)
+            year_files = glob_pages(year_dir, FilePatterns.HTML_FILE_PATTERN)
+            self.logger.info(
+                f"Processing year: {year_dir.name} ({len(year_files)} pages)"
+            )
+            html_files.extend(year_files)
+
+        if self.workers > 1:
+            self.logger.info(f"Parsing with {self.workers} worker processes")
+
+        cache = ExtractionCache(
+            session_path.parent,
+            DirectoryStructure.INITIATIVES_DIR_NAME,
+            ECIInitiativeDetailsRecord,
+            self.logger,
+            enabled=self.use_cache,
+        )
+
+        # Parse each HTML file not in the cache, results in file order
+        parsed = cache.extract(
+            html_files,
+            page_path=lambda html_file: html_file,
+            inputs=lambda html_file: logical_page_path(html_file).name,
+            extract_items=lambda missing: process_files(
+                _parse_initiative_file,
+                missing,
+                self.workers,
+                self.logger,
+                _create_parser,
+                local_state=self.parser,
+            ),
+            reuse=_reuse_initiative,
+        )
+        initiatives = [initiative for initiative in parsed if initiative]
+
+        cache.evict()
+        cache.log_summary()
 
         self.logger.info(f"Successfully processed {len(initiatives)} initiatives")
         return initiatives
@@ -151,3 +195,22 @@ class ECIDataProcessor:
         self.save_to_csv(initiatives, output_path)
 
         self.logger.info("Processing completed successfully")
+
+
+def _create_parser(logger: logging.Logger) -> ECIHTMLParser:
+    """Create the parser of a worker process"""
+    return ECIHTMLParser(logger=logger)
+
+
+def _parse_initiative_file(
+    parser: ECIHTMLParser, html_file: Path
+) -> Optional[ECIInitiativeDetailsRecord]:
+    """Parse one initiative page"""
+    return parser.parse_html_file(html_file)
+
+
+def _reuse_initiative(
+    initiative: ECIInitiativeDetailsRecord,
+) -> ECIInitiativeDetailsRecord:
+    """Stamp a record reused from the extraction cache as created in this run"""
+    return replace(initiative, created_timestamp=datetime.now().isoformat())
@@ -0,0 +1,124 @@
+"""
+Process pool fan-out shared by the extractor processors.
+
+Parsing pages with BeautifulSoup is CPU bound, so threads do not help; with
+more than one worker the pages are parsed in separate processes. Each worker
+builds its own parser once (make_state) and then processes one page at a time.
+Results come back in the order of the input pages, so output rows keep the
+order of a sequential run.
+
+Log records of the workers are sent over a queue to the processor's logger in
+the parent process and written by its handlers, so the session log stays one
+file without interleaved writes.
+"""
+
+import logging
+import logging.handlers
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence
+
+# Per-process state built by make_state in every worker
+_worker_state = None
+
+
+class _ForwardToLogger(logging.Handler):
+    """Hand records received from the workers to the parent's logger."""
+
+    def __init__(self, logger: logging.Logger):
+        super().__init__()
+        self.logger = logger
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.logger.handle(record)
+
+
+def _init_worker(
+    log_queue,
+    logger_name: str,
+    level: int,
+    make_state: Callable[..., Any],
+    state_args: Sequence[Any],
+) -> None:
+    """Send the worker's log records to the parent and build its state."""
+
+    global _worker_state
+
+    logger = logging.getLogger(logger_name)
+    logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    logger.setLevel(level)
+    logger.propagate = False
+
+    _worker_state = make_state(logger, *state_args)
+
+
+def _call_in_worker(task):
+    """Run one item with the state of this worker."""
+
+    process_item, item = task
+    return process_item(_worker_state, item)
+
+
+def process_files(
+    process_item: Callable[[Any, Any], Any],
+    items: Sequence[Any],
+    workers: int,
+    logger: logging.Logger,
+    make_state: Callable[..., Any],
+    state_args: Sequence[Any] = (),
+    local_state: Optional[Any] = None,
+) -> List[Any]:
+    """
+    Apply process_item to every item, in worker processes if workers > 1.
+
+    process_item and make_state must be module-level functions, and items
+    and state_args picklable, so that they can be sent to the workers.
+
+    Args:
+        process_item: Called as process_item(state, item) for every item
+        items: Items to process, e.g. page paths
+        workers: Number of worker processes; 1 processes the items in the
+                 calling process
+        logger: Logger of the processor, receiving the workers' records
+        make_state: Called as make_state(logger, *state_args) once per
+                    worker to build its state, e.g. a parser
+        state_args: Extra arguments for make_state
+        local_state: State to use when processing in the calling process,
+                     built with make_state if not given
+
+    Returns:
+        Results of process_item, in the order of items
+    """
+    items = list(items)
+
+    if workers <= 1 or len(items) <= 1:
+        state = local_state
+        if state is None:
+            state = make_state(logger, *state_args)
+
+        return [process_item(state, item) for item in items]
+
+    context = multiprocessing.get_context()
+    log_queue = context.Queue()
+    listener = logging.handlers.QueueListener(log_queue, _ForwardToLogger(logger))
+    listener.start()
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(items)),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(
+                log_queue,
+                logger.name,
+                logger.getEffectiveLevel(),
+                make_state,
+                tuple(state_args),
+            ),
+        ) as pool:
+            return list(
+                pool.map(_call_in_worker, [(process_item, item) for item in items])
+            )
+    finally:
+        # Writes the records still queued once all workers have exited
+        listener.stop()
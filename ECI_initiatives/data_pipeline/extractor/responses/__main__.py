@@ -4,13 +4,36 @@ ECI Responses Data Scraper - European Citizens' Initiative Response HTML Parser
 Processes scraped response HTML files and extracts Commission response data to CSV
 """
 
+import argparse
+
 from .processor import ECIResponseDataProcessor
+from ..consts import EXTRACTION_CACHE, EXTRACTION_WORKERS
 
 
-def main():
+def main(argv=None):
     """Main entry point"""
 
-    processor = ECIResponseDataProcessor()
+    parser = argparse.ArgumentParser(
+        description="Extract Commission response data from the latest scraping session."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=EXTRACTION_WORKERS,
+        metavar="N",
+        help="number of processes parsing pages in parallel "
+        f"(default: {EXTRACTION_WORKERS})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="parse every page, without reusing records of earlier runs",
+    )
+    parser.set_defaults(use_cache=EXTRACTION_CACHE)
+    args = parser.parse_args(argv)
+
+    processor = ECIResponseDataProcessor(workers=args.workers, use_cache=args.use_cache)
     processor.run()
 
 
@@ -3,10 +3,17 @@
 import logging
 from typing import Optional
 
+from bs4 import BeautifulSoup
+
+from ..document_context import DocumentContext
+
 
 class BaseExtractor:
     """Base class for all extractors with common utilities"""
 
+    # Context of the document being parsed, shared with the other extractors
+    document_context: Optional[DocumentContext] = None
+
     def __init__(
         self, logger: logging.Logger, registration_number: Optional[str] = None
     ):
@@ -16,3 +23,19 @@ class BaseExtractor:
     def set_registration_number(self, registration_number: str):
         """Update registration number for error reporting"""
         self.registration_number = registration_number
+
+    def set_document_context(self, document_context: Optional[DocumentContext]):
+        """Share the analysis context of the document being parsed"""
+        self.document_context = document_context
+
+    def _context(self, soup: BeautifulSoup) -> DocumentContext:
+        """
+        Analysis context of the given document.
+
+        Returns the shared context if it belongs to this soup, otherwise
+        starts a new one, so extractors can also be used on their own.
+        """
+        if self.document_context is None or self.document_context.soup is not soup:
+            self.document_context = DocumentContext(soup)
+
+        return self.document_context
@@ -7,7 +7,19 @@ from .eci_status import ECIImplementationStatus
 from .legislative_status import LegislativeStatus
 from .non_legislative_actions import NonLegislativeAction
 from .keywords import REJECTION_REASONING_KEYWORDS
-from .patterns import DEADLINE_PATTERNS, APPLICABLE_DATE_PATTERNS
+from .patterns import (
+    DEADLINE_PATTERNS,
+    APPLICABLE_DATE_PATTERNS,
+    DEADLINE_REGEXES,
+    APPLICABLE_DATE_REGEXES,
+    ENTERED_INTO_FORCE_DATE_REGEX,
+    ACTION_DATE_REGEXES,
+    LEGISLATIVE_ACTION_KEYWORDS_REGEX,
+    URL_REGEX,
+    IGNORED_DATE_PHRASES_REGEX,
+    FOLLOWUP_DATE_REGEXES,
+)
+from .regex_registry import get_regex, registered_names
 
 __all__ = [
     "ECIImplementationStatus",
@@ -16,4 +28,14 @@ __all__ = [
     "REJECTION_REASONING_KEYWORDS",
     "DEADLINE_PATTERNS",
     "APPLICABLE_DATE_PATTERNS",
+    "DEADLINE_REGEXES",
+    "APPLICABLE_DATE_REGEXES",
+    "ENTERED_INTO_FORCE_DATE_REGEX",
+    "ACTION_DATE_REGEXES",
+    "LEGISLATIVE_ACTION_KEYWORDS_REGEX",
+    "URL_REGEX",
+    "IGNORED_DATE_PHRASES_REGEX",
+    "FOLLOWUP_DATE_REGEXES",
+    "get_regex",
+    "registered_names",
 ]
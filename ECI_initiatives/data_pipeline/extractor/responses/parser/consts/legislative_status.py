@@ -1,7 +1,10 @@
 """Legislative action status definitions with patterns and keywords."""
 
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+import re
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Pattern
+
+from .regex_registry import register_any
 
 
 class LegislativeStatus:
@@ -20,12 +23,21 @@ class LegislativeStatus:
             priority: Priority level for matching (lower number = higher priority)
             keywords: List of keywords for date extraction context
             action_patterns: List of regex patterns to match this status in text
+            action_regex: Compiled pattern matching where any action pattern does
         """
 
         name: str
         priority: int
         keywords: List[str]
         action_patterns: List[Dict[str, str]]
+        action_regex: Pattern = field(init=False, repr=False, compare=False)
+
+        def __post_init__(self):
+            self.action_regex = register_any(
+                f"legislative_status.{self.name}",
+                self.action_patterns,
+                re.IGNORECASE | re.DOTALL,
+            )
 
     # Define all statuses as class attributes
 
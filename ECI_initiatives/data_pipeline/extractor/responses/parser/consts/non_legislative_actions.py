@@ -1,8 +1,10 @@
 """Non-legislative action type definitions with classification keywords."""
 
 import re
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import List, Optional, Pattern
+
+from .regex_registry import register_any
 
 
 class NonLegislativeAction:
@@ -16,10 +18,18 @@ class NonLegislativeAction:
         Attributes:
             name: Human-readable action type name (e.g., 'Monitoring and Enforcement', 'Funding Programme')
             keywords: List of regex patterns used to classify text as this action type
+            keywords_regex: Compiled pattern matching where any keyword does
         """
 
         name: str
         keywords: List[str]
+        keywords_regex: Pattern = field(init=False, repr=False, compare=False)
+
+        def __post_init__(self):
+            slug = re.sub(r"\W+", "_", self.name.lower())
+            self.keywords_regex = register_any(
+                f"non_legislative_action.{slug}", self.keywords
+            )
 
     # Define all non-legislative action types as class attributes
     IMPACT_ASSESSMENT_CONSULTATION = ActionType(
@@ -247,6 +257,9 @@ class NonLegislativeAction:
         r"\bin parallel to the legislation\b",
         r"\bseek specific supporting measures?\b",
     ]
+    SKIP_WORDS_LEGISLATIVE_REGEX = register_any(
+        "skip_words_legislative", SKIP_WORDS_LEGISLATIVE
+    )
 
     @classmethod
     def classify_text(cls, text: str) -> Optional[ActionType]:
@@ -262,7 +275,7 @@ class NonLegislativeAction:
         text_lower = text.lower()
 
         for action_type in cls.ALL_ACTION_TYPES:
-            if any(re.search(keyword, text_lower) for keyword in action_type.keywords):
+            if action_type.keywords_regex.search(text_lower):
                 return action_type
 
         return None
@@ -279,7 +292,7 @@ class NonLegislativeAction:
             True if text contains skip keywords, False otherwise
         """
         text_lower = text.lower()
-        return any(re.search(word, text_lower) for word in cls.SKIP_WORDS_LEGISLATIVE)
+        return bool(cls.SKIP_WORDS_LEGISLATIVE_REGEX.search(text_lower))
 
     @classmethod
     def get_all_keywords(cls) -> List[str]:
@@ -1,5 +1,10 @@
 """Regex patterns for deadline and date extraction."""
 
+import calendar
+import re
+
+from .regex_registry import register_any, register_pattern, register_patterns
+
 # Deadline extraction patterns for Commission commitments
 DEADLINE_PATTERNS = [
     # Legislative proposal patterns (action BEFORE deadline)
@@ -55,3 +60,133 @@ APPLICABLE_DATE_PATTERNS = [
     r"applies from\s+(\d{1,2}\s+[A-Za-z]+\s+\d{4})",  # applies from 27 March 2021
     r"apply from\s+(\d{1,2}\s+[A-Za-z]+\s+\d{4})",  # apply from 27 March 2021
 ]
+
+# Entry into force date, for laws that "became applicable immediately"
+ENTERED_INTO_FORCE_DATE_PATTERN = (
+    r"entered into force on\s+(\d{1,2}\s+[A-Za-z]+\s+\d{4})"
+)
+
+MONTH_NAMES_PATTERN = "|".join(calendar.month_name[1:])
+
+# Dates of legislative and non-legislative actions, tried in order
+ACTION_DATE_PATTERNS = [
+    rf"(\d{{1,2}}\s+(?:{MONTH_NAMES_PATTERN})\s+\d{{4}})",  # 12 January 2023
+    rf"(?:in|by|from)\s+((?:{MONTH_NAMES_PATTERN})\s+\d{{4}})",  # in May 2024
+    r"(\d{1,2}/\d{1,2}/\d{4})",  # 15/03/2022
+    r"(\d{4}-\d{2}-\d{2})",  # 2023-01-12
+    # Not f-strings, so the doubled braces match literal braces (kept as is)
+    r"(?:by|in|from)\s+(\d{{4}})",  # in 2024
+    r"(?:by|in|from)\s+(?:end\s+of\s+)?(\d{{4}})",  # by end of 2024
+]
+
+# Text with these belongs to legislative actions, not non-legislative ones
+LEGISLATIVE_ACTION_KEYWORDS = [
+    r"\bentered into force\b",
+    r"\bbecame applicable\b",
+    r"\bwithdrawal\b",
+    r"\bdecided not to submit a legislative proposal\b",
+    r"\bcome forward with a legislative proposal\b",
+    r"\btable a legislative proposal\b",
+    r"\bno new legislation\b",
+    r"\bcame into force on\b",
+    r"\bamendment to the directive\b",
+    r"\bamendment to the regulation\b",
+    r"\bamending directive\b",
+    r"\bamending regulation\b",
+    r"\brevision of legislation\b",
+    r"\blabelling requirements\b",
+    r"\bmandatory labelling\b",
+    r"\bsets out plans for a legislative proposal\b",
+]
+
+# Follow-up dates: URLs are removed first, e.g. ".../2022-11/cp220179en.pdf"
+URL_PATTERN = r"https?://\S+|www\.\S+"
+
+# Proper names/titles containing years, labels rather than event dates
+IGNORED_DATE_PHRASES = [
+    r"2030 Agenda",
+    r"Agenda 2030",
+    r"Europe 2020",
+    r"Horizon 2020",
+    r"Natura 2000",
+    r"Vision 2025",  # e.g., "2025 Vision for Agriculture"
+    r"Vision 2030",
+    r"Vision 2050",
+    r"Industrie 4\.0",
+    r"Industry 4\.0",
+    r"2020 Farm to Fork Strategy",
+]
+
+_MONTH_NAMES_OR_ABBR = f"(?:{MONTH_NAMES_PATTERN}|{'|'.join(calendar.month_abbr[1:])})"
+
+# Helper patterns for complex deadlines
+_ORDINALS = r"(?:first|second|third|fourth|last)"
+_PERIODS = r"(?:half|quarter)"
+_SEASONS = r"(?:spring|summer|autumn|fall|winter)"
+
+# Follow-up date patterns and their date types, ordered by specificity
+# (most specific first)
+FOLLOWUP_DATE_PATTERNS = [
+    # 1. ISO format YYYY-MM-DD (e.g., "2025-09-10")
+    (r"\b(\d{4})-(\d{1,2})-(\d{1,2})\b", "iso"),
+    # 2. Numeric formats (e.g., "09/09/2014", "12.10.2015", "27-03-2021")
+    (r"\b(\d{1,2})([./-])(\d{1,2})\2(\d{4})\b", "numeric"),
+    # 3. DD Month YYYY (e.g., "28 October 2015", "15 Mar 2021")
+    (rf"\b(\d{{1,2}})\s+({_MONTH_NAMES_OR_ABBR})\s+(\d{{4}})\b", "dmy"),
+    # 4. Complex Deadline Expressions
+    # Matches: "early 2026", "end of 2023", "second half of 2024", "autumn 2023", "since 2022"
+    (
+        rf"\b(?:"
+        rf"(?:early|late|end(?:\s+of)?)|"  # early/end/late
+        rf"(?:{_ORDINALS}\s+{_PERIODS}(?:\s+of)?)|"  # first half of...
+        rf"(?:{_SEASONS})|"  # autumn...
+        rf"(?:since)|"  # since...
+        rf"(?:Q[1-4])"  # Q1...
+        rf")\s+(\d{{4}})\b",  # ... YEAR
+        "deadline",
+    ),
+    # 5. Month YYYY (e.g., "February 2018", "Mar 2024")
+    (rf"\b({_MONTH_NAMES_OR_ABBR})\s+(\d{{4}})\b", "deadline"),
+    # 6. YYYY only (e.g., "2021")
+    # Lookbehind/Lookahead to avoid:
+    # - IDs/Fractions: "2022/0002"
+    # - Directives: "2010/63/EU"
+    # - Parentheses: "C(2021)"
+    # - Ranges: "2021-2027"
+    (r"(?<![\d\/\(\-])\b(20\d{2})\b(?![\d\/\-])", "y"),
+]
+
+
+# ============================================================================
+# Compiled patterns (see regex_registry.py)
+# ============================================================================
+
+DEADLINE_REGEXES = register_patterns("deadline", DEADLINE_PATTERNS, re.IGNORECASE)
+APPLICABLE_DATE_REGEXES = register_patterns(
+    "applicable_date", APPLICABLE_DATE_PATTERNS, re.IGNORECASE
+)
+ENTERED_INTO_FORCE_DATE_REGEX = register_pattern(
+    "entered_into_force_date", ENTERED_INTO_FORCE_DATE_PATTERN, re.IGNORECASE
+)
+ACTION_DATE_REGEXES = register_patterns(
+    "action_date", ACTION_DATE_PATTERNS, re.IGNORECASE
+)
+LEGISLATIVE_ACTION_KEYWORDS_REGEX = register_any(
+    "legislative_action_keywords", LEGISLATIVE_ACTION_KEYWORDS
+)
+URL_REGEX = register_pattern("url", URL_PATTERN)
+IGNORED_DATE_PHRASES_REGEX = register_any(
+    "ignored_date_phrases", IGNORED_DATE_PHRASES, re.IGNORECASE
+)
+
+# (compiled pattern, date type) pairs, in the order of FOLLOWUP_DATE_PATTERNS
+FOLLOWUP_DATE_REGEXES = tuple(
+    zip(
+        register_patterns(
+            "followup_date",
+            [pattern for pattern, _ in FOLLOWUP_DATE_PATTERNS],
+            re.IGNORECASE,
+        ),
+        [date_type for _, date_type in FOLLOWUP_DATE_PATTERNS],
+    )
+)
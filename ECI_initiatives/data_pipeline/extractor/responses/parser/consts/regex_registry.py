@@ -0,0 +1,97 @@
+"""
+Registry of precompiled regex patterns, by name.
+
+The pattern tables of the response extractors are compiled once, when their
+modules are imported, with the flags their call sites use. Extractors call
+the compiled patterns directly: passing a pattern string to re.search() looks
+it up in the cache of the re module on every call, and recompiles it once
+more distinct patterns are in use than that cache holds.
+"""
+
+import re
+from typing import Dict, Iterable, List, Pattern, Tuple, Union
+
+_REGISTRY: Dict[str, Union[Pattern, Tuple[Pattern, ...]]] = {}
+
+
+def _register(name: str, compiled: Union[Pattern, Tuple[Pattern, ...]]):
+    """Store compiled patterns under a name that is not registered yet."""
+
+    if name in _REGISTRY:
+        raise ValueError(f"Regex pattern '{name}' is already registered")
+
+    _REGISTRY[name] = compiled
+
+    return compiled
+
+
+def register_pattern(name: str, pattern: str, flags: int = 0) -> Pattern:
+    """
+    Compile a single pattern and register it.
+
+    Args:
+        name: Registry name of the pattern
+        pattern: Regex pattern string
+        flags: re flags used by all callers of the pattern
+
+    Returns:
+        Compiled pattern
+    """
+    return _register(name, re.compile(pattern, flags))
+
+
+def register_patterns(
+    name: str, patterns: Iterable[str], flags: int = 0
+) -> Tuple[Pattern, ...]:
+    """
+    Compile a table of patterns and register it, keeping the table order.
+
+    Args:
+        name: Registry name of the table
+        patterns: Regex pattern strings
+        flags: re flags used by all callers of the table
+
+    Returns:
+        Tuple of compiled patterns
+    """
+    return _register(name, tuple(re.compile(pattern, flags) for pattern in patterns))
+
+
+def register_any(name: str, patterns: Iterable[str], flags: int = 0) -> Pattern:
+    """
+    Compile a keyword table into one pattern matching where any keyword does.
+
+    For tables only checked with any(re.search(p, text) for p in patterns):
+    the alternation finds a match exactly when one of the patterns does, in
+    a single scan of the text. Group numbers are not preserved.
+
+    Args:
+        name: Registry name of the table
+        patterns: Regex pattern strings (without backreferences)
+        flags: re flags used by all callers of the table
+
+    Returns:
+        Compiled alternation of the patterns
+    """
+    alternation = "|".join(f"(?:{pattern})" for pattern in patterns)
+
+    return _register(name, re.compile(alternation, flags))
+
+
+def get_regex(name: str) -> Union[Pattern, Tuple[Pattern, ...]]:
+    """
+    Return the compiled pattern (or table of patterns) registered as name.
+
+    Raises:
+        KeyError: If nothing is registered under that name
+    """
+    try:
+        return _REGISTRY[name]
+    except KeyError:
+        raise KeyError(f"No regex pattern registered as '{name}'") from None
+
+
+def registered_names() -> List[str]:
+    """Return the names of all registered patterns, sorted."""
+
+    return sorted(_REGISTRY)
@@ -0,0 +1,219 @@
+"""
+Per-document analysis context shared by all extractors
+
+The parser runs about 35 extractor methods on the same soup. Many of them
+need the same intermediate results: the Answer section and its normalized
+text, the legislative outcome classifiers built from it, the submission
+section and its paragraphs, the Follow-up section and its text. A
+DocumentContext is created once per file and computes each of these on first
+use, so every extractor reads the same cached value instead of walking the
+tree again.
+
+The context is read-only: it never modifies the soup, and results derived
+from it must not be mutated by the callers.
+"""
+
+import re
+from functools import cached_property
+from typing import List, Optional, Tuple
+
+from bs4 import BeautifulSoup, Tag
+
+from .base.text_utilities import normalize_whitespace
+from .extractors.classifiers.status_matcher import LegislativeOutcomeClassifier
+from .extractors.html_sections import find_submission_section
+
+
+class DocumentContext:
+    """Lazily computed intermediate results of one response page"""
+
+    def __init__(self, soup: BeautifulSoup):
+        """
+        Initialize context
+
+        Args:
+            soup: BeautifulSoup object containing ECI response HTML
+        """
+        self.soup = soup
+        self._classifiers = {}
+
+    # Answer of the European Commission
+
+    @cached_property
+    def answer_section(self) -> Optional[Tag]:
+        """Answer section header, None if the page has none"""
+        return self.soup.find(
+            "h2", id="Answer-of-the-European-Commission"
+        ) or self.soup.find("h2", id="Answer-of-the-European-Commission-and-follow-up")
+
+    @cached_property
+    def legislative_content(self) -> Optional[str]:
+        """
+        All text after the Answer section, lowercased and whitespace-normalized.
+
+        Headers and document download boxes are skipped. None if the page has
+        no Answer section.
+        """
+        if not self.answer_section:
+            return None
+
+        all_text = []
+        for sibling in self.answer_section.find_next_siblings():
+            if not is_header_or_file_box(sibling):
+                all_text.append(sibling.get_text(strip=False))
+
+        content = " ".join(all_text).lower()
+        return normalize_whitespace(content)
+
+    def classifier(self, content: str) -> LegislativeOutcomeClassifier:
+        """
+        Outcome classifier of the given legislative content.
+
+        Keyed by content, as extractors of other page layouts supply their
+        own legislative content for the same document.
+
+        Args:
+            content: Normalized lowercase legislative content
+        """
+        classifier = self._classifiers.get(content)
+        if classifier is None:
+            classifier = LegislativeOutcomeClassifier(content)
+            self._classifiers[content] = classifier
+
+        return classifier
+
+    # Submission and examination
+
+    @cached_property
+    def _submission_section(self) -> Optional[Tag]:
+        try:
+            return find_submission_section(self.soup)
+        except ValueError:
+            return None
+
+    def submission_section(self, registration_number: Optional[str] = None) -> Tag:
+        """
+        Submission and examination section header.
+
+        Args:
+            registration_number: ECI registration number for the error message
+
+        Raises:
+            ValueError: If the page has no submission section
+        """
+        if self._submission_section is None:
+            # Raises the same error as the uncached lookup
+            return find_submission_section(self.soup, registration_number)
+
+        return self._submission_section
+
+    def submission_paragraphs(
+        self, registration_number: Optional[str] = None
+    ) -> List[str]:
+        """
+        Whitespace-normalized text of the non-empty paragraphs of the
+        submission section, in page order.
+
+        Args:
+            registration_number: ECI registration number for the error message
+
+        Raises:
+            ValueError: If the page has no submission section
+        """
+        self.submission_section(registration_number)
+        return self._submission_paragraphs
+
+    @cached_property
+    def _submission_paragraphs(self) -> List[str]:
+        paragraphs = []
+        for sibling in self._submission_section.find_next_siblings():
+            if sibling.name == "h2":
+                break
+            if sibling.name == "p":
+                text = sibling.get_text(separator=" ", strip=True)
+                text = " ".join(text.split())
+                if text:
+                    paragraphs.append(text)
+
+        return paragraphs
+
+    # Follow-up
+
+    @cached_property
+    def followup_section(self) -> Optional[Tuple[Tag, str]]:
+        """
+        Follow-up section header and its type ("h2" or "h4").
+
+        Matches <h2 id="Follow-up"> (or the proposal updates header) first,
+        then a <h4>Follow-up</h4> subsection. None if neither is found.
+        """
+        followup_section = self.soup.find(
+            "h2", id=["Follow-up", "Updates-on-the-Commissions-proposals"]
+        )
+        if followup_section:
+            return (followup_section, "h2")
+
+        # Handles whitespace and case variations
+        followup_section = self.soup.find(
+            "h4", string=re.compile(r"^\s*follow-up\s*$", re.IGNORECASE)
+        )
+        if followup_section:
+            return (followup_section, "h4")
+
+        return None
+
+    @cached_property
+    def followup_texts(self) -> Optional[List[str]]:
+        """
+        Text of every element of the Follow-up section, in page order.
+
+        The section ends at the next h2 (or the next h4 for an h4 section).
+        None if the page has no Follow-up section.
+        """
+        if not self.followup_section:
+            return None
+
+        followup_section, section_marker = self.followup_section
+
+        texts = []
+        element = followup_section.find_next_sibling()
+
+        while element and element.name != "h2":
+            if section_marker == "h4" and element.name == "h4":
+                break
+
+            if element.name:
+                texts.append(element.get_text(separator=" ", strip=True))
+
+            element = element.find_next_sibling()
+
+        return texts
+
+    @cached_property
+    def follow_up_header(self) -> Optional[Tag]:
+        """Follow-up h2 header, matched by id or by its text"""
+        return self.soup.find("h2", id="Follow-up") or self.soup.find(
+            "h2", string=re.compile(r"Follow[- ]up", re.IGNORECASE)
+        )
+
+    @cached_property
+    def updates_header(self) -> Optional[Tag]:
+        """Updates on the Commission's proposals h2 header"""
+        return self.soup.find(
+            "h2", id="Updates-on-the-Commissions-proposals"
+        ) or self.soup.find(
+            "h2", string=re.compile(r"Updates.*proposal", re.IGNORECASE)
+        )
+
+
+def is_header_or_file_box(element) -> bool:
+    """Check if element is a section header or a document download box."""
+    if element.name == "h2":
+        return True
+    if (
+        element.name == "div"
+        and element.get("class")
+        and "ecl-file" in element.get("class")
+    ):
+        return True
+    return False
@@ -15,6 +15,7 @@ from bs4 import BeautifulSoup, Tag, NavigableString
 
 from ..base.base_extractor import BaseExtractor
 from ..base.date_parser import parse_any_date_format, convert_deadline_to_date
+from ..consts import FOLLOWUP_DATE_REGEXES, IGNORED_DATE_PHRASES_REGEX, URL_REGEX
 
 
 class FollowUpActivityExtractor(BaseExtractor):
@@ -86,22 +87,8 @@ class FollowUpActivityExtractor(BaseExtractor):
             - section_marker: String "h2" or "h4" indicating the heading type
             Returns None if no Follow-up section is found
         """
-        # Primary pattern: <h2 id="Follow-up">
-        followup_section = soup.find(
-            "h2", id=["Follow-up", "Updates-on-the-Commissions-proposals"]
-        )
-        if followup_section:
-            return (followup_section, "h2")
-
-        # Fallback pattern: <h4>Follow-up</h4> (handles whitespace and case variations)
-        followup_section = soup.find(
-            "h4", string=re.compile(r"^\s*follow-up\s*$", re.IGNORECASE)
-        )
-        if followup_section:
-            return (followup_section, "h4")
-
-        # No Follow-up section found
-        return None
+        # <h2 id="Follow-up">, or <h4>Follow-up</h4> as fallback
+        return self._context(soup).followup_section
 
     def extract_has_followup_section(self, soup: BeautifulSoup) -> Optional[bool]:
         """
@@ -252,22 +239,10 @@ class FollowUpActivityExtractor(BaseExtractor):
             if not result:
                 return False
 
-            followup_section, section_marker = result
-
-            # Extract all text from Follow-up section
-            followup_text = followup_section.find_next_sibling()
-            full_text = ""
-
-            while followup_text and followup_text.name != "h2":
-                if section_marker == "h4" and followup_text.name == "h4":
-                    break
-
-                if followup_text.name:
-                    full_text += followup_text.get_text(
-                        separator=" ", strip=True
-                    ).lower()
-
-                followup_text = followup_text.find_next_sibling()
+            # All text from Follow-up section
+            full_text = "".join(
+                text.lower() for text in self._context(soup).followup_texts
+            )
 
             # Check for roadmap-related keywords
             roadmap_keywords = ["roadmap", "road map", "roadmaps"]
@@ -306,22 +281,10 @@ class FollowUpActivityExtractor(BaseExtractor):
             if not result:
                 return False
 
-            followup_section, section_marker = result
-
-            # Extract all text from Follow-up section
-            followup_text = followup_section.find_next_sibling()
-            full_text = ""
-
-            while followup_text and followup_text.name != "h2":
-                if section_marker == "h4" and followup_text.name == "h4":
-                    break
-
-                if followup_text.name:
-                    full_text += followup_text.get_text(
-                        separator=" ", strip=True
-                    ).lower()
-
-                followup_text = followup_text.find_next_sibling()
+            # All text from Follow-up section
+            full_text = "".join(
+                text.lower() for text in self._context(soup).followup_texts
+            )
 
             # Check for workshop-related keywords
             workshop_keywords = [
@@ -463,20 +426,10 @@ class FollowUpActivityExtractor(BaseExtractor):
                 # No Follow-up section exists
                 return None
 
-            followup_section, section_marker = result
-
-            # Extract all text from Follow-up section
-            followup_text = followup_section.find_next_sibling()
-            full_text = ""
-
-            while followup_text and followup_text.name != "h2":
-                if section_marker == "h4" and followup_text.name == "h4":
-                    break
-
-                if followup_text.name:
-                    full_text += followup_text.get_text(separator=" ", strip=True) + " "
-
-                followup_text = followup_text.find_next_sibling()
+            # All text from Follow-up section
+            full_text = "".join(
+                text + " " for text in self._context(soup).followup_texts
+            )
 
             # Regex pattern to find all potential dates
             # Matches patterns like: "27 March 2021", "March 2021", "27/03/2021", etc.
@@ -864,73 +817,18 @@ class FollowUpActivityExtractor(BaseExtractor):
 
         # 1. Remove URLs to prevent false positives from file paths/links containing dates
         # e.g., ".../2022-11/cp220179en.pdf" -> ""
-        text = re.sub(r"https?://\S+|www\.\S+", "", text)
+        text = URL_REGEX.sub("", text)
 
         # 2. Remove known proper names/titles containing years to prevent false positives
         # These are labels for programs/agendas, not specific event dates.
-        ignored_phrases = [
-            r"2030 Agenda",
-            r"Agenda 2030",
-            r"Europe 2020",
-            r"Horizon 2020",
-            r"Natura 2000",
-            r"Vision 2025",  # e.g., "2025 Vision for Agriculture"
-            r"Vision 2030",
-            r"Vision 2050",
-            r"Industrie 4\.0",
-            r"Industry 4\.0",
-            r"2020 Farm to Fork Strategy",
-        ]
-        # Join into a single regex pattern (case-insensitive)
-        ignored_pattern = "|".join(ignored_phrases)
-        text = re.sub(ignored_pattern, "", text, flags=re.IGNORECASE)
-
-        # Generate month names pattern from calendar module
-        month_names_full = "|".join(calendar.month_name[1:])
-        month_names_abbr = "|".join(calendar.month_abbr[1:])
-        month_names_pattern = f"(?:{month_names_full}|{month_names_abbr})"
-
-        # Helper patterns for complex deadlines
-        ordinals = r"(?:first|second|third|fourth|last)"
-        periods = r"(?:half|quarter)"
-        seasons = r"(?:spring|summer|autumn|fall|winter)"
-
-        # Date patterns ordered by specificity (most specific first)
-        date_patterns = [
-            # 1. ISO format YYYY-MM-DD (e.g., "2025-09-10")
-            (r"\b(\d{4})-(\d{1,2})-(\d{1,2})\b", "iso"),
-            # 2. Numeric formats (e.g., "09/09/2014", "12.10.2015", "27-03-2021")
-            (r"\b(\d{1,2})([./-])(\d{1,2})\2(\d{4})\b", "numeric"),
-            # 3. DD Month YYYY (e.g., "28 October 2015", "15 Mar 2021")
-            (rf"\b(\d{{1,2}})\s+({month_names_pattern})\s+(\d{{4}})\b", "dmy"),
-            # 4. Complex Deadline Expressions
-            # Matches: "early 2026", "end of 2023", "second half of 2024", "autumn 2023", "since 2022"
-            (
-                rf"\b(?:"
-                rf"(?:early|late|end(?:\s+of)?)|"  # early/end/late
-                rf"(?:{ordinals}\s+{periods}(?:\s+of)?)|"  # first half of...
-                rf"(?:{seasons})|"  # autumn...
-                rf"(?:since)|"  # since...
-                rf"(?:Q[1-4])"  # Q1...
-                rf")\s+(\d{{4}})\b",  # ... YEAR
-                "deadline",
-            ),
-            # 5. Month YYYY (e.g., "February 2018", "Mar 2024")
-            (rf"\b({month_names_pattern})\s+(\d{{4}})\b", "deadline"),
-            # 6. YYYY only (e.g., "2021")
-            # Lookbehind/Lookahead to avoid:
-            # - IDs/Fractions: "2022/0002"
-            # - Directives: "2010/63/EU"
-            # - Parentheses: "C(2021)"
-            # - Ranges: "2021-2027"
-            (r"(?<![\d\/\(\-])\b(20\d{2})\b(?![\d\/\-])", "y"),
-        ]
+        text = IGNORED_DATE_PHRASES_REGEX.sub("", text)
+
         found_dates = []
         used_positions: set = set()
 
-        # Process patterns in order of specificity
-        for pattern, date_type in date_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+        # Process patterns in order of specificity (most specific first)
+        for pattern, date_type in FOLLOWUP_DATE_REGEXES:
+            matches = list(pattern.finditer(text))
 
             for match in matches:
                 # Check if this position overlaps with already used position
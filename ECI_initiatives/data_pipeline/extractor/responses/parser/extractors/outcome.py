@@ -4,7 +4,6 @@ classifying Commission responses, determining proposal status, and
 identifying legislative actions taken.
 """
 
-import calendar
 import json
 import re
 from datetime import datetime
@@ -13,6 +12,7 @@ from typing import Optional
 from bs4 import BeautifulSoup
 
 from ..base.base_extractor import BaseExtractor
+from ..document_context import is_header_or_file_box
 from .classifiers.status_matcher import LegislativeOutcomeClassifier
 from ..base.date_parser import (
     parse_date_string,
@@ -23,8 +23,11 @@ from ..base.text_utilities import normalize_whitespace, remove_leading_punctuati
 from ..consts import (
     REJECTION_REASONING_KEYWORDS,
     NonLegislativeAction,
-    DEADLINE_PATTERNS,
-    APPLICABLE_DATE_PATTERNS,
+    DEADLINE_REGEXES,
+    APPLICABLE_DATE_REGEXES,
+    ENTERED_INTO_FORCE_DATE_REGEX,
+    ACTION_DATE_REGEXES,
+    LEGISLATIVE_ACTION_KEYWORDS_REGEX,
     LegislativeStatus,
 )
 
@@ -45,45 +48,24 @@ class LegislativeOutcomeExtractor(BaseExtractor):
 
     def _find_answer_section(self, soup: BeautifulSoup):
         """Find the Answer section header in the HTML."""
-        return soup.find("h2", id="Answer-of-the-European-Commission") or soup.find(
-            "h2", id="Answer-of-the-European-Commission-and-follow-up"
-        )
+        return self._context(soup).answer_section
 
     def _extract_legislative_content(self, soup: BeautifulSoup) -> Optional[str]:
         """
         Extract all text content after Answer section.
         Returns normalized lowercase string or None if section not found.
         """
-        answer_section = self._find_answer_section(soup)
-
-        if not answer_section:
-            return None
-
-        all_text = []
-        for sibling in answer_section.find_next_siblings():
-            if not self._should_skip_element(sibling):
-                all_text.append(sibling.get_text(strip=False))
-
-        content = " ".join(all_text).lower()
-        content = normalize_whitespace(content)
-
-        return content
+        return self._context(soup).legislative_content
 
     def _should_skip_element(self, element) -> bool:
         """Check if element should be skipped during extraction."""
-        if element.name == "h2":
-            return True
-        if (
-            element.name == "div"
-            and element.get("class")
-            and "ecl-file" in element.get("class")
-        ):
-            return True
-        return False
+        return is_header_or_file_box(element)
 
     def _get_classifier(self, soup: BeautifulSoup) -> LegislativeOutcomeClassifier:
         """
-        Create and return a LegislativeOutcomeClassifier for the given HTML.
+        Return the LegislativeOutcomeClassifier for the given HTML.
+
+        The classifier is shared by all extractions from the same document.
 
         Args:
             soup: BeautifulSoup object containing ECI response HTML
@@ -101,7 +83,7 @@ class LegislativeOutcomeExtractor(BaseExtractor):
                 f"initiative {self.registration_number}.\n"
                 f"Answer section may be missing or empty."
             )
-        return LegislativeOutcomeClassifier(content)
+        return self._context(soup).classifier(content)
 
     def extract_highest_status_reached(self, soup: BeautifulSoup) -> str:
         """
@@ -352,11 +334,7 @@ class LegislativeOutcomeExtractor(BaseExtractor):
                 # Check for "immediately" case first
                 if "became applicable immediately" in text.lower():
                     # Try to find entry into force date nearby
-                    force_match = re.search(
-                        r"entered into force on\s+(\d{1,2}\s+[A-Za-z]+\s+\d{4})",
-                        text,
-                        re.IGNORECASE,
-                    )
+                    force_match = ENTERED_INTO_FORCE_DATE_REGEX.search(text)
                     if force_match:
                         date_str = force_match.group(1).strip()
                         parsed_date = parse_date_string(date_str)
@@ -364,8 +342,8 @@ class LegislativeOutcomeExtractor(BaseExtractor):
                             return parsed_date
 
                 # Check each pattern
-                for pattern in APPLICABLE_DATE_PATTERNS:
-                    match = re.search(pattern, text, re.IGNORECASE)
+                for pattern in APPLICABLE_DATE_REGEXES:
+                    match = pattern.search(text)
                     if match:
                         if match.groups():  # Has captured group
                             date_str = match.group(1).strip()
@@ -424,9 +402,9 @@ class LegislativeOutcomeExtractor(BaseExtractor):
                 text_lower = text.lower()
 
                 # Check each pattern
-                for pattern in DEADLINE_PATTERNS:
+                for pattern in DEADLINE_REGEXES:
                     # Find all matches in this element (handles multiple deadlines per element)
-                    for match in re.finditer(pattern, text_lower, re.IGNORECASE):
+                    for match in pattern.finditer(text_lower):
                         deadline_text = match.group(1).strip()
 
                         if deadline_text:
@@ -591,13 +569,10 @@ class LegislativeOutcomeExtractor(BaseExtractor):
             actions = []
 
             # Find Answer and Follow-up sections
+            context = self._context(soup)
             answer_section = self._find_answer_section(soup)
-            follow_up_section = soup.find("h2", id="Follow-up") or soup.find(
-                "h2", string=re.compile(r"Follow[- ]up", re.IGNORECASE)
-            )
-            updates_section = soup.find(
-                "h2", id="Updates-on-the-Commissions-proposals"
-            ) or soup.find("h2", string=re.compile(r"Updates.*proposal", re.IGNORECASE))
+            follow_up_section = context.follow_up_header
+            updates_section = context.updates_header
 
             # Section priorities: Updates > Follow-up > Answer
             search_sections = []
@@ -650,16 +625,14 @@ class LegislativeOutcomeExtractor(BaseExtractor):
         """
         actions = []
 
-        # Build action patterns from LegislativeStatus
-        action_patterns = []
-        for status in LegislativeStatus.ALL_STATUSES:
-            for pattern in status.action_patterns:
-                action_patterns.append(
-                    {
-                        "pattern": pattern,
-                        "status_obj": status,  # Store the Status object
-                    }
-                )
+        # Action patterns of each LegislativeStatus, compiled into one
+        action_patterns = [
+            {
+                "pattern": status.action_regex,
+                "status_obj": status,  # Store the Status object
+            }
+            for status in LegislativeStatus.ALL_STATUSES
+        ]
 
         # Iterate through siblings after section header
         for sibling in section.find_next_siblings():
@@ -698,9 +671,7 @@ class LegislativeOutcomeExtractor(BaseExtractor):
         # Find ALL matching patterns, then pick the most specific status
         matches = []
         for pattern_info in action_patterns:
-            if re.search(
-                pattern_info["pattern"], text_lower, re.IGNORECASE | re.DOTALL
-            ):
+            if pattern_info["pattern"].search(text_lower):
                 matches.append(pattern_info)
 
         if not matches:
@@ -727,18 +698,7 @@ class LegislativeOutcomeExtractor(BaseExtractor):
         Returns:
             Action dictionary or None
         """
-        MONTH_NAMES_PATTERN = "|".join(calendar.month_name[1:])
-
         # Extract dates from text
-        date_patterns = [
-            rf"(\d{{1,2}}\s+(?:{MONTH_NAMES_PATTERN})\s+\d{{4}})",  # 12 January 2023
-            rf"(?:in|by|from)\s+((?:{MONTH_NAMES_PATTERN})\s+\d{{4}})",  # in May 2024
-            r"(\d{1,2}/\d{1,2}/\d{4})",  # 15/03/2022
-            r"(\d{4}-\d{2}-\d{2})",  # 2023-01-12
-            r"(?:by|in|from)\s+(\d{{4}})",  # in 2024
-            r"(?:by|in|from)\s+(?:end\s+of\s+)?(\d{{4}})",  # by end of 2024
-        ]
-
         found_date = None
         status_obj = pattern_info["status_obj"]
 
@@ -771,8 +731,8 @@ class LegislativeOutcomeExtractor(BaseExtractor):
             clause = text_from_keyword[: clause_end + 1]
 
             # Try to find a date in this clause
-            for date_pattern in date_patterns:
-                match = re.search(date_pattern, clause, re.IGNORECASE)
+            for date_pattern in ACTION_DATE_REGEXES:
+                match = date_pattern.search(clause)
                 if match:
                     date_str = match.group(1)
                     parsed = parse_date_string(date_str)
@@ -786,8 +746,8 @@ class LegislativeOutcomeExtractor(BaseExtractor):
 
         # Fallback: if no date found near status keyword, try the whole text
         if not found_date:
-            for date_pattern in date_patterns:
-                match = re.search(date_pattern, text, re.IGNORECASE)
+            for date_pattern in ACTION_DATE_REGEXES:
+                match = date_pattern.search(text)
                 if match:
                     date_str = match.group(1)
                     parsed = parse_date_string(date_str)
@@ -892,9 +852,7 @@ class LegislativeOutcomeExtractor(BaseExtractor):
 
             # Find Answer and Follow-up sections
             answer_section = self._find_answer_section(soup)
-            follow_up_section = soup.find("h2", id="Follow-up") or soup.find(
-                "h2", string=re.compile(r"Follow[- ]up", re.IGNORECASE)
-            )
+            follow_up_section = self._context(soup).follow_up_header
 
             # Section priorities: Follow-up > Answer
             search_sections = []
@@ -998,33 +956,14 @@ class LegislativeOutcomeExtractor(BaseExtractor):
         if text.endswith(":") and len(text) < 100:
             return
 
-        # Skip legislative keywords (these belong to legislative actions)
-        legislative_keywords = [
-            r"\bentered into force\b",
-            r"\bbecame applicable\b",
-            r"\bwithdrawal\b",
-            r"\bdecided not to submit a legislative proposal\b",
-            r"\bcome forward with a legislative proposal\b",
-            r"\btable a legislative proposal\b",
-            r"\bno new legislation\b",
-            r"\bcame into force on\b",
-            r"\bamendment to the directive\b",
-            r"\bamendment to the regulation\b",
-            r"\bamending directive\b",
-            r"\bamending regulation\b",
-            r"\brevision of legislation\b",
-            r"\blabelling requirements\b",
-            r"\bmandatory labelling\b",
-            r"\bsets out plans for a legislative proposal\b",
-        ]
-
         header_sections = [
             "transparency and benchmarking:",
             "Implementation and review of existing EU legislation:",
         ]
 
-        # If contains legislative keywords, skip (unless it's about enforcement)
-        if any(re.search(keyword, text_lower) for keyword in legislative_keywords):
+        # If contains legislative keywords, skip (these belong to legislative
+        # actions, unless it's about enforcement)
+        if LEGISLATIVE_ACTION_KEYWORDS_REGEX.search(text_lower):
             return
 
         # other trouble phrases
@@ -1057,23 +996,11 @@ class LegislativeOutcomeExtractor(BaseExtractor):
             Action dictionary or None
         """
 
-        MONTH_NAMES_PATTERN = "|".join(calendar.month_name[1:])
-
-        # Extract dates from text
-        date_patterns = [
-            rf"(\d{{1,2}}\s+(?:{MONTH_NAMES_PATTERN})\s+\d{{4}})",  # 12 January 2023
-            rf"(?:in|by|from)\s+((?:{MONTH_NAMES_PATTERN})\s+\d{{4}})",  # in May 2024
-            r"(\d{1,2}/\d{1,2}/\d{4})",  # 15/03/2022
-            r"(\d{4}-\d{2}-\d{2})",  # 2023-01-12
-            r"(?:by|in|from)\s+(\d{{4}})",  # in 2024
-            r"(?:by|in|from)\s+(?:end\s+of\s+)?(\d{{4}})",  # by end of 2024
-        ]
-
         found_date = None
 
         # Try to find date in text
-        for date_pattern in date_patterns:
-            match = re.search(date_pattern, text, re.IGNORECASE)
+        for date_pattern in ACTION_DATE_REGEXES:
+            match = date_pattern.search(text)
             if match:
                 date_str = match.group(1)
                 parsed = parse_date_string(date_str)
@@ -17,8 +17,7 @@ from ..base.text_utilities import normalize_whitespace
 from ..base.date_parser import format_date_from_match
 from ..consts.dates import month_map
 
-from .submission import SubmissionDataExtractor
-from .html_sections import find_submission_section, build_links_dict
+from .html_sections import build_links_dict
 
 
 class ParliamentActivityExtractor(BaseExtractor):
@@ -27,10 +26,9 @@ class ParliamentActivityExtractor(BaseExtractor):
     def extract_parliament_hearing_date(self, soup: BeautifulSoup) -> str:
         """Extracts and normalizes the European Parliament hearing date"""
         try:
-            submission_text_extractor = SubmissionDataExtractor(
-                self.logger, self.registration_number
+            submission_text = " ".join(
+                self._context(soup).submission_paragraphs(self.registration_number)
             )
-            submission_text = submission_text_extractor.extract_submission_text(soup)
 
             if not submission_text or not submission_text.strip():
                 raise ValueError("No submission text found in HTML.")
@@ -112,7 +110,9 @@ class ParliamentActivityExtractor(BaseExtractor):
         """Extracts all relevant video recording URLs from the 'public hearing' paragraph"""
 
         try:
-            submission_section = find_submission_section(soup, self.registration_number)
+            submission_section = self._context(soup).submission_section(
+                self.registration_number
+            )
 
             for sibling in submission_section.find_next_siblings():
                 if sibling.name == "h2":
@@ -158,7 +158,9 @@ class ParliamentActivityExtractor(BaseExtractor):
     def extract_plenary_debate_date(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract date of plenary debate in Parliament"""
         try:
-            submission_section = find_submission_section(soup, self.registration_number)
+            submission_section = self._context(soup).submission_section(
+                self.registration_number
+            )
 
             paragraphs = submission_section.find_next_siblings("p")
 
@@ -220,7 +222,9 @@ class ParliamentActivityExtractor(BaseExtractor):
     def extract_plenary_debate_video_urls(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract video recording URL of plenary debate as JSON"""
         try:
-            submission_section = find_submission_section(soup, self.registration_number)
+            submission_section = self._context(soup).submission_section(
+                self.registration_number
+            )
 
             paragraphs = submission_section.find_next_siblings("p")
 
@@ -15,7 +15,7 @@ from ..base.base_extractor import BaseExtractor
 from ..consts.dates import month_map
 from ..base.date_parser import format_date_from_match
 
-from .html_sections import find_submission_section, build_links_dict
+from .html_sections import build_links_dict
 
 
 class CommissionResponseExtractor(BaseExtractor):
@@ -27,7 +27,9 @@ class CommissionResponseExtractor(BaseExtractor):
         """Extract date Commission adopted official Communication"""
 
         try:
-            submission_section = find_submission_section(soup, self.registration_number)
+            submission_section = self._context(soup).submission_section(
+                self.registration_number
+            )
 
             paragraphs = submission_section.find_next_siblings("p")
 
@@ -88,7 +90,9 @@ class CommissionResponseExtractor(BaseExtractor):
             all_links = []
 
             # Strategy 1: Search in paragraphs after submission section
-            submission_section = find_submission_section(soup, self.registration_number)
+            submission_section = self._context(soup).submission_section(
+                self.registration_number
+            )
             paragraphs = submission_section.find_next_siblings("p")
 
             for p in paragraphs:
@@ -11,7 +11,6 @@ from typing import Optional
 from bs4 import BeautifulSoup
 
 from ..base.base_extractor import BaseExtractor
-from .html_sections import find_submission_section
 
 
 class SubmissionDataExtractor(BaseExtractor):
@@ -20,17 +19,9 @@ class SubmissionDataExtractor(BaseExtractor):
     def extract_submission_text(self, soup: BeautifulSoup) -> str:
         """Extract normalized text from all paragraphs in the submission section"""
         try:
-            submission_section = find_submission_section(soup, self.registration_number)
-
-            paragraphs = []
-            for sibling in submission_section.find_next_siblings():
-                if sibling.name == "h2":
-                    break
-                if sibling.name == "p":
-                    text = sibling.get_text(separator=" ", strip=True)
-                    text = " ".join(text.split())
-                    if text:
-                        paragraphs.append(text)
+            paragraphs = self._context(soup).submission_paragraphs(
+                self.registration_number
+            )
 
             if not paragraphs:
                 raise ValueError(
@@ -12,7 +12,6 @@ from typing import Optional
 from bs4 import BeautifulSoup
 
 from ..base.base_extractor import BaseExtractor
-from .html_sections import find_submission_section
 
 
 class ProceduralTimelineExtractor(BaseExtractor):
@@ -21,7 +20,9 @@ class ProceduralTimelineExtractor(BaseExtractor):
     def extract_commission_meeting_date(self, soup: BeautifulSoup) -> str:
         """Extract date of meeting with Commission officials (Article 15)"""
         try:
-            submission_section = find_submission_section(soup, self.registration_number)
+            submission_section = self._context(soup).submission_section(
+                self.registration_number
+            )
 
             paragraphs = []
             for sibling in submission_section.find_next_siblings():
@@ -81,7 +82,9 @@ class ProceduralTimelineExtractor(BaseExtractor):
     def extract_commission_officials_met(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract names and titles of Commissioners/Vice-Presidents who met"""
         try:
-            submission_section = find_submission_section(soup, self.registration_number)
+            submission_section = self._context(soup).submission_section(
+                self.registration_number
+            )
 
             paragraphs = []
             for sibling in submission_section.find_next_siblings():
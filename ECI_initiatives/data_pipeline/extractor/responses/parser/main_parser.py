@@ -10,9 +10,9 @@ import logging
 from pathlib import Path
 from typing import Dict, Optional
 
-from bs4 import BeautifulSoup
-
 from ..model import ECICommissionResponseRecord
+from .document_context import DocumentContext
+from ....scraper.scraper_shared.page_io import read_page_soup
 
 # Import all extractors
 from .extractors.metadata import BasicMetadataExtractor
@@ -26,7 +26,6 @@ from .extractors.multimedia import MultimediaDocumentationExtractor
 from .extractors.legislative_references import LegislativeReferences
 
 # Constants for JSON serialization
-HTML_ENCODING = "utf-8"
 JSON_ENSURE_ASCII = False
 
 
@@ -76,6 +75,21 @@ class ECIResponseHTMLParser:
         ]:
             extractor.set_registration_number(value)
 
+    def _set_document_context(self, document_context: Optional[DocumentContext]):
+        """Share one document context between all extractors"""
+        for extractor in [
+            self.basic_metadata,
+            self.submission_data,
+            self.procedural_timeline,
+            self.parliament_activity,
+            self.commission_response,
+            self.legislative_outcome,
+            self.followup_activity,
+            self.multimedia_docs,
+            self.structural_analysis,
+        ]:
+            extractor.set_document_context(document_context)
+
     def _to_json(self, data) -> str:
         """Helper to serialize data to JSON with consistent settings"""
         return json.dumps(data, ensure_ascii=JSON_ENSURE_ASCII)
@@ -102,11 +116,12 @@ class ECIResponseHTMLParser:
             ]:
                 extractor.set_registration_number(self.registration_number)
 
-            # Read and parse HTML file
-            with open(html_path, "r", encoding=HTML_ENCODING) as f:
-                html_content = f.read()
+            # Read and parse HTML file as stored, whether it was saved raw,
+            # prettified or compressed
+            soup = read_page_soup(html_path)
 
-            soup = BeautifulSoup(html_content, "html.parser")
+            # Intermediate results shared by the extractors, computed once
+            self._set_document_context(DocumentContext(soup))
 
             # Extract commission communication date for follow-up calculation
             official_communication_adoption_date = (
@@ -245,3 +260,4 @@ class ECIResponseHTMLParser:
             return None
         finally:
             self.registration_number = None
+            self._set_document_context(None)
@@ -14,6 +14,10 @@ import logging
 from .parser import ECIResponseHTMLParser
 from .model import ECICommissionResponseRecord
 from .responses_logger import ResponsesExtractorLogger
+from ..consts import EXTRACTION_CACHE, EXTRACTION_WORKERS
+from ..extraction_cache import ExtractionCache
+from ..parallel import process_files
+from ...scraper.scraper_shared.page_io import glob_pages, logical_page_path
 from .const import (
     SCRIPT_DIR,
     CSV_FILENAME,
@@ -31,6 +35,8 @@ class ECIResponseDataProcessor:
         data_root: Optional[Path] = None,
         responses_list_csv: Optional[str] = None,
         logger: Optional[logging.Logger] = None,
+        workers: int = EXTRACTION_WORKERS,
+        use_cache: bool = EXTRACTION_CACHE,
     ):
         """
         Initialize the processor
@@ -41,6 +47,8 @@ class ECIResponseDataProcessor:
             responses_list_csv: Filename of responses list CSV with metadata.
                                If None, defaults to CSV_FILENAME from const
             logger: Optional logger instance. If None, will be initialized in run()
+            workers: Number of processes parsing files in parallel
+            use_cache: Reuse the records of files extracted by earlier runs
         """
         # Use constants for default paths
         self.data_root = (
@@ -57,6 +65,8 @@ class ECIResponseDataProcessor:
         # Logger can be passed or initialized later
         self.logger = logger
         self.parser = None
+        self.workers = workers
+        self.use_cache = use_cache
 
     def find_latest_scrape_session(self) -> Optional[Path]:
         """Find the most recent scraping session directory"""
@@ -137,8 +147,8 @@ class ECIResponseDataProcessor:
         responses_metadata = self._load_responses_metadata(responses_list_csv)
         self.logger.info(f"Loaded metadata for {len(responses_metadata)} responses")
 
-        # Find all HTML files (pattern from constant)
-        html_files = sorted(html_dir.glob("**/*_en.html"))
+        # Find all HTML files, plain or compressed (pattern from constant)
+        html_files = glob_pages(html_dir, "**/*_en.html")
         if not html_files:
             raise FileNotFoundError(
                 f"No HTML response files found in: {html_dir}\n"
@@ -147,27 +157,43 @@ class ECIResponseDataProcessor:
 
         self.logger.info(f"Found {len(html_files)} HTML files to process")
 
-        # Process each file
-        results = []
+        # Get metadata for each response
+        tasks = []
         for html_file in html_files:
-            try:
-                self.logger.info(f"Processing {html_file.name}")
+            reg_num = self._extract_reg_num_from_filename(
+                logical_page_path(html_file).name
+            )
+            tasks.append((html_file, responses_metadata.get(reg_num, {})))
 
-                # Get metadata for this response
-                reg_num = self._extract_reg_num_from_filename(html_file.name)
-                metadata = responses_metadata.get(reg_num, {})
+        if self.workers > 1:
+            self.logger.info(f"Parsing with {self.workers} worker processes")
 
-                # Parse the file
-                response_data = self.parser.parse_file(html_file, metadata)
+        cache = ExtractionCache(
+            session_path.parent,
+            DirectoryStructure.RESPONSES_DIR_NAME,
+            ECICommissionResponseRecord,
+            self.logger,
+            enabled=self.use_cache,
+        )
 
-                if response_data:
-                    results.append(response_data)
-                    self.logger.info(f"Successfully processed {html_file.name}")
+        # Process each file not in the cache, results in file order
+        parsed = cache.extract(
+            tasks,
+            page_path=lambda task: task[0],
+            inputs=_cache_inputs,
+            extract_items=lambda missing: process_files(
+                _parse_response_file,
+                missing,
+                self.workers,
+                self.logger,
+                _create_parser,
+                local_state=self.parser,
+            ),
+        )
+        results = [response_data for response_data in parsed if response_data]
 
-            except Exception as e:
-                self.logger.error(
-                    f"Error processing {html_file.name}: {e}", exc_info=True
-                )
+        cache.evict()
+        cache.log_summary()
 
         # Write results to CSV
         self._write_csv(results, output_csv)
@@ -223,3 +249,44 @@ class ECIResponseDataProcessor:
                 writer.writerow(result.to_dict())
 
         self.logger.info(f"Wrote {len(results)} rows to {output_csv}")
+
+
+def _create_parser(logger: logging.Logger) -> ECIResponseHTMLParser:
+    """Create the parser of a worker process"""
+    return ECIResponseHTMLParser(logger)
+
+
+def _cache_inputs(task) -> list:
+    """Inputs of a file's record besides its HTML, for the extraction cache"""
+    html_file, metadata = task
+
+    # Only these metadata fields end up in the record; the others, such as
+    # the scrape datetime, change every session. The latest follow-up date is
+    # the latest one not after the day of the run, so that day is an input too
+    return [
+        logical_page_path(html_file).name,
+        metadata.get("registration_number"),
+        metadata.get("title"),
+        datetime.now().date().isoformat(),
+    ]
+
+
+def _parse_response_file(
+    parser: ECIResponseHTMLParser, task
+) -> Optional[ECICommissionResponseRecord]:
+    """Parse one response file, logging instead of raising errors"""
+    html_file, metadata = task
+
+    try:
+        parser.logger.info(f"Processing {html_file.name}")
+
+        response_data = parser.parse_file(html_file, metadata)
+
+        if response_data:
+            parser.logger.info(f"Successfully processed {html_file.name}")
+
+        return response_data
+
+    except Exception as e:
+        parser.logger.error(f"Error processing {html_file.name}: {e}", exc_info=True)
+        return None
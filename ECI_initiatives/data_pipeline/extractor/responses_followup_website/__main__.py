@@ -1,10 +1,35 @@
 #!/usr/bin/env python3
 
+import argparse
+
 from .processor import ECIFollowupWebsiteProcessor
+from ..consts import EXTRACTION_CACHE, EXTRACTION_WORKERS
+
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Extract follow-up website data from the latest scraping session."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=EXTRACTION_WORKERS,
+        metavar="N",
+        help="number of processes parsing pages in parallel "
+        f"(default: {EXTRACTION_WORKERS})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="parse every page, without reusing records of earlier runs",
+    )
+    parser.set_defaults(use_cache=EXTRACTION_CACHE)
+    args = parser.parse_args(argv)
 
-def main():
-    processor = ECIFollowupWebsiteProcessor()
+    processor = ECIFollowupWebsiteProcessor(
+        workers=args.workers, use_cache=args.use_cache
+    )
     processor.run()
 
 
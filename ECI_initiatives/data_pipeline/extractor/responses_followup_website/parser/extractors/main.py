@@ -8,10 +8,9 @@ into structured data records.
 from copy import copy
 from pathlib import Path
 import re
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Union
 import logging
 
-# Third-party
 from bs4 import BeautifulSoup
 
 # Local
@@ -22,13 +21,22 @@ from ....responses.parser.extractors.structural import StructuralAnalysisExtract
 from ....responses.parser.extractors.legislative_references import LegislativeReferences
 from .followup import FollowupWebsiteFollowUpExtractor
 from .outcome import FollowupWebsiteLegislativeOutcomeExtractor
+from .....scraper.scraper_shared.soup_factory import make_soup
 
 
 class FollowupWebsiteExtractor:
     """Extracts structured data from European Citizens' Initiative followup website HTML."""
 
-    def __init__(self, html_content: str, logger: Optional[logging.Logger] = None):
-        self.soup = BeautifulSoup(html_content, "html.parser")
+    def __init__(
+        self,
+        html_content: Union[str, BeautifulSoup],
+        logger: Optional[logging.Logger] = None,
+    ):
+        # Pages read with read_page_soup() come parsed already
+        if isinstance(html_content, BeautifulSoup):
+            self.soup = html_content
+        else:
+            self.soup = make_soup(html_content)
         self.logger = logger or logging.getLogger(__name__)
         self.registration_number = None
 
@@ -21,10 +21,11 @@ from bs4 import BeautifulSoup
 # Local
 from ....responses.parser.extractors.outcome import (
     LegislativeOutcomeExtractor,
-    APPLICABLE_DATE_PATTERNS,
+    APPLICABLE_DATE_REGEXES,
+    ENTERED_INTO_FORCE_DATE_REGEX,
     REJECTION_REASONING_KEYWORDS,
     parse_date_string,
-    DEADLINE_PATTERNS,
+    DEADLINE_REGEXES,
     convert_deadline_to_date,
     LegislativeStatus,
 )
@@ -367,11 +368,7 @@ class FollowupWebsiteLegislativeOutcomeExtractor(LegislativeOutcomeExtractor):
                     # Check for "immediately" case first
                     if "became applicable immediately" in text.lower():
 
-                        force_match = re.search(
-                            r"entered into force on\s+(\d{1,2}\s+[A-Za-z]+\s+\d{4})",
-                            text,
-                            re.IGNORECASE,
-                        )
+                        force_match = ENTERED_INTO_FORCE_DATE_REGEX.search(text)
 
                         if force_match:
                             date_str = force_match.group(1).strip()
@@ -380,8 +377,8 @@ class FollowupWebsiteLegislativeOutcomeExtractor(LegislativeOutcomeExtractor):
                                 return parsed_date
 
                     # Check each pattern
-                    for pattern in APPLICABLE_DATE_PATTERNS:
-                        match = re.search(pattern, text, re.IGNORECASE)
+                    for pattern in APPLICABLE_DATE_REGEXES:
+                        match = pattern.search(text)
                         if match:
                             if match.groups():
                                 date_str = match.group(1).strip()
@@ -424,9 +421,9 @@ class FollowupWebsiteLegislativeOutcomeExtractor(LegislativeOutcomeExtractor):
                 """Process each element for deadline patterns."""
 
                 # Check each pattern
-                for pattern in DEADLINE_PATTERNS:
+                for pattern in DEADLINE_REGEXES:
 
-                    for match in re.finditer(pattern, text_lower, re.IGNORECASE):
+                    for match in pattern.finditer(text_lower):
                         deadline_text = match.group(1).strip()
 
                         if deadline_text:
@@ -630,16 +627,14 @@ class FollowupWebsiteLegislativeOutcomeExtractor(LegislativeOutcomeExtractor):
         """
         actions = []
 
-        # Build action patterns from LegislativeStatus
-        action_patterns = []
-        for status in LegislativeStatus.ALL_STATUSES:
-            for pattern in status.action_patterns:
-                action_patterns.append(
-                    {
-                        "pattern": pattern,
-                        "status_obj": status,
-                    }
-                )
+        # Action patterns of each LegislativeStatus, compiled into one
+        action_patterns = [
+            {
+                "pattern": status.action_regex,
+                "status_obj": status,
+            }
+            for status in LegislativeStatus.ALL_STATUSES
+        ]
 
         # Process THE ELEMENT ITSELF (not its siblings)
         if section.name in ["p", "li"]:
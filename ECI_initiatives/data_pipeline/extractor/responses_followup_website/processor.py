@@ -5,13 +5,20 @@ import csv
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 import re
 
-
 # Local
 from .model import ECIFollowupWebsiteRecord
 from .parser.extractors import FollowupWebsiteExtractor
+from ..consts import EXTRACTION_CACHE, EXTRACTION_WORKERS
+from ..extraction_cache import ExtractionCache
+from ..parallel import process_files
+from ...scraper.scraper_shared.page_io import (
+    glob_pages,
+    logical_page_path,
+    read_page_soup,
+)
 
 # TODO
 # apply the: SCRIPT_DIR / DATA_DIR_NAME
@@ -33,7 +40,9 @@ from .consts import (
 
 class ECIFollowupWebsiteProcessor:
 
-    def __init__(self):
+    def __init__(
+        self, workers: int = EXTRACTION_WORKERS, use_cache: bool = EXTRACTION_CACHE
+    ):
         # Find latest timestamped directory under data
         current_file = Path(__file__)
         project_root = current_file.parent.parent.parent.parent
@@ -63,6 +72,8 @@ class ECIFollowupWebsiteProcessor:
             )
 
         self.input_dir = max(all_dirs, key=lambda x: x.name)  # use latest
+        self.workers = workers  # Processes parsing files in parallel
+        self.use_cache = use_cache  # Reuse records of files extracted earlier
         self.output_dir = self.input_dir
 
         timestamp_format = TimeFormats.TIMESTAMP_FORMAT
@@ -145,7 +156,7 @@ class ECIFollowupWebsiteProcessor:
         )
 
         html_dir = self.input_dir / RESPONSES_FOLLOWUP_WEBSITE_DIR_NAME
-        html_files = list(html_dir.glob(html_file_glob_pattern))
+        html_files = glob_pages(html_dir, html_file_glob_pattern)
 
         self.logger.info(f"In the directory:\n{html_dir}")
         self.logger.info(f"Found {len(html_files)} HTML files to process")
@@ -160,37 +171,68 @@ class ECIFollowupWebsiteProcessor:
 
     def run(self):
         """Process all HTML files and generate output CSV."""
-        records = []
+        if self.workers > 1:
+            self.logger.info(f"Parsing with {self.workers} worker processes")
+
+        cache = ExtractionCache(
+            self.input_dir.parent,
+            DirectoryStructure.RESPONSES_FOLLOWUP_WEBSITE_DIR_NAME,
+            ECIFollowupWebsiteRecord,
+            self.logger,
+            enabled=self.use_cache,
+        )
 
-        for idx, path in enumerate(self.html_files, 1):
-            self.logger.info(
-                f"Processing file {idx}/{len(self.html_files)}: {path.name}"
-            )
+        # Files not in the cache are processed by workers, which receive a
+        # copy of this processor; results in file order
+        processed = cache.extract(
+            list(enumerate(self.html_files, 1)),
+            page_path=lambda task: task[1],
+            inputs=lambda task: self._cache_inputs(task[1]),
+            extract_items=lambda missing: process_files(
+                _process_followup_file,
+                missing,
+                self.workers,
+                self.logger,
+                _processor_state,
+                (self,),
+                local_state=self,
+            ),
+        )
+        records = [record for record in processed if record is not None]
 
-            try:
-                record = self._process_html_file(path, self.response_data)
-                records.append(record)
-                self.logger.info(
-                    f"Successfully processed: {record.registration_number}"
-                )
-            except Exception as e:
-                self.logger.error(f"Error processing {path}: {e}", exc_info=True)
-                continue
+        cache.evict()
+        cache.log_summary()
 
         self._write_output_csv(records)
         self.logger.info(f"Processing complete. Output written to {self.output_csv}")
 
+    def _cache_inputs(self, path: Path) -> list:
+        """Inputs of a file's record besides its HTML, for the extraction cache."""
+        html_file_name = logical_page_path(path).name
+
+        # Row of the responses CSV the record takes its metadata from
+        match = re.match(r"^(\d{4})_(\d{6})_", html_file_name)
+        response_row = None
+        if match:
+            response_row = self.response_data.records.get("/".join(match.groups()))
+
+        # The follow-up dates are split into past and future ones by the date
+        # of the run, so records are only reused on the day they were extracted
+        run_date = datetime.now().date().isoformat()
+
+        return [html_file_name, response_row, run_date]
+
     def _process_html_file(
         self, path: Path, response_data: "ECIResponseDataLoader"
     ) -> ECIFollowupWebsiteRecord:
         """Process a single HTML file and return extracted record."""
-        with open(path, encoding=FILE_ENCODING) as f:
-            html_content = f.read()
+        # Parsed as stored, whether the page was saved raw, prettified or compressed
+        soup = read_page_soup(path)
 
-        html_file_name = path.name
+        html_file_name = logical_page_path(path).name
 
         # Create extractor with logger
-        extractor = FollowupWebsiteExtractor(html_content, logger=self.logger)
+        extractor = FollowupWebsiteExtractor(soup, logger=self.logger)
 
         # Extract and set registration number
         registration_number = extractor.extract_registration_number(html_file_name)
@@ -252,6 +294,33 @@ class ECIFollowupWebsiteProcessor:
                 writer.writerow(r.to_dict())
 
 
+def _processor_state(
+    logger: logging.Logger, processor: ECIFollowupWebsiteProcessor
+) -> ECIFollowupWebsiteProcessor:
+    """State of a worker process: the processor, logging to the worker logger"""
+    processor.logger = logger
+    return processor
+
+
+def _process_followup_file(
+    processor: ECIFollowupWebsiteProcessor, task
+) -> Optional[ECIFollowupWebsiteRecord]:
+    """Process one HTML file, logging instead of raising errors."""
+    idx, path = task
+
+    processor.logger.info(
+        f"Processing file {idx}/{len(processor.html_files)}: {path.name}"
+    )
+
+    try:
+        record = processor._process_html_file(path, processor.response_data)
+        processor.logger.info(f"Successfully processed: {record.registration_number}")
+        return record
+    except Exception as e:
+        processor.logger.error(f"Error processing {path}: {e}", exc_info=True)
+        return None
+
+
 class ECIResponseDataLoader:
     """Loads and provides access to ECI response data from CSV files."""
 
@@ -1,84 +1,300 @@
 # Python Standard Library
+import argparse
 import datetime
-from typing import Dict, Tuple
+import threading
+import time
+from typing import Dict, Optional, Tuple
 import os
 
 # Local
 from .crawler import scrape_all_initiatives_on_all_pages
-from .downloader import download_initiatives
-from .file_ops import setup_scraping_dirs, write_initiatives_csv
-from .statistics import display_completion_summary, gather_scraping_statistics
+from .downloader import download_initiative_stream, download_initiatives
+from .file_ops import (
+    append_initiatives_csv,
+    read_initiatives_csv,
+    setup_scraping_dirs,
+    write_initiatives_csv,
+)
+from .statistics import (
+    display_completion_summary,
+    gather_scraping_statistics,
+    telemetry,
+)
 from .browser import initialize_browser
+from .css_selectors import ECIinitiativeSelectors
 from .consts import (
     START_SCRAPING,
     SCRIPT_DIR,
     BASE_URL,
     DATA_DIR_NAME,
+    LOG_DIR_NAME,
     LISTINGS_DIR_NAME,
     PAGES_DIR_NAME,
     CSV_FILENAME,
+    HTTP_FIRST_FETCH,
+    DOWNLOAD_WORKERS,
+    DOWNLOAD_QUEUE_SIZE,
     LOG_MESSAGES,
 )
+from .rate_limiter import rate_controller
 from .scraper_logger import logger
+from ..scraper_shared.browser_session import browser_sessions
+from ..scraper_shared.http_fetcher import StaticPageFetcher
+from ..scraper_shared.incremental import create_page_store
+from ..scraper_shared.page_io import glob_pages, logical_page_path
+from ..scraper_shared.response_link_index import ResponseLinkIndex
+from ..scraper_shared.resume_journal import ResumeJournal, find_unfinished_session
+from ..scraper_shared.worker_pool import WorkStream
 
 
-def scrape_eci_initiatives() -> str:
+def scrape_eci_initiatives(resume: bool = False) -> str:
     """Main function to scrape European Citizens' Initiative data.
 
+    With resume, the latest unfinished session is reopened (see open_session())
+    and only the pages missing from its journal are downloaded.
+
+    Initiative pages are downloaded while the listing is still being
+    crawled, and browsers stay warm from the listing into the downloads.
+
+    Args:
+        resume: Continue the latest unfinished session, if there is one
+
+    Returns:
+        str: Timestamp string of the session scraped into
+    """
+    start_scraping, resumed = open_session(resume)
+
+    with browser_sessions.keep_alive(logger):
+        return _scrape_eci_initiatives(start_scraping, resumed)
+
+
+def open_session(resume: bool) -> Tuple[str, bool]:
+    """Select the session directory of this run.
+
+    A new session is named START_SCRAPING, and the log files are created
+    there when the modules are imported. A resumed session continues in its
+    own directory, so the log and telemetry files are moved into it.
+
+    Args:
+        resume: Reopen the latest unfinished session, if there is one
+
     Returns:
-        str: Timestamp string of when scraping started
+        Tuple of (session timestamp, whether it is a resumed session)
     """
+    if not resume:
+        return START_SCRAPING, False
+
+    data_dir = os.path.join(SCRIPT_DIR, DATA_DIR_NAME)
+    resumed_session = find_unfinished_session(data_dir, PAGES_DIR_NAME)
+
+    if not resumed_session:
+        logger.info("No unfinished session to resume, starting a new one")
+        return START_SCRAPING, False
+
+    log_dir = os.path.join(data_dir, resumed_session, LOG_DIR_NAME)
+    logger.move_to(log_dir)
+    telemetry.log_dir = log_dir
 
+    logger.info(f"Resuming unfinished session: {resumed_session}")
 
-    logger.info(LOG_MESSAGES["scraping_start"].format(timestamp=START_SCRAPING))
+    return resumed_session, True
+
+
+def _scrape_eci_initiatives(start_scraping: str, resumed: bool) -> str:
+    """Run the listing and download phases of scrape_eci_initiatives()."""
+
+    logger.info(LOG_MESSAGES["scraping_start"].format(timestamp=start_scraping))
 
     base_url = BASE_URL
 
     # Create directories relative to script location
     list_dir = os.path.join(
-        SCRIPT_DIR, DATA_DIR_NAME, START_SCRAPING, LISTINGS_DIR_NAME
+        SCRIPT_DIR, DATA_DIR_NAME, start_scraping, LISTINGS_DIR_NAME
     )
-    pages_dir = os.path.join(SCRIPT_DIR, DATA_DIR_NAME, START_SCRAPING, PAGES_DIR_NAME)
+    pages_dir = os.path.join(SCRIPT_DIR, DATA_DIR_NAME, start_scraping, PAGES_DIR_NAME)
     setup_scraping_dirs(list_dir, pages_dir)
 
-    driver = initialize_browser()
+    url_list_file = os.path.join(list_dir, CSV_FILENAME)
+    journal = ResumeJournal(pages_dir, logger=logger)
 
-    try:
-        # Scrape all pages and get accumulated initiative data
-        all_initiatives_catalog, saved_page_listing_paths = (
-            scrape_all_initiatives_on_all_pages(driver, base_url, list_dir)
-        )
-    finally:
-        driver.quit()
-        logger.info(LOG_MESSAGES["browser_closed"])
+    # The CSV of a run interrupted while crawling the listing is incomplete
+    if resumed and journal.listed and os.path.isfile(url_list_file):
 
-    if all_initiatives_catalog:
+        # Same catalog as the interrupted run, so its journal applies
+        all_initiatives_catalog = read_initiatives_csv(url_list_file)
+        saved_page_listing_paths = [
+            str(logical_page_path(path)) for path in glob_pages(list_dir, "*.html")
+        ]
+        logger.info(
+            "Reusing listings of the interrupted run: "
+            f"{len(all_initiatives_catalog)} initiatives"
+        )
         failed_urls = save_and_download_initiatives(
-            list_dir, pages_dir, all_initiatives_catalog
+            list_dir, pages_dir, all_initiatives_catalog, journal
         )
+
     else:
+        all_initiatives_catalog, saved_page_listing_paths, failed_urls = (
+            scrape_and_download_initiatives(base_url, list_dir, pages_dir, journal)
+        )
+
+    if not all_initiatives_catalog:
         logger.warning("No initiatives found to classify or download")
-        failed_urls = []
 
     display_completion_summary(
-        START_SCRAPING,
+        start_scraping,
         all_initiatives_catalog,
         saved_page_listing_paths,
         failed_urls,
     )
 
-    return START_SCRAPING
+    return start_scraping
+
+
+def scrape_and_download_initiatives(
+    base_url: str, list_dir: str, pages_dir: str, journal: ResumeJournal
+) -> Tuple[list, list, list]:
+    """Crawl the listings and download initiative pages as they are found.
+
+    Every parsed listing page is appended to the CSV and its initiatives are
+    queued for download right away, so detail pages are downloaded while
+    later listing pages are still loading. Once the listing is complete the
+    CSV is rewritten in listing order; at the end it gets the download times.
+
+    Args:
+        base_url: Base URL of the site
+        list_dir: Directory path for saving listing pages and the CSV
+        pages_dir: Directory path for saving HTML pages
+        journal: Resume journal of the session
+
+    Returns:
+        Tuple of (initiative data, saved listing page paths, failed URLs)
+    """
+
+    url_list_file = os.path.join(list_dir, CSV_FILENAME)
+
+    # Header only; also drops the partial CSV of an interrupted listing
+    write_initiatives_csv(url_list_file, [])
+
+    fetcher = create_static_fetcher()
+    incremental = create_page_store(pages_dir, logger=logger)
+    link_index = create_link_index(pages_dir, incremental)
+
+    rows = WorkStream(DOWNLOAD_QUEUE_SIZE)
+    queued: Dict[str, dict] = {}
+    queued_lock = threading.Lock()
+
+    def queue_listing_page(page_initiative_data: list) -> None:
+
+        # Pages crawled again after a fallback to "Next" repeat initiatives
+        with queued_lock:
+            new_rows = []
+
+            for row in page_initiative_data:
+                if row["url"] not in queued:
+                    new_rows.append((len(queued), row))
+                    queued[row["url"]] = row
+
+            append_initiatives_csv(url_list_file, [row for _, row in new_rows])
+
+        for indexed_row in new_rows:
+            rows.put(indexed_row)
+
+    downloads: dict = {"failed_urls": []}
+
+    def run_downloads() -> None:
+        try:
+            downloads["failed_urls"] = download_initiative_stream(
+                pages_dir,
+                rows,
+                fetcher=fetcher,
+                num_workers=DOWNLOAD_WORKERS,
+                incremental=incremental,
+                journal=journal,
+                link_index=link_index,
+            )
+        except BaseException as e:  # pylint: disable=broad-except
+            downloads["error"] = e
+
+    logger.info("Starting individual initiative pages download...")
+
+    started = time.monotonic()
+    download_thread = threading.Thread(
+        target=run_downloads, name="initiative-downloads"
+    )
+    download_thread.start()
+
+    try:
+        driver = initialize_browser()
+
+        try:
+            all_initiatives_catalog, saved_page_listing_paths = (
+                scrape_all_initiatives_on_all_pages(
+                    driver, base_url, list_dir, on_page=queue_listing_page
+                )
+            )
+        finally:
+            browser_sessions.release(driver)
+            logger.info(LOG_MESSAGES["browser_closed"])
+
+        listing_seconds = time.monotonic() - started
+
+        if all_initiatives_catalog:
+            write_initiatives_csv(url_list_file, all_initiatives_catalog)
+            logger.info(f"Initiative data saved to: {url_list_file}")
+            journal.mark_listed(len(all_initiatives_catalog))
+
+    finally:
+        # Lets the downloads finish what is queued, also after a listing error
+        rows.close()
+        download_thread.join()
+
+        if fetcher is not None:
+            fetcher.close()
+        if incremental is not None:
+            incremental.write_manifest()
+
+    if "error" in downloads:
+        raise downloads["error"]
+
+    logger.info(
+        f"Listing took {listing_seconds:.1f}s, downloads finished "
+        f"{time.monotonic() - started:.1f}s after the start"
+    )
+
+    if not all_initiatives_catalog:
+        return all_initiatives_catalog, saved_page_listing_paths, []
+
+    # Rows of a repeated page were downloaded through the first copy
+    for row in all_initiatives_catalog:
+        if not row.get("datetime") and row["url"] in queued:
+            row["datetime"] = queued[row["url"]].get("datetime", "")
+
+    write_initiatives_csv(url_list_file, all_initiatives_catalog)
+    logger.info(f"Updated CSV with download timestamps: {url_list_file}")
+
+    # Only now is the session complete; --resume no longer reopens it
+    journal.mark_finished()
+
+    return all_initiatives_catalog, saved_page_listing_paths, downloads["failed_urls"]
 
 
 def save_and_download_initiatives(
-    list_dir: str, pages_dir: str, initiative_data: list[Dict[str, str]]
+    list_dir: str,
+    pages_dir: str,
+    initiative_data: list[Dict[str, str]],
+    journal: Optional[ResumeJournal] = None,
 ) -> Tuple[int, list]:
     """Save initiative data to CSV and download individual pages.
 
+    Used when the catalog is already known (--resume after a complete
+    listing); otherwise scrape_and_download_initiatives() overlaps both.
+
     Args:
         list_dir: Directory path for saving CSV files
         pages_dir: Directory path for saving HTML pages
         initiative_data: List of initiative dictionaries
+        journal: Resume journal of the session (opened if not given)
 
     Returns:
         Tuple containing number of successful downloads and list of failed URLs
@@ -91,14 +307,75 @@ def save_and_download_initiatives(
     logger.info(f"Initiative data saved to: {url_list_file}")
 
     logger.info("Starting individual initiative pages download...")
-    updated_data, failed_urls = download_initiatives(pages_dir, initiative_data)
+
+    fetcher = create_static_fetcher()
+    incremental = create_page_store(pages_dir, logger=logger)
+    link_index = create_link_index(pages_dir, incremental)
+
+    if journal is None:
+        journal = ResumeJournal(pages_dir, logger=logger)
+
+    try:
+        updated_data, failed_urls = download_initiatives(
+            pages_dir,
+            initiative_data,
+            fetcher=fetcher,
+            num_workers=DOWNLOAD_WORKERS,
+            incremental=incremental,
+            journal=journal,
+            link_index=link_index,
+        )
+    finally:
+        if fetcher is not None:
+            fetcher.close()
+        if incremental is not None:
+            incremental.write_manifest()
 
     # Update CSV with download timestamps
     write_initiatives_csv(url_list_file, updated_data)
     logger.info(f"Updated CSV with download timestamps: {url_list_file}")
 
+    # Only now is the session complete; --resume no longer reopens it
+    journal.mark_finished()
+
     return failed_urls
 
 
+def create_static_fetcher() -> Optional[StaticPageFetcher]:
+    """Create the HTTP-first fetcher of initiative pages, if enabled."""
+
+    if not HTTP_FIRST_FETCH:
+        return None
+
+    return StaticPageFetcher(
+        [ECIinitiativeSelectors.INITIATIVE_PROGRESS],
+        logger=logger,
+        rate_controller=rate_controller,
+    )
+
+
+def create_link_index(pages_dir: str, incremental) -> ResponseLinkIndex:
+    """Create the response link index, reusing the previous session's entries."""
+
+    previous_pages_dir = incremental.previous_pages_dir if incremental else None
+
+    return ResponseLinkIndex(pages_dir, previous_pages_dir, logger=logger)
+
+
+def main(argv=None) -> str:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Scrape the European Citizens' Initiative registry."
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue the latest unfinished session instead of starting a new one",
+    )
+    args = parser.parse_args(argv)
+
+    return scrape_eci_initiatives(resume=args.resume)
+
+
 if __name__ == "__main__":
-    scrape_eci_initiatives()
\ No newline at end of file
+    main()
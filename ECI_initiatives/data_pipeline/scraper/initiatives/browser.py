@@ -1,21 +1,29 @@
 # Browser initialization and management
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 
 # Local
-from .consts import CHROME_OPTIONS, LOG_MESSAGES
+from .consts import BROWSER_ALLOWED_RESOURCES, CHROME_OPTIONS, LOG_MESSAGES
 from .scraper_logger import logger
+from ..scraper_shared.browser_factory import BrowserFactory
+from ..scraper_shared.browser_session import browser_sessions
+from ..scraper_shared.page_readiness import PageReadinessWaiter
+
+# Shared by the listing crawler and all download workers
+page_readiness = PageReadinessWaiter(logger=logger)
+browser_factory = BrowserFactory(
+    CHROME_OPTIONS, BROWSER_ALLOWED_RESOURCES, logger=logger
+)
 
 
 def initialize_browser() -> webdriver.Chrome:
-    """Initialize Chrome WebDriver with headless options."""
+    """Initialize Chrome WebDriver with headless options and resource blocking.
 
-    chrome_options = Options()
-    for option in CHROME_OPTIONS:
-        chrome_options.add_argument(option)
+    A warm driver left by an earlier phase is reused when there is one; give
+    the driver back with browser_sessions.release() instead of quitting it.
+    """
 
     logger.info(LOG_MESSAGES["browser_init"])
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = browser_sessions.acquire(browser_factory)
     logger.debug(LOG_MESSAGES["browser_success"])
 
     return driver
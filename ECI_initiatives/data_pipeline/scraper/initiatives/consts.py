@@ -5,16 +5,15 @@ Module-specific settings for scraping the main ECI initiatives listings.
 Common settings are imported from scraper_shared.const.py
 
 Note on Fine-Tuning:
-    The timing configurations (WAIT_BETWEEN_*, RETRY_WAIT_BASE) and retry limits
+    The starting request rate (INITIAL_REQUEST_RATE) and retry limits
     (DEFAULT_MAX_RETRIES) can be adjusted based on:
     - Server load and response times
     - Rate limiting policies of the target website
     - Network conditions and infrastructure changes
     - Other development teams' usage patterns
 
-    If you experience frequent rate limiting or timeouts, consider increasing
-    wait times and retry intervals. For faster, more stable servers, you may
-    reduce these values to speed up scraping.
+    The rate adapts itself during a run (see scraper_shared.rate_controller);
+    the initial value only decides how fast the first requests are sent.
 """
 
 import datetime
@@ -26,7 +25,9 @@ from ..scraper_shared.const import (
     DATA_DIR_NAME,
     LOG_DIR_NAME,
     CHROME_OPTIONS,
-    WAIT_DYNAMIC_CONTENT,
+    HTTP_FIRST_FETCH,
+    DOWNLOAD_WORKERS,
+    INCREMENTAL_SCRAPING,
     WEBDRIVER_TIMEOUT_DEFAULT,
     WEBDRIVER_TIMEOUT_CONTENT,
     MIN_HTML_LENGTH,
@@ -34,24 +35,37 @@ from ..scraper_shared.const import (
     SCRIPT_DIR,
 )
 
-# Scraping timestamp (unique to initiatives scraper as it runs first)
-START_SCRAPING = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-
 # Routes (initiatives-specific)
 ROUTE_FIND_INITIATIVE = "/find-initiative_en"
+# Listing pages after the first are requested directly, in parallel; the page
+# index starts at 0 for the first page (Drupal pager convention)
+LISTING_PAGE_QUERY = "?page={page_index}"
 
 # Module-specific Directory Names
 LISTINGS_DIR_NAME = "listings"
 PAGES_DIR_NAME = "initiatives"
 
+# Scraping timestamp (unique to initiatives scraper as it runs first)
+# With --resume, __main__ reopens the latest unfinished session instead and
+# moves the log files there (see open_session())
+START_SCRAPING = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
 # Log directory path
 LOG_DIR = os.path.join(SCRIPT_DIR, DATA_DIR_NAME, START_SCRAPING, LOG_DIR_NAME)
 
-# Module-specific Timing Configuration (in seconds)
-# Fine-tune these based on server response times and rate limiting behavior
-WAIT_BETWEEN_PAGES = (1.0, 2.0)  # Delay between pagination clicks
-WAIT_BETWEEN_DOWNLOADS = (0.5, 1.5)  # Delay between downloading individual pages
-RETRY_WAIT_BASE = (1.0, 1.2)  # Base time for retry exponential backoff
+# Browser Resource Allowlist (categories of BLOCKED_RESOURCE_PATTERNS)
+# Stylesheets stay loaded: the 'Next' button fallback of the listing crawler
+# waits for the button to be clickable, which depends on the page layout
+BROWSER_ALLOWED_RESOURCES = ["stylesheet"]
+
+# Listing/Download Pipeline
+# Initiatives found on a listing page are queued for download right away; the
+# listing crawler waits when this many pages are queued and not yet started
+DOWNLOAD_QUEUE_SIZE = 50
+
+# Module-specific Rate Configuration (requests per second)
+# Shared by pagination clicks and page downloads, adapted during the run
+INITIAL_REQUEST_RATE = 1.0
 
 # Module-specific File Naming Patterns
 LISTING_PAGE_FILENAME_PATTERN = (
@@ -84,6 +98,8 @@ LOG_MESSAGES = {
     "page_saved": "Page {page} saved to: {path}",
     "next_button_found": "Found 'Next' button on page {page}, navigating to page {next_page}",
     "last_page": "No 'Next' button found on page {page}. This appears to be the last page.",
+    "listing_page_count": "Listing has {page_count} pages, requesting pages 2-{page_count} directly",
+    "listing_direct_unsupported": "Page {page} requested as {query} did not list its own initiatives. Following 'Next' instead.",
     "download_success": "✅ Successfully downloaded: {filename}",
     "rate_limit_retry": "⚠️  Received rate limiting. Retrying {retry}/{max_retries} in {wait_time:.1f} seconds...",
     "pages_browser_closed": "Individual pages browser closed",
@@ -1,39 +1,54 @@
 # Python Standard Library
-import random
 import time
-from typing import Dict, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 # Third-party
-from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 # Local
-from .browser import initialize_browser
+from .browser import browser_factory, initialize_browser, page_readiness
 from .file_ops import save_listing_page
-from .data_parser import parse_initiatives_list_data
+from .data_parser import parse_initiatives_list_data, parse_listing_page_count
 from .css_selectors import ECIlistingSelectors
 from .consts import (
     ROUTE_FIND_INITIATIVE,
-    WAIT_DYNAMIC_CONTENT,
-    WAIT_BETWEEN_PAGES,
+    LISTING_PAGE_QUERY,
+    DOWNLOAD_WORKERS,
     WEBDRIVER_TIMEOUT_DEFAULT,
     LOG_MESSAGES,
 )
+from .rate_limiter import rate_controller
 from .scraper_logger import logger
+from ..scraper_shared.browser_session import browser_sessions
+from ..scraper_shared.page_io import write_page
+from ..scraper_shared.worker_pool import BrowserWorkerPool
 
 
 def scrape_all_initiatives_on_all_pages(
-    driver: webdriver.Chrome, base_url: str, list_dir: str
+    driver: webdriver.Chrome,
+    base_url: str,
+    list_dir: str,
+    num_workers: int = DOWNLOAD_WORKERS,
+    on_page: Optional[Callable[[list], None]] = None,
 ) -> Tuple[list, list]:
-    """Scrape all pages of initiatives on the listings by iterating through pagination.
+    """Scrape all pages of initiatives on the listings.
+
+    The first page gives the total page count; the other pages are then
+    requested directly by URL, in parallel. If the page count cannot be read
+    or the listing ignores the page query, the pagination is followed by
+    clicking "Next" instead.
 
     Args:
         driver: Chrome WebDriver instance
         base_url: Base URL of the site
         list_dir: Directory to save page HTML files
+        num_workers: Number of parallel workers for the direct requests
+        on_page: Called with the initiative data of each listing page as
+            soon as it is parsed, in completion order (feeds the downloads).
+            Pages fetched before a fallback to "Next" may be reported again.
 
     Returns:
         Tuple containing:
@@ -41,8 +56,6 @@ def scrape_all_initiatives_on_all_pages(
         - List of paths to saved HTML files
     """
     url_find_initiative = base_url + ROUTE_FIND_INITIATIVE
-    all_initiative_pages = []
-    saved_page_paths = []
     current_page = 1
 
     logger.info(f"Starting pagination scraping from: {url_find_initiative}")
@@ -51,9 +64,40 @@ def scrape_all_initiatives_on_all_pages(
     logger.info(f"Loading page {current_page}: {url_find_initiative}")
     driver.get(url_find_initiative)
 
-    while True:
+    page_initiative_data, page_path = scrape_single_listing_page(
+        driver, base_url, list_dir, current_page
+    )
+    all_initiative_pages = list(page_initiative_data)
+    saved_page_paths = [page_path]
+
+    if on_page is not None:
+        on_page(page_initiative_data)
+
+    page_count = parse_listing_page_count(driver.page_source)
+
+    if page_count > 1:
+
+        other_pages = scrape_listing_pages_directly(
+            base_url, list_dir, page_count, page_initiative_data, num_workers, on_page
+        )
+
+        if other_pages is not None:
+
+            for page_initiative_data, page_path in other_pages:
+                all_initiative_pages.extend(page_initiative_data)
+                saved_page_paths.append(page_path)
+
+            logger.info(
+                f"Completed scraping {page_count} pages with total of "
+                f"{len(all_initiative_pages)} initiatives"
+            )
+            return all_initiative_pages, saved_page_paths
+
+    # Follow the pagination one page at a time
+    while navigate_to_next_page(driver, current_page):
+
+        current_page += 1
 
-        # Scrape current page
         page_initiative_data, page_path = scrape_single_listing_page(
             driver, base_url, list_dir, current_page
         )
@@ -62,11 +106,8 @@ def scrape_all_initiatives_on_all_pages(
         all_initiative_pages.extend(page_initiative_data)
         saved_page_paths.append(page_path)
 
-        # Try to navigate to next page
-        if navigate_to_next_page(driver, current_page):
-            current_page += 1
-        else:
-            break
+        if on_page is not None:
+            on_page(page_initiative_data)
 
     logger.info(
         f"Completed scraping {current_page} pages with total of "
@@ -75,6 +116,81 @@ def scrape_all_initiatives_on_all_pages(
     return all_initiative_pages, saved_page_paths
 
 
+def scrape_listing_pages_directly(
+    base_url: str,
+    list_dir: str,
+    page_count: int,
+    first_page_data: list,
+    num_workers: int = 1,
+    on_page: Optional[Callable[[list], None]] = None,
+) -> Optional[List[Tuple[list, str]]]:
+    """Request listing pages 2..page_count by URL, in parallel.
+
+    Each worker opens its own browser; requests are paced by the shared
+    rate controller, like the pagination clicks were. Every page is checked
+    as soon as it is parsed; pages are passed to on_page until one fails.
+
+    Returns:
+        List of (initiative data, saved page path) in page order, or None if
+        the listing ignores the page query (a page is empty or repeats page 1)
+    """
+    logger.info(LOG_MESSAGES["listing_page_count"].format(page_count=page_count))
+
+    first_page_urls = {row["url"] for row in first_page_data}
+
+    def open_worker() -> dict:
+        return {"driver": initialize_browser()}
+
+    def close_worker(worker: dict) -> None:
+        browser_sessions.release(worker["driver"])
+
+    def scrape_page(worker: dict, current_page: int) -> Tuple[list, str]:
+
+        page_url = (
+            base_url
+            + ROUTE_FIND_INITIATIVE
+            + LISTING_PAGE_QUERY.format(page_index=current_page - 1)
+        )
+
+        time.sleep(rate_controller.reserve())
+        logger.info(f"Loading page {current_page}: {page_url}")
+        worker["driver"] = browser_sessions.refresh(worker["driver"])
+        worker["driver"].get(page_url)
+
+        return scrape_single_listing_page(
+            worker["driver"], base_url, list_dir, current_page
+        )
+
+    # Pages that did not list their own initiatives
+    rejected_pages = []
+
+    def check_page(current_page: int, result: Tuple[list, str]) -> None:
+
+        page_initiative_data, _ = result
+        page_urls = {row["url"] for row in page_initiative_data}
+
+        if not page_urls or page_urls & first_page_urls:
+            rejected_pages.append(current_page)
+
+        elif on_page is not None and not rejected_pages:
+            on_page(page_initiative_data)
+
+    pages = list(range(2, page_count + 1))
+    results = BrowserWorkerPool(num_workers, logger).map(
+        pages, scrape_page, open_worker, close_worker, on_result=check_page
+    )
+
+    if rejected_pages:
+        logger.warning(
+            LOG_MESSAGES["listing_direct_unsupported"].format(
+                page=min(rejected_pages), query=LISTING_PAGE_QUERY
+            )
+        )
+        return None
+
+    return results
+
+
 def scrape_single_listing_page(
     driver: webdriver.Chrome, base_url: str, list_dir: str, current_page: int
 ) -> Tuple[list, str]:
@@ -82,9 +198,13 @@ def scrape_single_listing_page(
 
     # Wait for page elements to load
     wait_for_listing_page_content(driver, current_page)
+    page_readiness.wait(
+        driver, f"listing page {current_page}", [ECIlistingSelectors.INITIATIVE_CARDS]
+    )
 
     # Save page source
     page_source, page_path = save_listing_page(driver, list_dir, current_page)
+    browser_factory.record_page(driver)
 
     # Parse initiatives from current page
     page_initiative_data = parse_initiatives_list_data(page_source, base_url)
@@ -127,8 +247,9 @@ def navigate_to_next_page(driver: webdriver.Chrome, current_page: int) -> bool:
         )
         # Click the next button
         driver.execute_script("arguments[0].click();", next_button)
-        # Wait a bit for the page to start loading
-        time.sleep(random.uniform(*WAIT_BETWEEN_PAGES))
+        # Pace pagination through the shared rate controller; the pause
+        # also lets the next page start loading
+        time.sleep(rate_controller.reserve())
         return True
 
     except Exception:
@@ -166,17 +287,13 @@ def scrape_initiatives_page(
             f"No initiatives found or timeout: {e} - continuing with current content"
         )
 
-    # Additional wait to ensure all dynamic content is loaded
-    random_time = random.uniform(*WAIT_DYNAMIC_CONTENT)
-    logger.debug(f"Waiting {random_time:.1f}s for dynamic content...")
-    time.sleep(random_time)
+    # Wait until the DOM has settled
+    page_readiness.wait(driver, url_find_initiative)
 
     page_source = driver.page_source
     main_page_path = os.path.join(list_dir, LISTING_PAGE_MAIN_FILENAME)
 
-    with open(main_page_path, "w", encoding="utf-8") as f:
-        pretty_html = BeautifulSoup(page_source, "html.parser").prettify()
-        f.write(pretty_html)
+    write_page(main_page_path, page_source)
 
     logger.info(f"Main page saved to: {main_page_path}")
     return page_source, main_page_path
@@ -31,6 +31,9 @@ class ECIlistingSelectors:
     PAGINATION_LINKS = (
         "ul.ecl-pagination__list li.ecl-pagination__item a.ecl-pagination__link"
     )
+    PAGINATION_SUMMARY = (  # "Page 1 of 13"
+        "li.ecl-pagination__item--current span.ecl-pagination__text--full"
+    )
 
     # Content parsing
     CONTENT_BLOCKS = "div.ecl-content-block.ecl-content-item__content-block"
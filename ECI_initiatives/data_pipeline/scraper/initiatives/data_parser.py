@@ -1,4 +1,5 @@
 # Python Standard Library
+import re
 from collections import Counter
 from typing import Dict, List
 
@@ -17,10 +18,6 @@ from .consts import (
     LOG_DIR_NAME,
     LISTINGS_DIR_NAME,
     PAGES_DIR_NAME,
-    WAIT_DYNAMIC_CONTENT,
-    WAIT_BETWEEN_PAGES,
-    WAIT_BETWEEN_DOWNLOADS,
-    RETRY_WAIT_BASE,
     WEBDRIVER_TIMEOUT_DEFAULT,
     WEBDRIVER_TIMEOUT_CONTENT,
     CHROME_OPTIONS,
@@ -88,3 +85,29 @@ def parse_initiatives_list_data(
 
     logger.info(f"Found {len(initiative_data)} initiative entries")
     return initiative_data
+
+
+def parse_listing_page_count(page_source: str) -> int:
+    """Read the total number of listing pages from the pagination.
+
+    Returns:
+        int: Number of pages, or 0 if the pagination could not be read
+    """
+
+    soup = BeautifulSoup(page_source, "html.parser")
+
+    # "Page 1 of 13" also covers a pagination shortened with an ellipsis
+    summary = soup.select_one(ECIlistingSelectors.PAGINATION_SUMMARY)
+    if summary:
+        match = re.search(r"of\s+(\d+)", summary.get_text(" ", strip=True))
+        if match:
+            return int(match.group(1))
+
+    page_numbers = [
+        int(link.get_text(strip=True))
+        for link in soup.select(ECIlistingSelectors.PAGINATION_LINKS)
+        if link.get_text(strip=True).isdigit()
+    ]
+
+    # Without any page link the listing fits on the current page
+    return max(page_numbers, default=0)
@@ -1,9 +1,8 @@
 # Python Standard Library
 import datetime
 import os
-import random
 import time
-from typing import Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 # Third-party
 from bs4 import BeautifulSoup
@@ -13,62 +12,409 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 # Local
-from .browser import initialize_browser
+from .browser import browser_factory, initialize_browser, page_readiness
 from .css_selectors import ECIinitiativeSelectors
 from .consts import (
-    WAIT_DYNAMIC_CONTENT,
-    WAIT_BETWEEN_DOWNLOADS,
-    RETRY_WAIT_BASE,
     WEBDRIVER_TIMEOUT_CONTENT,
     DEFAULT_MAX_RETRIES,
     MIN_HTML_LENGTH,
     RATE_LIMIT_INDICATORS,
     LOG_MESSAGES,
 )
-from .file_ops import save_initiative_page
+from .file_ops import initiative_page_path, save_initiative_page
+from .rate_limiter import rate_controller
 from .scraper_logger import logger
-
-
-def download_initiatives(pages_dir: str, initiative_data: list) -> Tuple[list, list]:
-    """Download individual initiative pages using Selenium.
+from .statistics import telemetry
+from ..scraper_shared.browser_session import browser_sessions
+from ..scraper_shared.const import DEFERRED_RETRIES
+from ..scraper_shared.http_fetcher import StaticPageFetcher
+from ..scraper_shared.incremental import IncrementalStore
+from ..scraper_shared.page_io import find_page
+from ..scraper_shared.page_validator import scan_page
+from ..scraper_shared.rate_controller import is_rate_limit_error
+from ..scraper_shared.response_link_index import ResponseLinkIndex
+from ..scraper_shared.resume_journal import ResumeJournal
+from ..scraper_shared.telemetry import PageSpan
+from ..scraper_shared.worker_pool import BrowserWorkerPool, RetryLater, WorkStream
+
+
+def download_initiatives(
+    pages_dir: str,
+    initiative_data: list,
+    fetcher: Optional[StaticPageFetcher] = None,
+    num_workers: int = 1,
+    incremental: Optional[IncrementalStore] = None,
+    journal: Optional[ResumeJournal] = None,
+    link_index: Optional[ResponseLinkIndex] = None,
+) -> Tuple[list, list]:
+    """Download individual initiative pages, over HTTP first and Selenium as fallback.
 
     Args:
         pages_dir: Directory path for saving HTML pages
         initiative_data: List of initiative dictionaries
+        fetcher: Optional HTTP-first fetcher; Chrome is started only for
+            pages it cannot serve
+        num_workers: Number of parallel workers, each with its own browser
+        incremental: Optional store carrying unchanged pages forward from
+            the previous session
+        journal: Optional resume journal; pages it lists as completed are
+            skipped, and every page completed now is appended to it
+        link_index: Optional side-car index every saved page is recorded in,
+            read by the responses scraper
 
     Returns:
         Tuple containing updated data list and list of failed URLs
     """
-    updated_data = []
-    failed_urls = []
+    total = len(initiative_data)
 
-    driver = initialize_browser()
+    pending = [
+        (i, row)
+        for i, row in enumerate(initiative_data)
+        if not is_resumed_page(pages_dir, row, journal, incremental)
+    ]
+
+    if len(pending) < total:
+        logger.info(
+            f"Skipping {total - len(pending)} pages completed before the interruption"
+        )
+
+    open_worker, close_worker, process_row = initiative_download_worker(
+        pages_dir, lambda: total, fetcher, incremental, journal, link_index
+    )
 
     try:
+        results = BrowserWorkerPool(num_workers, logger).map(
+            pending, process_row, open_worker, close_worker
+        )
 
-        for i, row in enumerate(initiative_data):
+    finally:
+        log_download_summaries(fetcher)
 
-            url = row["url"]
-            logger.info(f"Processing {i+1}/{len(initiative_data)}: {url}")
+    # Rows are updated in place, so the CSV keeps the listing order
+    updated_data = list(initiative_data)
+    failed_urls = [
+        row["url"] for (_, row), success in zip(pending, results) if not success
+    ]
+
+    logger.info(f"Download completed. Failed URLs: {len(failed_urls)}")
+    return updated_data, failed_urls
 
-            success = download_single_initiative(driver, pages_dir, url)
 
-            if success:
+def download_initiative_stream(
+    pages_dir: str,
+    rows: WorkStream,
+    fetcher: Optional[StaticPageFetcher] = None,
+    num_workers: int = 1,
+    incremental: Optional[IncrementalStore] = None,
+    journal: Optional[ResumeJournal] = None,
+    link_index: Optional[ResponseLinkIndex] = None,
+) -> list:
+    """Download initiative pages as the listing crawler discovers them.
+
+    Works like download_initiatives(), but rows arrive through a stream fed
+    while later listing pages are still loading. Blocks until the stream is
+    closed and drained, so it runs in its own thread.
 
-                row["datetime"] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                time.sleep(random.uniform(*WAIT_BETWEEN_DOWNLOADS))
+    Args:
+        pages_dir: Directory path for saving HTML pages
+        rows: Stream of (index, initiative dictionary); rows get their
+            download time in place
+        fetcher: Optional HTTP-first fetcher
+        num_workers: Number of parallel workers, each with its own browser
+        incremental: Optional store carrying unchanged pages forward
+        journal: Optional resume journal, as in download_initiatives()
+        link_index: Optional side-car index, as in download_initiatives()
 
-            else:
-                failed_urls.append(url)
+    Returns:
+        List of failed URLs, in the order the rows were streamed
+    """
+    open_worker, close_worker, download_row = initiative_download_worker(
+        pages_dir, lambda: rows.count, fetcher, incremental, journal, link_index
+    )
+    resumed = []
+
+    def process_row(worker: dict, indexed_row: Tuple[int, dict]) -> Tuple[str, bool]:
+
+        _, row = indexed_row
+
+        if is_resumed_page(pages_dir, row, journal, incremental):
+            resumed.append(row["url"])
+            return row["url"], True
 
-            updated_data.append(row)
+        return row["url"], download_row(worker, indexed_row)
+
+    try:
+        results = BrowserWorkerPool(num_workers, logger).consume(
+            rows, process_row, open_worker, close_worker
+        )
 
     finally:
-        driver.quit()
-        logger.info(LOG_MESSAGES["pages_browser_closed"])
+        log_download_summaries(fetcher)
+
+    if resumed:
+        logger.info(f"Skipped {len(resumed)} pages completed before the interruption")
+
+    failed_urls = [url for url, success in results if not success]
 
     logger.info(f"Download completed. Failed URLs: {len(failed_urls)}")
-    return updated_data, failed_urls
+    return failed_urls
+
+
+def initiative_download_worker(
+    pages_dir: str,
+    total: Callable[[], int],
+    fetcher: Optional[StaticPageFetcher] = None,
+    incremental: Optional[IncrementalStore] = None,
+    journal: Optional[ResumeJournal] = None,
+    link_index: Optional[ResponseLinkIndex] = None,
+) -> Tuple[Callable, Callable, Callable]:
+    """Build the worker callbacks shared by the list and stream downloads.
+
+    Args:
+        pages_dir: Directory path for saving HTML pages
+        total: Returns the number of rows known so far, for progress logs
+        fetcher: Optional HTTP-first fetcher
+        incremental: Optional store carrying unchanged pages forward
+        journal: Optional resume journal
+        link_index: Optional side-car index of saved pages
+
+    Returns:
+        Tuple of (open_worker, close_worker, process_row) for BrowserWorkerPool
+    """
+
+    # Spans of pages queued for a retry, by URL; a page is only ever handled
+    # by one worker at a time
+    deferred: Dict[str, PageSpan] = {}
+
+    def open_worker() -> dict:
+        # Browser is started lazily, only once a page needs it
+        return {"driver": None}
+
+    def close_worker(worker: dict) -> None:
+        if worker["driver"] is not None:
+            browser_sessions.release(worker["driver"])
+            logger.info(LOG_MESSAGES["pages_browser_closed"])
+
+    def process_row(worker: dict, indexed_row: Tuple[int, dict]) -> bool:
+
+        i, row = indexed_row
+        url = row["url"]
+
+        # A retried page continues its span, and skips the HTTP attempt
+        span = deferred.pop(url, None)
+        retrying = span is not None
+
+        if retrying:
+            logger.info(f"Retrying {i+1}/{total()}: {url}")
+        else:
+            logger.info(f"Processing {i+1}/{total()}: {url}")
+            span = telemetry.page(url)
+
+        # Request rate is shared by all workers
+        with span.phase("rate_wait"):
+            time.sleep(rate_controller.reserve())
+
+        success = (
+            not retrying
+            and fetcher is not None
+            and download_static_initiative(
+                fetcher, pages_dir, url, incremental, link_index, span
+            )
+        )
+
+        if not success:
+
+            if worker["driver"] is None:
+                worker["driver"] = initialize_browser()
+            else:
+                # Replaces a crashed or worn-out browser
+                worker["driver"] = browser_sessions.refresh(worker["driver"])
+
+            # The HTTP attempt used up the reserved slot
+            if fetcher is not None and not retrying:
+                with span.phase("rate_wait"):
+                    time.sleep(rate_controller.reserve())
+
+            try:
+                success = download_single_initiative(
+                    worker["driver"],
+                    pages_dir,
+                    url,
+                    span=span,
+                    defer_retries=DEFERRED_RETRIES,
+                    link_index=link_index,
+                )
+
+            except RetryLater:
+                deferred[url] = span
+                raise
+
+            if success and incremental is not None:
+                incremental.record_download(url, initiative_page_path(url))
+
+        if success:
+            rate_controller.record_success()
+            row["datetime"] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            if journal is not None:
+                journal.record(url, row["datetime"])
+
+        span.finish(success)
+
+        return success
+
+    return open_worker, close_worker, process_row
+
+
+def log_download_summaries(fetcher: Optional[StaticPageFetcher] = None) -> None:
+    """Log the fetch, rate, readiness, blocking and timing summaries of a download run."""
+
+    if fetcher is not None:
+        fetcher.log_summary()
+    rate_controller.log_summary()
+    page_readiness.log_summary()
+    browser_factory.log_summary()
+    telemetry.log_summary()
+
+
+def is_resumed_page(
+    pages_dir: str,
+    row: dict,
+    journal: Optional[ResumeJournal],
+    incremental: Optional[IncrementalStore] = None,
+) -> bool:
+    """Take over a page completed by an interrupted run of the same session.
+
+    The page counts as completed only if the journal lists it and its file
+    is still there. Its completion time is restored into the row, and it is
+    recorded in the incremental manifest rewritten by this run.
+
+    Returns:
+        bool: True if the page does not need to be downloaded again
+    """
+
+    url = row["url"]
+
+    if journal is None or not journal.is_completed(url):
+        return False
+
+    relative_path = initiative_page_path(url)
+
+    if find_page(os.path.join(pages_dir, relative_path)) is None:
+        return False
+
+    row["datetime"] = journal.completed[url]
+
+    if incremental is not None:
+        incremental.record_download(url, relative_path)
+
+    return True
+
+
+def download_static_initiative(
+    fetcher: StaticPageFetcher,
+    pages_dir: str,
+    url: str,
+    incremental: Optional[IncrementalStore] = None,
+    link_index: Optional[ResponseLinkIndex] = None,
+    span: Optional[PageSpan] = None,
+) -> bool:
+    """Download a single initiative page over plain HTTP.
+
+    With an incremental store the request is conditional, and a page the
+    server reports as not modified is carried forward from the previous session.
+
+    Returns:
+        bool: True if the page was saved, False if the browser is needed
+    """
+
+    span = span or PageSpan(url)
+    relative_path = initiative_page_path(url)
+    headers = incremental.conditional_headers(relative_path) if incremental else None
+
+    with span.phase("navigate"):
+        static_page = fetcher.fetch(url, headers=headers)
+
+    if static_page is not None and static_page.not_modified:
+
+        if incremental.carry_forward(url, relative_path):
+            logger.info(f"♻️  Unchanged since previous session: {relative_path}")
+            index_initiative_page(link_index, url, carried_forward=True)
+            span.source = "carried_forward"
+            return True
+
+        with span.phase("navigate"):
+            static_page = fetcher.fetch(url)
+
+    if static_page is None or static_page.gone:
+        return False
+
+    # Scanned by the fetcher already
+    report = static_page.report or scan_page(static_page.page_source)
+
+    try:
+        with span.phase("save"):
+            file_name = save_initiative_page(
+                pages_dir, url, static_page.page_source, report
+            )
+
+    except Exception as e:
+        fetcher.record_fallback(url, str(e))
+        return False
+
+    span.source = "http"
+    span.bytes = report.size
+
+    if incremental is not None:
+        incremental.record_download(
+            url, relative_path, static_page.etag, static_page.last_modified
+        )
+
+    index_initiative_page(
+        link_index, url, static_page.page_source, soup=static_page.soup
+    )
+
+    logger.info(LOG_MESSAGES["download_success"].format(filename=file_name))
+    return True
+
+
+def index_initiative_page(
+    link_index: Optional[ResponseLinkIndex],
+    url: str,
+    page_source: Optional[str] = None,
+    soup: Optional[BeautifulSoup] = None,
+    carried_forward: bool = False,
+) -> None:
+    """Record a saved page in the response link index.
+
+    The page is indexed from memory: the DOM parsed by the HTTP fetcher is
+    reused, and the source just saved is parsed otherwise. A failure is only
+    logged: the responses scraper then parses the page itself.
+
+    Args:
+        link_index: Index to record the page in (nothing is done if None)
+        url: Initiative page URL
+        page_source: HTML of the page as saved
+        soup: Page already parsed from page_source, if it was
+        carried_forward: True if the page was carried forward unchanged
+    """
+    if link_index is None:
+        return
+
+    relative_path = initiative_page_path(url)
+
+    try:
+        if carried_forward:
+            link_index.record_carried_forward(url, relative_path)
+
+        elif soup is not None:
+            link_index.record(url, relative_path, soup)
+
+        else:
+            link_index.record_source(url, relative_path, page_source)
+
+    except Exception as e:
+        logger.warning(f"Could not index response link of {relative_path}: {e}")
 
 
 def download_single_initiative(
@@ -76,33 +422,64 @@ def download_single_initiative(
     pages_dir: str,
     url: str,
     max_retries: int = DEFAULT_MAX_RETRIES,
+    span: Optional[PageSpan] = None,
+    defer_retries: bool = False,
+    link_index: Optional[ResponseLinkIndex] = None,
 ) -> bool:
     """Download a single initiative page with retry logic.
 
+    The retry count continues from span.retries, so a page given back to the
+    worker pool resumes where its previous attempt left off.
+
+    Args:
+        driver: Browser to load the page in
+        pages_dir: Directory path for saving HTML pages
+        url: Initiative page URL
+        max_retries: Maximum number of retries after rate limiting
+        span: Timings of the page (a throwaway span by default)
+        defer_retries: Raise RetryLater instead of sleeping before a retry
+        link_index: Optional side-car index of saved pages
+
     Returns:
         bool: True if successful, False if failed
+
+    Raises:
+        RetryLater: With defer_retries, when the page should be retried
     """
 
-    retry_wait_base = 1 * random.uniform(*RETRY_WAIT_BASE)
-    retry_count = 0
+    span = span or PageSpan(url)
+    retry_count = span.retries
 
     while retry_count <= max_retries:
         try:
             logger.info("Downloading the html file...")
-            driver.get(url)
+            with span.phase("navigate"):
+                driver.get(url)
 
             # Check for rate limiting
-            check_rate_limiting(driver)
+            with span.phase("rate_limit_check"):
+                check_rate_limiting(driver)
 
-            # Wait for page content to load
-            wait_for_page_content(driver)
+            with span.phase("readiness"):
+                # Wait for page content to load
+                wait_for_page_content(driver)
 
-            # Additional wait for dynamic content
-            time.sleep(random.uniform(*WAIT_DYNAMIC_CONTENT))
+                # Wait until the DOM has settled
+                page_readiness.wait(driver, url)
 
             # Get page source and save
             page_source = driver.page_source
-            file_name = save_initiative_page(pages_dir, url, page_source)
+            report = scan_page(page_source)
+            with span.phase("save"):
+                file_name = save_initiative_page(pages_dir, url, page_source, report)
+
+            span.source = "browser"
+            span.bytes = report.size
+
+            index_initiative_page(link_index, url, page_source)
+
+            # Count blocked resources of the page
+            browser_factory.record_page(driver)
 
             logger.info(LOG_MESSAGES["download_success"].format(filename=file_name))
             return True
@@ -110,9 +487,7 @@ def download_single_initiative(
         except Exception as e:
 
             error_msg = str(e)
-            is_rate_limited = any(
-                indicator in error_msg for indicator in RATE_LIMIT_INDICATORS
-            )
+            is_rate_limited = is_rate_limit_error(error_msg)
 
             logger.debug(
                 f"🔍 Exception details for {url}: {type(e).__name__}: {error_msg}"
@@ -124,7 +499,18 @@ def download_single_initiative(
 
                 if retry_count <= max_retries:
 
-                    wait_time = retry_wait_base * (retry_count**2)
+                    span.retries += 1
+
+                    # Backs off through the shared rate, not a local formula
+                    if defer_retries:
+                        wait_time = rate_controller.backoff_delay(
+                            retry_count - 1, rate_limited=True
+                        )
+                    else:
+                        wait_time = rate_controller.retry_delay(
+                            retry_count - 1, rate_limited=True
+                        )
+
                     logger.warning(
                         LOG_MESSAGES["rate_limit_retry"].format(
                             retry=retry_count,
@@ -132,10 +518,17 @@ def download_single_initiative(
                             wait_time=wait_time,
                         )
                     )
-                    time.sleep(wait_time)
+
+                    # The worker downloads other pages meanwhile
+                    if defer_retries:
+                        raise RetryLater(wait_time)
+
+                    with span.phase("rate_wait"):
+                        time.sleep(wait_time)
 
                 else:
 
+                    rate_controller.record_rate_limited()
                     error_type = type(e).__name__
 
                     # Categorize different types of errors for better logging
@@ -1,24 +1,22 @@
 # Python Standard Library
 import csv
 import os
-import random
-import time
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Third-party
-from bs4 import BeautifulSoup
 from selenium import webdriver
 
 # Local
 from .consts import (
-    WAIT_DYNAMIC_CONTENT,
     CSV_FIELDNAMES,
-    MIN_HTML_LENGTH,
     RATE_LIMIT_INDICATORS,
     LISTING_PAGE_FILENAME_PATTERN,
+    INITIATIVE_PAGE_FILENAME_PATTERN,
     LOG_MESSAGES,
 )
 from .scraper_logger import logger
+from ..scraper_shared.page_io import write_page
+from ..scraper_shared.page_validator import PageReport, scan_page
 
 
 def setup_scraping_dirs(list_dir: str, pages_dir: str) -> None:
@@ -34,81 +32,70 @@ def save_listing_page(
 ) -> Tuple[str, str]:
     """Save listing page source and return page source and file path."""
 
-    # Additional wait for dynamic content
-    random_time = random.uniform(*WAIT_DYNAMIC_CONTENT)
-    logger.debug(f"Waiting {random_time:.1f}s for dynamic content...")
-    time.sleep(random_time)
-
     # Get page source and save it
     page_source = driver.page_source
     page_filename = LISTING_PAGE_FILENAME_PATTERN.format(current_page)
     page_path = os.path.join(list_dir, page_filename)
 
-    with open(page_path, "w", encoding="utf-8") as f:
-        pretty_html = BeautifulSoup(page_source, "html.parser").prettify()
-        f.write(pretty_html)
+    write_page(page_path, page_source)
 
     logger.info(LOG_MESSAGES["page_saved"].format(page=current_page, path=page_path))
     return page_source, page_path
 
 
-def save_initiative_page(pages_dir: str, url: str, page_source: str) -> str:
-    """Save initiative page source to file and return filename."""
-
-    # Double-check page source for rate limiting content
-    if any(indicator in page_source for indicator in RATE_LIMIT_INDICATORS[:2]):
-        raise Exception("429 - Rate limited (found in page source)")
+def initiative_page_path(url: str) -> str:
+    """Return the path of an initiative page relative to the pages directory."""
 
     # Extract year and number from URL for filename
     parts = url.rstrip("/").split("/")
     year = parts[-2]
     number = parts[-1]
 
+    # Create filename with year and number to avoid overwriting
+    file_name = INITIATIVE_PAGE_FILENAME_PATTERN.format(year=year, number=number)
+
+    return os.path.join(year, file_name)
+
+
+def save_initiative_page(
+    pages_dir: str, url: str, page_source: str, report: Optional[PageReport] = None
+) -> str:
+    """Save initiative page source to file and return filename.
+
+    Args:
+        pages_dir: Directory path for saving HTML pages
+        url: Initiative page URL
+        page_source: HTML content
+        report: Validation scan of page_source, if already made
+
+    Returns:
+        File name of the saved page
+    """
+    report = report or scan_page(page_source)
+
+    # Double-check page source for rate limiting content (case-sensitive)
+    if any(
+        indicator in report.exact_rate_limit_indicators
+        for indicator in RATE_LIMIT_INDICATORS[:2]
+    ):
+        raise Exception("429 - Rate limited (found in page source)")
+
     # Generate directory under pages_dir for year
-    year_dir = os.path.join(pages_dir, year)
-    os.makedirs(year_dir, exist_ok=True)
+    file_path = os.path.join(pages_dir, initiative_page_path(url))
+    file_name = os.path.basename(file_path)
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-    # Create filename with year and number to avoid overwriting
-    file_name = f"{year}_{number}.html"
-    file_path = os.path.join(year_dir, file_name)
-
-    try:
-        # Check for obvious signs of malformed HTML
-        original_length = len(page_source)
-
-        # Common malformed HTML indicators
-        malformed_indicators = [
-            page_source.count("<") != page_source.count(">"),  # Unmatched brackets
-            page_source.count('"') % 2 != 0,  # Unmatched quotes
-            "</html>" not in page_source.lower()
-            and "<html" in page_source.lower(),  # Missing closing html tag
-            original_length < MIN_HTML_LENGTH,  # Suspiciously short HTML
-        ]
-
-        if any(malformed_indicators):
-            logger.warning(
-                f"⚠️  Potential malformed HTML detected in {file_name}: "
-                f"length={original_length}, unmatched_brackets={malformed_indicators[0]}, "
-                f"unmatched_quotes={malformed_indicators[1]}"
-            )
-
-        # Parse with BeautifulSoup and detect if it had to fix issues
-        soup = BeautifulSoup(page_source, "html.parser")
-        pretty_html = soup.prettify()
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(pretty_html)
-
-    except Exception as e:
-        # BeautifulSoup rarely throws exceptions, but if it does, the HTML is severely malformed
+    # Check for obvious signs of malformed HTML (unmatched brackets or quotes,
+    # missing closing html tag, suspiciously short page)
+    if report.malformed:
         logger.warning(
-            f"⚠️  Failed to parse HTML for {file_name}: {str(e)}. "
-            f"Saving raw HTML without prettification."
+            f"⚠️  Potential malformed HTML detected in {file_name}: "
+            f"length={report.length}, unmatched_brackets={report.unmatched_brackets}, "
+            f"unmatched_quotes={report.unmatched_quotes}"
         )
 
-        # Save raw HTML as fallback
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(page_source)
+    # Saved as received, extractors parse it as stored (see scraper_shared.page_io)
+    write_page(file_path, page_source)
 
     return file_name
 
@@ -127,3 +114,31 @@ def write_initiatives_csv(
         writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
         writer.writeheader()
         writer.writerows(initiative_data)
+
+
+def append_initiatives_csv(
+    file_path: str, initiative_data: list[Dict[str, str]]
+) -> None:
+    """Append initiative rows to a CSV file started by write_initiatives_csv.
+
+    Args:
+        file_path: Full path to the CSV file
+        initiative_data: List of initiative dictionaries to append
+    """
+    with open(file_path, "a", encoding="utf-8", newline="") as f:
+
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+        writer.writerows(initiative_data)
+
+
+def read_initiatives_csv(file_path: str) -> list[Dict[str, str]]:
+    """Read initiative data written by write_initiatives_csv.
+
+    Args:
+        file_path: Full path to the CSV file
+
+    Returns:
+        List of initiative dictionaries, in listing order
+    """
+    with open(file_path, "r", encoding="utf-8", newline="") as f:
+        return list(csv.DictReader(f))
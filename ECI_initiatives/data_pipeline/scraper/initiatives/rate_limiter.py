@@ -0,0 +1,13 @@
+"""
+Request rate controller of the initiatives scraper.
+
+A single instance paces both the listing pagination and the initiative page
+downloads, since they hit the same server.
+"""
+
+# Local
+from .consts import INITIAL_REQUEST_RATE
+from .scraper_logger import logger
+from ..scraper_shared.rate_controller import AdaptiveRateController
+
+rate_controller = AdaptiveRateController(INITIAL_REQUEST_RATE, logger=logger)
@@ -2,6 +2,7 @@
 import logging
 import os
 import datetime
+import shutil
 
 # scraper
 from .consts import LOG_DIR
@@ -40,15 +41,7 @@ class ScraperLogger:
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         log_file = os.path.join(self.log_dir, f"scraper_initiatives{timestamp}.log")
 
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
-        file_handler.setLevel(logging.DEBUG)
-
-        # File formatter (more detailed)
-        file_formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
-        )
-        file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+        self._add_file_handler(log_file)
 
         # Console formatter (simpler)
         console_formatter = logging.Formatter(
@@ -60,6 +53,45 @@ class ScraperLogger:
         # Mark as initialized
         ScraperLogger._initialized = True
 
+    def _add_file_handler(self, log_file: str):
+        self.log_file = log_file
+
+        self.file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        self.file_handler.setLevel(logging.DEBUG)
+
+        # File formatter (more detailed)
+        file_formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
+        )
+        self.file_handler.setFormatter(file_formatter)
+        self.logger.addHandler(self.file_handler)
+
+    def move_to(self, log_dir: str):
+        """
+        Continue logging in another directory (e.g. of a resumed session).
+
+        The log file written so far is moved along; the previous log
+        directory and its session directory are removed if left empty.
+        """
+        if os.path.abspath(log_dir) == os.path.abspath(self.log_dir):
+            return
+
+        self.logger.removeHandler(self.file_handler)
+        self.file_handler.close()
+
+        os.makedirs(log_dir, exist_ok=True)
+        log_file = os.path.join(log_dir, os.path.basename(self.log_file))
+        shutil.move(self.log_file, log_file)
+
+        for directory in (self.log_dir, os.path.dirname(self.log_dir)):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                break
+
+        self.log_dir = log_dir
+        self._add_file_handler(log_file)
+
     def debug(self, message: str):
         self.logger.debug(message)
 
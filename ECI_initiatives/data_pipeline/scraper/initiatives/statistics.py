@@ -6,8 +6,13 @@ from collections import Counter
 from typing import Dict, List
 
 # Local modules
-from .consts import CSV_FILENAME, LOG_MESSAGES
+from .consts import CSV_FILENAME, LOG_DIR, LOG_MESSAGES
 from .scraper_logger import logger
+from ..scraper_shared.page_io import is_page_file
+from ..scraper_shared.telemetry import ScrapeTelemetry
+
+# Per-page timings of the download workers, written next to the log file
+telemetry = ScrapeTelemetry("initiatives", LOG_DIR, logger=logger)
 
 
 def display_completion_summary(
@@ -58,7 +63,7 @@ def gather_scraping_statistics(
 
             if os.path.isdir(year_path):
 
-                html_files = [f for f in os.listdir(year_path) if f.endswith(".html")]
+                html_files = [f for f in os.listdir(year_path) if is_page_file(f)]
                 downloaded_files_count += len(html_files)
 
     return {
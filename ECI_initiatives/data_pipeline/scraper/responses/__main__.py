@@ -11,6 +11,7 @@ import logging
 from .errors import MissingDataDirectoryError
 from .html_parser import ResponseLinkExtractor
 from .downloader import ResponseDownloader
+from .css_selectors import ResponsePageSelectors
 from .file_operations.page import PageFileManager
 from .statistics import display_completion_summary
 from .consts import (
@@ -21,7 +22,15 @@ from .consts import (
     LOG_DIR_NAME,
     LOG_MESSAGES,
     CSV_FILENAME,
+    HTTP_FIRST_FETCH,
+    DOWNLOAD_WORKERS,
+    INITIAL_REQUEST_RATE,
 )
+from ..scraper_shared.browser_session import browser_sessions
+from ..scraper_shared.http_fetcher import StaticPageFetcher
+from ..scraper_shared.incremental import create_page_store
+from ..scraper_shared.rate_controller import AdaptiveRateController
+from ..scraper_shared.telemetry import ScrapeTelemetry
 
 
 def scrape_commission_responses() -> str:
@@ -222,8 +231,42 @@ def _download_responses(
     Returns:
         Tuple of (updated_data, failed_items)
     """
-    downloader = ResponseDownloader(responses_dir)
-    return downloader.download_all_responses(response_links)
+    logger = logging.getLogger("ECIResponsesScraper")
+    rate_controller = AdaptiveRateController(INITIAL_REQUEST_RATE, logger=logger)
+
+    fetcher = None
+    if HTTP_FIRST_FETCH:
+        fetcher = StaticPageFetcher(
+            [ResponsePageSelectors.MAIN_CONTENT],
+            logger=logger,
+            rate_controller=rate_controller,
+        )
+
+    incremental = create_page_store(responses_dir, logger=logger)
+
+    downloader = ResponseDownloader(
+        responses_dir,
+        fetcher=fetcher,
+        num_workers=DOWNLOAD_WORKERS,
+        rate_controller=rate_controller,
+        incremental=incremental,
+        telemetry=ScrapeTelemetry(
+            "responses",
+            os.path.join(os.path.dirname(responses_dir), LOG_DIR_NAME),
+            logger=logger,
+        ),
+    )
+
+    try:
+        # Download workers reuse warm browsers; also keeps them for a caller
+        # running several scrapers in one process inside its own keep_alive()
+        with browser_sessions.keep_alive(logger):
+            return downloader.download_all_responses(response_links)
+    finally:
+        if fetcher is not None:
+            fetcher.close()
+        if incremental is not None:
+            incremental.write_manifest()
 
 
 if __name__ == "__main__":
@@ -5,16 +5,15 @@ Module-specific settings for scraping Commission response pages.
 Common settings are imported from scraper_shared.const.
 
 Note on Fine-Tuning:
-    The timing configurations (WAIT_BETWEEN_DOWNLOADS, RETRY_WAIT_BASE) and retry
-    limits (DEFAULT_MAX_RETRIES) can be adjusted based on:
+    The starting request rate (INITIAL_REQUEST_RATE) and retry limits
+    (DEFAULT_MAX_RETRIES) can be adjusted based on:
     - Server load and response times
     - Rate limiting policies of the target website
     - Network conditions and infrastructure changes
     - Other development teams' usage patterns
 
-    If you experience frequent rate limiting or timeouts, consider increasing
-    wait times and retry intervals. For faster, more stable servers, you may
-    reduce these values to speed up scraping.
+    The rate adapts itself during a run (see scraper_shared.rate_controller);
+    the initial value only decides how fast the first requests are sent.
 """
 
 from pathlib import Path
@@ -22,11 +21,14 @@ from pathlib import Path
 # Import shared constants
 from ..scraper_shared.const import (
     BASE_URL,
+    DEFAULT_BASE_URL,
     SCRIPT_DIR,
     DATA_DIR_NAME,
     LOG_DIR_NAME,
     CHROME_OPTIONS,
-    WAIT_DYNAMIC_CONTENT,
+    HTTP_FIRST_FETCH,
+    DOWNLOAD_WORKERS,
+    INCREMENTAL_SCRAPING,
     WEBDRIVER_TIMEOUT_DEFAULT,
     WEBDRIVER_TIMEOUT_CONTENT,
     MIN_HTML_LENGTH,
@@ -46,10 +48,19 @@ CSV_FIELDNAMES = [
     "datetime",
 ]
 
-# Module-specific Timing Configuration (in seconds)
-# Fine-tune these based on server response times and rate limiting behavior
-WAIT_BETWEEN_DOWNLOADS = (1.5, 1.9)  # Delay between downloading response pages
-RETRY_WAIT_BASE = (2.0, 2.5)  # Base time for retry exponential backoff
+# Link Extraction
+# Initiative pages missing from the response link index are scanned at byte
+# level first (see link_scan.py); BeautifulSoup only parses the pages the scan
+# cannot decide. False parses every page
+FAST_LINK_SCAN = True
+
+# Browser Resource Allowlist (categories of BLOCKED_RESOURCE_PATTERNS)
+# Response pages are only read as HTML, nothing blocked is needed
+BROWSER_ALLOWED_RESOURCES = []
+
+# Module-specific Rate Configuration (requests per second)
+# Starting rate of response page downloads, adapted during the run
+INITIAL_REQUEST_RATE = 0.6
 
 # Module-specific File Naming Patterns
 RESPONSE_PAGE_FILENAME_PATTERN = "{year}/{number}_en.html"
@@ -3,10 +3,9 @@ Download Commission response pages using Selenium.
 """
 
 import datetime
-import random
 import time
 import logging
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 
 from bs4 import BeautifulSoup
 from selenium import webdriver
@@ -14,34 +13,72 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-from .browser import initialize_browser
+from .browser import browser_factory, initialize_browser
 from .css_selectors import ResponsePageSelectors
 from .consts import (
-    WAIT_DYNAMIC_CONTENT,
-    WAIT_BETWEEN_DOWNLOADS,
-    RETRY_WAIT_BASE,
+    INITIAL_REQUEST_RATE,
+    RESPONSE_PAGE_FILENAME_PATTERN,
     WEBDRIVER_TIMEOUT_CONTENT,
     DEFAULT_MAX_RETRIES,
-    RATE_LIMIT_INDICATORS,
     LOG_MESSAGES,
 )
 from .file_operations.page import save_response_html_file
+from ..scraper_shared.browser_session import browser_sessions
+from ..scraper_shared.const import DEFERRED_RETRIES
+from ..scraper_shared.http_fetcher import StaticPageFetcher
+from ..scraper_shared.incremental import IncrementalStore
+from ..scraper_shared.page_readiness import PageReadinessWaiter
+from ..scraper_shared.page_validator import PageReport, scan_page
+from ..scraper_shared.rate_controller import (
+    AdaptiveRateController,
+    is_rate_limit_error,
+)
+from ..scraper_shared.telemetry import PageSpan, ScrapeTelemetry
+from ..scraper_shared.worker_pool import BrowserWorkerPool, RetryLater
 
 
 class ResponseDownloader:
     """Download Commission response pages with retry logic and error handling."""
 
-    def __init__(self, responses_dir: str):
+    def __init__(
+        self,
+        responses_dir: str,
+        fetcher: Optional[StaticPageFetcher] = None,
+        num_workers: int = 1,
+        rate_controller: Optional[AdaptiveRateController] = None,
+        incremental: Optional[IncrementalStore] = None,
+        telemetry: Optional[ScrapeTelemetry] = None,
+    ):
         """
         Initialize the downloader.
 
         Args:
             responses_dir: Base directory for saving response HTML files
+            fetcher: Optional HTTP-first fetcher; the browser is started
+                only for pages it cannot serve
+            num_workers: Number of parallel workers, each with its own browser
+            rate_controller: Request rate controller shared by all workers
+                (a new one starting at INITIAL_REQUEST_RATE by default)
+            incremental: Optional store carrying unchanged pages forward
+                from the previous session
+            telemetry: Per-page timing collector shared by all workers
+                (in memory only by default)
         """
 
         self.responses_dir = responses_dir
+        self.fetcher = fetcher
+        self.incremental = incremental
+        self.num_workers = num_workers
         self.driver = None
         self.logger = logging.getLogger("ECIResponsesScraper")
+        self.rate_controller = rate_controller or AdaptiveRateController(
+            INITIAL_REQUEST_RATE, logger=self.logger
+        )
+        self.page_readiness = PageReadinessWaiter(logger=self.logger)
+        self.telemetry = telemetry or ScrapeTelemetry("responses", logger=self.logger)
+
+        # Spans of pages queued for a retry, by URL
+        self._deferred: Dict[str, PageSpan] = {}
 
     def download_all_responses(
         self, response_links: List[Dict[str, str]]
@@ -58,44 +95,113 @@ class ResponseDownloader:
         updated_data = []
         failed_items = []
 
+        self.logger.info("Starting download responses...")
+
         try:
-            # Initialize browser once for all downloads
-            self._initialize_driver()
+            results = BrowserWorkerPool(self.num_workers, self.logger).map(
+                response_links,
+                self._download_link,
+                self._open_worker,
+                self._close_worker,
+            )
 
-            # Download each response page
-            self.logger.info("Starting download responses...")
+        finally:
+            if self.fetcher is not None:
+                self.fetcher.log_summary()
+            self.rate_controller.log_summary()
+            self.page_readiness.log_summary()
+            browser_factory.log_summary()
+            self.telemetry.log_summary()
+
+        for link_data, (success, timestamp) in zip(response_links, results):
+
+            # Update data with timestamp
+            updated_item = {
+                "url_find_initiative": link_data["url"],
+                "registration_number": link_data["reg_number"],
+                "title": link_data.get("title", ""),
+                "datetime": timestamp if success else "",
+            }
+
+            if success:
+                updated_data.append(updated_item)
+            else:
+                failed_items.append(link_data)
 
-            for link_data in response_links:
+        return updated_data, failed_items
 
-                url = link_data["url"]
-                year = link_data["year"]
-                reg_number = link_data["reg_number"]
+    def _download_link(
+        self, worker: "ResponseDownloader", link_data: Dict[str, str]
+    ) -> Tuple[bool, str]:
+        """
+        Download one response page on the given worker.
 
-                success, timestamp = self.download_single_response(
-                    url, year, reg_number
-                )
+        Args:
+            worker: Downloader owning the browser used for this page
+            link_data: Dictionary with 'url', 'year', 'reg_number'
 
-                # Update data with timestamp
-                updated_item = {
-                    "url_find_initiative": url,
-                    "registration_number": reg_number,
-                    "title": link_data.get("title", ""),
-                    "datetime": timestamp if success else "",
-                }
+        Returns:
+            Tuple of (success: bool, timestamp: str)
+        """
 
-                if success:
-                    updated_data.append(updated_item)
-                else:
-                    failed_items.append(link_data)
+        # A retried page continues its span
+        span = self._deferred.pop(link_data["url"], None) or self.telemetry.page(
+            link_data["url"]
+        )
 
-                # Wait between downloads
-                wait_time = random.uniform(*WAIT_BETWEEN_DOWNLOADS)
-                time.sleep(wait_time)
+        # Request rate is shared by all workers
+        with span.phase("rate_wait"):
+            time.sleep(self.rate_controller.reserve())
 
-        finally:
-            self._close_driver()
+        try:
+            success, timestamp = worker.download_single_response(
+                link_data["url"],
+                link_data["year"],
+                link_data["reg_number"],
+                span=span,
+                defer_retries=DEFERRED_RETRIES,
+            )
 
-        return updated_data, failed_items
+        except RetryLater:
+            self._deferred[link_data["url"]] = span
+            raise
+
+        if success:
+            self.rate_controller.record_success()
+
+        span.finish(success)
+
+        return success, timestamp
+
+    def _open_worker(self) -> "ResponseDownloader":
+        """
+        Create the downloader used by one pool worker.
+
+        A single worker reuses this instance; parallel workers get their own
+        instance (and browser) sharing the fetcher and logger.
+        """
+
+        worker = self
+        if self.num_workers > 1:
+            worker = ResponseDownloader(
+                self.responses_dir, fetcher=self.fetcher, incremental=self.incremental
+            )
+            worker.logger = self.logger
+            worker.rate_controller = self.rate_controller
+            worker.page_readiness = self.page_readiness
+            worker.telemetry = self.telemetry
+
+        # Without HTTP-first fetching every page needs the browser
+        if self.fetcher is None:
+            worker._initialize_driver()
+
+        return worker
+
+    @staticmethod
+    def _close_worker(worker: "ResponseDownloader") -> None:
+        """Close the browser of one pool worker."""
+
+        worker._close_driver()
 
     def download_single_response(
         self,
@@ -103,6 +209,8 @@ class ResponseDownloader:
         year: str,
         reg_number: str,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        span: Optional[PageSpan] = None,
+        defer_retries: bool = False,
     ) -> Tuple[bool, str]:
         """
         Download a single Commission response page with retry logic.
@@ -112,44 +220,82 @@ class ResponseDownloader:
             year: Year of the initiative
             reg_number: Registration number
             max_retries: Maximum number of retry attempts
+            span: Timings of the page (a throwaway span by default); the
+                attempts continue from span.retries
+            defer_retries: Raise RetryLater instead of sleeping before a retry
 
         Returns:
             Tuple of (success: bool, timestamp: str)
         """
-        actual_url = url
+        span = span or PageSpan(url)
+        first_attempt = span.retries
 
-        for attempt in range(max_retries):
-            try:
-                # On first attempt, check if URL redirects
-                if attempt == 0:
+        # A retried page goes straight to the browser
+        if self.fetcher is not None and not first_attempt:
+            filename = self._download_static_response(url, year, reg_number, span)
 
-                    self.driver.get(url)
-                    time.sleep(1)
-                    actual_url = self.driver.current_url
+            if filename:
+                timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                self.logger.info(
+                    LOG_MESSAGES["download_success"].format(filename=filename)
+                )
+                return True, timestamp
 
-                    if actual_url != url:
+            # The HTTP attempt used up the reserved slot
+            with span.phase("rate_wait"):
+                time.sleep(self.rate_controller.reserve())
 
-                        self.logger.info(f"URL redirected: {url} -> {actual_url}")
-                else:
+        # Browser is started lazily, only once a page needs it
+        self._initialize_driver()
+
+        # Skips the redirect round trip if a previous session saw one
+        target_url = self._resolve_url(url)
+        actual_url = target_url
+
+        for attempt in range(first_attempt, max_retries):
+            try:
+                # Replaces a crashed or worn-out browser
+                self.driver = browser_sessions.refresh(self.driver)
+                with span.phase("navigate"):
                     self.driver.get(actual_url)
 
                 # Wait for page content to load
-                self._wait_for_page_content()
+                with span.phase("readiness"):
+                    self._wait_for_page_content()
 
-                # Check for rate limiting
-                self._check_rate_limiting()
+                # Wait until the DOM has settled; scripted redirects have
+                # happened by then
+                with span.phase("readiness"):
+                    self.page_readiness.wait(self.driver, url)
 
-                # Wait for dynamic content
-                wait_time = random.uniform(*WAIT_DYNAMIC_CONTENT)
-                time.sleep(wait_time)
+                # On first attempt, check if URL redirected
+                if attempt == first_attempt:
+                    requested_url, actual_url = actual_url, self.driver.current_url
+                    self._record_redirect(url, requested_url, actual_url)
 
-                # Get page source
+                # Get page source, scanned once for the rate limit check
+                # and the saver
                 page_source = self.driver.page_source
 
+                # Check for rate limiting
+                with span.phase("rate_limit_check"):
+                    report = scan_page(page_source)
+                    self._check_rate_limiting(report)
+
                 # Save to file
-                filename = save_response_html_file(
-                    self.responses_dir, year, reg_number, page_source
-                )
+                with span.phase("save"):
+                    filename = save_response_html_file(
+                        self.responses_dir, year, reg_number, page_source, report
+                    )
+
+                span.source = "browser"
+                span.bytes = report.size
+
+                # Count blocked resources of the page
+                browser_factory.record_page(self.driver)
+
+                if self.incremental is not None:
+                    self.incremental.record_download(url, filename)
 
                 # Get current timestamp
                 timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -164,9 +310,21 @@ class ResponseDownloader:
                     f"Download attempt {attempt + 1}/{max_retries} failed for {url}: {str(e)}"
                 )
 
+                rate_limited = is_rate_limit_error(str(e))
+
                 if attempt < max_retries - 1:
-                    base_wait = random.uniform(*RETRY_WAIT_BASE)
-                    wait_time = base_wait * (2**attempt)
+                    span.retries += 1
+
+                    # Backs off through the shared rate, not a local formula
+                    if defer_retries:
+                        wait_time = self.rate_controller.backoff_delay(
+                            attempt, rate_limited
+                        )
+                    else:
+                        wait_time = self.rate_controller.retry_delay(
+                            attempt, rate_limited
+                        )
+
                     self.logger.info(
                         LOG_MESSAGES["rate_limit_retry"].format(
                             retry=attempt + 1,
@@ -174,24 +332,153 @@ class ResponseDownloader:
                             wait_time=wait_time,
                         )
                     )
-                    time.sleep(wait_time)
+
+                    # The worker downloads other pages meanwhile
+                    if defer_retries:
+                        raise RetryLater(wait_time)
+
+                    with span.phase("rate_wait"):
+                        time.sleep(wait_time)
+
+                elif rate_limited:
+                    self.rate_controller.record_rate_limited()
 
         self.logger.error(LOG_MESSAGES["download_failed"].format(url=url))
         return False, ""
 
-    def _check_rate_limiting(self) -> None:
+    def _download_static_response(
+        self, url: str, year: str, reg_number: str, span: Optional[PageSpan] = None
+    ) -> Optional[str]:
+        """
+        Download a response page over plain HTTP without the browser.
+
+        Args:
+            url: Full URL to the response page
+            year: Year of the initiative
+            reg_number: Registration number
+
+            span: Timings of the page
+
+        Returns:
+            Filename of saved file, or None if the browser is needed
+        """
+
+        span = span or PageSpan(url)
+
+        relative_path = RESPONSE_PAGE_FILENAME_PATTERN.format(
+            year=year, number=reg_number
+        )
+        headers = None
+        if self.incremental is not None:
+            headers = self.incremental.conditional_headers(relative_path)
+
+        target_url = self._resolve_url(url)
+
+        with span.phase("navigate"):
+            static_page = self.fetcher.fetch(target_url, headers=headers)
+
+        if static_page is not None and static_page.not_modified:
+
+            if self.incremental.carry_forward(url, relative_path):
+                self.logger.info(
+                    f"♻️  Unchanged since previous session: {relative_path}"
+                )
+                span.source = "carried_forward"
+                return relative_path
+
+            with span.phase("navigate"):
+                static_page = self.fetcher.fetch(target_url)
+
+        if static_page is None:
+            return None
+
+        if static_page.gone:
+
+            # The known target is gone; the browser asks the original URL
+            if target_url != url:
+                self.logger.info(f"Redirect target gone: {target_url}")
+                self.incremental.forget_redirect(url)
+
+            return None
+
+        self._record_redirect(url, target_url, static_page.final_url)
+
+        # Scanned by the fetcher already
+        report = static_page.report or scan_page(static_page.page_source)
+
+        try:
+            with span.phase("save"):
+                filename = save_response_html_file(
+                    self.responses_dir,
+                    year,
+                    reg_number,
+                    static_page.page_source,
+                    report,
+                )
+
+        except Exception as e:
+            self.fetcher.record_fallback(url, str(e))
+            return None
+
+        span.source = "http"
+        span.bytes = report.size
+
+        if self.incremental is not None:
+            self.incremental.record_download(
+                url, filename, static_page.etag, static_page.last_modified
+            )
+
+        return filename
+
+    def _resolve_url(self, url: str) -> str:
+        """URL to navigate to, following a redirect known from earlier sessions."""
+
+        if self.incremental is None:
+            return url
+
+        return self.incremental.resolve_redirect(url)
+
+    def _record_redirect(self, url: str, requested_url: str, final_url: str) -> None:
+        """
+        Log and remember where a page ended up.
+
+        Args:
+            url: Page URL
+            requested_url: URL navigated to (url or its known redirect target)
+            final_url: URL the page was loaded from
+        """
+        if final_url != requested_url:
+            self.logger.info(f"URL redirected: {requested_url} -> {final_url}")
+
+        if self.incremental is None:
+            return
+
+        # A known target that redirects elsewhere is stale; the next visit
+        # asks the original URL where the page is now
+        if requested_url != url and final_url != requested_url:
+            self.incremental.forget_redirect(url)
+        else:
+            self.incremental.record_redirect(
+                url, final_url, verified=requested_url == url
+            )
+
+    def _check_rate_limiting(self, report: Optional[PageReport] = None) -> None:
         """
         Check if the current page shows rate limiting errors.
 
+        Args:
+            report: Validation scan of the current page (scanned if not given)
+
         Raises:
             Exception: If rate limiting is detected
         """
 
-        page_source = self.driver.page_source.lower()
+        report = report or scan_page(self.driver.page_source)
 
-        for indicator in RATE_LIMIT_INDICATORS:
-            if indicator.lower() in page_source:
-                raise Exception(f"Rate limiting detected: {indicator}")
+        if report.rate_limit_indicators:
+            raise Exception(
+                f"Rate limiting detected: {report.rate_limit_indicators[0]}"
+            )
 
     def _wait_for_page_content(self) -> None:
         """
@@ -238,7 +525,7 @@ class ResponseDownloader:
 
         if self.driver:
             try:
-                self.driver.quit()
+                browser_sessions.release(self.driver)
                 self.logger.info(LOG_MESSAGES["browser_closed"])
             except Exception as e:
                 self.logger.error(f"Error closing browser: {str(e)}")
@@ -4,10 +4,10 @@ File operations for saving Commission response pages.
 
 import os
 import logging
+from typing import Optional
 
-from bs4 import BeautifulSoup
-
-from ..consts import MIN_HTML_LENGTH, RATE_LIMIT_INDICATORS
+from ...scraper_shared.page_io import write_page
+from ...scraper_shared.page_validator import PageReport, scan_page
 
 
 class PageFileManager:
@@ -34,7 +34,13 @@ class PageFileManager:
             os.makedirs(self.base_dir, exist_ok=True)
             self.logger.info(f"Created responses directory: {self.base_dir}")
 
-    def save_response_page(self, page_source: str, year: str, reg_number: str) -> str:
+    def save_response_page(
+        self,
+        page_source: str,
+        year: str,
+        reg_number: str,
+        report: Optional[PageReport] = None,
+    ) -> str:
         """
         Save Commission response page HTML to file.
 
@@ -42,6 +48,7 @@ class PageFileManager:
             page_source: HTML content to save
             year: Year of the initiative
             reg_number: Registration number
+            report: Validation scan of page_source, if already made
 
         Returns:
             Filename of saved file
@@ -51,7 +58,8 @@ class PageFileManager:
         """
 
         # Validate HTML
-        self._validate_html(page_source)
+        report = report or scan_page(page_source)
+        self._validate_html(page_source, report)
 
         # Create year directory
         year_dir = self._create_year_directory(year)
@@ -60,57 +68,44 @@ class PageFileManager:
         filename = self._generate_filename(year, reg_number)
         full_path = os.path.join(self.base_dir, filename)
 
-        # Prettify HTML
-        soup = BeautifulSoup(page_source, "html.parser")
-        pretty_html = soup.prettify()
-
-        # Save to file
-        with open(full_path, "w", encoding="utf-8") as f:
-            f.write(pretty_html)
+        # Save to file as received, extractors parse it as stored
+        write_page(full_path, page_source)
 
         self.logger.debug(f"Saved response page: {filename}")
 
         return filename
 
-    def _validate_html(self, page_source: str) -> bool:
+    def _validate_html(
+        self, page_source: str, report: Optional[PageReport] = None
+    ) -> bool:
         """
         Validate HTML content for rate limiting and malformed content.
 
         Args:
             page_source: HTML content to validate
+            report: Validation scan of page_source, if already made
 
         Returns:
-            True if valid, False otherwise
+            True if valid
 
         Raises:
-            Exception: If rate limiting detected
+            Exception: If the page is too short, an error page or rate limited
         """
+        report = report or scan_page(page_source)
 
         # Check minimum length
-        if len(page_source) < MIN_HTML_LENGTH:
-            raise Exception(f"HTML content too short: {len(page_source)} characters")
+        if report.too_short:
+            raise Exception(f"HTML content too short: {report.length} characters")
 
         # Check for error page (multilingual "Sorry" page)
-        error_page_indicators = [
-            "We apologise for any inconvenience",
-            "Veuillez nous excuser pour ce désagrément",
-            "Ci scusiamo per il disagio arrecato",
-        ]
-
-        page_lower = page_source.lower()
-
-        for indicator in error_page_indicators:
-            if indicator.lower() in page_lower:
-                raise Exception(f"Error page detected: {indicator}")
+        if report.error_page_indicators:
+            raise Exception(f"Error page detected: {report.error_page_indicators[0]}")
 
         # Check for rate limiting indicators
-        for indicator in RATE_LIMIT_INDICATORS:
-
-            # To avoid false positive with the '429' in HTML code
-            if indicator.lower() in page_lower and indicator != "429":
-                raise Exception(
-                    f"Rate limiting detected in content:\nindicator:{indicator}"
-                )
+        if report.rate_limit_indicators:
+            raise Exception(
+                f"Rate limiting detected in content:\nindicator:{report.rate_limit_indicators[0]}"
+            )
 
         return True
 
@@ -146,7 +141,11 @@ class PageFileManager:
 
 
 def save_response_html_file(
-    responses_dir: str, year: str, reg_number: str, page_source: str
+    responses_dir: str,
+    year: str,
+    reg_number: str,
+    page_source: str,
+    report: Optional[PageReport] = None,
 ) -> str:
     """
     Convenience function to save response page.
@@ -156,10 +155,11 @@ def save_response_html_file(
         year: Year of initiative
         reg_number: Registration number
         page_source: HTML content
+        report: Validation scan of page_source, if already made
 
     Returns:
         Filename of saved file
     """
 
     file_ops = PageFileManager(responses_dir)
-    return file_ops.save_response_page(page_source, year, reg_number)
+    return file_ops.save_response_page(page_source, year, reg_number, report)
@@ -1,19 +1,45 @@
 """
 HTML parser for extracting Commission response links from initiative pages.
+
+Pages listed in the side-car index written by the initiatives downloader
+(see scraper_shared/response_link_index.py) are not parsed again. The other
+pages go through the byte-level fast path of link_scan.py first; BeautifulSoup
+only parses the pages the fast path cannot decide.
 """
-import re
+import os
 import logging
 from typing import List, Dict, Optional
 from pathlib import Path
 from bs4 import BeautifulSoup
 
+from .consts import BASE_URL, DEFAULT_BASE_URL, FAST_LINK_SCAN
+from .link_scan import NO_LINK, scan_response_link
+from ..scraper_shared.page_io import (
+    glob_pages,
+    logical_page_path,
+    page_bytes,
+    read_page,
+)
+from ..scraper_shared.soup_factory import make_soup
+from ..scraper_shared.response_link_index import (
+    find_initiative_title,
+    find_response_link,
+    load_response_link_index,
+)
+
 
 class ResponseLinkExtractor:
     """Extract Commission response links from initiative page HTML files."""
     
-    def __init__(self):
-        """Initialize the link extractor."""
+    def __init__(self, fast_scan: bool = FAST_LINK_SCAN):
+        """
+        Initialize the link extractor.
+        
+        Args:
+            fast_scan: Try the byte-level fast path before parsing a page
+        """
         self.logger = logging.getLogger("ECIResponsesScraper")
+        self.fast_scan = fast_scan
     
     def extract_links_from_file(self, file_path: str) -> Optional[Dict[str, str]]:
         """
@@ -26,13 +52,41 @@ class ResponseLinkExtractor:
             Dictionary with 'url', 'year', 'reg_number', 'title' or None if no link found
         """
 
+        if self.fast_scan:
+            try:
+                with page_bytes(file_path) as data:
+                    scanned = scan_response_link(data)
+
+            except Exception as e:
+                self.logger.debug(f"Fast link scan failed for {file_path}: {str(e)}")
+                scanned = None
+
+            if scanned == NO_LINK:
+                return None
+
+            if scanned is not None:
+                url, title = scanned
+                return self._link_data(file_path, url, title)
+
+        return self._extract_links_with_soup(file_path)
+
+    def _extract_links_with_soup(self, file_path: str) -> Optional[Dict[str, str]]:
+        """
+        Extract the response link and title by fully parsing the page.
+        
+        Args:
+            file_path: Path to the initiative HTML file
+            
+        Returns:
+            Same dictionary as extract_links_from_file, or None
+        """
+
         try:
-            # Read HTML file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            # Read HTML file (plain or compressed)
+            html_content = read_page(file_path)
             
             # Parse HTML
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content)
             
             # Extract response link
             url = self._extract_response_commission_url(soup)
@@ -43,16 +97,7 @@ class ResponseLinkExtractor:
             # Extract title
             title = self._extract_title(soup)
             
-            # Extract metadata from file path
-            metadata = self._extract_metadata_from_path(file_path)
-            
-            return {
-                'url': url,
-                'year': metadata['year'],
-                'reg_number': metadata['reg_number'],
-                'title': title,
-                'datetime': ''  # Will be filled during download
-            }
+            return self._link_data(file_path, url, title)
             
         except Exception as e:
             self.logger.error(f"Error extracting link from {file_path}: {str(e)}")
@@ -68,24 +113,17 @@ class ResponseLinkExtractor:
         Returns:
             Title string or empty string if not found
         """
-        
-        # Try to find the page header title
-        title_element = soup.select_one('h1.ecl-page-header-core__title')
-        
-        if title_element:
-            return title_element.get_text(strip=True)
-        
-        # Fallback to first h1
-        h1_element = soup.find('h1')
-        if h1_element:
-            return h1_element.get_text(strip=True)
-        
-        return ""
+
+        # Page header title, else the first h1
+        return find_initiative_title(soup)
 
     def extract_links_from_directory(self, base_dir: str) -> List[Dict[str, str]]:
         """
         Extract all Commission response links from initiative pages directory.
         
+        Pages found in the response link index are taken from it; only the
+        others are read and parsed.
+        
         Args:
             base_dir: Base directory containing initiative_pages/<year>/<reg_number>_en.html
             
@@ -95,6 +133,9 @@ class ResponseLinkExtractor:
 
         response_links = []
         base_path = Path(base_dir)
+        index = load_response_link_index(base_dir, self.logger)
+        indexed_count = 0
+        parsed_count = 0
         
         # Traverse all year directories
         for year_dir in base_path.iterdir():
@@ -102,13 +143,78 @@ class ResponseLinkExtractor:
                 continue
             
             # Process all HTML files in year directory
-            for html_file in year_dir.glob("*_en.html"):
-                link_data = self.extract_links_from_file(str(html_file))
+            for html_file in glob_pages(year_dir, "*_en.html"):
+
+                relative_path = os.path.normpath(
+                    logical_page_path(html_file).relative_to(base_path)
+                )
+                entry = index.get(relative_path)
+
+                if entry is not None:
+                    indexed_count += 1
+                    link_data = self._link_from_index_entry(entry, str(html_file))
+                else:
+                    parsed_count += 1
+                    link_data = self.extract_links_from_file(str(html_file))
+
                 if link_data:
                     response_links.append(link_data)
         
+        if index:
+            self.logger.info(
+                f"Response links of {indexed_count} pages read from the index, "
+                f"{parsed_count} pages parsed"
+            )
+        
         return response_links
     
+    def _link_from_index_entry(
+        self, entry: Dict[str, str], file_path: str
+    ) -> Optional[Dict[str, str]]:
+        """
+        Build the response link of a page from its index entry.
+        
+        Args:
+            entry: Index entry with 'response_url' and 'title'
+            file_path: Path to the initiative HTML file
+            
+        Returns:
+            Same dictionary as extract_links_from_file, or None if no link
+        """
+
+        if not entry.get('response_url'):
+            return None
+        
+        return self._link_data(file_path, entry['response_url'], entry.get('title', ''))
+
+    def _link_data(self, file_path: str, url: str, title: str) -> Dict[str, str]:
+        """
+        Build the response link dictionary of an initiative page.
+        
+        Args:
+            file_path: Path to the initiative HTML file
+            url: Commission response page URL
+            title: Initiative title
+            
+        Returns:
+            Dictionary with 'url', 'year', 'reg_number', 'title', 'datetime'
+        """
+        
+        # Extract metadata from file path
+        metadata = self._extract_metadata_from_path(file_path)
+        
+        # Pages link to the live site, also when BASE_URL points elsewhere
+        if url.startswith(DEFAULT_BASE_URL):
+            url = BASE_URL + url[len(DEFAULT_BASE_URL):]
+        
+        return {
+            'url': url,
+            'year': metadata['year'],
+            'reg_number': metadata['reg_number'],
+            'title': title,
+            'datetime': ''  # Will be filled during download
+        }
+    
     def _parse_html_for_link(self, html_content: str, file_path: str) -> Optional[str]:
         """
         Parse HTML content and extract Commission response link.
@@ -122,7 +228,7 @@ class ResponseLinkExtractor:
         """
 
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content)
             
             # Find Commission response link using text matching
             url = self._extract_response_commission_url(soup)
@@ -147,7 +253,7 @@ class ResponseLinkExtractor:
             Dictionary with 'year' and 'reg_number'
         """
         
-        path = Path(file_path)
+        path = Path(logical_page_path(file_path))
         year = path.parent.name  # Get year from directory name
         reg_number = path.stem.replace('_en', '')  # Get reg number from filename
 
@@ -172,9 +278,4 @@ class ResponseLinkExtractor:
 
         # Find the link with text containing "Commission's answer and follow-up"
         # Pattern handles both regular apostrophe (') and Unicode right single quotation mark (\u2019)
-        link = soup.find('a', string=re.compile(r"Commission['\u2019]s answer and follow-up", re.I))
-        
-        if link and link.get('href'):
-            return link.get('href')
-        
-        return None
+        return find_response_link(soup)
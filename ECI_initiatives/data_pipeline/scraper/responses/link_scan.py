@@ -0,0 +1,181 @@
+"""
+Fast path for finding the Commission response link of an initiative page.
+
+Most initiative pages have no Commission answer, yet every one of them used
+to be parsed into a full BeautifulSoup tree. The scan works on the raw bytes
+of the stored page instead:
+
+1. A byte-level prefilter looks for "s answer and follow-up". Pages without
+   it have no response link and are done without decoding anything.
+2. Otherwise the enclosing <a> tag and the page title are located with
+   regular expressions, and only those few fragments are decoded.
+
+Whenever the markup around a match is not plain enough to be sure of giving
+the same result as BeautifulSoup (nested tags in the link, a missing closing
+tag, ...), the scan answers "undecided" and the caller parses the page.
+"""
+
+import html
+import re
+from typing import Optional, Tuple, Union
+
+from ..scraper_shared.page_io import PAGE_ENCODING
+from ..scraper_shared.response_link_index import (
+    INITIATIVE_TITLE_SELECTOR,
+    RESPONSE_LINK_TEXT,
+)
+
+# Apostrophe-independent, so it also matches &#39;, &rsquo; or U+2019
+_PREFILTER = re.compile(rb"s answer and follow-up", re.I)
+
+_TITLE_CLASS = INITIATIVE_TITLE_SELECTOR.split(".", 1)[1].encode()
+_TITLE_CORE = re.compile(
+    rb"<h1\b[^>]*\bclass\s*=\s*[\"'][^\"']*\b"
+    + re.escape(_TITLE_CLASS)
+    + rb"\b[^\"']*[\"'][^>]*>(.*?)</h1\s*>",
+    re.I | re.S,
+)
+_FIRST_H1 = re.compile(rb"<h1\b[^>]*>(.*?)</h1\s*>", re.I | re.S)
+
+_ANCHOR_OPEN = re.compile(rb"<a[\s>]", re.I)
+_ANCHOR_CLOSE = re.compile(rb"</a\s*>", re.I)
+_HREF = re.compile(r"""\bhref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I)
+_TAG = re.compile(r"<[^>]*>")
+
+# Page has no response link
+NO_LINK = "no-link"
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class _Undecided(Exception):
+    """The markup is too unusual for the fast path; parse the page."""
+
+
+def scan_response_link(data: Buffer) -> Union[None, str, Tuple[str, str]]:
+    """
+    Find the response link and the title of an initiative page.
+
+    Args:
+        data: Raw page bytes (bytes or mmap)
+
+    Returns:
+        (response URL, title) if the page has a response link, NO_LINK if it
+        has none, or None if the page has to be parsed to decide
+    """
+    try:
+        url = _scan_link(data)
+
+        if url is None:
+            return NO_LINK
+
+        return url, _scan_title(data)
+
+    except _Undecided:
+        return None
+
+
+def _scan_link(data: Buffer) -> Optional[str]:
+    """Return the href of the first matching <a>, or None if there is none."""
+
+    for match in _PREFILTER.finditer(data):
+
+        anchor = _enclosing_anchor(data, match.start(), match.end())
+
+        if anchor is None:
+            continue
+
+        open_tag, text = anchor
+
+        # BeautifulSoup only matches a link whose text is a single string
+        if "<" in text:
+            raise _Undecided()
+
+        if not RESPONSE_LINK_TEXT.search(html.unescape(text)):
+            continue
+
+        # The first link with the text decides, as soup.find() does
+        href = _HREF.search(open_tag)
+
+        if href is None:
+            return None
+
+        value = next(group for group in href.groups() if group is not None)
+
+        return html.unescape(value) or None
+
+    return None
+
+
+def _enclosing_anchor(data: Buffer, start: int, end: int) -> Optional[Tuple[str, str]]:
+    """
+    Find the <a> element around a text match.
+
+    Returns:
+        (opening tag, inner HTML), or None if the match is not inside a link
+    """
+    open_start = data.rfind(b"<a", 0, start)
+
+    # Skip tags such as <abbr> or <article>
+    while open_start != -1 and not _ANCHOR_OPEN.match(data, open_start):
+        open_start = data.rfind(b"<a", 0, open_start)
+
+    if open_start == -1:
+        return None
+
+    open_end = data.find(b">", open_start)
+
+    if open_end == -1 or open_end > start:
+        return None
+
+    # The closest link before the match was already closed
+    if _ANCHOR_CLOSE.search(data, open_end, start):
+        return None
+
+    close = _ANCHOR_CLOSE.search(data, end)
+
+    if close is None:
+        raise _Undecided()
+
+    if b"<!--" in data[open_start : close.start()]:
+        raise _Undecided()
+
+    return _decode(data[open_start : open_end + 1]), _decode(
+        data[open_end + 1 : close.start()]
+    )
+
+
+def _scan_title(data: Buffer) -> str:
+    """Title as BeautifulSoup's get_text(strip=True) gives it."""
+
+    match = _TITLE_CORE.search(data)
+
+    if match is None:
+
+        # The header class is there, but not in a form the pattern knows
+        if data.find(_TITLE_CLASS) != -1:
+            raise _Undecided()
+
+        match = _FIRST_H1.search(data)
+
+    if match is None:
+
+        if re.search(rb"<h1\b", data, re.I):
+            raise _Undecided()
+
+        return ""
+
+    inner = _decode(match.group(1))
+
+    if "<!--" in inner or "<h1" in inner.lower():
+        raise _Undecided()
+
+    pieces = (html.unescape(piece).strip() for piece in _TAG.split(inner))
+
+    return "".join(piece for piece in pieces if piece)
+
+
+def _decode(fragment: Buffer) -> str:
+    """Decode a page fragment."""
+
+    return bytes(fragment).decode(PAGE_ENCODING, errors="replace")
@@ -14,6 +14,7 @@ from .file_operations.csv_reader import (
     extract_followup_website_urls,
 )
 from .downloader import FollowupWebsiteDownloader
+from .css_selectors import FollowupWebsiteSelectors
 from .file_operations.page import PageFileManager
 from .statistics import display_completion_summary
 from .consts import (
@@ -22,7 +23,15 @@ from .consts import (
     RESPONSES_FOLLOWUP_WEBSITE_DIR_NAME,
     LOG_DIR_NAME,
     LOG_MESSAGES,
+    HTTP_FIRST_FETCH,
+    DOWNLOAD_WORKERS,
+    INITIAL_REQUEST_RATE,
 )
+from ..scraper_shared.browser_session import browser_sessions
+from ..scraper_shared.http_fetcher import StaticPageFetcher
+from ..scraper_shared.incremental import create_page_store
+from ..scraper_shared.rate_controller import AdaptiveRateController
+from ..scraper_shared.telemetry import ScrapeTelemetry
 
 
 def scrape_followup_websites() -> str:
@@ -139,8 +148,42 @@ def _download_followup_websites(
     Returns:
         Tuple of (successful_items, failed_items)
     """
-    downloader = FollowupWebsiteDownloader(followup_website_dir)
-    return downloader.download_all_followup_websites(followup_urls)
+    logger = logging.getLogger("ECIFollowupWebsiteScraper")
+    rate_controller = AdaptiveRateController(INITIAL_REQUEST_RATE, logger=logger)
+
+    fetcher = None
+    if HTTP_FIRST_FETCH:
+        fetcher = StaticPageFetcher(
+            [FollowupWebsiteSelectors.MAIN_CONTENT],
+            logger=logger,
+            rate_controller=rate_controller,
+        )
+
+    incremental = create_page_store(followup_website_dir, logger=logger)
+
+    downloader = FollowupWebsiteDownloader(
+        followup_website_dir,
+        fetcher=fetcher,
+        num_workers=DOWNLOAD_WORKERS,
+        rate_controller=rate_controller,
+        incremental=incremental,
+        telemetry=ScrapeTelemetry(
+            "followup",
+            os.path.join(os.path.dirname(followup_website_dir), LOG_DIR_NAME),
+            logger=logger,
+        ),
+    )
+
+    try:
+        # Download workers reuse warm browsers; also keeps them for a caller
+        # running several scrapers in one process inside its own keep_alive()
+        with browser_sessions.keep_alive(logger):
+            return downloader.download_all_followup_websites(followup_urls)
+    finally:
+        if fetcher is not None:
+            fetcher.close()
+        if incremental is not None:
+            incremental.write_manifest()
 
 
 if __name__ == "__main__":
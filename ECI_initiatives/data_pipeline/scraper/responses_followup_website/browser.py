@@ -4,25 +4,28 @@ Browser initialization and management for followup website scraper.
 
 import logging
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 
-from .consts import CHROME_OPTIONS, LOG_MESSAGES
+from .consts import BROWSER_ALLOWED_RESOURCES, CHROME_OPTIONS, LOG_MESSAGES
+from ..scraper_shared.browser_factory import BrowserFactory
+from ..scraper_shared.browser_session import browser_sessions
+
+# Shared by all download workers, reports blocked resources at the end of a run
+browser_factory = BrowserFactory(
+    CHROME_OPTIONS,
+    BROWSER_ALLOWED_RESOURCES,
+    logger=logging.getLogger("ECIFollowupWebsiteScraper"),
+)
 
 
 def initialize_browser() -> webdriver.Chrome:
-    """Initialize Chrome WebDriver with headless options."""
+    """Initialize Chrome WebDriver with headless options and resource blocking."""
 
     logger = logging.getLogger("ECIFollowupWebsiteScraper")
 
-    chrome_options = Options()
-
-    # Add all configured options
-    for option in CHROME_OPTIONS:
-        chrome_options.add_argument(option)
-
     logger.info(LOG_MESSAGES["browser_init"])
 
-    driver = webdriver.Chrome(options=chrome_options)
+    # Reuses a warm driver when an earlier phase left one
+    driver = browser_sessions.acquire(browser_factory)
 
     logger.debug(LOG_MESSAGES["browser_success"])
 
@@ -5,16 +5,15 @@ Module-specific settings for scraping dedicated followup website pages.
 Common settings are imported from scraper_shared.const.
 
 Note on Fine-Tuning:
-    The timing configurations (WAIT_BETWEEN_DOWNLOADS, RETRY_WAIT_BASE) and retry
-    limits (DEFAULT_MAX_RETRIES) can be adjusted based on:
+    The starting request rate (INITIAL_REQUEST_RATE) and retry limits
+    (DEFAULT_MAX_RETRIES) can be adjusted based on:
     - Server load and response times
     - Rate limiting policies of the target website
     - Network conditions and infrastructure changes
     - Other development teams' usage patterns
 
-    If you experience frequent rate limiting or timeouts, consider increasing
-    wait times and retry intervals. For faster, more stable servers, you may
-    reduce these values to speed up scraping.
+    The rate adapts itself during a run (see scraper_shared.rate_controller);
+    the initial value only decides how fast the first requests are sent.
 """
 
 from pathlib import Path
@@ -26,11 +25,14 @@ from ..scraper_shared.const import (
     DATA_DIR_NAME,
     LOG_DIR_NAME,
     CHROME_OPTIONS,
-    WAIT_DYNAMIC_CONTENT,
+    HTTP_FIRST_FETCH,
+    DOWNLOAD_WORKERS,
+    INCREMENTAL_SCRAPING,
     WEBDRIVER_TIMEOUT_DEFAULT,
     WEBDRIVER_TIMEOUT_CONTENT,
     MIN_HTML_LENGTH,
     RATE_LIMIT_INDICATORS,
+    ERROR_PAGE_INDICATORS,
 )
 
 # Directory Structure
@@ -47,10 +49,13 @@ REGISTRATION_NUMBER_COLUMN = "registration_number"
 CSV_FILENAME = "responses_list.csv"  # Read from responses scraper output
 CSV_FIELDNAME_FOLLOWUP_URL = "followup_dedicated_website"
 
-# Module-specific Timing Configuration (in seconds)
-# Fine-tune these based on server response times and rate limiting behavior
-WAIT_BETWEEN_DOWNLOADS = (1.5, 2.0)  # Delay between downloading followup pages
-RETRY_WAIT_BASE = (2.0, 3.0)  # Base time for retry exponential backoff
+# Browser Resource Allowlist (categories of BLOCKED_RESOURCE_PATTERNS)
+# Followup pages are only read as HTML, nothing blocked is needed
+BROWSER_ALLOWED_RESOURCES = []
+
+# Module-specific Rate Configuration (requests per second)
+# Starting rate of followup page downloads, adapted during the run
+INITIAL_REQUEST_RATE = 0.55
 
 # Module-specific File Naming Patterns
 FOLLOWUP_PAGE_FILENAME_PATTERN = "{year}/{reg_number}_en.html"
@@ -59,14 +64,6 @@ FOLLOWUP_PAGE_FILENAME_PATTERN = "{year}/{reg_number}_en.html"
 # Adjust based on network stability and server reliability
 DEFAULT_MAX_RETRIES = 5
 
-# Error Page Detection (in addition to shared RATE_LIMIT_INDICATORS)
-# These multilingual error messages indicate server issues
-ERROR_PAGE_INDICATORS = [
-    "We apologise for any inconvenience",
-    "Veuillez nous excuser pour ce désagrément",
-    "Ci scusiamo per il disagio arrecato",
-]
-
 # Log Messages (followup-website-specific)
 LOG_MESSAGES = {
     # Scraping lifecycle
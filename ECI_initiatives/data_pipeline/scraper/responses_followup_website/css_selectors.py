@@ -0,0 +1,10 @@
+"""
+CSS selectors for followup website pages.
+"""
+
+
+class FollowupWebsiteSelectors:
+    """CSS selectors for followup website page elements."""
+
+    # Main content area (to verify page loaded)
+    MAIN_CONTENT = "main"
@@ -3,10 +3,9 @@ Download followup website pages using Selenium.
 """
 
 import datetime
-import random
 import time
 import logging
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 
 from bs4 import BeautifulSoup
 from selenium import webdriver
@@ -14,33 +13,71 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-from .browser import initialize_browser
+from .browser import browser_factory, initialize_browser
 from .consts import (
-    WAIT_DYNAMIC_CONTENT,
-    WAIT_BETWEEN_DOWNLOADS,
-    RETRY_WAIT_BASE,
+    INITIAL_REQUEST_RATE,
+    FOLLOWUP_PAGE_FILENAME_PATTERN,
     WEBDRIVER_TIMEOUT_CONTENT,
     DEFAULT_MAX_RETRIES,
-    RATE_LIMIT_INDICATORS,
     LOG_MESSAGES,
 )
 from .file_operations.page import save_followup_website_html_file
+from ..scraper_shared.browser_session import browser_sessions
+from ..scraper_shared.const import DEFERRED_RETRIES
+from ..scraper_shared.http_fetcher import StaticPageFetcher
+from ..scraper_shared.incremental import IncrementalStore
+from ..scraper_shared.page_readiness import PageReadinessWaiter
+from ..scraper_shared.page_validator import PageReport, scan_page
+from ..scraper_shared.rate_controller import (
+    AdaptiveRateController,
+    is_rate_limit_error,
+)
+from ..scraper_shared.telemetry import PageSpan, ScrapeTelemetry
+from ..scraper_shared.worker_pool import BrowserWorkerPool, RetryLater
 
 
 class FollowupWebsiteDownloader:
     """Download followup website pages with retry logic and error handling."""
 
-    def __init__(self, followup_website_dir: str):
+    def __init__(
+        self,
+        followup_website_dir: str,
+        fetcher: Optional[StaticPageFetcher] = None,
+        num_workers: int = 1,
+        rate_controller: Optional[AdaptiveRateController] = None,
+        incremental: Optional[IncrementalStore] = None,
+        telemetry: Optional[ScrapeTelemetry] = None,
+    ):
         """
         Initialize the downloader.
 
         Args:
             followup_website_dir: Base directory for saving followup website HTML files
+            fetcher: Optional HTTP-first fetcher; the browser is started
+                only for pages it cannot serve
+            num_workers: Number of parallel workers, each with its own browser
+            rate_controller: Request rate controller shared by all workers
+                (a new one starting at INITIAL_REQUEST_RATE by default)
+            incremental: Optional store carrying unchanged pages forward
+                from the previous session
+            telemetry: Per-page timing collector shared by all workers
+                (in memory only by default)
         """
 
         self.followup_website_dir = followup_website_dir
+        self.fetcher = fetcher
+        self.incremental = incremental
+        self.num_workers = num_workers
         self.driver = None
         self.logger = logging.getLogger("ECIFollowupWebsiteScraper")
+        self.rate_controller = rate_controller or AdaptiveRateController(
+            INITIAL_REQUEST_RATE, logger=self.logger
+        )
+        self.page_readiness = PageReadinessWaiter(logger=self.logger)
+        self.telemetry = telemetry or ScrapeTelemetry("followup", logger=self.logger)
+
+        # Spans of pages queued for a retry, by URL
+        self._deferred: Dict[str, PageSpan] = {}
 
     def download_all_followup_websites(
         self, followup_urls: List[Dict[str, str]]
@@ -57,33 +94,107 @@ class FollowupWebsiteDownloader:
         successful_items = []
         failed_items = []
 
+        self.logger.info("Starting download followups...")
+
         try:
-            # Initialize browser once for all downloads
-            self._initialize_driver()
+            results = BrowserWorkerPool(self.num_workers, self.logger).map(
+                followup_urls,
+                self._download_url,
+                self._open_worker,
+                self._close_worker,
+            )
 
-            # Download each followup website page
-            self.logger.info("Starting download followups...")
+        finally:
+            if self.fetcher is not None:
+                self.fetcher.log_summary()
+            self.rate_controller.log_summary()
+            self.page_readiness.log_summary()
+            browser_factory.log_summary()
+            self.telemetry.log_summary()
 
-            for url_data in followup_urls:
-                url = url_data["url"]
-                year = url_data["year"]
-                reg_number = url_data["registration_number"]
+        for url_data, success in zip(followup_urls, results):
 
-                success = self.download_single_followup_website(url, year, reg_number)
+            if success:
+                successful_items.append(url_data)
+            else:
+                failed_items.append(url_data)
 
-                if success:
-                    successful_items.append(url_data)
-                else:
-                    failed_items.append(url_data)
+        return successful_items, failed_items
 
-                # Wait between downloads
-                wait_time = random.uniform(*WAIT_BETWEEN_DOWNLOADS)
-                time.sleep(wait_time)
+    def _download_url(
+        self, worker: "FollowupWebsiteDownloader", url_data: Dict[str, str]
+    ) -> bool:
+        """
+        Download one followup website page on the given worker.
 
-        finally:
-            self._close_driver()
+        Args:
+            worker: Downloader owning the browser used for this page
+            url_data: Dictionary with 'url', 'year', 'registration_number'
 
-        return successful_items, failed_items
+        Returns:
+            True if successful, False otherwise
+        """
+
+        # A retried page continues its span
+        span = self._deferred.pop(url_data["url"], None) or self.telemetry.page(
+            url_data["url"]
+        )
+
+        # Request rate is shared by all workers
+        with span.phase("rate_wait"):
+            time.sleep(self.rate_controller.reserve())
+
+        try:
+            success = worker.download_single_followup_website(
+                url_data["url"],
+                url_data["year"],
+                url_data["registration_number"],
+                span=span,
+                defer_retries=DEFERRED_RETRIES,
+            )
+
+        except RetryLater:
+            self._deferred[url_data["url"]] = span
+            raise
+
+        if success:
+            self.rate_controller.record_success()
+
+        span.finish(success)
+
+        return success
+
+    def _open_worker(self) -> "FollowupWebsiteDownloader":
+        """
+        Create the downloader used by one pool worker.
+
+        A single worker reuses this instance; parallel workers get their own
+        instance (and browser) sharing the fetcher and logger.
+        """
+
+        worker = self
+        if self.num_workers > 1:
+            worker = FollowupWebsiteDownloader(
+                self.followup_website_dir,
+                fetcher=self.fetcher,
+                incremental=self.incremental,
+            )
+            worker.logger = self.logger
+            worker.rate_controller = self.rate_controller
+            worker.page_readiness = self.page_readiness
+            worker.telemetry = self.telemetry
+
+        # Without HTTP-first fetching every page needs the browser
+        if self.fetcher is None:
+            worker._initialize_driver()
+
+        return worker
+
+    @staticmethod
+    def _close_worker(worker: "FollowupWebsiteDownloader") -> None:
+        """Close the browser of one pool worker."""
+
+        worker._close_driver()
 
     def download_single_followup_website(
         self,
@@ -91,6 +202,8 @@ class FollowupWebsiteDownloader:
         year: str,
         reg_number: str,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        span: Optional[PageSpan] = None,
+        defer_retries: bool = False,
     ) -> bool:
         """
         Download a single followup website page with retry logic.
@@ -100,6 +213,9 @@ class FollowupWebsiteDownloader:
             year: Year of the initiative
             reg_number: Registration number (format: YYYY_NNNNNN)
             max_retries: Maximum number of retry attempts
+            span: Timings of the page (a throwaway span by default); the
+                attempts continue from span.retries
+            defer_retries: Raise RetryLater instead of sleeping before a retry
 
         Returns:
             True if successful, False otherwise
@@ -108,38 +224,76 @@ class FollowupWebsiteDownloader:
             LOG_MESSAGES["download_start"].format(reg_number=reg_number, url=url)
         )
 
-        actual_url = url
+        span = span or PageSpan(url)
+        first_attempt = span.retries
+
+        # A retried page goes straight to the browser
+        if self.fetcher is not None and not first_attempt:
+            filename = self._download_static_followup_website(
+                url, year, reg_number, span
+            )
+
+            if filename:
+                self.logger.info(
+                    LOG_MESSAGES["download_success"].format(filename=filename)
+                )
+                return True
+
+            # The HTTP attempt used up the reserved slot
+            with span.phase("rate_wait"):
+                time.sleep(self.rate_controller.reserve())
+
+        # Browser is started lazily, only once a page needs it
+        self._initialize_driver()
+
+        # Skips the redirect round trip if a previous session saw one
+        target_url = self._resolve_url(url)
+        actual_url = target_url
 
-        for attempt in range(max_retries):
+        for attempt in range(first_attempt, max_retries):
             try:
-                # On first attempt, check if URL redirects
-                if attempt == 0:
-                    self.driver.get(url)
-                    time.sleep(1)
-                    actual_url = self.driver.current_url
-
-                    if actual_url != url:
-                        self.logger.info(f"URL redirected: {url} -> {actual_url}")
-                else:
+                # Replaces a crashed or worn-out browser
+                self.driver = browser_sessions.refresh(self.driver)
+                with span.phase("navigate"):
                     self.driver.get(actual_url)
 
                 # Wait for page content to load
-                self._wait_for_page_content()
+                with span.phase("readiness"):
+                    self._wait_for_page_content()
 
-                # Check for rate limiting
-                self._check_rate_limiting()
+                # Wait until the DOM has settled; scripted redirects have
+                # happened by then
+                with span.phase("readiness"):
+                    self.page_readiness.wait(self.driver, url)
 
-                # Wait for dynamic content
-                wait_time = random.uniform(*WAIT_DYNAMIC_CONTENT)
-                time.sleep(wait_time)
+                # On first attempt, check if URL redirected
+                if attempt == first_attempt:
+                    requested_url, actual_url = actual_url, self.driver.current_url
+                    self._record_redirect(url, requested_url, actual_url)
 
-                # Get page source
+                # Get page source, scanned once for the rate limit check
+                # and the saver
                 page_source = self.driver.page_source
 
+                # Check for rate limiting
+                with span.phase("rate_limit_check"):
+                    report = scan_page(page_source)
+                    self._check_rate_limiting(report)
+
                 # Save to file
-                filename = save_followup_website_html_file(
-                    self.followup_website_dir, year, reg_number, page_source
-                )
+                with span.phase("save"):
+                    filename = save_followup_website_html_file(
+                        self.followup_website_dir, year, reg_number, page_source, report
+                    )
+
+                span.source = "browser"
+                span.bytes = report.size
+
+                # Count blocked resources of the page
+                browser_factory.record_page(self.driver)
+
+                if self.incremental is not None:
+                    self.incremental.record_download(url, filename)
 
                 self.logger.info(
                     LOG_MESSAGES["download_success"].format(filename=filename)
@@ -151,9 +305,21 @@ class FollowupWebsiteDownloader:
                     f"Download attempt {attempt + 1}/{max_retries} failed for {url}: {str(e)}"
                 )
 
+                rate_limited = is_rate_limit_error(str(e))
+
                 if attempt < max_retries - 1:
-                    base_wait = random.uniform(*RETRY_WAIT_BASE)
-                    wait_time = base_wait * (2**attempt)
+                    span.retries += 1
+
+                    # Backs off through the shared rate, not a local formula
+                    if defer_retries:
+                        wait_time = self.rate_controller.backoff_delay(
+                            attempt, rate_limited
+                        )
+                    else:
+                        wait_time = self.rate_controller.retry_delay(
+                            attempt, rate_limited
+                        )
+
                     self.logger.info(
                         LOG_MESSAGES["rate_limit_retry"].format(
                             retry=attempt + 1,
@@ -161,23 +327,152 @@ class FollowupWebsiteDownloader:
                             wait_time=wait_time,
                         )
                     )
-                    time.sleep(wait_time)
+
+                    # The worker downloads other pages meanwhile
+                    if defer_retries:
+                        raise RetryLater(wait_time)
+
+                    with span.phase("rate_wait"):
+                        time.sleep(wait_time)
+
+                elif rate_limited:
+                    self.rate_controller.record_rate_limited()
 
         self.logger.error(LOG_MESSAGES["download_failed"].format(url=url))
         return False
 
-    def _check_rate_limiting(self) -> None:
+    def _download_static_followup_website(
+        self, url: str, year: str, reg_number: str, span: Optional[PageSpan] = None
+    ) -> Optional[str]:
+        """
+        Download a followup website page over plain HTTP without the browser.
+
+        Args:
+            url: Full URL to the followup website page
+            year: Year of the initiative
+            reg_number: Registration number (format: YYYY_NNNNNN)
+
+            span: Timings of the page
+
+        Returns:
+            Filename of saved file, or None if the browser is needed
+        """
+
+        span = span or PageSpan(url)
+
+        relative_path = FOLLOWUP_PAGE_FILENAME_PATTERN.format(
+            year=year, reg_number=reg_number
+        )
+        headers = None
+        if self.incremental is not None:
+            headers = self.incremental.conditional_headers(relative_path)
+
+        target_url = self._resolve_url(url)
+
+        with span.phase("navigate"):
+            static_page = self.fetcher.fetch(target_url, headers=headers)
+
+        if static_page is not None and static_page.not_modified:
+
+            if self.incremental.carry_forward(url, relative_path):
+                self.logger.info(
+                    f"♻️  Unchanged since previous session: {relative_path}"
+                )
+                span.source = "carried_forward"
+                return relative_path
+
+            with span.phase("navigate"):
+                static_page = self.fetcher.fetch(target_url)
+
+        if static_page is None:
+            return None
+
+        if static_page.gone:
+
+            # The known target is gone; the browser asks the original URL
+            if target_url != url:
+                self.logger.info(f"Redirect target gone: {target_url}")
+                self.incremental.forget_redirect(url)
+
+            return None
+
+        self._record_redirect(url, target_url, static_page.final_url)
+
+        # Scanned by the fetcher already
+        report = static_page.report or scan_page(static_page.page_source)
+
+        try:
+            with span.phase("save"):
+                filename = save_followup_website_html_file(
+                    self.followup_website_dir,
+                    year,
+                    reg_number,
+                    static_page.page_source,
+                    report,
+                )
+
+        except Exception as e:
+            self.fetcher.record_fallback(url, str(e))
+            return None
+
+        span.source = "http"
+        span.bytes = report.size
+
+        if self.incremental is not None:
+            self.incremental.record_download(
+                url, filename, static_page.etag, static_page.last_modified
+            )
+
+        return filename
+
+    def _resolve_url(self, url: str) -> str:
+        """URL to navigate to, following a redirect known from earlier sessions."""
+
+        if self.incremental is None:
+            return url
+
+        return self.incremental.resolve_redirect(url)
+
+    def _record_redirect(self, url: str, requested_url: str, final_url: str) -> None:
+        """
+        Log and remember where a page ended up.
+
+        Args:
+            url: Page URL
+            requested_url: URL navigated to (url or its known redirect target)
+            final_url: URL the page was loaded from
+        """
+        if final_url != requested_url:
+            self.logger.info(f"URL redirected: {requested_url} -> {final_url}")
+
+        if self.incremental is None:
+            return
+
+        # A known target that redirects elsewhere is stale; the next visit
+        # asks the original URL where the page is now
+        if requested_url != url and final_url != requested_url:
+            self.incremental.forget_redirect(url)
+        else:
+            self.incremental.record_redirect(
+                url, final_url, verified=requested_url == url
+            )
+
+    def _check_rate_limiting(self, report: Optional[PageReport] = None) -> None:
         """
         Check if the current page shows rate limiting errors.
 
+        Args:
+            report: Validation scan of the current page (scanned if not given)
+
         Raises:
             Exception: If rate limiting is detected
         """
-        page_source = self.driver.page_source.lower()
+        report = report or scan_page(self.driver.page_source)
 
-        for indicator in RATE_LIMIT_INDICATORS:
-            if indicator.lower() in page_source:
-                raise Exception(f"Rate limiting detected: {indicator}")
+        if report.rate_limit_indicators:
+            raise Exception(
+                f"Rate limiting detected: {report.rate_limit_indicators[0]}"
+            )
 
     def _wait_for_page_content(self) -> None:
         """
@@ -220,7 +515,7 @@ class FollowupWebsiteDownloader:
         """Close the WebDriver and clean up resources."""
         if self.driver:
             try:
-                self.driver.quit()
+                browser_sessions.release(self.driver)
                 self.logger.info(LOG_MESSAGES["browser_closed"])
             except Exception as e:
                 self.logger.error(f"Error closing browser: {str(e)}")
@@ -4,10 +4,10 @@ File operations for saving followup website pages.
 
 import os
 import logging
+from typing import Optional
 
-from bs4 import BeautifulSoup
-
-from ..consts import MIN_HTML_LENGTH, RATE_LIMIT_INDICATORS
+from ...scraper_shared.page_io import write_page
+from ...scraper_shared.page_validator import PageReport, scan_page
 
 
 class PageFileManager:
@@ -34,7 +34,11 @@ class PageFileManager:
             self.logger.info(f"Created followup website directory: {self.base_dir}")
 
     def save_followup_website_page(
-        self, page_source: str, year: str, reg_number: str
+        self,
+        page_source: str,
+        year: str,
+        reg_number: str,
+        report: Optional[PageReport] = None,
     ) -> str:
         """
         Save followup website page HTML to file.
@@ -43,6 +47,7 @@ class PageFileManager:
             page_source: HTML content to save
             year: Year of the initiative
             reg_number: Registration number (format: YYYY_NNNNNN)
+            report: Validation scan of page_source, if already made
 
         Returns:
             Filename of saved file
@@ -52,7 +57,8 @@ class PageFileManager:
         """
 
         # Validate HTML
-        self._validate_html(page_source)
+        report = report or scan_page(page_source)
+        self._validate_html(page_source, report)
 
         # Create year directory
         year_dir = self._create_year_directory(year)
@@ -61,53 +67,44 @@ class PageFileManager:
         filename = self._generate_filename(year, reg_number)
         full_path = os.path.join(self.base_dir, filename)
 
-        # Prettify HTML
-        soup = BeautifulSoup(page_source, "html.parser")
-        pretty_html = soup.prettify()
-
-        # Save to file
-        with open(full_path, "w", encoding="utf-8") as f:
-            f.write(pretty_html)
+        # Save to file as received, extractors parse it as stored
+        write_page(full_path, page_source)
 
         self.logger.debug(f"Saved followup website page: {filename}")
 
         return filename
 
-    def _validate_html(self, page_source: str) -> bool:
+    def _validate_html(
+        self, page_source: str, report: Optional[PageReport] = None
+    ) -> bool:
         """
         Validate HTML content for rate limiting and malformed content.
 
         Args:
             page_source: HTML content to validate
+            report: Validation scan of page_source, if already made
 
         Returns:
-            True if valid, False otherwise
+            True if valid
 
         Raises:
-            Exception: If rate limiting detected
+            Exception: If the page is too short, an error page or rate limited
         """
+        report = report or scan_page(page_source)
 
         # Check minimum length
-        if len(page_source) < MIN_HTML_LENGTH:
-            raise Exception(f"HTML content too short: {len(page_source)} characters")
+        if report.too_short:
+            raise Exception(f"HTML content too short: {report.length} characters")
 
         # Check for error page
-        error_page_indicators = [
-            "We apologise for any inconvenience",
-            "Veuillez nous excuser pour ce désagrément",
-            "Ci scusiamo per il disagio arrecato",
-        ]
-
-        page_lower = page_source.lower()
-
-        for indicator in error_page_indicators:
-            if indicator.lower() in page_lower:
-                raise Exception(f"Error page detected: {indicator}")
+        if report.error_page_indicators:
+            raise Exception(f"Error page detected: {report.error_page_indicators[0]}")
 
         # Check for rate limiting indicators
-        for indicator in RATE_LIMIT_INDICATORS:
-            if indicator.lower() in page_lower:
-                raise Exception(f"Rate limiting detected in content: {indicator}")
+        if report.rate_limit_indicators:
+            raise Exception(
+                f"Rate limiting detected in content: {report.rate_limit_indicators[0]}"
+            )
 
         return True
 
@@ -141,7 +138,11 @@ class PageFileManager:
 
 
 def save_followup_website_html_file(
-    followup_website_dir: str, year: str, reg_number: str, page_source: str
+    followup_website_dir: str,
+    year: str,
+    reg_number: str,
+    page_source: str,
+    report: Optional[PageReport] = None,
 ) -> str:
     """
     Convenience function to save followup website page.
@@ -151,9 +152,10 @@ def save_followup_website_html_file(
         year: Year of initiative
         reg_number: Registration number
         page_source: HTML content
+        report: Validation scan of page_source, if already made
 
     Returns:
         Filename of saved file
     """
     file_ops = PageFileManager(followup_website_dir)
-    return file_ops.save_followup_website_page(page_source, year, reg_number)
+    return file_ops.save_followup_website_page(page_source, year, reg_number, report)
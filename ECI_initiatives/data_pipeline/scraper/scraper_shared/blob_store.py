@@ -0,0 +1,169 @@
+"""
+Content-addressed store for raw HTML pages shared by all scrape sessions.
+
+Every saved page is adopted into data/.blobs/, keyed by the SHA-256 of its
+exact (decompressed) bytes, and the session file becomes a hardlink to that blob.
+Identical pages from different sessions therefore occupy disk space once,
+and backups only need to copy blobs that did not exist before. Compressed
+pages keep their compression suffix in the blob name, as the blob is the
+very same file. Session
+directories keep their usual layout, so the extractors' globbing still works.
+
+The incremental manifest of each pages directory (see incremental.py) maps
+relative paths to blob digests and doubles as the session's thin index:
+materialize_session() rebuilds a session directory from it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+
+from .const import BLOB_STORE_DIR_NAME, BLOB_FILE_SUFFIX
+from .page_io import compression_suffix, page_bytes
+
+
+def page_fingerprint(path: str) -> str:
+    """
+    Return the SHA-256 hex digest of a page's exact bytes.
+
+    Pages are stored as received, so pages differing in whitespace or line
+    endings only get different digests and never share a blob.
+    """
+    # Decompressed, so the digest does not depend on how the page is stored
+    with page_bytes(path) as content:
+        return hashlib.sha256(content).hexdigest()
+
+
+def link_or_copy(source: str, destination: str) -> None:
+    """Atomically replace destination with a hardlink to source (or a copy)."""
+
+    temp_path = f"{destination}.link-tmp"
+
+    try:
+        os.link(source, temp_path)
+    except OSError:
+        # Different file system, or hardlinks not supported
+        shutil.copy2(source, temp_path)
+
+    os.replace(temp_path, destination)
+
+
+class BlobStore:
+    """Deduplicate page files across sessions by hardlinking them to blobs."""
+
+    def __init__(self, data_dir: str, logger=None):
+        """
+        Initialize the store.
+
+        Args:
+            data_dir: Data directory holding the timestamped sessions; blobs
+                are kept next to them so that hardlinks stay on one file system
+            logger: Logger of the calling scraper (defaults to module logger)
+        """
+        self.root = os.path.join(data_dir, BLOB_STORE_DIR_NAME)
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.new_blobs = 0
+        self.deduplicated = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+
+    def blob_path(self, digest: str, page_path: str = "") -> str:
+        """
+        Return the path of a blob, sharded by the first two hex digits.
+
+        Args:
+            digest: Digest of the page
+            page_path: Stored page path whose compression suffix the blob keeps
+        """
+        suffix = BLOB_FILE_SUFFIX + compression_suffix(page_path)
+
+        return os.path.join(self.root, digest[:2], f"{digest}{suffix}")
+
+    def adopt(self, path: str) -> str:
+        """
+        Move a freshly saved page into the store.
+
+        If a blob with the same bytes exists, the page file is
+        replaced by a hardlink to it; otherwise the page file becomes the blob.
+
+        Args:
+            path: Page file inside a session directory
+
+        Returns:
+            Digest of the page
+        """
+        digest = page_fingerprint(path)
+        blob = self.blob_path(digest, path)
+
+        with self._lock:
+
+            if not os.path.exists(blob):
+                os.makedirs(os.path.dirname(blob), exist_ok=True)
+                link_or_copy(path, blob)
+                self.new_blobs += 1
+
+            elif not os.path.samefile(blob, path):
+                self.bytes_saved += os.path.getsize(path)
+                link_or_copy(blob, path)
+                self.deduplicated += 1
+
+        return digest
+
+    def materialize(self, digest: str, path: str) -> None:
+        """
+        Recreate a page file from its blob.
+
+        Args:
+            digest: Digest of the page
+            path: Destination page file, as stored (with compression suffix)
+
+        Raises:
+            FileNotFoundError: If the blob is not in the store
+        """
+        blob = self.blob_path(digest, path)
+
+        if not os.path.isfile(blob):
+            raise FileNotFoundError(f"Blob not found in store: {blob}")
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        link_or_copy(blob, path)
+
+    def log_summary(self) -> None:
+        """Log how much the store deduplicated in this run."""
+
+        if self.new_blobs or self.deduplicated:
+            self.logger.info(
+                f"Blob store: {self.new_blobs} new blobs, {self.deduplicated} pages "
+                f"deduplicated ({self.bytes_saved / 1024:.0f} KiB saved)"
+            )
+
+
+def materialize_session(manifest_path: str, blob_store: BlobStore) -> int:
+    """
+    Rebuild the pages of a session directory from its manifest.
+
+    Used after restoring a backup that contains only the blob store and the
+    session manifests.
+
+    Args:
+        manifest_path: Incremental manifest of a pages directory
+        blob_store: Store holding the blobs referenced by the manifest
+
+    Returns:
+        Number of page files written
+    """
+    pages_dir = os.path.dirname(manifest_path)
+
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        pages = json.load(f).get("pages", [])
+
+    for page in pages:
+        blob_store.materialize(
+            page["fingerprint"], os.path.join(pages_dir, page["path"])
+        )
+
+    return len(pages)
@@ -0,0 +1,304 @@
+"""
+Chrome WebDriver factory shared by all ECI scrapers.
+
+The extractors only read the HTML of a page, but every browser page load also
+pulled images, web fonts, stylesheets and third-party analytics. Drivers
+created here block those requests through the Chrome DevTools protocol
+(Network.setBlockedURLs), by the URL patterns in BLOCKED_RESOURCE_PATTERNS.
+Each scraper passes the categories it still needs as its allowlist.
+
+Network events are read back from the Chrome performance log after every
+page, to count blocked requests and transferred bytes. The first page of a
+run is loaded once more without blocking, so the run summary can report the
+bytes and load time saved per page, and extrapolated over the run.
+"""
+
+import json
+import logging
+import threading
+from collections import Counter
+from typing import Iterable, List, Optional, Tuple
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from .const import (
+    BLOCK_BROWSER_RESOURCES,
+    BLOCKED_RESOURCE_PATTERNS,
+    CHROME_OPTIONS,
+    MEASURE_BLOCKING_SAVINGS,
+)
+
+# Load time of the current document in seconds (0 while still loading)
+LOAD_TIME_SCRIPT = """
+var entry = performance.getEntriesByType('navigation')[0];
+return entry ? entry.duration / 1000 : 0;
+"""
+
+
+def blocked_url_patterns(allowed_resources: Iterable[str] = ()) -> List[str]:
+    """
+    Build the DevTools URL block list without the allowed categories.
+
+    Args:
+        allowed_resources: Categories of BLOCKED_RESOURCE_PATTERNS to load anyway
+
+    Returns:
+        URL patterns ('*' wildcards) to block
+
+    Raises:
+        ValueError: If an allowed category is unknown
+    """
+    allowed = set(allowed_resources)
+    unknown = allowed - set(BLOCKED_RESOURCE_PATTERNS)
+
+    if unknown:
+        raise ValueError(f"Unknown resource categories: {sorted(unknown)}")
+
+    patterns = []
+
+    for category, category_patterns in BLOCKED_RESOURCE_PATTERNS.items():
+
+        if category in allowed:
+            continue
+
+        for pattern in category_patterns:
+            patterns.append(pattern)
+
+            # Patterns match the whole URL, including cache-busting queries
+            if pattern.startswith("*."):
+                patterns.append(pattern + "?*")
+
+    return patterns
+
+
+def read_network_log(driver) -> Optional[Tuple[int, Counter]]:
+    """
+    Read the network events logged since the last call.
+
+    Args:
+        driver: WebDriver created with performance logging
+
+    Returns:
+        Tuple of transferred bytes and blocked requests by resource type,
+        or None if the driver does not provide a performance log
+    """
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return None
+
+    if not isinstance(entries, list):
+        return None
+
+    transferred = 0
+    blocked = Counter()
+
+    for entry in entries:
+
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+
+        params = message.get("params", {})
+
+        if message.get("method") == "Network.loadingFinished":
+            transferred += int(params.get("encodedDataLength", 0))
+
+        elif message.get("method") == "Network.loadingFailed" and params.get(
+            "blockedReason"
+        ):
+            blocked[params.get("type", "Other")] += 1
+
+    return transferred, blocked
+
+
+class BrowserFactory:
+    """Create Chrome drivers that skip resources the extractors never read."""
+
+    def __init__(
+        self,
+        chrome_options: Iterable[str] = CHROME_OPTIONS,
+        allowed_resources: Iterable[str] = (),
+        block_resources: bool = BLOCK_BROWSER_RESOURCES,
+        measure_savings: bool = MEASURE_BLOCKING_SAVINGS,
+        logger=None,
+    ):
+        """
+        Initialize the factory.
+
+        Args:
+            chrome_options: Chrome command line arguments
+            allowed_resources: Categories of BLOCKED_RESOURCE_PATTERNS the
+                scraper needs loaded
+            block_resources: Whether to block resources at all
+            measure_savings: Whether to load the first page once more
+                without blocking (outside the rate controller), to estimate
+                the savings
+            logger: Logger of the calling scraper (defaults to module logger)
+        """
+        self.chrome_options = list(chrome_options)
+        self.blocked_patterns = (
+            blocked_url_patterns(allowed_resources) if block_resources else []
+        )
+        self.measure_savings = measure_savings
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.pages = 0
+        self.bytes_transferred = 0
+        self.blocked_requests = Counter()
+
+        # Bytes and load time of one page with and without blocking
+        self.reference: Optional[Tuple[int, float, int, float]] = None
+        self._reference_claimed = False
+        self._lock = threading.Lock()
+
+    def create(self) -> webdriver.Chrome:
+        """Start a Chrome driver with resource blocking enabled."""
+
+        chrome_options = Options()
+
+        for option in self.chrome_options:
+            chrome_options.add_argument(option)
+
+        if self.blocked_patterns:
+            # Network events are read back for the run summary
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        driver = webdriver.Chrome(options=chrome_options)
+        self.configure(driver)
+
+        return driver
+
+    def configure(self, driver) -> None:
+        """
+        Apply this factory's blocking to a driver, new or reused.
+
+        A warm driver handed over by another scraper gets this scraper's
+        block list, and the network events of its previous pages are dropped.
+
+        Args:
+            driver: Chrome driver
+        """
+        if not self.blocked_patterns:
+            return
+
+        self._set_blocking(driver, True)
+        read_network_log(driver)
+
+    def record_page(self, driver) -> None:
+        """
+        Account for the network traffic of the page just loaded.
+
+        Call once per page, after it was saved: with measure_savings, the
+        first page of a run is reloaded without blocking to estimate the
+        savings.
+
+        Args:
+            driver: WebDriver created by this factory
+        """
+        if not self.blocked_patterns:
+            return
+
+        network = read_network_log(driver)
+
+        if network is None:
+            return
+
+        transferred, blocked = network
+
+        with self._lock:
+            self.pages += 1
+            self.bytes_transferred += transferred
+            self.blocked_requests.update(blocked)
+
+            measure = self.measure_savings and not self._reference_claimed
+            self._reference_claimed = True
+
+        if measure:
+            self._measure_reference(driver, transferred)
+
+    def log_summary(self) -> None:
+        """Log blocked requests and the bytes and load time saved in the run."""
+
+        with self._lock:
+            pages = self.pages
+            transferred = self.bytes_transferred
+            blocked = sum(self.blocked_requests.values())
+            by_type = ", ".join(
+                f"{resource_type} {count}"
+                for resource_type, count in self.blocked_requests.most_common()
+            )
+
+        if not pages:
+            return
+
+        self.logger.info(
+            f"Resource blocking: {pages} pages, {blocked} requests blocked"
+            + (f" ({by_type})" if by_type else "")
+            + f", {transferred / 1024:.0f} KB transferred"
+        )
+
+        if self.reference is None:
+            return
+
+        blocked_bytes, blocked_time, full_bytes, full_time = self.reference
+        saved_bytes = max(full_bytes - blocked_bytes, 0)
+        saved_time = max(full_time - blocked_time, 0.0)
+
+        self.logger.info(
+            f"Resource blocking saved an estimated {saved_bytes / 1024:.0f} KB "
+            f"and {saved_time:.2f}s per page (extrapolated from the first page), "
+            f"about {saved_bytes * pages / 1024 / 1024:.1f} MB and "
+            f"{saved_time * pages:.0f}s over the run"
+        )
+
+    def _measure_reference(self, driver, blocked_bytes: int) -> None:
+        """Reload the current page without blocking and record both loads."""
+
+        blocked_time = self._load_time(driver)
+
+        try:
+            self._set_blocking(driver, False)
+            driver.get(driver.current_url)
+            full_bytes, _ = read_network_log(driver) or (0, None)
+            full_time = self._load_time(driver)
+
+        except Exception as e:
+            self.logger.warning(f"Could not measure resource blocking savings: {e}")
+            return
+
+        finally:
+            self._set_blocking(driver, True)
+
+        if full_bytes:
+            self.reference = (blocked_bytes, blocked_time, full_bytes, full_time)
+
+    def _set_blocking(self, driver, enabled: bool) -> None:
+        """Switch DevTools request blocking (and the cache, for fair numbers)."""
+
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd(
+                "Network.setBlockedURLs",
+                {"urls": self.blocked_patterns if enabled else []},
+            )
+            # The reference load must not be served from the cache
+            driver.execute_cdp_cmd(
+                "Network.setCacheDisabled", {"cacheDisabled": not enabled}
+            )
+
+        except Exception as e:
+            self.logger.warning(f"Could not set resource blocking: {e}")
+
+    @staticmethod
+    def _load_time(driver) -> float:
+        """Load time of the current document in seconds (0 if unknown)."""
+
+        try:
+            seconds = driver.execute_script(LOAD_TIME_SCRIPT)
+        except Exception:
+            return 0.0
+
+        return float(seconds) if isinstance(seconds, (int, float)) else 0.0
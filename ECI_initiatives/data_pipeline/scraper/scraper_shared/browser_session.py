@@ -0,0 +1,247 @@
+"""
+Long-lived Chrome sessions shared by all ECI scrapers.
+
+Every phase used to start its own Chrome and quit it when done: the listing
+crawler, the listing workers, the download workers and each of the three
+scrapers. Drivers are now taken from and given back to one process-wide pool.
+Inside keep_alive() (entered by the scraper entry points) a released driver
+stays warm, with its HTTP cache and connections, for the next phase or the
+next scraper run in the same process. Outside it a released driver is quit,
+as before.
+
+Before every page load, callers pass their driver through refresh(): a driver
+that no longer answers (crashed Chrome) or that has served
+BROWSER_RECYCLE_AFTER_PAGES pages is quit and replaced by a fresh one.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List
+
+from .browser_factory import BrowserFactory
+from .const import BROWSER_POOL_SIZE, BROWSER_RECYCLE_AFTER_PAGES
+
+
+@dataclass
+class _Session:
+    """Bookkeeping of one pooled driver."""
+
+    driver: object
+    factory: BrowserFactory
+    pages: int = 0
+
+
+class BrowserSessionPool:
+    """Keep Chrome drivers warm across scraping phases and recycle them."""
+
+    def __init__(
+        self,
+        pool_size: int = BROWSER_POOL_SIZE,
+        recycle_after_pages: int = BROWSER_RECYCLE_AFTER_PAGES,
+        logger=None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            pool_size: Maximum number of idle drivers kept for reuse
+            recycle_after_pages: Page loads after which a driver is replaced
+            logger: Logger (defaults to module logger)
+        """
+        self.pool_size = max(1, pool_size)
+        self.recycle_after_pages = recycle_after_pages
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._sessions: Dict[int, _Session] = {}
+        self._idle: List[_Session] = []
+        self._keep_alive_depth = 0
+        self._lock = threading.Lock()
+
+        self.started = 0
+        self.reused = 0
+        self.recycled = 0
+        self.crashed = 0
+
+    @contextmanager
+    def keep_alive(self, logger=None) -> Iterator["BrowserSessionPool"]:
+        """
+        Keep released drivers warm until the outermost block exits.
+
+        Nested blocks (e.g. several scrapers run from one script) share the
+        drivers; idle drivers are quit when the outermost block exits.
+
+        Args:
+            logger: Logger of the calling scraper, used by the outermost block
+        """
+        with self._lock:
+            self._keep_alive_depth += 1
+
+            if self._keep_alive_depth == 1 and logger is not None:
+                self.logger = logger
+
+        try:
+            yield self
+
+        finally:
+            with self._lock:
+                self._keep_alive_depth -= 1
+                outermost = self._keep_alive_depth == 0
+
+            if outermost:
+                self.close()
+                self.log_summary()
+
+    def acquire(self, factory: BrowserFactory):
+        """
+        Take a warm driver from the pool, or start one with the factory.
+
+        Args:
+            factory: Factory of the calling scraper (options and blocking)
+
+        Returns:
+            Chrome driver, to be given back with release()
+        """
+        while True:
+
+            with self._lock:
+                session = self._idle.pop() if self._idle else None
+
+            if session is None:
+                return self._start(factory)
+
+            if self._is_alive(session.driver):
+                session.factory = factory
+                factory.configure(session.driver)
+
+                with self._lock:
+                    self.reused += 1
+
+                self.logger.debug("Reusing warm browser session")
+                return session.driver
+
+            self._discard(session)
+
+            with self._lock:
+                self.crashed += 1
+
+    def refresh(self, driver):
+        """
+        Check a driver before its next page load.
+
+        Drivers not started by the pool are returned unchanged.
+
+        Args:
+            driver: Driver about to load a page
+
+        Returns:
+            The same driver, or a fresh one if it crashed or served enough pages
+        """
+        with self._lock:
+            session = self._sessions.get(id(driver))
+
+        if session is None:
+            return driver
+
+        if not self._is_alive(driver):
+            self.logger.warning("Browser session not responding, starting a new one")
+            with self._lock:
+                self.crashed += 1
+
+        elif session.pages >= self.recycle_after_pages:
+            self.logger.info(f"Recycling browser session after {session.pages} pages")
+            with self._lock:
+                self.recycled += 1
+
+        else:
+            session.pages += 1
+            return driver
+
+        self._discard(session)
+
+        driver = self._start(session.factory)
+        self._sessions[id(driver)].pages = 1
+
+        return driver
+
+    def release(self, driver) -> None:
+        """
+        Give a driver back: kept warm inside keep_alive(), quit otherwise.
+
+        Args:
+            driver: Driver from acquire(), refresh() or any other source
+        """
+        with self._lock:
+            session = self._sessions.get(id(driver))
+            keep = (
+                session is not None
+                and self._keep_alive_depth > 0
+                and len(self._idle) < self.pool_size
+            )
+            if keep:
+                self._idle.append(session)
+
+        if keep:
+            return
+
+        if session is not None:
+            self._discard(session)
+        else:
+            driver.quit()
+
+    def close(self) -> None:
+        """Quit all idle drivers."""
+
+        with self._lock:
+            idle, self._idle = self._idle, []
+
+        for session in idle:
+            self._discard(session)
+
+    def log_summary(self) -> None:
+        """Log how often drivers were started, reused and replaced."""
+
+        if not self.started:
+            return
+
+        self.logger.info(
+            f"Browser sessions: {self.started} started, {self.reused} reused, "
+            f"{self.recycled} recycled, {self.crashed} replaced after a crash"
+        )
+
+    def _start(self, factory: BrowserFactory):
+        """Start a new driver and register it."""
+
+        driver = factory.create()
+
+        with self._lock:
+            self._sessions[id(driver)] = _Session(driver, factory)
+            self.started += 1
+
+        return driver
+
+    def _discard(self, session: _Session) -> None:
+        """Unregister a driver and quit it, ignoring a dead browser."""
+
+        with self._lock:
+            self._sessions.pop(id(session.driver), None)
+
+        try:
+            session.driver.quit()
+        except Exception as e:
+            self.logger.debug(f"Error quitting browser: {e}")
+
+    @staticmethod
+    def _is_alive(driver) -> bool:
+        """Health check: the browser still answers a trivial command."""
+
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+
+# Shared by the listing and download phases of all scrapers in the process
+browser_sessions = BrowserSessionPool()
@@ -6,12 +6,16 @@ and other configuration values common to all scraper modules (initiatives, respo
 responses_followup_website).
 """
 
+import os
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent.parent.parent.parent.absolute()
 
 # Base URL
-BASE_URL = "https://citizens-initiative.europa.eu"
+# ECI_BASE_URL points the scrapers at another server, e.g. the offline replay
+# server of the benchmarks (dev/benchmarks/replay_server.py)
+DEFAULT_BASE_URL = "https://citizens-initiative.europa.eu"
+BASE_URL = os.environ.get("ECI_BASE_URL", DEFAULT_BASE_URL).rstrip("/")
 
 # Directory Structure (shared directory names)
 DATA_DIR_NAME = "data"
@@ -24,12 +28,136 @@ CHROME_OPTIONS = [
     "--disable-dev-shm-usage",
 ]
 
-# Timing Configuration (in seconds)
-WAIT_DYNAMIC_CONTENT = (1.5, 1.9)  # Time to wait for JavaScript content to load
+# Browser Resource Blocking
+# The extractors only read the HTML, so browser page loads skip images, fonts,
+# stylesheets, media and analytics (DevTools request blocking, see
+# browser_factory.py). Each scraper allows the categories it needs through
+# BROWSER_ALLOWED_RESOURCES in its own consts.py
+BLOCK_BROWSER_RESOURCES = True
+BLOCKED_RESOURCE_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "stylesheet": ["*.css"],
+    "media": ["*.mp4", "*.webm", "*.mp3", "*.ogg"],
+    "analytics": [
+        "*google-analytics.com/*",
+        "*googletagmanager.com/*",
+        "*webanalytics.europa.eu/*",
+        "*matomo.js*",
+        "*piwik.js*",
+    ],
+}
+# Load the first browser page of a run once more without blocking, to estimate
+# how many bytes and how much load time the blocking saves. The extra load is
+# not paced by the rate controller and one page may not be typical, so this is
+# off by default; switch it on for a one-off measurement only
+MEASURE_BLOCKING_SAVINGS = False
+
+# HTTP-first Fetch Configuration
+# Most ECI pages are server-rendered, so a plain HTTP request is tried first and
+# Chrome is only started when the expected content selectors are missing
+HTTP_FIRST_FETCH = True
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en",
+}
+HTTP_POOL_MAXSIZE = 4  # Keep-alive connections kept per host
+HTTP_MAX_REDIRECTS = 5
+# Statuses meaning a page is definitely gone from its URL (a known redirect
+# target answering these is dropped, the browser fallback is still tried)
+HTTP_GONE_STATUSES = (404, 410)
+
+# Download Worker Pool
+# Each worker runs its own Chrome instance; the rate controller is shared by all
+# workers, so the total request rate does not grow with the number of workers
+DOWNLOAD_WORKERS = min(4, os.cpu_count() or 1)
+# A failed page is put back in the queue until its retry is due, instead of
+# holding its worker in a back-off sleep; the worker downloads other pages
+DEFERRED_RETRIES = True
+
+# Browser Sessions
+# Chrome drivers are kept warm between the listing and download phases (and
+# between scrapers run in one process), see browser_session.py. A driver is
+# replaced after this many page loads, to bound Chrome's memory growth
+BROWSER_POOL_SIZE = DOWNLOAD_WORKERS  # Idle drivers kept for reuse
+BROWSER_RECYCLE_AFTER_PAGES = 200
+
+# Adaptive Rate Control (AIMD, in requests per second)
+# The starting rate (INITIAL_REQUEST_RATE) is set per scraper
+RATE_MIN = 0.05  # Never slower than one request every 20 seconds
+RATE_MAX = 4.0  # Never faster than this, even if the server keeps up
+RATE_INCREASE_STEP = 0.05  # Added to the rate after each successful page
+RATE_DECREASE_FACTOR = 0.5  # Applied to the rate when rate limiting is detected
+RATE_JITTER = 0.25  # Random +/- fraction applied to every request interval
+
+# Incremental Scraping
+# Pages unchanged since the previous session are hardlinked instead of re-saved;
+# a manifest in each pages directory records what was reused and what refreshed
+INCREMENTAL_SCRAPING = True
+INCREMENTAL_MANIFEST_FILENAME = "incremental_manifest.json"
+# Redirects found on the way to a page are kept in the manifest and followed
+# directly by later sessions; the original URL is visited again to re-check a
+# redirect once it is this old
+REDIRECT_REVALIDATE_DAYS = 90
+
+# Resume Journal
+# Completed URLs are appended (and fsync'ed) to a journal in each pages directory,
+# so an interrupted session can be continued with --resume
+RESUME_JOURNAL_FILENAME = "resume_journal.jsonl"
+
+# Response Link Index
+# The initiatives downloader records the Commission response link and title of
+# every saved page in this file, so the responses scraper does not re-parse them
+RESPONSE_LINK_INDEX_FILENAME = "response_link_index.jsonl"
+
+# Download Telemetry
+# Every page download is recorded as one JSON line (time per phase, retries,
+# bytes) in the session logs/ directory, see telemetry.py. At the end of a run
+# p50/p95/p99 are logged and written as a Prometheus textfile into logs/, and
+# into this directory too if set (textfile collector of the node exporter)
+TELEMETRY_FILENAME = "telemetry_{scraper}.jsonl"
+TELEMETRY_METRICS_FILENAME = "metrics_{scraper}.prom"
+TELEMETRY_QUANTILES = (0.5, 0.95, 0.99)
+PROMETHEUS_TEXTFILE_DIR = os.environ.get("ECI_PROMETHEUS_TEXTFILE_DIR", "")
+
+# Content-addressed Page Storage
+# Saved pages are hardlinked into one blob store shared by all sessions, keyed by
+# the hash of the exact page bytes. The name sorts before the timestamped session
+# directories, so it is never picked up as the latest session.
+CONTENT_ADDRESSED_STORAGE = True
+BLOB_STORE_DIR_NAME = ".blobs"
+BLOB_FILE_SUFFIX = ".html"
+
+# Pages are stored raw; prettify_export writes indented copies for reading
+PRETTIFIED_DIR_SUFFIX = "_prettified"
+
+# Compression of stored pages: "gzip", "zstd" (needs the zstandard package) or
+# "" for plain .html files. Readers handle every form, see page_io.py
+PAGE_COMPRESSION = "gzip"
+
+# HTML Parser Backend
+# BeautifulSoup tree builder used by the extractors and the response link
+# extractor, see soup_factory.py. Runs always use "html.parser": lxml and
+# html5lib (optional packages) change extractor output, e.g. the initiatives'
+# objective, as they close <p> elements html.parser keeps open. They are only
+# selectable in-process, for dev/benchmarks/parser_backends.py, which fails
+# while any output field differs from html.parser
+HTML_PARSER_BACKEND = "html.parser"
+
+# Page Readiness (in seconds)
+# Browser pages are used as soon as the DOM is stable instead of after a fixed
+# sleep, see page_readiness.py
+PAGE_READY_QUIET_PERIOD = 0.3  # No DOM changes for this long counts as stable
+PAGE_READY_POLL_INTERVAL = 0.1  # Time between two readiness checks
+PAGE_READY_TIMEOUT = 5  # Hard ceiling of the wait, for pages that never settle
 
 # Timeout Configuration (in seconds)
 WEBDRIVER_TIMEOUT_DEFAULT = 30  # Default timeout for page loads
 WEBDRIVER_TIMEOUT_CONTENT = 15  # Timeout for waiting for specific content elements
+HTTP_TIMEOUT_CONNECT = 10  # Timeout for opening an HTTP connection
+HTTP_TIMEOUT_READ = 30  # Timeout for reading an HTTP response body
 
 # HTML Validation
 MIN_HTML_LENGTH = 50  # Minimum acceptable length for HTML content (characters)
@@ -43,3 +171,11 @@ RATE_LIMIT_INDICATORS = [
     "Too Many Requests",
     "Rate limited",
 ]
+
+# Error Page Detection (in addition to RATE_LIMIT_INDICATORS)
+# These multilingual error messages indicate server issues
+ERROR_PAGE_INDICATORS = [
+    "We apologise for any inconvenience",
+    "Veuillez nous excuser pour ce désagrément",
+    "Ci scusiamo per il disagio arrecato",
+]
@@ -0,0 +1,252 @@
+"""
+HTTP-first page fetching shared by all ECI scrapers.
+
+Initiative, Commission response and follow-up pages are server-rendered, so a
+plain pooled HTTP request usually returns the complete document. The fetcher
+verifies the body with the scraper's own CSS selectors and returns None when
+the page is incomplete, letting the caller fall back to Selenium.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional
+from urllib.parse import urljoin
+
+import urllib3
+from bs4 import BeautifulSoup
+
+from .const import (
+    HTTP_GONE_STATUSES,
+    HTTP_HEADERS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_MAX_REDIRECTS,
+    HTTP_TIMEOUT_CONNECT,
+    HTTP_TIMEOUT_READ,
+)
+from .page_validator import PageReport, scan_page
+from .rate_controller import AdaptiveRateController
+
+
+@dataclass
+class StaticPage:
+    """Page fetched over plain HTTP that passed the content check."""
+
+    url: str
+    final_url: str
+    page_source: str
+    status: int
+    etag: str = ""
+    last_modified: str = ""
+    # DOM parsed for the content check, reusable by the caller
+    soup: Optional[BeautifulSoup] = field(default=None, repr=False, compare=False)
+    # Validation scan of page_source, handed on to the page saver
+    report: Optional[PageReport] = field(default=None, repr=False, compare=False)
+
+    @property
+    def not_modified(self) -> bool:
+        """True if a conditional request found the page unchanged (HTTP 304)."""
+        return self.status == 304
+
+    @property
+    def gone(self) -> bool:
+        """True if the server reported the page gone from its URL (404/410)."""
+        return self.status in HTTP_GONE_STATUSES
+
+
+class StaticPageFetcher:
+    """Fetch pages over a keep-alive connection pool before resorting to Chrome."""
+
+    def __init__(
+        self,
+        required_selectors: Iterable[str],
+        logger=None,
+        pool_manager: Optional[urllib3.PoolManager] = None,
+        rate_controller: Optional[AdaptiveRateController] = None,
+    ):
+        """
+        Initialize the fetcher.
+
+        Args:
+            required_selectors: CSS selectors that must all be present in the
+                body for the page to count as fully rendered
+            logger: Logger of the calling scraper (defaults to module logger)
+            pool_manager: Optional preconfigured urllib3 pool (used in tests)
+            rate_controller: Optional shared rate controller, told about
+                rate limited responses
+        """
+        self.required_selectors = list(required_selectors)
+        self.logger = logger or logging.getLogger(__name__)
+        self.rate_controller = rate_controller
+        self.headers = {**HTTP_HEADERS, **urllib3.make_headers(accept_encoding=True)}
+        self.http = pool_manager or urllib3.PoolManager(
+            maxsize=HTTP_POOL_MAXSIZE,
+            block=False,
+            headers=self.headers,
+            timeout=urllib3.Timeout(
+                connect=HTTP_TIMEOUT_CONNECT, read=HTTP_TIMEOUT_READ
+            ),
+            retries=urllib3.Retry(
+                total=HTTP_MAX_REDIRECTS,
+                connect=0,
+                read=0,
+                redirect=HTTP_MAX_REDIRECTS,
+                raise_on_redirect=False,
+            ),
+        )
+
+        self.static_pages = 0
+        self.browser_fallbacks = 0
+        self._counter_lock = threading.Lock()
+
+    def fetch(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Optional[StaticPage]:
+        """
+        Fetch a page over HTTP and check that it is complete.
+
+        Args:
+            url: Page URL
+            headers: Extra request headers, e.g. conditional request validators
+
+        Returns:
+            StaticPage if the body contains all required selectors (or the
+            server answered 304 to a conditional request, or 404/410), None
+            if the caller should fall back to the browser
+        """
+
+        try:
+            # Per-request headers replace the pool defaults, so merge them
+            request_headers = {**self.headers, **headers} if headers else None
+            response = self.http.request("GET", url, headers=request_headers)
+        except urllib3.exceptions.HTTPError as e:
+            return self._fallback(url, f"HTTP request failed: {e}")
+
+        if response.status == 304 and headers:
+            with self._counter_lock:
+                self.static_pages += 1
+
+            self.logger.debug(f"Not modified since previous session: {url}")
+            return StaticPage(url=url, final_url=url, page_source="", status=304)
+
+        if response.status == 429:
+            self._record_rate_limited()
+
+        if response.status in HTTP_GONE_STATUSES:
+            self._fallback(url, f"HTTP status {response.status}")
+
+            # Tells the caller the URL itself is gone, not just incomplete
+            final_url = urljoin(url, response.url) if response.url else url
+            return StaticPage(
+                url=url, final_url=final_url, page_source="", status=response.status
+            )
+
+        if response.status != 200:
+            return self._fallback(url, f"HTTP status {response.status}")
+
+        page_source = self._decode_body(response)
+
+        report = scan_page(page_source)
+
+        if report.exact_rate_limit_indicators:
+            self._record_rate_limited()
+            return self._fallback(
+                url,
+                f"rate limiting indicator: {report.exact_rate_limit_indicators[0]}",
+            )
+
+        soup = BeautifulSoup(page_source, "html.parser")
+        missing = self._find_missing_selectors(soup)
+
+        if missing:
+            return self._fallback(url, f"missing selectors: {', '.join(missing)}")
+
+        with self._counter_lock:
+            self.static_pages += 1
+
+        # urllib3 reports the last redirect target relative to the request
+        final_url = urljoin(url, response.url) if response.url else url
+
+        self.logger.debug(f"Fetched over HTTP without browser: {url}")
+
+        return StaticPage(
+            url=url,
+            final_url=final_url,
+            page_source=page_source,
+            status=response.status,
+            etag=response.headers.get("ETag", ""),
+            last_modified=response.headers.get("Last-Modified", ""),
+            soup=soup,
+            report=report,
+        )
+
+    def record_fallback(self, url: str, reason: str) -> None:
+        """
+        Reclassify a page whose HTTP copy was fetched but rejected by the caller.
+
+        Args:
+            url: Page URL
+            reason: Why the HTTP copy was not used
+        """
+        with self._counter_lock:
+            self.static_pages -= 1
+
+        self._fallback(url, reason)
+
+    def log_summary(self) -> None:
+        """Log how many pages were served without starting the browser."""
+
+        total = self.static_pages + self.browser_fallbacks
+
+        if total:
+            self.logger.info(
+                f"HTTP-first fetch: {self.static_pages}/{total} pages without browser, "
+                f"{self.browser_fallbacks} browser fallbacks"
+            )
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+
+        self.http.clear()
+
+    def _record_rate_limited(self) -> None:
+        """Tell the shared rate controller that the server pushed back."""
+
+        if self.rate_controller is not None:
+            self.rate_controller.record_rate_limited()
+
+    def _fallback(self, url: str, reason: str) -> None:
+        """Record a browser fallback and return None for the caller."""
+
+        with self._counter_lock:
+            self.browser_fallbacks += 1
+
+        self.logger.debug(f"Falling back to browser for {url}: {reason}")
+
+        return None
+
+    def _find_missing_selectors(self, soup: BeautifulSoup) -> list:
+        """Return the required selectors that are absent from the page."""
+
+        return [
+            selector
+            for selector in self.required_selectors
+            if soup.select_one(selector) is None
+        ]
+
+    @staticmethod
+    def _decode_body(response: urllib3.BaseHTTPResponse) -> str:
+        """Decode the (already decompressed) response body to text."""
+
+        content_type = response.headers.get("Content-Type", "")
+        charset = "utf-8"
+
+        for part in content_type.split(";"):
+            key, _, value = part.strip().partition("=")
+            if key.lower() == "charset" and value:
+                charset = value.strip('"')
+
+        try:
+            return response.data.decode(charset, errors="replace")
+        except LookupError:
+            return response.data.decode("utf-8", errors="replace")
@@ -0,0 +1,480 @@
+"""
+Incremental scraping against the previous scrape session.
+
+Every run writes a complete session directory (data/<timestamp>/...), but most
+pages, e.g. of closed initiatives, never change between runs. The incremental
+store looks up the previous session's copy of each page:
+
+- If the previous manifest recorded HTTP validators (ETag / Last-Modified),
+  the page is requested conditionally and a 304 answer carries the previous
+  file forward by hardlink without downloading it.
+- Otherwise the page is downloaded as usual and its fingerprint (SHA-256 of
+  the saved file) is compared to the previous copy; identical pages are
+  replaced by a hardlink to the previous file.
+
+A manifest in each pages directory records, for every URL, whether the page
+was reused, unchanged, refreshed or new, together with its fingerprint and
+validators, so the next run can do the same against this one.
+
+The manifest also keeps the redirects seen on the way to pages (e.g. old
+ec.citizens-initiative.europa.eu/public/... URLs). Later sessions navigate to
+the known target directly, saving a redirect round trip per page, and only
+visit the original URL again once a redirect is due for re-validation.
+
+With a blob store (see blob_store.py) every page is additionally linked into
+the content-addressed store shared by all sessions, and the fingerprint is
+the page's blob digest.
+
+Pages are identified by their logical .html path; the manifest records the
+path as stored, including a compression suffix (see page_io.py).
+"""
+
+import datetime
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+from .blob_store import BlobStore, link_or_copy, page_fingerprint
+from .page_io import compression_suffix, find_page, logical_page_path
+from .const import (
+    CONTENT_ADDRESSED_STORAGE,
+    INCREMENTAL_MANIFEST_FILENAME,
+    INCREMENTAL_SCRAPING,
+    REDIRECT_REVALIDATE_DAYS,
+)
+
+# Manifest status values
+STATUS_REUSED = "reused"  # Not downloaded, previous copy carried forward (HTTP 304)
+STATUS_UNCHANGED = "unchanged"  # Downloaded, identical to previous copy, hardlinked
+STATUS_REFRESHED = "refreshed"  # Downloaded, differs from previous copy
+STATUS_NEW = "new"  # No previous copy
+
+
+@dataclass
+class ManifestEntry:
+    """One page of a session, as recorded in the manifest."""
+
+    url: str
+    path: str
+    fingerprint: str
+    status: str
+    etag: str = ""
+    last_modified: str = ""
+
+
+@dataclass
+class RedirectEntry:
+    """Known redirect of a page URL, as recorded in the manifest."""
+
+    target: str
+    verified: str  # Date (YYYY-MM-DD) the original URL last redirected there
+
+
+def find_previous_session_dir(
+    data_dir: str, current_session: str, pages_dir_name: str
+) -> Optional[str]:
+    """
+    Find the pages directory of the most recent session before the current one.
+
+    Args:
+        data_dir: Directory containing the timestamped session directories
+        current_session: Name (timestamp) of the current session directory
+        pages_dir_name: Name of the pages directory inside a session
+
+    Returns:
+        Path to the previous session's pages directory, or None
+    """
+    if not os.path.isdir(data_dir):
+        return None
+
+    # Session names are timestamps, so lexical order is chronological
+    for session in sorted(os.listdir(data_dir), reverse=True):
+
+        if session >= current_session:
+            continue
+
+        pages_dir = os.path.join(data_dir, session, pages_dir_name)
+
+        if os.path.isdir(pages_dir):
+            return pages_dir
+
+    return None
+
+
+def create_page_store(pages_dir: str, logger=None) -> Optional["IncrementalStore"]:
+    """
+    Create the page store of a session as configured in scraper_shared.const.
+
+    The session layout is data/<timestamp>/<pages dir>, so the previous
+    session and the blob store are located relative to pages_dir.
+
+    Args:
+        pages_dir: Pages directory of the current session
+        logger: Logger of the calling scraper
+
+    Returns:
+        IncrementalStore, or None if both incremental scraping and
+        content-addressed storage are disabled
+    """
+    if not (INCREMENTAL_SCRAPING or CONTENT_ADDRESSED_STORAGE):
+        return None
+
+    session_dir = os.path.dirname(os.path.abspath(pages_dir))
+    data_dir = os.path.dirname(session_dir)
+
+    previous_pages_dir = None
+    if INCREMENTAL_SCRAPING:
+        previous_pages_dir = find_previous_session_dir(
+            data_dir, os.path.basename(session_dir), os.path.basename(pages_dir)
+        )
+
+    blob_store = None
+    if CONTENT_ADDRESSED_STORAGE:
+        blob_store = BlobStore(data_dir, logger=logger)
+
+    return IncrementalStore(
+        pages_dir, previous_pages_dir, logger=logger, blob_store=blob_store
+    )
+
+
+class IncrementalStore:
+    """Carry unchanged pages forward from the previous session."""
+
+    def __init__(
+        self,
+        pages_dir: str,
+        previous_pages_dir: Optional[str],
+        logger=None,
+        blob_store: Optional[BlobStore] = None,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            pages_dir: Pages directory of the current session
+            previous_pages_dir: Pages directory of the previous session, or None
+                for a full crawl
+            logger: Logger of the calling scraper (defaults to module logger)
+            blob_store: Optional content-addressed store every page is linked into
+        """
+        self.pages_dir = pages_dir
+        self.previous_pages_dir = previous_pages_dir
+        self.logger = logger or logging.getLogger(__name__)
+        self.blob_store = blob_store
+
+        self.entries: Dict[str, ManifestEntry] = {}
+        self.redirects: Dict[str, RedirectEntry] = {}
+        self.previous_redirects: Dict[str, RedirectEntry] = {}
+        self.previous_entries = self._load_previous_manifest()
+        self.redirects_resolved = 0  # Pages loaded from a known target
+        self._lock = threading.Lock()
+
+        if previous_pages_dir:
+            self.logger.info(f"Incremental scraping against: {previous_pages_dir}")
+
+    def conditional_headers(self, relative_path: str) -> Dict[str, str]:
+        """
+        HTTP headers asking the server to skip a page unchanged since last run.
+
+        Args:
+            relative_path: Page path relative to the pages directory
+
+        Returns:
+            If-None-Match / If-Modified-Since headers (empty if unknown)
+        """
+        previous = self.previous_entries.get(relative_path)
+
+        if previous is None or self._previous_path(relative_path) is None:
+            return {}
+
+        headers = {}
+        if previous.etag:
+            headers["If-None-Match"] = previous.etag
+        if previous.last_modified:
+            headers["If-Modified-Since"] = previous.last_modified
+
+        return headers
+
+    def carry_forward(self, url: str, relative_path: str) -> bool:
+        """
+        Reuse the previous session's copy of a page without downloading it.
+
+        Args:
+            url: Page URL
+            relative_path: Page path relative to the pages directory
+
+        Returns:
+            True if the previous copy was linked into the current session
+        """
+        previous_path = self._previous_path(relative_path)
+
+        if previous_path is None:
+            return False
+
+        # Keep the previous copy's compression, it is the same file
+        current_path = os.path.join(
+            self.pages_dir, relative_path + compression_suffix(previous_path)
+        )
+        os.makedirs(os.path.dirname(current_path), exist_ok=True)
+        link_or_copy(previous_path, current_path)
+
+        if self.blob_store is not None:
+            fingerprint = self.blob_store.adopt(current_path)
+        else:
+            fingerprint = self._previous_fingerprint(relative_path, previous_path)
+
+        previous = self.previous_entries.get(relative_path)
+        self._record(
+            relative_path,
+            ManifestEntry(
+                url=url,
+                path=self._stored_relative_path(current_path),
+                fingerprint=fingerprint,
+                status=STATUS_REUSED,
+                etag=previous.etag if previous else "",
+                last_modified=previous.last_modified if previous else "",
+            ),
+        )
+        return True
+
+    def record_download(
+        self, url: str, relative_path: str, etag: str = "", last_modified: str = ""
+    ) -> str:
+        """
+        Record a freshly downloaded page and deduplicate it against last run.
+
+        Args:
+            url: Page URL
+            relative_path: Page path relative to the pages directory
+            etag: ETag header of the response, if known
+            last_modified: Last-Modified header of the response, if known
+
+        Returns:
+            Manifest status of the page
+        """
+        current_path = find_page(os.path.join(self.pages_dir, relative_path))
+        previous_path = self._previous_path(relative_path)
+
+        if current_path is None:
+            raise FileNotFoundError(f"Downloaded page not found: {relative_path}")
+
+        if self.blob_store is not None:
+            # Identical content is deduplicated by the store itself
+            fingerprint = self.blob_store.adopt(current_path)
+        else:
+            fingerprint = page_fingerprint(current_path)
+
+        if previous_path is None:
+            status = STATUS_NEW
+
+        elif self._previous_fingerprint(relative_path, previous_path) == fingerprint:
+            status = STATUS_UNCHANGED
+
+            same_form = compression_suffix(previous_path) == compression_suffix(
+                current_path
+            )
+            if self.blob_store is None and same_form:
+                link_or_copy(previous_path, current_path)
+
+        else:
+            status = STATUS_REFRESHED
+
+        self._record(
+            relative_path,
+            ManifestEntry(
+                url=url,
+                path=self._stored_relative_path(current_path),
+                fingerprint=fingerprint,
+                status=status,
+                etag=etag,
+                last_modified=last_modified,
+            ),
+        )
+        return status
+
+    def resolve_redirect(self, url: str) -> str:
+        """
+        URL to navigate to for a page, following a known redirect.
+
+        Redirects older than REDIRECT_REVALIDATE_DAYS are not followed, so the
+        original URL is visited and the redirect seen (and recorded) again.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Known redirect target, or the URL itself
+        """
+        with self._lock:
+            known = self.redirects.get(url) or self.previous_redirects.get(url)
+
+            if known is None:
+                return url
+
+            age = datetime.date.today() - datetime.date.fromisoformat(known.verified)
+
+            if age.days >= REDIRECT_REVALIDATE_DAYS:
+                return url
+
+        self.logger.debug(f"Known redirect: {url} -> {known.target}")
+        return known.target
+
+    def record_redirect(self, url: str, final_url: str, verified: bool = True) -> None:
+        """
+        Record where a page URL ended up (thread-safe).
+
+        Args:
+            url: Page URL
+            final_url: URL the page was finally loaded from
+            verified: True if the original URL was requested and redirected
+                now; False if the page was loaded from a known target, which
+                keeps the date the redirect was last seen
+        """
+        with self._lock:
+            known = self.redirects.get(url) or self.previous_redirects.get(url)
+
+            if final_url == url:
+                self.redirects.pop(url, None)
+                self.previous_redirects.pop(url, None)
+                return
+
+            if verified or known is None:
+                verified_on = datetime.date.today().isoformat()
+            else:
+                # Counted once loaded: an HTTP attempt and the browser
+                # fallback both resolve the redirect
+                verified_on = known.verified
+                self.redirects_resolved += 1
+
+            self.redirects[url] = RedirectEntry(target=final_url, verified=verified_on)
+
+    def forget_redirect(self, url: str) -> None:
+        """Drop a known redirect whose target no longer serves the page."""
+
+        with self._lock:
+            self.redirects.pop(url, None)
+            self.previous_redirects.pop(url, None)
+
+    def write_manifest(self) -> str:
+        """
+        Write the manifest of the current session and log a summary.
+
+        Returns:
+            Path to the manifest file
+        """
+        manifest_path = os.path.join(self.pages_dir, INCREMENTAL_MANIFEST_FILENAME)
+
+        with self._lock:
+            pages = [asdict(entry) for _, entry in sorted(self.entries.items())]
+
+            # Redirects of pages not visited this session are carried along
+            redirects = {
+                url: asdict(entry)
+                for url, entry in sorted(
+                    {**self.previous_redirects, **self.redirects}.items()
+                )
+            }
+
+        counts = {
+            status: sum(1 for page in pages if page["status"] == status)
+            for status in (
+                STATUS_REUSED,
+                STATUS_UNCHANGED,
+                STATUS_REFRESHED,
+                STATUS_NEW,
+            )
+        }
+
+        manifest = {
+            "created": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "previous_session": self.previous_pages_dir or "",
+            "counts": counts,
+            "pages": pages,
+            "redirects": redirects,
+        }
+
+        os.makedirs(self.pages_dir, exist_ok=True)
+
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+        self.logger.info(
+            "Incremental scraping: "
+            + ", ".join(f"{count} {status}" for status, count in counts.items())
+        )
+
+        if redirects:
+            self.logger.info(
+                f"Redirects: {len(redirects)} known, "
+                f"{self.redirects_resolved} pages loaded without the redirect"
+            )
+
+        if self.blob_store is not None:
+            self.blob_store.log_summary()
+
+        return manifest_path
+
+    def _record(self, relative_path: str, entry: ManifestEntry) -> None:
+        """Store a manifest entry under the page's logical path (thread-safe)."""
+
+        with self._lock:
+            self.entries[relative_path] = entry
+
+        self.logger.debug(f"Page {entry.status}: {entry.url}")
+
+    def _stored_relative_path(self, path: str) -> str:
+        """Return a stored page path relative to the pages directory."""
+
+        return os.path.relpath(path, self.pages_dir)
+
+    def _previous_path(self, relative_path: str) -> Optional[str]:
+        """Return the previous session's copy of a page, in any stored form."""
+
+        if not self.previous_pages_dir:
+            return None
+
+        return find_page(os.path.join(self.previous_pages_dir, relative_path))
+
+    def _previous_fingerprint(self, relative_path: str, previous_path: str) -> str:
+        """Fingerprint of the previous copy, from its manifest if available."""
+
+        previous = self.previous_entries.get(relative_path)
+
+        if previous is not None and previous.fingerprint:
+            return previous.fingerprint
+
+        return page_fingerprint(previous_path)
+
+    def _load_previous_manifest(self) -> Dict[str, ManifestEntry]:
+        """Load the previous session's manifest, keyed by relative path."""
+
+        if not self.previous_pages_dir:
+            return {}
+
+        manifest_path = os.path.join(
+            self.previous_pages_dir, INCREMENTAL_MANIFEST_FILENAME
+        )
+
+        if not os.path.isfile(manifest_path):
+            return {}
+
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+
+            pages = manifest.get("pages", [])
+            self.previous_redirects = {
+                url: RedirectEntry(**entry)
+                for url, entry in manifest.get("redirects", {}).items()
+            }
+
+            return {
+                logical_page_path(page["path"]): ManifestEntry(**page) for page in pages
+            }
+
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            self.logger.warning(f"Ignoring unreadable manifest {manifest_path}: {e}")
+            return {}
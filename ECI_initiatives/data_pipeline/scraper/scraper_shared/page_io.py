@@ -0,0 +1,313 @@
+"""
+Reading and writing of downloaded HTML pages.
+
+Scrapers store pages exactly as received: prettifying every page meant a
+second full parse and re-serialization on the download path and made files
+larger. The extractors parse every page once, as it was stored
+(read_page_soup()), so pages saved prettified by older sessions give the
+same output as before. Prettify is not idempotent (it reindents the text of
+an already prettified page, which changes fields such as the initiatives'
+objective), so pages are never prettified on the way to an extractor.
+
+Pages are compressed on disk as configured by PAGE_COMPRESSION, e.g.
+2019/2019_000007_en.html is stored as 2019/2019_000007_en.html.gz. Callers
+keep using the plain .html path (the "logical" path): open_page() and
+find_page() resolve whichever form exists, so sessions written before
+compression was enabled, or with another codec, stay readable.
+
+For reading pages by hand, see prettify_export.py.
+"""
+
+import gzip
+import io
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, List, Optional, Union
+
+from bs4 import BeautifulSoup
+
+from .const import PAGE_COMPRESSION
+from .soup_factory import make_soup
+
+try:
+    import zstandard
+except ImportError:  # Optional, only needed for PAGE_COMPRESSION = "zstd"
+    zstandard = None
+
+PAGE_ENCODING = "utf-8"
+
+# Suffix appended to the .html name of a page, by compression
+COMPRESSION_SUFFIXES = {"": "", "gzip": ".gz", "zstd": ".zst"}
+
+PathLike = Union[str, Path]
+
+
+def _compression_of(path: PathLike) -> str:
+    """Return the compression of a stored page file, by its suffix."""
+
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if suffix and str(path).endswith(suffix):
+            return compression
+
+    return ""
+
+
+def stored_page_path(path: PathLike, compression: str = None) -> str:
+    """
+    Return the file name a page is written to.
+
+    Args:
+        path: Logical .html path of the page
+        compression: Compression to use (defaults to PAGE_COMPRESSION)
+
+    Raises:
+        ValueError: If the compression is unknown
+    """
+    compression = PAGE_COMPRESSION if compression is None else compression
+
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown page compression: {compression!r}")
+
+    return str(logical_page_path(path)) + COMPRESSION_SUFFIXES[compression]
+
+
+def logical_page_path(path: PathLike) -> PathLike:
+    """
+    Strip the compression suffix from a stored page path.
+
+    File names of stored pages carry the registration number, so callers
+    parse them from the logical name. The type of path (str or Path) is kept.
+    """
+    suffix = COMPRESSION_SUFFIXES[_compression_of(path)]
+
+    if not suffix:
+        return path
+
+    logical = str(path)[: -len(suffix)]
+
+    return Path(logical) if isinstance(path, Path) else logical
+
+
+def compression_suffix(path: PathLike) -> str:
+    """Return the compression suffix of a stored page path ("" if plain)."""
+
+    return COMPRESSION_SUFFIXES[_compression_of(path)]
+
+
+def find_page(path: PathLike) -> Optional[str]:
+    """
+    Find the stored file of a page in any of the supported forms.
+
+    Args:
+        path: Logical or stored path of the page
+
+    Returns:
+        Path of the existing file, or None
+    """
+    logical = str(logical_page_path(path))
+
+    # The given path, then the configured form the current session writes
+    candidates = [str(path), stored_page_path(logical)] + [
+        logical + suffix for suffix in COMPRESSION_SUFFIXES.values()
+    ]
+
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return candidate
+
+    return None
+
+
+def glob_pages(directory: PathLike, pattern: str) -> List[Path]:
+    """
+    Glob stored pages by a pattern written for plain .html files.
+
+    Args:
+        directory: Directory to search
+        pattern: Glob pattern such as "*_en.html" or "**/*.html"
+
+    Returns:
+        Sorted stored page paths, one per page
+    """
+    found = {}
+
+    for suffix in COMPRESSION_SUFFIXES.values():
+        for path in Path(directory).glob(pattern + suffix):
+            found.setdefault(logical_page_path(path), path)
+
+    return [found[logical] for logical in sorted(found)]
+
+
+def is_page_file(name: str) -> bool:
+    """Tell whether a file name is a stored .html page, compressed or not."""
+
+    return str(logical_page_path(name)).endswith(".html")
+
+
+def _require_codec(compression: str) -> None:
+    """Raise if the codec of a compression is not installed."""
+
+    if compression == "zstd" and zstandard is None:
+        raise RuntimeError(
+            "PAGE_COMPRESSION is 'zstd' but the zstandard package is not "
+            "installed (pip install zstandard)"
+        )
+
+
+def open_page(path: PathLike) -> IO[str]:
+    """
+    Open a stored page for reading text, decompressing transparently.
+
+    Args:
+        path: Logical or stored path of the page
+
+    Returns:
+        Text stream of the page content
+
+    Raises:
+        FileNotFoundError: If no stored form of the page exists
+    """
+    stored = find_page(path)
+
+    if stored is None:
+        raise FileNotFoundError(f"Page not found: {path}")
+
+    compression = _compression_of(stored)
+
+    if compression == "gzip":
+        return gzip.open(stored, "rt", encoding=PAGE_ENCODING)
+
+    if compression == "zstd":
+        _require_codec(compression)
+        return io.TextIOWrapper(zstandard.open(stored, "rb"), encoding=PAGE_ENCODING)
+
+    return open(stored, "r", encoding=PAGE_ENCODING)
+
+
+def write_page(path: PathLike, page_source: str) -> str:
+    """
+    Write a page exactly as received, compressed as configured.
+
+    Other stored forms of the same page are removed, so a page exists
+    once per session.
+
+    Args:
+        path: Logical .html path of the page
+        page_source: HTML content as returned by the fetcher or browser
+
+    Returns:
+        Path of the written file
+    """
+    stored = stored_page_path(path)
+    compression = _compression_of(stored)
+    data = page_source.encode(PAGE_ENCODING)
+
+    if compression == "gzip":
+        # mtime=0 keeps identical pages byte-identical, for the blob store
+        data = gzip.compress(data, compresslevel=6, mtime=0)
+
+    elif compression == "zstd":
+        _require_codec(compression)
+        data = zstandard.ZstdCompressor().compress(data)
+
+    # Replace rather than overwrite: the file may be a hardlink shared with
+    # earlier sessions (see blob_store.py)
+    temp_path = f"{stored}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, stored)
+
+    logical = str(logical_page_path(path))
+    for suffix in COMPRESSION_SUFFIXES.values():
+        other = logical + suffix
+        if other != stored and os.path.isfile(other):
+            os.remove(other)
+
+    return stored
+
+
+def read_page(path: PathLike) -> str:
+    """Read the text of a stored page."""
+
+    with open_page(path) as f:
+        return f.read()
+
+
+@contextmanager
+def page_bytes(path: PathLike) -> Iterator[Union[bytes, mmap.mmap]]:
+    """
+    Give the raw (undecoded) bytes of a stored page, for byte-level scans.
+
+    Plain pages are memory-mapped, so a scan that stops early never reads
+    the rest of the file; compressed pages are decompressed into memory.
+
+    Args:
+        path: Logical or stored path of the page
+
+    Yields:
+        Bytes-like object supporting find() and bytes regex search
+
+    Raises:
+        FileNotFoundError: If no stored form of the page exists
+    """
+    stored = find_page(path)
+
+    if stored is None:
+        raise FileNotFoundError(f"Page not found: {path}")
+
+    compression = _compression_of(stored)
+
+    if compression == "gzip":
+        with gzip.open(stored, "rb") as f:
+            yield f.read()
+        return
+
+    if compression == "zstd":
+        _require_codec(compression)
+        with zstandard.open(stored, "rb") as f:
+            yield f.read()
+        return
+
+    with open(stored, "rb") as f:
+
+        # An empty file cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def canonical_html(page_source: str) -> str:
+    """Return the prettified (indented) form of a page, for reading by hand."""
+
+    return BeautifulSoup(page_source, "html.parser").prettify()
+
+
+def read_page_html(path: PathLike) -> str:
+    """
+    Read a saved page in its prettified form.
+
+    Args:
+        path: Page file, plain or compressed
+
+    Returns:
+        Prettified HTML content
+    """
+    return canonical_html(read_page(path))
+
+
+def read_page_soup(path: PathLike) -> BeautifulSoup:
+    """
+    Read and parse a saved page as it was stored, with the configured backend.
+
+    Args:
+        path: Page file, plain or compressed
+
+    Returns:
+        Parsed page
+    """
+    return make_soup(read_page(path))
@@ -0,0 +1,155 @@
+"""
+Event-driven page readiness detection shared by all ECI scrapers.
+
+Pages opened in Chrome used to be given a fixed random sleep after the
+selector waits (WAIT_DYNAMIC_CONTENT, 1.5-1.9 s), plus an unconditional
+one-second sleep before reading driver.current_url for redirect detection.
+Most pages are complete long before that.
+
+The readiness waiter instead installs a MutationObserver in the page and
+polls it: the page is ready once document.readyState is "complete", the
+expected selectors are present and the DOM has not changed for
+PAGE_READY_QUIET_PERIOD. A scripted redirect loads a new document, which
+resets the observer, so redirects have settled by then as well. The wait
+never exceeds PAGE_READY_TIMEOUT; a page that keeps changing (e.g. a
+carousel) is used as it is once the ceiling is reached.
+
+Readiness times are recorded per page and summarized at the end of a run.
+"""
+
+import logging
+import threading
+import time
+from typing import List, Sequence, Tuple
+
+from .const import (
+    PAGE_READY_POLL_INTERVAL,
+    PAGE_READY_QUIET_PERIOD,
+    PAGE_READY_TIMEOUT,
+)
+
+# Installs the observer on first call for each document, then reports state
+READINESS_SCRIPT = """
+var state = window.__eciReadiness;
+if (!state) {
+    state = window.__eciReadiness = {lastChange: performance.now()};
+    new MutationObserver(function () {
+        state.lastChange = performance.now();
+    }).observe(document, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+}
+return {
+    readyState: document.readyState,
+    quietFor: (performance.now() - state.lastChange) / 1000,
+    missing: arguments[0].filter(function (s) { return !document.querySelector(s); })
+};
+"""
+
+
+class PageReadinessWaiter:
+    """Wait until a browser page is ready and record how long it took."""
+
+    def __init__(
+        self,
+        timeout: float = PAGE_READY_TIMEOUT,
+        quiet_period: float = PAGE_READY_QUIET_PERIOD,
+        poll_interval: float = PAGE_READY_POLL_INTERVAL,
+        logger=None,
+    ):
+        """
+        Initialize the waiter.
+
+        Args:
+            timeout: Hard ceiling of a single wait (seconds)
+            quiet_period: Time without DOM changes that counts as stable (seconds)
+            poll_interval: Time between two state checks (seconds)
+            logger: Logger of the calling scraper (defaults to module logger)
+        """
+        self.timeout = timeout
+        self.quiet_period = quiet_period
+        self.poll_interval = poll_interval
+        self.logger = logger or logging.getLogger(__name__)
+
+        # (page, seconds until ready, ceiling reached)
+        self.timings: List[Tuple[str, float, bool]] = []
+        self._lock = threading.Lock()
+
+    def wait(self, driver, page: str = "", selectors: Sequence[str] = ()) -> float:
+        """
+        Block until the page loaded in the driver is ready.
+
+        Args:
+            driver: WebDriver with the page loaded
+            page: Page URL or name, for the timing record
+            selectors: CSS selectors that must be present
+
+        Returns:
+            Seconds waited
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout
+
+        while True:
+
+            try:
+                state = driver.execute_script(READINESS_SCRIPT, list(selectors))
+            except Exception as e:  # Document replaced while the script ran
+                self.logger.debug(f"Readiness check failed, retrying: {e}")
+                state = {}
+
+            if not isinstance(state, dict):
+                # Driver cannot run scripts; nothing to wait for
+                return 0.0
+
+            if self._is_ready(state):
+                return self._record(page, time.monotonic() - started, False)
+
+            if time.monotonic() >= deadline:
+                return self._record(page, time.monotonic() - started, True)
+
+            time.sleep(self.poll_interval)
+
+    def log_summary(self) -> None:
+        """Log the mean and slowest readiness times of the run."""
+
+        with self._lock:
+            timings = list(self.timings)
+
+        if not timings:
+            return
+
+        seconds = sorted(elapsed for _, elapsed, _ in timings)
+        timeouts = sum(1 for _, _, timed_out in timings if timed_out)
+
+        self.logger.info(
+            f"Page readiness: {len(seconds)} pages, "
+            f"mean {sum(seconds) / len(seconds):.2f}s, "
+            f"p95 {seconds[int(0.95 * (len(seconds) - 1))]:.2f}s, "
+            f"max {seconds[-1]:.2f}s, {timeouts} reached the "
+            f"{self.timeout:.0f}s ceiling"
+        )
+
+    def _is_ready(self, state: dict) -> bool:
+        """Tell whether a reported page state counts as ready."""
+
+        return (
+            state.get("readyState") == "complete"
+            and not state.get("missing")
+            and state.get("quietFor", 0) >= self.quiet_period
+        )
+
+    def _record(self, page: str, elapsed: float, timed_out: bool) -> float:
+        """Record the readiness time of a page (thread-safe)."""
+
+        with self._lock:
+            self.timings.append((page, elapsed, timed_out))
+
+        if timed_out:
+            self.logger.debug(
+                f"Page not stable after {elapsed:.2f}s, continuing: {page}"
+            )
+        else:
+            self.logger.debug(f"Page ready in {elapsed:.2f}s: {page}")
+
+        return elapsed
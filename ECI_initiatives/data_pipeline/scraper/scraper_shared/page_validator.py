@@ -0,0 +1,170 @@
+"""
+Single-pass validation of downloaded pages, shared by all page savers.
+
+A page used to be scanned four or five times between download and disk: the
+HTTP fetcher looked for rate limiting indicators, the browser path read
+driver.page_source once more to do the same, and the savers lowercased the
+page again for the error page and rate limiting indicators and counted
+brackets and quotes. scan_page() runs one compiled regex over the page and
+reports everything these checks need:
+
+- the rate limiting and error page indicators found
+- length, bracket and quote counts and the <html> tags, for the
+  malformed-HTML heuristics
+- UTF-8 size of the content
+
+Indicators are matched ignoring case, and the report also lists those found
+with their configured case: the HTTP fetcher and the initiatives saver have
+always checked them case-sensitively, the response and follow-up website
+scrapers ignoring case. The report travels with the page (StaticPage.report
+over HTTP, a local in the browser path) and is handed to the saver, so
+nothing is scanned twice.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Tuple
+
+from .const import ERROR_PAGE_INDICATORS, MIN_HTML_LENGTH, RATE_LIMIT_INDICATORS
+
+# Indicator (lowercased) -> indicator as configured
+_INDICATORS = {
+    text.lower(): text for text in RATE_LIMIT_INDICATORS + ERROR_PAGE_INDICATORS
+}
+
+# First characters of the indicators, in both cases
+_INDICATOR_STARTS = "".join(
+    sorted({char for text in _INDICATORS for char in (text[0], text[0].upper())})
+)
+
+# Indicators are matched ignoring case, in a lookahead so one inside another
+# (e.g. "Too Many Requests" in "429 - Too Many Requests") is still found. A "<"
+# opening or closing the html element captures the tag name in "html". The
+# leading class lets the engine skip characters no alternative starts with
+_SCAN_REGEX = re.compile(
+    '(?=[{}<>"\u0080-\U0010ffff])(?:{})'.format(
+        re.escape(_INDICATOR_STARTS),
+        "|".join(
+            [
+                "(?=(?P<indicator>(?i:{})))".format(
+                    "|".join(
+                        re.escape(text)
+                        for text in sorted(_INDICATORS, key=len, reverse=True)
+                    )
+                ),
+                r"(?P<open><)(?:(?=(?P<html>(?i:html|/html>)))|)",
+                r"(?P<close>>)",
+                r'(?P<quote>")',
+                # Runs of characters taking 2, 3 and 4 bytes in UTF-8
+                r"(?P<utf8_2>[\u0080-\u07ff]+)",
+                r"(?P<utf8_3>[\u0800-\uffff]+)",
+                r"(?P<utf8_4>[\U00010000-\U0010ffff]+)",
+            ]
+        ),
+    )
+)
+
+
+@dataclass(frozen=True)
+class PageReport:
+    """Everything the page checks need to know about one page."""
+
+    length: int  # Characters
+    size: int  # Bytes, UTF-8 encoded
+    open_brackets: int
+    close_brackets: int
+    quotes: int
+    has_html_open: bool
+    has_html_close: bool
+    # Indicators found ignoring case, in configured order
+    rate_limit_indicators: Tuple[str, ...]
+    error_page_indicators: Tuple[str, ...]
+    # Rate limiting indicators found with their configured case
+    exact_rate_limit_indicators: Tuple[str, ...]
+
+    @property
+    def too_short(self) -> bool:
+        """True if the page is shorter than MIN_HTML_LENGTH characters."""
+        return self.length < MIN_HTML_LENGTH
+
+    @property
+    def unmatched_brackets(self) -> bool:
+        """True if the page has more '<' than '>' or the other way round."""
+        return self.open_brackets != self.close_brackets
+
+    @property
+    def unmatched_quotes(self) -> bool:
+        """True if the page has an odd number of double quotes."""
+        return self.quotes % 2 != 0
+
+    @property
+    def missing_html_close(self) -> bool:
+        """True if the page opens <html> but never closes it."""
+        return self.has_html_open and not self.has_html_close
+
+    @property
+    def malformed(self) -> bool:
+        """True if any of the malformed-HTML heuristics applies."""
+        return (
+            self.unmatched_brackets
+            or self.unmatched_quotes
+            or self.missing_html_close
+            or self.too_short
+        )
+
+
+def scan_page(page_source: str) -> PageReport:
+    """
+    Scan a page once for everything the page checks need.
+
+    Args:
+        page_source: HTML content as returned by the fetcher or browser
+
+    Returns:
+        PageReport of the page
+    """
+    counts = dict.fromkeys(("open", "close", "quote"), 0)
+    size = len(page_source)
+    html_tags = set()
+    found, found_exact = set(), set()
+
+    for match in _SCAN_REGEX.finditer(page_source):
+        kind = match.lastgroup
+
+        if kind == "indicator":
+            text = match.group("indicator")
+            indicator = _INDICATORS[text.lower()]
+            found.add(indicator)
+            if text == indicator:
+                found_exact.add(indicator)
+
+        elif kind in counts:
+            counts[kind] += 1
+
+        elif kind == "html":
+            # "<" followed by the tag name, still counted as a bracket
+            counts["open"] += 1
+            html_tags.add(match.group("html").lower())
+
+        else:
+            # Extra bytes of each character beyond the first
+            size += (match.end() - match.start()) * (int(kind[-1]) - 1)
+
+    return PageReport(
+        length=len(page_source),
+        size=size,
+        open_brackets=counts["open"],
+        close_brackets=counts["close"],
+        quotes=counts["quote"],
+        has_html_open="html" in html_tags,
+        has_html_close="/html>" in html_tags,
+        rate_limit_indicators=tuple(
+            text for text in RATE_LIMIT_INDICATORS if text in found
+        ),
+        error_page_indicators=tuple(
+            text for text in ERROR_PAGE_INDICATORS if text in found
+        ),
+        exact_rate_limit_indicators=tuple(
+            text for text in RATE_LIMIT_INDICATORS if text in found_exact
+        ),
+    )
@@ -0,0 +1,89 @@
+"""
+Export prettified copies of saved pages for reading them by hand.
+
+Scrapers store pages raw (see page_io.py). To browse a pages directory in
+indented form, run from the ECI_initiatives directory:
+
+    python -m data_pipeline.scraper.scraper_shared.prettify_export \\
+        data/<timestamp>/initiatives [--output DIR]
+
+The copies are written uncompressed to <pages dir>_prettified unless
+--output is given; the original pages are left untouched.
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from .const import PRETTIFIED_DIR_SUFFIX
+from .page_io import PAGE_ENCODING, is_page_file, logical_page_path, read_page_html
+
+
+def export_prettified(pages_dir: str, output_dir: Optional[str] = None) -> int:
+    """
+    Write a prettified copy of every HTML page below pages_dir.
+
+    Args:
+        pages_dir: Pages directory of a scrape session
+        output_dir: Destination directory (defaults to <pages_dir>_prettified)
+
+    Returns:
+        Number of pages exported
+
+    Raises:
+        FileNotFoundError: If pages_dir does not exist
+    """
+    if not os.path.isdir(pages_dir):
+        raise FileNotFoundError(f"Pages directory not found: {pages_dir}")
+
+    pages_dir = os.path.normpath(pages_dir)
+    output_dir = output_dir or pages_dir + PRETTIFIED_DIR_SUFFIX
+    exported = 0
+
+    for root, _, files in os.walk(pages_dir):
+
+        for name in sorted(files):
+
+            if not is_page_file(name):
+                continue
+
+            source = os.path.join(root, name)
+            # Copies are plain .html, also for compressed pages
+            destination = os.path.join(
+                output_dir, logical_page_path(os.path.relpath(source, pages_dir))
+            )
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+
+            with open(destination, "w", encoding=PAGE_ENCODING) as f:
+                f.write(read_page_html(source))
+
+            exported += 1
+
+    return exported
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+
+    parser = argparse.ArgumentParser(
+        description="Export prettified copies of raw scraped HTML pages."
+    )
+    parser.add_argument("pages_dir", help="Pages directory of a scrape session")
+    parser.add_argument(
+        "--output", help="Destination directory (default: <pages_dir>_prettified)"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        exported = export_prettified(args.pages_dir, args.output)
+    except FileNotFoundError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(f"Exported {exported} prettified pages from {args.pages_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
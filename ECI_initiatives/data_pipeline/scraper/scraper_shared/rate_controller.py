@@ -0,0 +1,193 @@
+"""
+Adaptive (AIMD) request rate controller shared by all ECI scrapers.
+
+One controller is shared by all workers of a scraper and replaces the fixed
+random sleeps between requests. The request rate grows additively while pages
+download cleanly and is cut multiplicatively whenever the server signals rate
+limiting, so the scraper settles just below the rate the site tolerates.
+Consecutive rate limited retries back off exponentially through the same
+multiplicative decrease, so there is no separate backoff formula.
+"""
+
+import logging
+import random
+import threading
+import time
+
+from .const import (
+    RATE_MIN,
+    RATE_MAX,
+    RATE_INCREASE_STEP,
+    RATE_DECREASE_FACTOR,
+    RATE_JITTER,
+    RATE_LIMIT_INDICATORS,
+)
+
+
+def is_rate_limit_error(error_message: str) -> bool:
+    """Return True if an error message contains a rate limiting indicator."""
+
+    lowered = error_message.lower()
+
+    return any(indicator.lower() in lowered for indicator in RATE_LIMIT_INDICATORS)
+
+
+class AdaptiveRateController:
+    """Thread-safe AIMD request pacing shared by all workers of a scraper."""
+
+    def __init__(
+        self,
+        initial_rate: float,
+        min_rate: float = RATE_MIN,
+        max_rate: float = RATE_MAX,
+        increase_step: float = RATE_INCREASE_STEP,
+        decrease_factor: float = RATE_DECREASE_FACTOR,
+        jitter: float = RATE_JITTER,
+        logger=None,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            initial_rate: Starting request rate (requests per second)
+            min_rate: Lower bound of the rate
+            max_rate: Upper bound of the rate
+            increase_step: Rate added after each successful page
+            decrease_factor: Factor applied to the rate on rate limiting
+            jitter: Random +/- fraction applied to every interval
+            logger: Logger of the calling scraper (defaults to module logger)
+        """
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.jitter = jitter
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.rate = min(max(initial_rate, min_rate), max_rate)
+        self.requests = 0
+        self.rate_limit_events = 0
+
+        self._next_slot = 0.0
+        self._last_decrease = float("-inf")
+        self._first_request = None
+        self._lock = threading.Lock()
+
+    @property
+    def interval(self) -> float:
+        """Mean number of seconds between two requests at the current rate."""
+
+        return 1.0 / self.rate
+
+    def reserve(self) -> float:
+        """
+        Reserve the next request slot.
+
+        The caller is expected to sleep for the returned delay before sending
+        its request, which keeps the sleep patchable in the calling module.
+
+        Returns:
+            Seconds to wait before the reserved slot starts
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            spacing = self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            self._next_slot = slot + spacing
+
+            self.requests += 1
+            if self._first_request is None:
+                self._first_request = slot
+
+        return slot - now
+
+    def record_success(self) -> None:
+        """Additive increase after a page downloaded without rate limiting."""
+
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def record_rate_limited(self) -> None:
+        """
+        Multiplicative decrease after the server signalled rate limiting.
+
+        Workers running in parallel usually hit the limit together; signals
+        arriving within one interval of the previous decrease are treated as
+        the same event, so the rate is only cut once per congestion episode.
+        The next slot is pushed out by a full new interval.
+        """
+        with self._lock:
+            now = time.monotonic()
+
+            if now - self._last_decrease < self.interval:
+                return
+
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self.rate_limit_events += 1
+            self._last_decrease = now
+            self._next_slot = max(self._next_slot, now + self.interval)
+
+        self.logger.warning(f"Rate limited, slowing down to {self.rate:.2f} req/s")
+
+    def retry_delay(self, attempt: int, rate_limited: bool) -> float:
+        """
+        Seconds to wait before retrying a failed request.
+
+        Rate limited failures back off through the multiplicative decrease of
+        the shared rate; other failures wait exponentially longer on the
+        current request interval.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            rate_limited: Whether the failure was caused by rate limiting
+
+        Returns:
+            Seconds to wait; the retry slot is already reserved
+        """
+        if rate_limited:
+            self.record_rate_limited()
+            return self.reserve()
+
+        return max(self.reserve(), self.interval * (2**attempt))
+
+    def backoff_delay(self, attempt: int, rate_limited: bool) -> float:
+        """
+        Seconds until a failed request may be retried, without reserving a slot.
+
+        For retries queued behind other work (see worker_pool.RetryLater):
+        the retry reserves its slot when it is taken up again, so the pages
+        downloaded meanwhile are not pushed back.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            rate_limited: Whether the failure was caused by rate limiting
+
+        Returns:
+            Seconds to wait before the retry is due
+        """
+        if rate_limited:
+            self.record_rate_limited()
+            return self.interval
+
+        return self.interval * (2**attempt)
+
+    def effective_rate(self) -> float:
+        """Requests per second actually issued since the first reserved slot."""
+
+        with self._lock:
+            if self._first_request is None or self.requests < 2:
+                return 0.0
+
+            elapsed = time.monotonic() - self._first_request
+
+        return (self.requests - 1) / elapsed if elapsed > 0 else 0.0
+
+    def log_summary(self) -> None:
+        """Log the rate the controller settled on."""
+
+        if self.requests:
+            self.logger.info(
+                f"Request rate settled at {self.rate:.2f} req/s "
+                f"(effective {self.effective_rate():.2f} req/s over "
+                f"{self.requests} requests, {self.rate_limit_events} rate limit backoffs)"
+            )
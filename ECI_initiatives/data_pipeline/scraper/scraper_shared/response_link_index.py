@@ -0,0 +1,222 @@
+"""
+Side-car index of the Commission response links of saved initiative pages.
+
+The responses scraper only needs two things from every initiative page: the
+"Commission's answer and follow-up" link and the title. It used to re-read
+and fully re-parse the whole initiatives corpus to find them. The initiatives
+downloader now records both while it saves each page, from the page still in
+memory (the DOM the HTTP fetcher already parsed, or the browser's page
+source), in a JSON-lines file next to the pages.
+
+The index is append-only; a page saved again later in the session gets a new
+line and the last line wins. The responses scraper falls back to parsing the
+pages that are missing from the index (e.g. an index cut short by a crash).
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from typing import Dict, Optional
+
+from bs4 import BeautifulSoup
+
+from .const import RESPONSE_LINK_INDEX_FILENAME
+from .page_io import find_page, read_page
+from .soup_factory import make_soup
+
+# Handles both the regular apostrophe and the right single quotation mark
+RESPONSE_LINK_TEXT = re.compile(r"Commission['\u2019]s answer and follow-up", re.I)
+INITIATIVE_TITLE_SELECTOR = "h1.ecl-page-header-core__title"
+
+
+def find_response_link(soup: BeautifulSoup) -> Optional[str]:
+    """
+    Find the href of the "Commission's answer and follow-up" link.
+
+    Args:
+        soup: Parsed initiative page
+
+    Returns:
+        The link as written in the page, or None if the page has none
+    """
+    link = soup.find("a", string=RESPONSE_LINK_TEXT)
+
+    if link and link.get("href"):
+        return link.get("href")
+
+    return None
+
+
+def find_initiative_title(soup: BeautifulSoup) -> str:
+    """
+    Find the initiative title: the page header, else the first h1.
+
+    Args:
+        soup: Parsed initiative page
+
+    Returns:
+        Title string or empty string if not found
+    """
+    title_element = soup.select_one(INITIATIVE_TITLE_SELECTOR) or soup.find("h1")
+
+    if title_element:
+        return title_element.get_text(strip=True)
+
+    return ""
+
+
+def load_response_link_index(pages_dir: str, logger=None) -> Dict[str, dict]:
+    """
+    Read the index of a pages directory.
+
+    A line cut short by a crash in the middle of a write is skipped.
+
+    Args:
+        pages_dir: Initiative pages directory of a session
+        logger: Logger for skipped lines
+
+    Returns:
+        Entries by page path relative to pages_dir (empty if there is no index)
+    """
+    index_path = os.path.join(pages_dir, RESPONSE_LINK_INDEX_FILENAME)
+
+    if not os.path.isfile(index_path):
+        return {}
+
+    entries = {}
+
+    with open(index_path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+
+            if not line.strip():
+                continue
+
+            try:
+                entry = json.loads(line)
+                entries[os.path.normpath(entry["path"])] = entry
+
+            except (ValueError, KeyError):
+                if logger is not None:
+                    logger.warning(
+                        f"Skipping damaged index line {line_number}: {index_path}"
+                    )
+
+    return entries
+
+
+class ResponseLinkIndex:
+    """Append-only index of the response link and title of every saved page."""
+
+    def __init__(
+        self,
+        pages_dir: str,
+        previous_pages_dir: Optional[str] = None,
+        logger=None,
+    ):
+        """
+        Open the index of a session's pages directory.
+
+        Args:
+            pages_dir: Initiative pages directory of the current session
+            previous_pages_dir: Pages directory of the previous session, whose
+                entries are reused for pages carried forward unchanged
+            logger: Logger of the calling scraper (defaults to module logger)
+        """
+        self.pages_dir = pages_dir
+        self.path = os.path.join(pages_dir, RESPONSE_LINK_INDEX_FILENAME)
+        self.previous_pages_dir = previous_pages_dir
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._previous_entries: Optional[Dict[str, dict]] = None
+        self._lock = threading.Lock()
+
+    def record(self, url: str, relative_path: str, soup: BeautifulSoup) -> None:
+        """
+        Record a page from its parsed DOM (thread-safe).
+
+        Args:
+            url: Initiative page URL
+            relative_path: Page path relative to the pages directory
+            soup: Parsed page
+        """
+        self._append(
+            {
+                "url": url,
+                "path": relative_path,
+                "title": find_initiative_title(soup),
+                "response_url": find_response_link(soup) or "",
+            }
+        )
+
+    def record_source(self, url: str, relative_path: str, page_source: str) -> None:
+        """
+        Record a page from its HTML source.
+
+        Args:
+            url: Initiative page URL
+            relative_path: Page path relative to the pages directory
+            page_source: HTML of the page
+        """
+        self.record(url, relative_path, make_soup(page_source))
+
+    def record_saved_page(self, url: str, relative_path: str) -> None:
+        """
+        Record a page already saved in the pages directory, reading it back.
+
+        Args:
+            url: Initiative page URL
+            relative_path: Page path relative to the pages directory
+        """
+        page_path = find_page(os.path.join(self.pages_dir, relative_path))
+
+        if page_path is None:
+            self.logger.warning(f"Cannot index missing page: {relative_path}")
+            return
+
+        self.record_source(url, relative_path, read_page(page_path))
+
+    def record_carried_forward(self, url: str, relative_path: str) -> None:
+        """
+        Record a page carried forward unchanged from the previous session.
+
+        The previous session's entry is reused; the page is only read and
+        parsed when that entry is missing.
+
+        Args:
+            url: Initiative page URL
+            relative_path: Page path relative to the pages directory
+        """
+        previous = self._previous_entry(relative_path)
+
+        if previous is None:
+            self.record_saved_page(url, relative_path)
+            return
+
+        self._append({**previous, "url": url, "path": relative_path})
+
+    def _previous_entry(self, relative_path: str) -> Optional[dict]:
+        """Entry of the previous session for a page, loaded on first use."""
+
+        if self.previous_pages_dir is None:
+            return None
+
+        with self._lock:
+            if self._previous_entries is None:
+                self._previous_entries = load_response_link_index(
+                    self.previous_pages_dir, self.logger
+                )
+
+        return self._previous_entries.get(os.path.normpath(relative_path))
+
+    def _append(self, entry: dict) -> None:
+        """Append one entry to the index file."""
+
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
@@ -0,0 +1,200 @@
+"""
+Crash-safe journal of the pages a scrape session has completed.
+
+A session that dies halfway (browser crash, task timeout, killed process)
+used to be lost: the retry started a new timestamped session from page one.
+The journal is an append-only JSON-lines file in the session's pages
+directory. One line is appended, flushed and fsync'ed per completed URL, so
+every line that made it to disk stands for a page that was saved before it.
+
+When the run completes, a final "finished" line is appended. A scraper started
+with --resume reopens the latest session whose journal has no such line and
+only schedules the URLs that are not in it yet.
+
+Pages are downloaded while the listing is still being crawled, so the listings
+CSV of an interrupted session may be incomplete. A "listed" line records that
+the CSV holds the full catalog and can be reused by --resume.
+"""
+
+import datetime
+import json
+import logging
+import os
+import threading
+from typing import Dict, Optional
+
+from .const import RESUME_JOURNAL_FILENAME
+
+EVENT_COMPLETED = "completed"
+EVENT_LISTED = "listed"
+EVENT_FINISHED = "finished"
+
+
+def _read_journal(journal_path: str, logger=None) -> list:
+    """
+    Read the records of a journal file.
+
+    A line cut short by a crash in the middle of a write is skipped.
+
+    Args:
+        journal_path: Path to the journal file
+        logger: Logger for skipped lines
+
+    Returns:
+        Records in the order they were written (empty if there is no journal)
+    """
+    if not os.path.isfile(journal_path):
+        return []
+
+    records = []
+
+    with open(journal_path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+
+            if not line.strip():
+                continue
+
+            try:
+                records.append(json.loads(line))
+
+            except ValueError:
+                if logger is not None:
+                    logger.warning(
+                        f"Skipping damaged journal line {line_number}: {journal_path}"
+                    )
+
+    return records
+
+
+def find_unfinished_session(data_dir: str, pages_dir_name: str) -> Optional[str]:
+    """
+    Find the latest session whose run did not complete.
+
+    Only the most recent session with a journal is considered: once a later
+    run has finished, older interrupted sessions are not worth resuming.
+
+    Args:
+        data_dir: Directory containing the timestamped session directories
+        pages_dir_name: Name of the pages directory inside a session
+
+    Returns:
+        Name (timestamp) of the session to resume, or None
+    """
+    if not os.path.isdir(data_dir):
+        return None
+
+    # Session names are timestamps, so lexical order is chronological
+    for session in sorted(os.listdir(data_dir), reverse=True):
+
+        journal_path = os.path.join(
+            data_dir, session, pages_dir_name, RESUME_JOURNAL_FILENAME
+        )
+
+        if not os.path.isfile(journal_path):
+            continue
+
+        records = _read_journal(journal_path)
+        finished = any(record.get("event") == EVENT_FINISHED for record in records)
+
+        return None if finished else session
+
+    return None
+
+
+class ResumeJournal:
+    """Append-only record of the URLs a session has completed."""
+
+    def __init__(self, pages_dir: str, logger=None):
+        """
+        Open the journal of a session, loading what it recorded so far.
+
+        Args:
+            pages_dir: Pages directory of the session
+            logger: Logger of the calling scraper (defaults to module logger)
+        """
+        self.path = os.path.join(pages_dir, RESUME_JOURNAL_FILENAME)
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        self.completed: Dict[str, str] = {}
+        self.listed = False
+        self.finished = False
+
+        for record in _read_journal(self.path, self.logger):
+
+            if record.get("event") == EVENT_COMPLETED:
+                self.completed[record["url"]] = record.get("time", "")
+
+            elif record.get("event") == EVENT_LISTED:
+                self.listed = True
+
+            elif record.get("event") == EVENT_FINISHED:
+                self.finished = True
+
+        if self.completed:
+            self.logger.info(
+                f"Resuming session: {len(self.completed)} pages already completed"
+            )
+
+    def is_completed(self, url: str) -> bool:
+        """Tell whether a URL was completed by an earlier run of this session."""
+
+        return url in self.completed
+
+    def record(self, url: str, completed_at: str = "") -> None:
+        """
+        Durably record a completed URL (thread-safe).
+
+        Call only after the page is saved: the line is on disk when this returns.
+
+        Args:
+            url: Completed page URL
+            completed_at: Completion time as written to the CSV
+        """
+        completed_at = completed_at or datetime.datetime.now().strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+        self._append({"event": EVENT_COMPLETED, "url": url, "time": completed_at})
+
+        with self._lock:
+            self.completed[url] = completed_at
+
+    def mark_listed(self, count: int) -> None:
+        """
+        Record that the listings CSV holds the full catalog of the session.
+
+        Args:
+            count: Number of initiatives in the catalog
+        """
+        self._append(
+            {
+                "event": EVENT_LISTED,
+                "count": count,
+                "time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+        )
+        self.listed = True
+
+    def mark_finished(self) -> None:
+        """Record that the run completed, so --resume does not reopen it."""
+
+        self._append(
+            {
+                "event": EVENT_FINISHED,
+                "time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+        )
+        self.finished = True
+
+    def _append(self, record: dict) -> None:
+        """Append one record and force it to disk."""
+
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
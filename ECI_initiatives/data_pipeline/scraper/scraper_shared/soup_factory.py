@@ -0,0 +1,92 @@
+"""
+BeautifulSoup factory shared by the extractors and the response link extractor.
+
+Every page parse of ECIHTMLParser, ECIResponseHTMLParser,
+FollowupWebsiteExtractor and ResponseLinkExtractor goes through make_soup(),
+so the tree builder is chosen in one place: HTML_PARSER_BACKEND
+(html.parser, standard library) for every run.
+
+set_parser_backend() switches the process to lxml or html5lib (optional
+packages) for dev/benchmarks/parser_backends.py only: both change the
+objective extracted from some initiative pages, so they are not offered as
+a run setting until the benchmark reports identical output.
+"""
+
+from typing import Optional, Union
+
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+from .const import HTML_PARSER_BACKEND
+
+PARSER_BACKENDS = ("html.parser", "lxml", "html5lib")
+
+_backend = HTML_PARSER_BACKEND
+
+
+def check_parser_backend(backend: str) -> str:
+    """
+    Check that a parser backend is supported and installed.
+
+    Args:
+        backend: One of PARSER_BACKENDS
+
+    Returns:
+        The backend name
+
+    Raises:
+        ValueError: If the backend is unknown or its package is not installed
+    """
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(
+            f"Unknown HTML parser backend: {backend!r}. "
+            f"Expected one of: {', '.join(PARSER_BACKENDS)}"
+        )
+
+    if builder_registry.lookup(backend) is None:
+        raise ValueError(
+            f"HTML parser backend {backend!r} is not installed "
+            f"(pip install {backend})"
+        )
+
+    return backend
+
+
+def get_parser_backend() -> str:
+    """Return the parser backend used by make_soup()."""
+
+    return _backend
+
+
+def set_parser_backend(backend: str) -> None:
+    """
+    Use another parser backend for the rest of the process, to compare it.
+
+    Worker processes started afterwards with the fork start method inherit
+    it.
+
+    Args:
+        backend: One of PARSER_BACKENDS
+
+    Raises:
+        ValueError: If the backend is unknown or its package is not installed
+    """
+    global _backend
+
+    _backend = check_parser_backend(backend)
+
+
+def make_soup(
+    markup: Union[str, bytes], backend: Optional[str] = None
+) -> BeautifulSoup:
+    """
+    Parse a page with the configured backend.
+
+    Args:
+        markup: HTML of the page
+        backend: Backend to use instead of the configured one
+
+    Returns:
+        Parsed page
+    """
+    return BeautifulSoup(markup, backend or _backend)
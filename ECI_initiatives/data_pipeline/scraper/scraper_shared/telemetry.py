@@ -0,0 +1,322 @@
+"""
+Per-page timing telemetry shared by all ECI scrapers.
+
+The scraper logs are written for humans; tuning timeouts and concurrency
+needs numbers. Every page download gets a PageSpan that times its phases:
+
+- rate_wait: sleeping for the shared rate controller
+- navigate: the HTTP request, or the browser page load
+- rate_limit_check: looking for rate limiting indicators in the page
+- readiness: waiting for the content selectors and a stable DOM
+- save: writing the page to disk
+
+together with its retries, size and outcome. Finished spans are appended as
+JSON lines to the session logs/ directory. At the end of a run the p50/p95/p99
+of every phase are logged and exported in the Prometheus text format, so the
+Airflow host can graph scraper latency across runs.
+"""
+
+import datetime
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from .const import (
+    PROMETHEUS_TEXTFILE_DIR,
+    TELEMETRY_FILENAME,
+    TELEMETRY_METRICS_FILENAME,
+    TELEMETRY_QUANTILES,
+)
+
+METRIC_PREFIX = "eci_scraper"
+
+
+def percentile(sorted_values: Sequence[float], quantile: float) -> float:
+    """Linearly interpolated quantile of sorted values (0.0 if empty)."""
+
+    if not sorted_values:
+        return 0.0
+
+    position = quantile * (len(sorted_values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (
+        position - lower
+    )
+
+
+class PageSpan:
+    """Timings of one page download."""
+
+    def __init__(self, url: str, telemetry: Optional["ScrapeTelemetry"] = None):
+        """
+        Start timing a page.
+
+        Args:
+            url: Page URL
+            telemetry: Collector the span is recorded in by finish(); a span
+                without one only measures
+        """
+        self.url = url
+        self.telemetry = telemetry
+        self.phases: Dict[str, float] = {}
+        self.retries = 0
+        self.bytes = 0
+        self.source = ""
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase; repeated phases (retries) add up."""
+
+        started = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (
+                time.perf_counter() - started
+            )
+
+    def finish(self, success: bool) -> dict:
+        """
+        Stop timing and record the span.
+
+        Args:
+            success: Whether the page was saved
+
+        Returns:
+            The span as recorded
+        """
+        record = {
+            "time": datetime.datetime.now().isoformat(timespec="seconds"),
+            "url": self.url,
+            "outcome": "success" if success else "failed",
+            "source": self.source,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "phases": {
+                name: round(seconds, 4) for name, seconds in self.phases.items()
+            },
+            "total": round(time.perf_counter() - self._started, 4),
+        }
+
+        if self.telemetry is not None:
+            self.telemetry.record(record)
+
+        return record
+
+
+class ScrapeTelemetry:
+    """Thread-safe collector of the page spans of one scraper run."""
+
+    def __init__(
+        self,
+        scraper: str,
+        log_dir: Optional[str] = None,
+        logger=None,
+        textfile_dir: str = PROMETHEUS_TEXTFILE_DIR,
+    ):
+        """
+        Initialize the collector.
+
+        Args:
+            scraper: Scraper name, used in file names and metric labels
+            log_dir: Session logs/ directory; spans are only kept in memory
+                until one is set
+            logger: Logger of the calling scraper (defaults to module logger)
+            textfile_dir: Extra directory for the Prometheus textfile
+        """
+        self.scraper = scraper
+        self.log_dir = log_dir
+        self.logger = logger or logging.getLogger(__name__)
+        self.textfile_dir = textfile_dir
+
+        self.records: List[dict] = []
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Optional[str]:
+        """JSON-lines file of the spans, if there is a log directory."""
+
+        if self.log_dir is None:
+            return None
+
+        return os.path.join(
+            self.log_dir, TELEMETRY_FILENAME.format(scraper=self.scraper)
+        )
+
+    def page(self, url: str) -> PageSpan:
+        """Start the span of a page download."""
+
+        return PageSpan(url, self)
+
+    def record(self, record: dict) -> None:
+        """Keep a finished span and append it to the JSON-lines file."""
+
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+
+        with self._lock:
+            self.records.append(record)
+
+            if self.path is None:
+                return
+
+            try:
+                os.makedirs(self.log_dir, exist_ok=True)
+
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
+
+            except OSError as e:
+                self.logger.debug(f"Could not write telemetry: {e}")
+
+    def summary(self) -> dict:
+        """
+        Summarize the spans of the run.
+
+        Returns:
+            Dictionary with page, outcome, retry and byte counts, and the
+            quantiles, sum and count of every phase (and "total")
+        """
+        with self._lock:
+            records = list(self.records)
+
+        durations: Dict[str, List[float]] = {}
+
+        for record in records:
+            for name, seconds in record["phases"].items():
+                durations.setdefault(name, []).append(seconds)
+
+            durations.setdefault("total", []).append(record["total"])
+
+        phases = {}
+
+        for name, values in durations.items():
+            values.sort()
+            phases[name] = {
+                "quantiles": {q: percentile(values, q) for q in TELEMETRY_QUANTILES},
+                "sum": sum(values),
+                "count": len(values),
+            }
+
+        outcomes: Dict[str, int] = {}
+
+        for record in records:
+            outcomes[record["outcome"]] = outcomes.get(record["outcome"], 0) + 1
+
+        return {
+            "pages": len(records),
+            "outcomes": outcomes,
+            "retries": sum(record["retries"] for record in records),
+            "bytes": sum(record["bytes"] for record in records),
+            "phases": phases,
+        }
+
+    def log_summary(self) -> None:
+        """Log the p50/p95/p99 of every phase and export the metrics."""
+
+        summary = self.summary()
+
+        if not summary["pages"]:
+            return
+
+        self.logger.info(
+            f"Download telemetry: {summary['pages']} pages, "
+            f"{summary['retries']} retries, {summary['bytes'] / 1024:.0f} KiB"
+        )
+
+        for name, phase in summary["phases"].items():
+            quantiles = ", ".join(
+                f"p{q * 100:g} {seconds:.2f}s"
+                for q, seconds in phase["quantiles"].items()
+            )
+            self.logger.info(f"  {name}: {quantiles} ({phase['count']} pages)")
+
+        self.export_metrics(summary)
+
+    def export_metrics(self, summary: Optional[dict] = None) -> List[str]:
+        """
+        Write the run summary as a Prometheus textfile.
+
+        The file is written into the log directory and into textfile_dir,
+        each replaced atomically so a collector never reads half a file.
+
+        Args:
+            summary: Summary to export (computed if not given)
+
+        Returns:
+            Paths written
+        """
+        text = self.prometheus_text(summary or self.summary())
+        file_name = TELEMETRY_METRICS_FILENAME.format(scraper=self.scraper)
+        written = []
+
+        for directory in (self.log_dir, self.textfile_dir):
+
+            if not directory:
+                continue
+
+            path = os.path.join(directory, file_name)
+
+            try:
+                os.makedirs(directory, exist_ok=True)
+
+                with open(path + ".tmp", "w", encoding="utf-8") as f:
+                    f.write(text)
+
+                os.replace(path + ".tmp", path)
+                written.append(path)
+
+            except OSError as e:
+                self.logger.warning(f"Could not write scraper metrics to {path}: {e}")
+
+        return written
+
+    def prometheus_text(self, summary: dict) -> str:
+        """Render a summary in the Prometheus text exposition format."""
+
+        label = f'scraper="{self.scraper}"'
+        seconds = f"{METRIC_PREFIX}_page_seconds"
+        lines = [
+            f"# HELP {seconds} Time per page and phase in the last scraper run.",
+            f"# TYPE {seconds} summary",
+        ]
+
+        for name, phase in summary["phases"].items():
+            labels = f'{label},phase="{name}"'
+
+            for q, value in phase["quantiles"].items():
+                lines.append(f'{seconds}{{{labels},quantile="{q:g}"}} {value:.6f}')
+
+            lines.append(f"{seconds}_sum{{{labels}}} {phase['sum']:.6f}")
+            lines.append(f"{seconds}_count{{{labels}}} {phase['count']}")
+
+        gauges = [
+            ("pages", "Pages attempted in the last scraper run, by outcome."),
+            ("retries", "Download retries in the last scraper run."),
+            ("page_bytes", "Bytes of the pages downloaded in the last scraper run."),
+            ("last_run_timestamp_seconds", "End time of the last scraper run."),
+        ]
+        values = {
+            "retries": summary["retries"],
+            "page_bytes": summary["bytes"],
+            "last_run_timestamp_seconds": int(time.time()),
+        }
+
+        for name, help_text in gauges:
+            metric = f"{METRIC_PREFIX}_{name}"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} gauge"]
+
+            if name == "pages":
+                for outcome, count in sorted(summary["outcomes"].items()):
+                    lines.append(f'{metric}{{{label},outcome="{outcome}"}} {count}')
+            else:
+                lines.append(f"{metric}{{{label}}} {values[name]}")
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,427 @@
+"""
+Bounded worker pool shared by all ECI scrapers.
+
+Each worker owns its own resources (typically one Chrome driver) and pulls
+items from a single shared queue. Requests are paced by one rate controller
+shared by all workers (see rate_controller.py), so the total request rate
+does not depend on how many workers are running; only page load latency is
+overlapped.
+
+Items are either known up front (map) or arrive while the workers are already
+running (consume, fed through a bounded WorkStream by a producer such as the
+listing crawler).
+
+An item whose attempt failed can be retried later: process_item raises
+RetryLater(delay), the item is parked until the delay has passed, and the
+worker goes on with other items meanwhile. A few flaky pages then no longer
+hold their workers in back-off sleeps.
+"""
+
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+Item = TypeVar("Item")
+Result = TypeVar("Result")
+Worker = TypeVar("Worker")
+
+# Marks the end of a WorkStream
+_END = object()
+
+# How often a producer blocked on a full stream checks for an abort (seconds)
+_PUT_POLL_INTERVAL = 0.5
+
+
+class RetryLater(Exception):
+    """Raised by process_item to have its item processed again after a delay."""
+
+    def __init__(self, delay: float):
+        """
+        Args:
+            delay: Seconds before the item is due again
+        """
+        super().__init__(f"Retry in {delay:.1f}s")
+        self.delay = delay
+
+
+class WorkStream:
+    """
+    Bounded queue of work items, fed while the workers already process it.
+
+    put() blocks while the queue is full, so a fast producer cannot run far
+    ahead of the workers. close() ends the stream once all items are in.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        """
+        Initialize the stream.
+
+        Args:
+            maxsize: Maximum number of waiting items (0 for unbounded)
+        """
+        self._queue: "queue.Queue" = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        self._aborted = threading.Event()
+        self.count = 0
+
+    def put(self, item: Item) -> bool:
+        """
+        Add an item, waiting while the queue is full (thread-safe).
+
+        Returns:
+            bool: False if the stream was aborted and the item dropped
+        """
+        with self._lock:
+            index = self.count
+            self.count += 1
+
+        return self._put((index, item))
+
+    def close(self) -> None:
+        """Mark the end of the stream; workers stop once it is drained."""
+
+        self._put(_END)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Tuple[int, Item]]:
+        """
+        Take the next item, waiting for the producer if needed.
+
+        Args:
+            timeout: Seconds to wait at most (None waits until an item arrives)
+
+        Returns:
+            (index, item) in the order items were put, or None at the end
+
+        Raises:
+            queue.Empty: If no item arrived within the timeout
+        """
+        entry = self._queue.get(timeout=timeout)
+
+        if entry is _END:
+            # Leave the marker for the other workers
+            self._queue.put_nowait(_END)
+            return None
+
+        return entry
+
+    def abort(self) -> None:
+        """Drop waiting items and wake up blocked producers and workers."""
+
+        self._aborted.set()
+
+        while True:
+            try:
+                self._queue.get_nowait()
+                continue
+            except queue.Empty:
+                pass
+
+            # A producer may have slipped one more item in meanwhile
+            try:
+                self._queue.put_nowait(_END)
+                return
+            except queue.Full:
+                continue
+
+    def _put(self, entry) -> bool:
+        """Put an entry, giving up once the stream is aborted."""
+
+        while not self._aborted.is_set():
+            try:
+                self._queue.put(entry, timeout=_PUT_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+
+class _RetrySchedule:
+    """
+    Hands out the items of one pool run: retries that are due, then new items.
+
+    Items parked by RetryLater are kept in a heap by due time. Workers finish
+    once there are no new items, no parked retries and no items in progress
+    (an item in progress may still be parked again).
+    """
+
+    def __init__(
+        self,
+        next_item: Callable[[Optional[float]], Optional[tuple]],
+        abort: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Initialize the schedule.
+
+        Args:
+            next_item: Returns the next new (index, item) or None at the end,
+                waiting at most the given timeout (None for no limit) and
+                raising queue.Empty when it passes
+            abort: Called by stop() to wake up workers waiting in next_item
+        """
+        self._next_item = next_item
+        self._abort = abort
+        self._retries: List[tuple] = []
+        self._order = itertools.count()
+        self._in_progress = 0
+        self._no_new_items = False
+        self._stopped = False
+        self._condition = threading.Condition()
+        self.deferred = 0
+
+    def take(self) -> Optional[tuple]:
+        """Next (index, item) to process, or None once all work is done."""
+
+        while True:
+            with self._condition:
+
+                if self._stopped:
+                    return None
+
+                now = time.monotonic()
+
+                if self._retries and self._retries[0][0] <= now:
+                    _, _, index, item = heapq.heappop(self._retries)
+                    self._in_progress += 1
+                    return index, item
+
+                timeout = self._retries[0][0] - now if self._retries else None
+
+                if self._no_new_items:
+                    if timeout is None and not self._in_progress:
+                        return None
+
+                    # Woken up early by done() if an item is parked meanwhile
+                    self._condition.wait(timeout)
+                    continue
+
+            # New items may take a while to arrive (stream), wait unlocked
+            try:
+                entry = self._next_item(timeout)
+            except queue.Empty:
+                continue
+
+            with self._condition:
+
+                if self._stopped:
+                    return None
+
+                if entry is None:
+                    self._no_new_items = True
+                    continue
+
+                self._in_progress += 1
+
+            return entry
+
+    def done(self, index: int, item: Item, retry_delay: Optional[float] = None):
+        """Finish an item, parking it for retry_delay seconds if given."""
+
+        with self._condition:
+            self._in_progress -= 1
+
+            if retry_delay is not None:
+                due = time.monotonic() + retry_delay
+                heapq.heappush(self._retries, (due, next(self._order), index, item))
+                self.deferred += 1
+
+            self._condition.notify_all()
+
+    def stop(self) -> None:
+        """Stop handing out items, e.g. after an error."""
+
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+        if self._abort is not None:
+            self._abort()
+
+
+class BrowserWorkerPool:
+    """Run items through N workers sharing one work queue."""
+
+    def __init__(self, num_workers: int, logger=None):
+        """
+        Initialize the pool.
+
+        Args:
+            num_workers: Maximum number of concurrent workers
+            logger: Logger of the calling scraper (defaults to module logger)
+        """
+        self.num_workers = max(1, num_workers)
+        self.logger = logger or logging.getLogger(__name__)
+
+    def map(
+        self,
+        items: List[Item],
+        process_item: Callable[[Worker, Item], Result],
+        open_worker: Callable[[], Worker],
+        close_worker: Callable[[Worker], None],
+        on_result: Optional[Callable[[Item, Result], None]] = None,
+    ) -> List[Result]:
+        """
+        Process all items and return their results in input order.
+
+        With a single worker (or a single item) everything runs in the
+        calling thread, like a plain loop.
+
+        Args:
+            items: Work items
+            process_item: Called as process_item(worker, item) for each item
+            open_worker: Creates the per-worker state (e.g. browser holder)
+            close_worker: Releases the per-worker state
+            on_result: Called as on_result(item, result) as soon as an item
+                is done, in the worker's thread (e.g. to feed a WorkStream)
+
+        Returns:
+            List of results, in the same order as items
+
+        Raises:
+            Exception: The first exception raised by process_item
+                (other than RetryLater)
+        """
+        work_queue: "queue.Queue[Tuple[int, Item]]" = queue.Queue()
+        for index, item in enumerate(items):
+            work_queue.put((index, item))
+
+        def next_item(timeout: Optional[float]) -> Optional[Tuple[int, Item]]:
+            try:
+                return work_queue.get_nowait()
+            except queue.Empty:
+                return None
+
+        results: Dict[int, Result] = {}
+        self._run(
+            min(self.num_workers, len(items)),
+            _RetrySchedule(next_item),
+            process_item,
+            open_worker,
+            close_worker,
+            results,
+            on_result,
+        )
+
+        return [results[index] for index in range(len(items))]
+
+    def consume(
+        self,
+        stream: WorkStream,
+        process_item: Callable[[Worker, Item], Result],
+        open_worker: Callable[[], Worker],
+        close_worker: Callable[[Worker], None],
+    ) -> List[Result]:
+        """
+        Process items of a stream until it is closed.
+
+        Blocks the calling thread, so the producer feeding the stream runs in
+        another one. With a single worker the items are processed in the
+        calling thread.
+
+        Args:
+            stream: Stream fed by a producer, ended with stream.close()
+            process_item: Called as process_item(worker, item) for each item
+            open_worker: Creates the per-worker state (e.g. browser holder)
+            close_worker: Releases the per-worker state
+
+        Returns:
+            List of results, in the order the items were put into the stream
+
+        Raises:
+            Exception: The first exception raised by process_item (other
+                than RetryLater); the stream is aborted so the producer does
+                not block on it
+        """
+        results: Dict[int, Result] = {}
+        self._run(
+            self.num_workers,
+            _RetrySchedule(stream.get, abort=stream.abort),
+            process_item,
+            open_worker,
+            close_worker,
+            results,
+        )
+
+        return [results[index] for index in sorted(results)]
+
+    def _run(
+        self,
+        num_workers: int,
+        schedule: _RetrySchedule,
+        process_item: Callable[[Worker, Item], Result],
+        open_worker: Callable[[], Worker],
+        close_worker: Callable[[Worker], None],
+        results: Dict[int, Result],
+        on_result: Optional[Callable[[Item, Result], None]] = None,
+    ) -> None:
+        """
+        Run the workers until the schedule is exhausted.
+
+        With a single worker it runs in the calling thread.
+
+        Raises:
+            Exception: The first exception raised by process_item
+        """
+        errors: List[BaseException] = []
+
+        def run_worker() -> None:
+
+            worker = open_worker()
+
+            try:
+                while True:
+
+                    entry = schedule.take()
+                    if entry is None:
+                        return
+
+                    index, item = entry
+
+                    try:
+                        result = process_item(worker, item)
+
+                    except RetryLater as retry:
+                        schedule.done(index, item, retry.delay)
+                        continue
+
+                    results[index] = result
+                    schedule.done(index, item)
+
+                    if on_result is not None:
+                        on_result(item, result)
+
+            except BaseException as e:  # pylint: disable=broad-except
+                errors.append(e)
+                schedule.stop()
+
+            finally:
+                close_worker(worker)
+
+        if num_workers <= 1:
+            run_worker()
+
+        else:
+            self.logger.info(f"Starting {num_workers} download workers")
+
+            threads = [
+                threading.Thread(target=run_worker, name=f"scraper-worker-{n}")
+                for n in range(num_workers)
+            ]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+        if schedule.deferred:
+            self.logger.info(
+                f"{schedule.deferred} retries were queued behind other pages"
+            )
+
+        if errors:
+            raise errors[0]
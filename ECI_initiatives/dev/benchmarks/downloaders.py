@@ -0,0 +1,298 @@
+"""
+Benchmark the three page downloaders against the offline replay server.
+
+Each downloader (initiatives, responses, follow-up websites) downloads the
+example pages of the test suite from a local replay server that adds latency,
+429 bursts and redirects (see replay_server.py), with its real rate
+controller, worker pool and HTTP-first fetcher. No request leaves the machine.
+Reported per downloader:
+
+- pages/s: pages saved per second of wall time
+- recovery: seconds from the first 429 of a burst until the server next
+  served a page (mean and worst over the bursts of the run)
+- CPU/page: CPU time of the scraper process per saved page (the server
+  runs in a child process and is not counted)
+
+Without --browser, a page answered with 429 is fetched again over HTTP after
+the rate controller's back-off, standing in for the browser's retry loop, and
+the run stops if a page would still need Chrome. With --browser the
+downloaders fall back to Chrome as in production. Run from the
+ECI_initiatives directory:
+
+    python -m dev.benchmarks.downloaders [--copies N] [--workers N] [--browser]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import ExitStack
+from typing import Callable, List, Optional, Tuple
+from unittest.mock import patch
+
+from data_pipeline.scraper.scraper_shared.browser_session import browser_sessions
+from data_pipeline.scraper.scraper_shared.const import DOWNLOAD_WORKERS, RATE_MAX
+from data_pipeline.scraper.scraper_shared.http_fetcher import StaticPageFetcher
+from data_pipeline.scraper.scraper_shared.rate_controller import (
+    AdaptiveRateController,
+)
+
+from .replay_server import (
+    ReplayConfig,
+    ReplayCorpus,
+    fetch_request_log,
+    start_server_process,
+)
+
+MAX_RETRIES = 5
+
+
+class ReplayRetryFetcher(StaticPageFetcher):
+    """HTTP fetcher that retries rate limited pages instead of starting Chrome."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._attempt = threading.local()
+
+    def fetch(self, url, headers=None):
+        for attempt in range(MAX_RETRIES + 1):
+            self._attempt.rate_limited = False
+            static_page = super().fetch(url, headers=headers)
+
+            if static_page is not None or not self._attempt.rate_limited:
+                return static_page
+
+            # Same back-off as the browser retry loop of the downloaders
+            time.sleep(self.rate_controller.retry_delay(attempt, rate_limited=True))
+
+        return None
+
+    def _record_rate_limited(self) -> None:
+        self._attempt.rate_limited = True
+        super()._record_rate_limited()
+
+
+def browser_unavailable():
+    """Replaces initialize_browser() in HTTP-only runs."""
+
+    raise RuntimeError("A page needs Chrome; run the benchmark with --browser")
+
+
+def recovery_times(log: List[Tuple[float, str, int]]) -> List[float]:
+    """Seconds from the first 429 of each burst to the next page served."""
+
+    times = []
+    burst_start = None
+
+    for served_at, _, status in log:
+        if status == 429 and burst_start is None:
+            burst_start = served_at
+
+        elif status == 200 and burst_start is not None:
+            times.append(served_at - burst_start)
+            burst_start = None
+
+    return times
+
+
+def initiatives_run(
+    base_url: str, corpus: ReplayCorpus, fetcher_class, max_rate: float
+) -> Tuple[str, List[str], Callable]:
+    """Initiatives downloader: download_initiatives() on the listing rows."""
+
+    from data_pipeline.scraper.initiatives import downloader
+    from data_pipeline.scraper.initiatives.consts import INITIAL_REQUEST_RATE
+    from data_pipeline.scraper.initiatives.css_selectors import (
+        ECIinitiativeSelectors,
+    )
+
+    urls = [base_url + path for path in corpus.paths("/initiatives/details/")]
+    urls = [url for url in urls if not url.endswith("commission-answer_en")]
+
+    def run(output_dir: str, workers: int) -> int:
+        controller = AdaptiveRateController(INITIAL_REQUEST_RATE, max_rate=max_rate)
+        fetcher = fetcher_class(
+            [ECIinitiativeSelectors.INITIATIVE_PROGRESS], rate_controller=controller
+        )
+
+        with patch.object(downloader, "rate_controller", controller):
+            _, failed = downloader.download_initiatives(
+                output_dir, [{"url": url} for url in urls], fetcher, workers
+            )
+
+        return len(urls) - len(failed)
+
+    return "initiatives", urls, run
+
+
+def responses_run(
+    base_url: str, corpus: ReplayCorpus, fetcher_class, max_rate: float
+) -> Tuple[str, List[str], Callable]:
+    """Responses downloader: ResponseDownloader on the response links."""
+
+    from data_pipeline.scraper.responses.consts import INITIAL_REQUEST_RATE
+    from data_pipeline.scraper.responses.css_selectors import ResponsePageSelectors
+    from data_pipeline.scraper.responses.downloader import ResponseDownloader
+
+    paths = [path for path in corpus.paths() if path.endswith("commission-answer_en")]
+    links = []
+
+    for path in paths:
+        year, number = path.split("/")[3:5]
+        links.append(
+            {"url": base_url + path, "year": year, "reg_number": f"{year}_{number}"}
+        )
+
+    def run(output_dir: str, workers: int) -> int:
+        controller = AdaptiveRateController(INITIAL_REQUEST_RATE, max_rate=max_rate)
+        fetcher = fetcher_class(
+            [ResponsePageSelectors.MAIN_CONTENT], rate_controller=controller
+        )
+        downloaded, _ = ResponseDownloader(
+            output_dir, fetcher, workers, rate_controller=controller
+        ).download_all_responses(links)
+
+        return len(downloaded)
+
+    return "responses", [link["url"] for link in links], run
+
+
+def followup_run(
+    base_url: str, corpus: ReplayCorpus, fetcher_class, max_rate: float
+) -> Tuple[str, List[str], Callable]:
+    """Follow-up website downloader: FollowupWebsiteDownloader on the sites."""
+
+    from data_pipeline.scraper.responses_followup_website.consts import (
+        INITIAL_REQUEST_RATE,
+    )
+    from data_pipeline.scraper.responses_followup_website.css_selectors import (
+        FollowupWebsiteSelectors,
+    )
+    from data_pipeline.scraper.responses_followup_website.downloader import (
+        FollowupWebsiteDownloader,
+    )
+
+    sites = []
+
+    for path in corpus.paths("/followup/"):
+        year, number = path.split("/")[2:4]
+        sites.append(
+            {
+                "url": base_url + path,
+                "year": year,
+                "registration_number": f"{year}_{number[:-len('_en')]}",
+            }
+        )
+
+    def run(output_dir: str, workers: int) -> int:
+        controller = AdaptiveRateController(INITIAL_REQUEST_RATE, max_rate=max_rate)
+        fetcher = fetcher_class(
+            [FollowupWebsiteSelectors.MAIN_CONTENT], rate_controller=controller
+        )
+        downloaded, _ = FollowupWebsiteDownloader(
+            output_dir, fetcher, workers, rate_controller=controller
+        ).download_all_followup_websites(sites)
+
+        return len(downloaded)
+
+    return "follow-up", [site["url"] for site in sites], run
+
+
+def initiatives_log_session() -> Optional[str]:
+    """Session directory the initiatives scraper logs into, if it is new."""
+
+    from data_pipeline.scraper.initiatives.consts import LOG_DIR
+
+    session_dir = os.path.dirname(LOG_DIR)
+
+    return None if os.path.exists(session_dir) else session_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--copies", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=DOWNLOAD_WORKERS)
+    parser.add_argument("--max-rate", type=float, default=RATE_MAX)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--burst-every", type=int, default=8)
+    parser.add_argument("--burst-length", type=int, default=2)
+    parser.add_argument("--redirect-every", type=int, default=5)
+    parser.add_argument("--browser", action="store_true")
+    args = parser.parse_args()
+
+    corpus = ReplayCorpus.from_example_pages(copies=args.copies)
+    config = ReplayConfig(
+        latency=args.latency,
+        burst_every=args.burst_every,
+        burst_length=args.burst_length,
+        redirect_every=args.redirect_every,
+    )
+    process, base_url = start_server_process(corpus, config)
+
+    # Importing the initiatives scraper opens its session log; removed below
+    log_session = initiatives_log_session()
+    fetcher_class = StaticPageFetcher if args.browser else ReplayRetryFetcher
+
+    print(f"Replay server {base_url}: {config}")
+    print(f"{args.workers} workers, max rate {args.max_rate} req/s")
+
+    try:
+        with ExitStack() as stack:
+            stack.enter_context(browser_sessions.keep_alive())
+
+            if not args.browser:
+                for module in (
+                    "data_pipeline.scraper.initiatives.downloader",
+                    "data_pipeline.scraper.responses.downloader",
+                    "data_pipeline.scraper.responses_followup_website.downloader",
+                ):
+                    stack.enter_context(
+                        patch(f"{module}.initialize_browser", browser_unavailable)
+                    )
+
+            # Every page is logged; the rate controller's slow-downs still show
+            logging.disable(logging.INFO)
+            logging.getLogger("ECIScraper").setLevel(logging.ERROR)
+
+            for make_run in (initiatives_run, responses_run, followup_run):
+                name, urls, run = make_run(
+                    base_url, corpus, fetcher_class, args.max_rate
+                )
+                log_start = len(fetch_request_log(base_url))
+
+                with tempfile.TemporaryDirectory() as output_dir:
+                    started = time.perf_counter()
+                    cpu_started = time.process_time()
+
+                    saved = run(output_dir, args.workers)
+
+                    wall = time.perf_counter() - started
+                    cpu = time.process_time() - cpu_started
+
+                recovery = recovery_times(fetch_request_log(base_url)[log_start:])
+                recovery_text = (
+                    f"recovery {sum(recovery) / len(recovery):5.2f} s mean, "
+                    f"{max(recovery):5.2f} s worst ({len(recovery)} bursts)"
+                    if recovery
+                    else "no 429 bursts"
+                )
+
+                print(
+                    f"{name:>12}: {saved}/{len(urls)} pages, "
+                    f"{saved / wall:5.2f} pages/s, {recovery_text}, "
+                    f"CPU {cpu * 1000 / max(saved, 1):6.1f} ms/page"
+                )
+
+    finally:
+        logging.disable(logging.NOTSET)
+        process.terminate()
+
+        if log_session is not None:
+            shutil.rmtree(log_session, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
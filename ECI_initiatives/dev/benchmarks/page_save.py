@@ -0,0 +1,94 @@
+"""
+Benchmark the per-page cost of saving and reading back a downloaded page.
+
+Compares the previous save path (BeautifulSoup prettify, then write) with
+writing the page as received, plain and compressed, using the example pages
+of the test suite. Run from the ECI_initiatives directory:
+
+    python -m dev.benchmarks.page_save [--repeat N]
+"""
+
+import argparse
+import glob
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from data_pipeline.scraper.scraper_shared import page_io
+
+EXAMPLE_PAGES_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "tests", "data", "example_htmls"
+)
+
+
+def save_prettified(path: str, page_source: str) -> str:
+    """Save path used before pages were stored raw."""
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(BeautifulSoup(page_source, "html.parser").prettify())
+
+    return path
+
+
+def time_pages(save, pages, output_dir: str, repeat: int):
+    """Return mean save and read seconds per page and bytes stored by one pass."""
+
+    started = time.perf_counter()
+
+    for _ in range(repeat):
+        stored = [
+            save(os.path.join(output_dir, f"{i}.html"), page_source)
+            for i, page_source in enumerate(pages)
+        ]
+
+    save_time = (time.perf_counter() - started) / (repeat * len(pages))
+
+    started = time.perf_counter()
+
+    for _ in range(repeat):
+        for path in stored:
+            page_io.read_page(path)
+
+    read_time = (time.perf_counter() - started) / (repeat * len(pages))
+
+    return save_time, read_time, sum(os.path.getsize(path) for path in stored)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = []
+    for path in sorted(
+        glob.glob(os.path.join(EXAMPLE_PAGES_DIR, "**", "*.html"), recursive=True)
+    ):
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+
+    variants = [("prettify + write", save_prettified, "")]
+    variants += [("raw", page_io.write_page, ""), ("gzip", page_io.write_page, "gzip")]
+    if page_io.zstandard is not None:
+        variants.append(("zstd", page_io.write_page, "zstd"))
+
+    print(f"{len(pages)} pages, {args.repeat} passes")
+
+    for name, save, compression in variants:
+        with tempfile.TemporaryDirectory() as output_dir, patch.object(
+            page_io, "PAGE_COMPRESSION", compression
+        ):
+            save_time, read_time, stored = time_pages(
+                save, pages, output_dir, args.repeat
+            )
+
+        print(
+            f"{name:>16}: save {save_time * 1000:7.2f} ms/page, "
+            f"read {read_time * 1000:6.2f} ms/page, {stored / 1024:8.0f} KiB stored"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""
+Compare the extractors' output and extraction time under each HTML parser backend.
+
+Runs the initiatives, responses and follow-up website extractors on the
+example pages of the test suite under each BeautifulSoup backend (see
+data_pipeline/scraper/scraper_shared/soup_factory.py), then diffs every
+output CSV field by field against the html.parser run. Fields holding the
+time of the run are skipped.
+
+The headline number is the end-to-end extraction time of all three
+extractors (fastest of --repeat runs, each with an empty extraction cache)
+and its speedup over html.parser. Page parse time, reading every example page
+as the extractors do (page_io.read_page_soup()), is reported
+next to it. Backends that are not installed are skipped.
+
+A backend is only usable if every field is identical: a backend whose output
+differs is reported as failed, without a speedup, and the run exits with
+status 1. Run from the
+ECI_initiatives directory:
+
+    python -m dev.benchmarks.parser_backends [--backends lxml ...] [--repeat N]
+"""
+
+import argparse
+import contextlib
+import csv
+import glob
+import importlib
+import io
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+from unittest.mock import patch
+
+from data_pipeline.extractor.consts import DirectoryStructure
+from data_pipeline.extractor.initiatives.processor import ECIDataProcessor
+from data_pipeline.extractor.responses.const import CSV_FIELDNAMES, CSV_FILENAME
+from data_pipeline.extractor.responses.processor import ECIResponseDataProcessor
+from data_pipeline.extractor.responses_followup_website.processor import (
+    ECIFollowupWebsiteProcessor,
+)
+from data_pipeline.scraper.scraper_shared.page_io import read_page
+from data_pipeline.scraper.scraper_shared.soup_factory import (
+    PARSER_BACKENDS,
+    check_parser_backend,
+    get_parser_backend,
+    make_soup,
+    set_parser_backend,
+)
+
+EXAMPLE_PAGES_DIR = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "tests",
+    "data",
+    "example_htmls",
+)
+
+REFERENCE_BACKEND = "html.parser"
+SESSION_NAME = "2024-01-01_12-00-00"
+
+# Set to the time of the run by the initiatives extractor
+RUN_TIME_FIELDS = {"created_timestamp", "last_updated"}
+
+# Example page directory -> session directory of each extractor
+PAGE_DIRS = {
+    "initiatives": DirectoryStructure.INITIATIVES_DIR_NAME,
+    "responses": DirectoryStructure.RESPONSES_DIR_NAME,
+    "responses_followup_website": (
+        DirectoryStructure.RESPONSES_FOLLOWUP_WEBSITE_DIR_NAME
+    ),
+}
+
+
+def example_pages(page_dir: str) -> List[str]:
+    """Return the example pages of one extractor, sorted by path."""
+
+    pattern = os.path.join(EXAMPLE_PAGES_DIR, page_dir, "**", "*_en.html")
+    return sorted(glob.glob(pattern, recursive=True))
+
+
+def create_session(data_root: Path) -> Path:
+    """Copy the example pages into a scrape session, one directory per year."""
+
+    session_dir = data_root / SESSION_NAME
+
+    for page_dir, session_page_dir in PAGE_DIRS.items():
+        for path in example_pages(page_dir):
+            name = os.path.basename(path)
+            year_dir = session_dir / session_page_dir / name.split("_")[0]
+            year_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, year_dir / name)
+
+    # Metadata of the responses scraper, one row per response page
+    responses_dir = session_dir / DirectoryStructure.RESPONSES_DIR_NAME
+    with open(responses_dir / CSV_FILENAME, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+        writer.writeheader()
+
+        for path in example_pages("responses"):
+            year, number, _ = os.path.basename(path).split("_", 2)
+            writer.writerow(
+                {
+                    "url_find_initiative": f"https://example.com/{year}/{number}",
+                    "registration_number": f"{year}/{number}",
+                    "title": f"ECI {year}/{number}",
+                    "datetime": SESSION_NAME,
+                }
+            )
+
+    (session_dir / DirectoryStructure.LOG_DIR_NAME).mkdir(exist_ok=True)
+
+    return session_dir
+
+
+def run_extractors(data_root: Path) -> Tuple[Dict[str, Path], float]:
+    """
+    Run the three extractors on a session under data_root.
+
+    Returns:
+        Output CSV of each extractor and the seconds taken by all three
+    """
+    session_dir = create_session(data_root)
+    logger = logging.getLogger(__name__)
+    outputs = {}
+
+    started = time.perf_counter()
+
+    initiatives = ECIDataProcessor(logger=logger)
+    with patch.object(
+        initiatives, "find_latest_scrape_session", return_value=session_dir
+    ):
+        initiatives.run()
+    outputs["initiatives"] = next(session_dir.glob("eci_initiatives_*.csv"))
+
+    ECIResponseDataProcessor(data_root=data_root, logger=logger).run()
+    outputs["responses"] = next(session_dir.glob("eci_responses_*.csv"))
+
+    # The follow-up processor finds its data directory from its own path
+    processor_module = importlib.import_module(ECIFollowupWebsiteProcessor.__module__)
+    processor_file = (
+        data_root.parent
+        / "data_pipeline"
+        / "extractor"
+        / "responses_followup_website"
+        / "processor.py"
+    )
+    with patch.object(processor_module, "__file__", str(processor_file)):
+        ECIFollowupWebsiteProcessor().run()
+    outputs["responses_followup_website"] = next(
+        session_dir.glob("eci_responses_followup_website_*.csv")
+    )
+
+    return outputs, time.perf_counter() - started
+
+
+def read_rows(csv_path: Path) -> Dict[str, Dict[str, str]]:
+    """Read an output CSV as rows keyed by registration number."""
+
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        return {row["registration_number"]: row for row in csv.DictReader(f)}
+
+
+def describe_difference(expected: str, actual: str, context: int = 30) -> str:
+    """Show both values around the first character where they differ."""
+
+    start = len(os.path.commonprefix([expected, actual]))
+    window = slice(max(start - context, 0), start + context)
+
+    return (
+        f"lengths {len(expected)} != {len(actual)}, from character {start}: "
+        f"{expected[window]!r} != {actual[window]!r}"
+    )
+
+
+def diff_outputs(reference: Dict[str, Path], other: Dict[str, Path]) -> List[str]:
+    """Return one line per field that differs between two sets of outputs."""
+
+    differences = []
+
+    for extractor, reference_csv in reference.items():
+        reference_rows = read_rows(reference_csv)
+        other_rows = read_rows(other[extractor])
+
+        for reg_num in sorted(reference_rows.keys() | other_rows.keys()):
+            if reg_num not in other_rows or reg_num not in reference_rows:
+                differences.append(f"{extractor} {reg_num}: row missing in one run")
+                continue
+
+            reference_row, other_row = reference_rows[reg_num], other_rows[reg_num]
+
+            # In column order
+            fields = list(reference_row)
+            fields += [field for field in other_row if field not in reference_row]
+
+            for field in fields:
+                if field in RUN_TIME_FIELDS:
+                    continue
+
+                expected = reference_row.get(field) or ""
+                actual = other_row.get(field) or ""
+
+                if expected != actual:
+                    differences.append(
+                        f"{extractor} {reg_num} {field}: "
+                        f"{describe_difference(expected, actual)}"
+                    )
+
+    return differences
+
+
+def time_extraction(data_root: Path, repeat: int) -> Tuple[Dict[str, Path], float]:
+    """
+    Run the extractors repeat times, each on a new session and cache.
+
+    Returns:
+        Output CSV of each extractor (last run) and the fastest run in seconds
+    """
+    times = []
+
+    for run in range(repeat):
+        outputs, seconds = run_extractors(data_root / str(run) / "data")
+        times.append(seconds)
+
+    return outputs, min(times)
+
+
+def time_parse(page_sources: List[str], repeat: int) -> float:
+    """Return the fastest seconds per page of building the extractors' trees."""
+
+    times = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+
+        for page_source in page_sources:
+            make_soup(page_source)
+
+        times.append((time.perf_counter() - started) / len(page_sources))
+
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--backends", nargs="+", choices=PARSER_BACKENDS, default=PARSER_BACKENDS
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    backends = [REFERENCE_BACKEND]
+    for backend in args.backends:
+        if backend == REFERENCE_BACKEND:
+            continue
+
+        try:
+            backends.append(check_parser_backend(backend))
+        except ValueError as e:
+            print(f"Skipping {backend}: {e}")
+
+    page_sources = [
+        read_page(path) for page_dir in PAGE_DIRS for path in example_pages(page_dir)
+    ]
+
+    print(f"{len(page_sources)} pages, {args.repeat} passes")
+
+    configured_backend = get_parser_backend()
+    outputs, run_times, parse_times = {}, {}, {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Extractor logs and progress output are not of interest here
+        logging.disable(logging.CRITICAL)
+
+        try:
+            for backend in backends:
+                set_parser_backend(backend)
+
+                with contextlib.redirect_stdout(io.StringIO()):
+                    outputs[backend], run_times[backend] = time_extraction(
+                        Path(tmp_dir) / backend, args.repeat
+                    )
+
+                parse_times[backend] = time_parse(page_sources, args.repeat)
+        finally:
+            set_parser_backend(configured_backend)
+            logging.disable(logging.NOTSET)
+
+        differences = {
+            backend: diff_outputs(outputs[REFERENCE_BACKEND], outputs[backend])
+            for backend in backends[1:]
+        }
+
+    reference_run = run_times[REFERENCE_BACKEND]
+    reference_parse = parse_times[REFERENCE_BACKEND]
+
+    for backend in backends:
+        # A backend that changes the output is no drop-in speedup
+        if differences.get(backend):
+            print(
+                f"{backend:>11}: extraction {run_times[backend]:.2f} s, "
+                f"page parse {parse_times[backend] * 1000:7.2f} ms/page, "
+                f"FAILED: output differs"
+            )
+            continue
+
+        print(
+            f"{backend:>11}: extraction {run_times[backend]:.2f} s "
+            f"({reference_run / run_times[backend]:.2f}x), "
+            f"page parse {parse_times[backend] * 1000:7.2f} ms/page "
+            f"({reference_parse / parse_times[backend]:.2f}x)"
+        )
+
+    for backend, lines in differences.items():
+        if not lines:
+            print(f"{backend}: output identical to {REFERENCE_BACKEND}")
+            continue
+
+        print(f"{backend}: {len(lines)} fields differ from {REFERENCE_BACKEND}")
+        for line in lines:
+            print(f"  {line}")
+
+    if any(differences.values()):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Benchmark the per-document cost of the response extractors' regex tables.
+
+Compares the pattern tables as the extractors used to apply them (pattern
+strings passed to re.search()/re.finditer() with flags, one search per
+keyword) against the precompiled patterns of the regex registry
+(data_pipeline/extractor/responses/parser/consts/regex_registry.py), on the
+paragraph and list item texts of the example response and follow-up website
+pages. Both are checked to find the same matches.
+
+The string variant is timed twice: with the cache of the re module warm, as
+in a long run, and cleared before every document (re.purge()), the cost of
+each pattern compilation, as in a fresh --workers process or once more
+distinct patterns are in use than that cache holds. The variants run in
+alternating passes and the fastest pass of each is reported. Run from the
+ECI_initiatives directory:
+
+    python -m dev.benchmarks.regex_patterns [--repeat N]
+"""
+
+import argparse
+import glob
+import os
+import re
+import time
+from typing import Callable, Dict, List
+
+from data_pipeline.extractor.responses.parser.base.text_utilities import (
+    normalize_whitespace,
+)
+from data_pipeline.extractor.responses.parser.consts import (
+    ACTION_DATE_REGEXES,
+    APPLICABLE_DATE_REGEXES,
+    DEADLINE_REGEXES,
+    FOLLOWUP_DATE_REGEXES,
+    IGNORED_DATE_PHRASES_REGEX,
+    LEGISLATIVE_ACTION_KEYWORDS_REGEX,
+    URL_REGEX,
+    LegislativeStatus,
+    NonLegislativeAction,
+    registered_names,
+)
+from data_pipeline.extractor.responses.parser.consts.patterns import (
+    ACTION_DATE_PATTERNS,
+    APPLICABLE_DATE_PATTERNS,
+    DEADLINE_PATTERNS,
+    FOLLOWUP_DATE_PATTERNS,
+    IGNORED_DATE_PHRASES,
+    LEGISLATIVE_ACTION_KEYWORDS,
+    URL_PATTERN,
+)
+from data_pipeline.scraper.scraper_shared.page_io import read_page_soup
+
+EXAMPLE_PAGES_DIR = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "tests",
+    "data",
+    "example_htmls",
+)
+
+
+def document_texts() -> Dict[str, List[str]]:
+    """Return the paragraph and list item texts of every example page."""
+
+    texts = {}
+
+    for page_dir in ("responses", "responses_followup_website"):
+        pattern = os.path.join(EXAMPLE_PAGES_DIR, page_dir, "**", "*_en.html")
+
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            soup = read_page_soup(path)
+            texts[path] = [
+                normalize_whitespace(element.get_text(separator=" ", strip=True))
+                for element in soup.find_all(["p", "li"])
+            ]
+
+    return texts
+
+
+def _groups(match) -> tuple:
+    return (match.span(), match.groups()) if match else None
+
+
+def string_tables(text: str) -> list:
+    """Apply the tables with pattern strings, as the extractors did."""
+
+    text_lower = text.lower()
+
+    return [
+        [
+            [_groups(m) for m in re.finditer(p, text_lower, re.IGNORECASE)]
+            for p in DEADLINE_PATTERNS
+        ],
+        [_groups(re.search(p, text, re.IGNORECASE)) for p in APPLICABLE_DATE_PATTERNS],
+        [
+            any(
+                re.search(p, text_lower, re.IGNORECASE | re.DOTALL)
+                for p in status.action_patterns
+            )
+            for status in LegislativeStatus.ALL_STATUSES
+        ],
+        [_groups(re.search(p, text, re.IGNORECASE)) for p in ACTION_DATE_PATTERNS],
+        any(re.search(p, text_lower) for p in LEGISLATIVE_ACTION_KEYWORDS),
+        [
+            any(re.search(p, text_lower) for p in action_type.keywords)
+            for action_type in NonLegislativeAction.ALL_ACTION_TYPES
+        ],
+        any(
+            re.search(p, text_lower)
+            for p in NonLegislativeAction.SKIP_WORDS_LEGISLATIVE
+        ),
+        _followup_dates_strings(text),
+    ]
+
+
+def _followup_dates_strings(text: str) -> list:
+    text = re.sub(URL_PATTERN, "", text)
+    text = re.sub("|".join(IGNORED_DATE_PHRASES), "", text, flags=re.IGNORECASE)
+
+    return [
+        [_groups(m) for m in re.finditer(p, text, re.IGNORECASE)]
+        for p, _ in FOLLOWUP_DATE_PATTERNS
+    ]
+
+
+def registry_tables(text: str) -> list:
+    """Apply the precompiled tables of the regex registry."""
+
+    text_lower = text.lower()
+
+    return [
+        [[_groups(m) for m in p.finditer(text_lower)] for p in DEADLINE_REGEXES],
+        [_groups(p.search(text)) for p in APPLICABLE_DATE_REGEXES],
+        [
+            bool(status.action_regex.search(text_lower))
+            for status in LegislativeStatus.ALL_STATUSES
+        ],
+        [_groups(p.search(text)) for p in ACTION_DATE_REGEXES],
+        bool(LEGISLATIVE_ACTION_KEYWORDS_REGEX.search(text_lower)),
+        [
+            bool(action_type.keywords_regex.search(text_lower))
+            for action_type in NonLegislativeAction.ALL_ACTION_TYPES
+        ],
+        bool(NonLegislativeAction.SKIP_WORDS_LEGISLATIVE_REGEX.search(text_lower)),
+        _followup_dates_registry(text),
+    ]
+
+
+def _followup_dates_registry(text: str) -> list:
+    text = URL_REGEX.sub("", text)
+    text = IGNORED_DATE_PHRASES_REGEX.sub("", text)
+
+    return [[_groups(m) for m in p.finditer(text)] for p, _ in FOLLOWUP_DATE_REGEXES]
+
+
+def time_pass(texts: Dict[str, List[str]], apply: Callable[[str], list], purge: bool):
+    """Return seconds per document of one pass and the matches found."""
+
+    results = []
+    seconds = 0.0
+
+    for document in texts.values():
+        if purge:
+            re.purge()
+
+        started = time.perf_counter()
+        results.append([apply(text) for text in document])
+        seconds += time.perf_counter() - started
+
+    return seconds / len(texts), results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    texts = document_texts()
+    elements = sum(len(document) for document in texts.values())
+
+    print(
+        f"{len(texts)} documents, {elements} text elements, "
+        f"{len(registered_names())} registered patterns, {args.repeat} passes"
+    )
+
+    variants = {
+        "strings, cold re cache": (string_tables, True),
+        "strings, warm re cache": (string_tables, False),
+        "registry": (registry_tables, False),
+    }
+    times = {name: [] for name in variants}
+    results = {}
+
+    for _ in range(args.repeat):
+        for name, (apply, purge) in variants.items():
+            seconds, results[name] = time_pass(texts, apply, purge)
+            times[name].append(seconds)
+
+    reference = results["registry"]
+    if any(result != reference for result in results.values()):
+        raise SystemExit("Pattern strings and the registry found different matches")
+
+    registry_time = min(times["registry"])
+
+    for name, name_times in times.items():
+        print(
+            f"{name:>22}: {min(name_times) * 1000:7.2f} ms/document, "
+            f"{min(name_times) / registry_time:.2f}x the registry"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+"""
+Offline record/replay HTTP server for benchmarking the scrapers.
+
+Serves a recorded corpus of ECI pages on localhost, so concurrency and timing
+can be tuned without sending a single request to the EU site. The corpus is
+seeded from the example pages of the test suite (or recorded from the live
+site with --record), and the server can make itself harder to scrape:
+
+- latency: every response is delayed (with optional random jitter)
+- 429 bursts: after every N pages served, the next M requests get HTTP 429
+  with the recorded "Too Many Requests" page
+- redirects: every Nth page request is redirected to a /moved copy of itself
+
+Point the scrapers at it with the ECI_BASE_URL environment variable. Run from
+the ECI_initiatives directory:
+
+    python -m dev.benchmarks.replay_server [--port 8000] [--latency 0.05]
+    ECI_BASE_URL=http://127.0.0.1:8000 python -m data_pipeline.scraper.initiatives
+
+Routes of the seeded corpus (the live site's where it has them):
+
+    /find-initiative_en[?page=N]                         listing pages
+    /initiatives/details/{year}/{number}_en              initiative pages
+    /initiatives/details/{year}/{number}/commission-answer_en   response pages
+    /followup/{year}/{number}_en                         follow-up websites
+    /__replay__/log                                      request log (JSON)
+"""
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import urllib3
+
+EXAMPLE_PAGES_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "tests", "data", "example_htmls"
+)
+MANIFEST_FILENAME = "corpus.json"
+
+LISTING_ROUTE = "/find-initiative_en"
+INITIATIVE_ROUTE = "/initiatives/details/{year}/{number}_en"
+RESPONSE_ROUTE = "/initiatives/details/{year}/{number}/commission-answer_en"
+FOLLOWUP_ROUTE = "/followup/{year}/{number}_en"
+RATE_LIMIT_PAGE = "/__replay__/429"
+LOG_ROUTE = "/__replay__/log"
+MOVED_PREFIX = "/moved"
+
+
+@dataclass
+class ReplayConfig:
+    """How hard the server makes scraping."""
+
+    latency: float = 0.05  # Seconds added to every response
+    latency_jitter: float = 0.0  # Random +/- fraction of the latency
+    burst_every: int = 0  # Pages served between two 429 bursts (0: no bursts)
+    burst_length: int = 3  # Requests answered with 429 in each burst
+    redirect_every: int = 0  # Every Nth page request is redirected (0: never)
+
+
+class ReplayCorpus:
+    """Recorded pages by request path (including the query string)."""
+
+    def __init__(self, pages: Optional[Dict[str, bytes]] = None):
+        self.pages: Dict[str, bytes] = dict(pages or {})
+
+    def add(self, path: str, body: bytes) -> None:
+        """Record a page served at a path."""
+
+        self.pages[path] = body
+
+    def lookup(self, path: str) -> Optional[bytes]:
+        """Page recorded at a path; unknown queries fall back to the bare path."""
+
+        return self.pages.get(path, self.pages.get(path.split("?", 1)[0]))
+
+    def paths(self, prefix: str = "") -> List[str]:
+        """Recorded paths starting with a prefix, sorted."""
+
+        return sorted(path for path in self.pages if path.startswith(prefix))
+
+    @classmethod
+    def from_example_pages(
+        cls, examples_dir: str = EXAMPLE_PAGES_DIR, copies: int = 1
+    ) -> "ReplayCorpus":
+        """
+        Seed a corpus from the example pages of the test suite.
+
+        Args:
+            examples_dir: tests/data/example_htmls directory
+            copies: Number of times every initiative, response and follow-up
+                page is served, under distinct registration numbers
+
+        Returns:
+            Corpus with the routes listed in the module docstring
+        """
+        corpus = cls()
+
+        def read(*parts: str) -> bytes:
+            with open(os.path.join(examples_dir, *parts), "rb") as f:
+                return f.read()
+
+        corpus.add(LISTING_ROUTE, read("listings", "first_page.html"))
+        corpus.add(f"{LISTING_ROUTE}?page=0", read("listings", "first_page.html"))
+        corpus.add(f"{LISTING_ROUTE}?page=1", read("listings", "last_page.html"))
+        corpus.add(RATE_LIMIT_PAGE, read("errors", "429_too_many_requests_error.html"))
+
+        seeds = [
+            (INITIATIVE_ROUTE, "initiatives/*.html"),
+            (RESPONSE_ROUTE, "responses/*/*/*.html"),
+            (FOLLOWUP_ROUTE, "responses_followup_website/*/*.html"),
+        ]
+
+        for route, pattern in seeds:
+            for path in sorted(glob.glob(os.path.join(examples_dir, pattern))):
+                year, number = os.path.basename(path).split("_")[:2]
+                body = read(os.path.relpath(path, examples_dir))
+
+                for copy in range(copies):
+                    # Copies get numbers of their own, e.g. 000007 -> 001007
+                    copy_number = f"{int(number) + copy * 1000:06d}"
+                    corpus.add(route.format(year=year, number=copy_number), body)
+
+        return corpus
+
+    @classmethod
+    def load(cls, corpus_dir: str) -> "ReplayCorpus":
+        """Load a corpus saved with save()."""
+
+        with open(os.path.join(corpus_dir, MANIFEST_FILENAME), encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        corpus = cls()
+
+        for path, file_name in manifest.items():
+            with open(os.path.join(corpus_dir, file_name), "rb") as f:
+                corpus.add(path, f.read())
+
+        return corpus
+
+    def save(self, corpus_dir: str) -> None:
+        """Save the corpus as numbered files and a path manifest."""
+
+        os.makedirs(corpus_dir, exist_ok=True)
+        manifest = {}
+
+        for i, path in enumerate(self.paths()):
+            file_name = f"{i:05d}.html"
+            manifest[path] = file_name
+
+            with open(os.path.join(corpus_dir, file_name), "wb") as f:
+                f.write(self.pages[path])
+
+        with open(
+            os.path.join(corpus_dir, MANIFEST_FILENAME), "w", encoding="utf-8"
+        ) as f:
+            json.dump(manifest, f, indent=2)
+
+    @classmethod
+    def record(cls, urls: Iterable[str], delay: float = 2.0) -> "ReplayCorpus":
+        """
+        Record pages from the live site, politely one at a time.
+
+        Args:
+            urls: Absolute page URLs; each is recorded at its path
+            delay: Seconds between two requests
+
+        Returns:
+            Corpus of the pages that answered HTTP 200
+        """
+        corpus = cls()
+        http = urllib3.PoolManager()
+
+        for url in urls:
+            response = http.request("GET", url)
+
+            if response.status == 200:
+                parts = urlsplit(url)
+                path = parts.path + (f"?{parts.query}" if parts.query else "")
+                corpus.add(path, response.data)
+
+            time.sleep(delay)
+
+        return corpus
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """Threaded HTTP server replaying a corpus under a ReplayConfig."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        corpus: ReplayCorpus,
+        config: Optional[ReplayConfig] = None,
+        address: Tuple[str, int] = ("127.0.0.1", 0),
+    ):
+        super().__init__(address, ReplayRequestHandler)
+        self.corpus = corpus
+        self.config = config or ReplayConfig()
+
+        # (time, path, status) of every request, for the benchmarks
+        self.request_log: List[Tuple[float, str, int]] = []
+        self._pages_served = 0
+        self._page_requests = 0
+        self._burst_left = 0
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        """URL to use as ECI_BASE_URL."""
+
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> threading.Thread:
+        """Serve in a daemon thread."""
+
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def decide(self, path: str) -> Tuple[int, bytes, Optional[str]]:
+        """
+        Decide the answer to a page request.
+
+        Returns:
+            Tuple of (status, body, redirect location)
+        """
+        moved = path.startswith(MOVED_PREFIX + "/")
+        body = self.corpus.lookup(path[len(MOVED_PREFIX) :] if moved else path)
+
+        if body is None:
+            return 404, b"Not recorded", None
+
+        config = self.config
+
+        with self._lock:
+            if self._burst_left:
+                self._burst_left -= 1
+                return 429, self.corpus.lookup(RATE_LIMIT_PAGE) or b"", None
+
+            self._page_requests += 1
+
+            if (
+                not moved
+                and config.redirect_every
+                and self._page_requests % config.redirect_every == 0
+            ):
+                return 302, b"", MOVED_PREFIX + path
+
+            self._pages_served += 1
+
+            if config.burst_every and self._pages_served % config.burst_every == 0:
+                self._burst_left = config.burst_length
+
+        return 200, body, None
+
+    def log_request_result(self, path: str, status: int) -> None:
+        """Append a request to the request log."""
+
+        with self._lock:
+            self.request_log.append((time.time(), path, status))
+
+
+class ReplayRequestHandler(BaseHTTPRequestHandler):
+    """Answer GET requests from the server's corpus."""
+
+    server: ReplayServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        if self.path == LOG_ROUTE:
+            with self.server._lock:
+                body = json.dumps(self.server.request_log).encode()
+
+            self._send(200, body, "application/json")
+            return
+
+        config = self.server.config
+
+        if config.latency:
+            jitter = random.uniform(-config.latency_jitter, config.latency_jitter)
+            time.sleep(config.latency * (1 + jitter))
+
+        status, body, location = self.server.decide(self.path)
+        self.server.log_request_result(self.path, status)
+
+        self._send(status, body, "text/html; charset=utf-8", location)
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+        """Keep benchmark output clean; requests are in the request log."""
+
+    def _send(
+        self,
+        status: int,
+        body: bytes,
+        content_type: str,
+        location: Optional[str] = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+
+        if location is not None:
+            self.send_header("Location", location)
+
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _serve(corpus_pages: Dict[str, bytes], config: dict, port, ready) -> None:
+    """Child process body of start_server_process()."""
+
+    server = ReplayServer(ReplayCorpus(corpus_pages), ReplayConfig(**config))
+    port.value = server.server_address[1]
+    ready.set()
+    server.serve_forever()
+
+
+def start_server_process(
+    corpus: ReplayCorpus, config: ReplayConfig
+) -> Tuple[multiprocessing.Process, str]:
+    """
+    Serve a corpus from a child process, so its CPU time is not counted
+    against the scraper being benchmarked.
+
+    Returns:
+        Tuple of (process, base URL); terminate the process when done
+    """
+    port = multiprocessing.Value("i", 0)
+    ready = multiprocessing.Event()
+    process = multiprocessing.Process(
+        target=_serve, args=(corpus.pages, asdict(config), port, ready), daemon=True
+    )
+    process.start()
+
+    if not ready.wait(10):
+        process.terminate()
+        raise RuntimeError("Replay server did not start")
+
+    return process, f"http://127.0.0.1:{port.value}"
+
+
+def fetch_request_log(base_url: str) -> List[Tuple[float, str, int]]:
+    """Request log of a running replay server."""
+
+    response = urllib3.PoolManager().request("GET", base_url + LOG_ROUTE)
+    return [tuple(entry) for entry in json.loads(response.data)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--corpus", help="Corpus directory (default: example pages)")
+    parser.add_argument("--copies", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--burst-every", type=int, default=0)
+    parser.add_argument("--burst-length", type=int, default=3)
+    parser.add_argument("--redirect-every", type=int, default=0)
+    parser.add_argument(
+        "--record",
+        metavar="URL_FILE",
+        help="Record the URLs listed in this file into --corpus and exit",
+    )
+    args = parser.parse_args()
+
+    if args.record:
+        if not args.corpus:
+            parser.error("--record needs --corpus")
+
+        with open(args.record, encoding="utf-8") as f:
+            urls = [line.strip() for line in f if line.strip()]
+
+        corpus = ReplayCorpus.record(urls)
+        corpus.save(args.corpus)
+        print(f"Recorded {len(corpus.pages)}/{len(urls)} pages into {args.corpus}")
+        return
+
+    if args.corpus:
+        corpus = ReplayCorpus.load(args.corpus)
+    else:
+        corpus = ReplayCorpus.from_example_pages(copies=args.copies)
+
+    config = ReplayConfig(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        burst_every=args.burst_every,
+        burst_length=args.burst_length,
+        redirect_every=args.redirect_every,
+    )
+    server = ReplayServer(corpus, config, ("127.0.0.1", args.port))
+
+    print(f"Replaying {len(corpus.pages)} pages at {server.base_url}")
+    print(f"ECI_BASE_URL={server.base_url}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
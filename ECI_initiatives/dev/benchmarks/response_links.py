@@ -0,0 +1,68 @@
+"""
+Benchmark the per-page cost of finding the Commission response link.
+
+Compares full BeautifulSoup parsing of every initiative page with the
+byte-level fast path (link_scan.py), which parses a page only when it cannot
+decide it, using the example initiative pages of the test suite. Both are
+checked to give the same links. Run from the ECI_initiatives directory:
+
+    python -m dev.benchmarks.response_links [--repeat N]
+"""
+
+import argparse
+import glob
+import os
+import time
+
+from data_pipeline.scraper.responses.html_parser import ResponseLinkExtractor
+
+EXAMPLE_PAGES_DIR = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "tests",
+    "data",
+    "example_htmls",
+    "initiatives",
+)
+
+
+def time_extractor(extractor: ResponseLinkExtractor, paths, repeat: int):
+    """Return mean seconds per page and the links found by one pass."""
+
+    started = time.perf_counter()
+
+    for _ in range(repeat):
+        links = [extractor.extract_links_from_file(path) for path in paths]
+
+    return (time.perf_counter() - started) / (repeat * len(paths)), links
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(EXAMPLE_PAGES_DIR, "*.html")))
+
+    print(f"{len(paths)} pages, {args.repeat} passes")
+
+    full_time, full_links = time_extractor(
+        ResponseLinkExtractor(fast_scan=False), paths, args.repeat
+    )
+    fast_time, fast_links = time_extractor(
+        ResponseLinkExtractor(fast_scan=True), paths, args.repeat
+    )
+
+    if fast_links != full_links:
+        raise SystemExit("Fast path and full parsing found different links")
+
+    found = sum(link is not None for link in full_links)
+
+    print(f"{'BeautifulSoup':>14}: {full_time * 1000:7.2f} ms/page")
+    print(f"{'fast path':>14}: {fast_time * 1000:7.2f} ms/page")
+    print(f"{found} links found by both, {full_time / fast_time:.0f}x faster")
+
+
+if __name__ == "__main__":
+    main()
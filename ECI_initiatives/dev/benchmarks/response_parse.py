@@ -0,0 +1,141 @@
+"""
+Benchmark the per-file cost of parsing Commission response pages.
+
+Compares ECIResponseHTMLParser.parse_file with the document context shared
+by all extractors against a context recomputed on every extractor call (the
+behaviour before the context was introduced), using the example response
+pages of the test suite. Both are checked to give the same records.
+
+Pages are read from disk once up front; building the soup, which the context
+does not affect, is timed on its own and reported apart from the extractors.
+The two variants run in alternating passes and the fastest pass of each is
+reported. Run from the ECI_initiatives directory:
+
+    python -m dev.benchmarks.response_parse [--repeat N]
+"""
+
+import argparse
+import glob
+import logging
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from data_pipeline.extractor.responses.parser import main_parser
+from data_pipeline.extractor.responses.parser.base.base_extractor import (
+    BaseExtractor,
+)
+from data_pipeline.extractor.responses.parser.document_context import (
+    DocumentContext,
+)
+from data_pipeline.extractor.responses.parser.main_parser import (
+    ECIResponseHTMLParser,
+)
+from data_pipeline.scraper.scraper_shared.page_io import read_page
+from data_pipeline.scraper.scraper_shared.soup_factory import make_soup
+
+EXAMPLE_PAGES_DIR = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "tests",
+    "data",
+    "example_htmls",
+    "responses",
+)
+
+
+def time_soup(html_by_path) -> float:
+    """Return seconds per file spent building the soup."""
+
+    started = time.perf_counter()
+
+    for html in html_by_path.values():
+        BeautifulSoup(html, "html.parser")
+
+    return (time.perf_counter() - started) / len(html_by_path)
+
+
+def time_parser(pages, shared: bool):
+    """Return seconds per file of one parse_file pass and its records."""
+
+    parser = ECIResponseHTMLParser(logging.getLogger(__name__))
+
+    if shared:
+        started = time.perf_counter()
+        records = [parser.parse_file(path, metadata) for path, metadata in pages]
+    else:
+        # Every extractor call starts from scratch
+        with patch.object(
+            BaseExtractor, "_context", lambda self, soup: DocumentContext(soup)
+        ):
+            started = time.perf_counter()
+            records = [parser.parse_file(path, metadata) for path, metadata in pages]
+
+    return (time.perf_counter() - started) / len(pages), records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    paths = glob.glob(
+        os.path.join(EXAMPLE_PAGES_DIR, "**", "*_en.html"), recursive=True
+    )
+
+    pages = []
+    for path in sorted(paths):
+        year, number, _ = os.path.basename(path).split("_", 2)
+        pages.append((Path(path), {"registration_number": f"{year}/{number}"}))
+
+    html_by_path = {path: read_page(path) for path, _ in pages}
+
+    print(f"{len(pages)} pages, {args.repeat} passes")
+
+    logging.getLogger(__name__).disabled = True
+
+    soup_times, shared_times, unshared_times = [], [], []
+
+    def read_page_soup(path):
+        return make_soup(html_by_path[path])
+
+    with patch.object(main_parser, "read_page_soup", read_page_soup):
+        for _ in range(args.repeat):
+            soup_times.append(time_soup(html_by_path))
+
+            seconds, shared_records = time_parser(pages, shared=True)
+            shared_times.append(seconds)
+
+            seconds, unshared_records = time_parser(pages, shared=False)
+            unshared_times.append(seconds)
+
+    if shared_records != unshared_records:
+        raise SystemExit("Shared and per-call contexts gave different records")
+
+    soup_time = min(soup_times)
+    unshared_extract = min(unshared_times) - soup_time
+    shared_extract = min(shared_times) - soup_time
+
+    print(f"{'soup':>9}: {soup_time * 1000:7.2f} ms/file")
+    print(
+        f"{'per call':>9}: {min(unshared_times) * 1000:7.2f} ms/file, "
+        f"extractors {unshared_extract * 1000:7.2f} ms/file"
+    )
+    print(
+        f"{'shared':>9}: {min(shared_times) * 1000:7.2f} ms/file, "
+        f"extractors {shared_extract * 1000:7.2f} ms/file"
+    )
+
+    parsed = sum(record is not None for record in shared_records)
+    print(
+        f"{parsed} records parsed by both, "
+        f"extractors {unshared_extract / shared_extract:.2f}x faster"
+    )
+
+
+if __name__ == "__main__":
+    main()
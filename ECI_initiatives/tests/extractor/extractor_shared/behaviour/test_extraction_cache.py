@@ -0,0 +1,237 @@
+"""
+Behavioural tests for reusing records of unchanged pages between runs.
+"""
+
+# Python
+import csv
+import os
+import shutil
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+# Eci app extractor
+from ECI_initiatives.data_pipeline.extractor import extraction_cache
+from ECI_initiatives.data_pipeline.extractor.extraction_cache import ExtractionCache
+from ECI_initiatives.data_pipeline.extractor.responses import (
+    processor as responses_processor,
+)
+from ECI_initiatives.data_pipeline.extractor.responses.model import (
+    ECICommissionResponseRecord,
+)
+from ECI_initiatives.data_pipeline.extractor.responses.parser.main_parser import (
+    ECIResponseHTMLParser,
+)
+from ECI_initiatives.data_pipeline.extractor.responses.processor import (
+    ECIResponseDataProcessor,
+)
+
+from ECI_initiatives.tests.extractor.responses.behaviour.data_quality.conftest import (
+    TEST_DATA_DIR,
+    _create_metadata_csv,
+)
+
+
+def _create_session(data_root: Path, session_name: str) -> Path:
+    """Create a scrape session with the example response pages."""
+
+    session_dir = data_root / session_name
+    responses_dir = session_dir / "responses"
+    responses_dir.mkdir(parents=True)
+    (session_dir / "logs").mkdir()
+
+    for html_file in TEST_DATA_DIR.rglob("*.html"):
+        shutil.copy2(html_file, responses_dir / html_file.name)
+
+    _create_metadata_csv(responses_dir)
+
+    return session_dir
+
+
+def _run_processor(data_root: Path, session_dir: Path, **kwargs):
+    """Run the processor on a session, return its CSV rows and parsed files."""
+
+    processor = ECIResponseDataProcessor(data_root=data_root, **kwargs)
+
+    with mock.patch.object(
+        processor, "find_latest_scrape_session", return_value=session_dir
+    ), mock.patch.object(
+        ECIResponseHTMLParser,
+        "parse_file",
+        autospec=True,
+        side_effect=ECIResponseHTMLParser.parse_file,
+    ) as parse_file:
+        processor.run()
+
+    output_csv = next(session_dir.glob("eci_responses_*.csv"))
+    with open(output_csv, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    parsed = sorted(call.args[1].name for call in parse_file.call_args_list)
+
+    return rows, parsed
+
+
+class TestResponseExtractionCache:
+    """Tests for ECIResponseDataProcessor with the extraction cache."""
+
+    def test_unchanged_pages_not_parsed_again(self, tmp_path: Path):
+        """A later session with the same pages reuses all records."""
+
+        first = _create_session(tmp_path, "2024-01-01_12-00-00")
+        first_rows, first_parsed = _run_processor(tmp_path, first)
+
+        second = _create_session(tmp_path, "2024-02-01_12-00-00")
+        second_rows, second_parsed = _run_processor(tmp_path, second)
+
+        assert len(first_parsed) == len(first_rows)
+        assert second_parsed == []
+        assert second_rows == first_rows
+
+        log_text = "".join(
+            log_file.read_text(encoding="utf-8")
+            for log_file in (second / "logs").glob("*.log")
+        )
+        assert "(100.0% hit ratio)" in log_text
+
+    def test_changed_page_parsed_again(self, tmp_path: Path):
+        """Only the pages whose content changed are parsed."""
+
+        first = _create_session(tmp_path, "2024-01-01_12-00-00")
+        _run_processor(tmp_path, first)
+
+        second = _create_session(tmp_path, "2024-02-01_12-00-00")
+        changed = second / "responses" / "2017_000002_en.html"
+        changed.write_text(
+            changed.read_text(encoding="utf-8") + "\n<!-- edited -->\n",
+            encoding="utf-8",
+        )
+
+        _, parsed = _run_processor(tmp_path, second)
+
+        assert parsed == ["2017_000002_en.html"]
+
+    def test_pages_parsed_again_on_another_day(self, tmp_path: Path):
+        """Records depending on the day of the run are not reused the next day."""
+
+        class NextDay(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime.now(tz) + timedelta(days=1)
+
+        first = _create_session(tmp_path, "2024-01-01_12-00-00")
+        first_rows, _ = _run_processor(tmp_path, first)
+
+        second = _create_session(tmp_path, "2024-02-01_12-00-00")
+        with mock.patch.object(responses_processor, "datetime", NextDay):
+            second_rows, parsed = _run_processor(tmp_path, second)
+
+        assert len(parsed) == len(second_rows) == len(first_rows)
+
+    def test_cache_disabled(self, tmp_path: Path):
+        """With use_cache=False every page is parsed and nothing is stored."""
+
+        first = _create_session(tmp_path, "2024-01-01_12-00-00")
+        first_rows, _ = _run_processor(tmp_path, first, use_cache=False)
+
+        assert not (tmp_path / ".extraction_cache").exists()
+
+        second = _create_session(tmp_path, "2024-02-01_12-00-00")
+        second_rows, parsed = _run_processor(tmp_path, second, use_cache=False)
+
+        assert len(parsed) == len(second_rows) == len(first_rows)
+
+
+class TestExtractionCache:
+    """Tests for keys and eviction of ExtractionCache."""
+
+    @staticmethod
+    def _record(reg_num: str) -> ECICommissionResponseRecord:
+        fields = ECICommissionResponseRecord.__dataclass_fields__
+        record = dict.fromkeys(fields, "")
+        record["registration_number"] = reg_num
+        return ECICommissionResponseRecord(**record)
+
+    def test_key_covers_inputs_and_backend(self, tmp_path: Path):
+        """Other inputs and the parser backend give different keys."""
+
+        page = tmp_path / "2017_000002_en.html"
+        page.write_text("<html><body>Answer</body></html>", encoding="utf-8")
+        cache = ExtractionCache(tmp_path, "responses", ECICommissionResponseRecord)
+
+        key = cache.key(page, ["ECI 2017/000002"])
+
+        assert cache.key(page, ["ECI 2017/000002"]) == key
+        assert cache.key(page, ["Another title"]) != key
+
+        with mock.patch.object(
+            extraction_cache, "get_parser_backend", return_value="lxml"
+        ):
+            assert cache.key(page, ["ECI 2017/000002"]) != key
+
+    def test_expired_entries_missed_and_evicted(self, tmp_path: Path):
+        """Entries older than the maximum age are extracted again and removed."""
+
+        cache = ExtractionCache(
+            tmp_path, "responses", ECICommissionResponseRecord, max_age_days=1
+        )
+        cache.put("aa" * 32, self._record("2017/000002"))
+        cache.put("bb" * 32, self._record("2018/000004"))
+
+        # Two days old
+        old = time.time() - 2 * 24 * 60 * 60
+        os.utime(cache.entry_path("aa" * 32), (old, old))
+
+        assert cache.get("aa" * 32) is None
+        assert cache.get("bb" * 32).registration_number == "2018/000004"
+
+        cache.evict()
+
+        assert not cache.entry_path("aa" * 32).exists()
+        assert cache.entry_path("bb" * 32).exists()
+
+    def test_oldest_entries_evicted_above_size_limit(self, tmp_path: Path):
+        """The oldest entries are removed until the cache fits its limit."""
+
+        cache = ExtractionCache(tmp_path, "responses", ECICommissionResponseRecord)
+        keys = ["aa" * 32, "bb" * 32, "cc" * 32]
+
+        for age, key in zip((300, 200, 100), keys):
+            cache.put(key, self._record(key[:2]))
+            created = time.time() - age
+            os.utime(cache.entry_path(key), (created, created))
+
+        cache.max_bytes = cache.entry_path(keys[2]).stat().st_size * 2
+        cache.evict()
+
+        assert [cache.entry_path(key).exists() for key in keys] == [
+            False,
+            True,
+            True,
+        ]
+
+    def test_reused_records_refreshed(self, tmp_path: Path):
+        """Cache hits get the run values of this run, fresh records are kept."""
+
+        page = tmp_path / "2017_000002_en.html"
+        page.write_text("<html><body>Answer</body></html>", encoding="utf-8")
+        cache = ExtractionCache(tmp_path, "responses", ECICommissionResponseRecord)
+
+        def extract(items):
+            return [self._record("2017/000002") for _ in items]
+
+        def reuse(record):
+            record.registration_number += " (reused)"
+            return record
+
+        extract_page = dict(page_path=lambda item: item, inputs=lambda item: None)
+        first = cache.extract(
+            [page], extract_items=extract, reuse=reuse, **extract_page
+        )
+        second = cache.extract(
+            [page], extract_items=extract, reuse=reuse, **extract_page
+        )
+
+        assert first[0].registration_number == "2017/000002"
+        assert second[0].registration_number == "2017/000002 (reused)"
@@ -0,0 +1,131 @@
+"""
+Behavioural tests for parsing response pages in worker processes.
+"""
+
+# Python
+import csv
+import logging
+import os
+import shutil
+from pathlib import Path
+from unittest import mock
+
+# Eci app extractor
+from ECI_initiatives.data_pipeline.extractor.parallel import process_files
+from ECI_initiatives.data_pipeline.extractor.responses.processor import (
+    ECIResponseDataProcessor,
+)
+
+from ECI_initiatives.tests.extractor.responses.behaviour.data_quality.conftest import (
+    TEST_DATA_DIR,
+    _create_metadata_csv,
+)
+
+
+def _make_state(logger, offset):
+    return logger, offset
+
+
+def _report_pid(state, item):
+    logger, offset = state
+    logger.info(f"item {item} in worker")
+    return item + offset, os.getpid()
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestProcessFiles:
+    """Tests for the process pool shared by the extractor processors."""
+
+    def test_results_in_input_order_and_logs_forwarded(self):
+        """Workers return results in item order and log to the parent logger."""
+
+        logger = logging.getLogger("test_parallel_extraction")
+        logger.setLevel(logging.INFO)
+        handler = _ListHandler()
+        logger.addHandler(handler)
+
+        try:
+            results = process_files(
+                _report_pid, list(range(8)), 2, logger, _make_state, (100,)
+            )
+        finally:
+            logger.removeHandler(handler)
+
+        assert [value for value, _ in results] == list(range(100, 108))
+        assert os.getpid() not in {pid for _, pid in results}
+        assert sorted(handler.messages) == sorted(
+            f"item {item} in worker" for item in range(8)
+        )
+
+    def test_single_worker_runs_in_calling_process(self):
+        """With one worker the items are processed in the calling process."""
+
+        results = process_files(
+            _report_pid,
+            [1, 2],
+            1,
+            logging.getLogger("test_parallel_extraction"),
+            _make_state,
+            (0,),
+        )
+
+        assert results == [(1, os.getpid()), (2, os.getpid())]
+
+
+class TestParallelResponseExtraction:
+    """Tests for ECIResponseDataProcessor with several workers."""
+
+    @staticmethod
+    def _run_processor(data_root: Path, workers: int):
+        """Run the processor on the example pages, return CSV rows and log."""
+
+        session_dir = data_root / "2024-01-01_12-00-00"
+        responses_dir = session_dir / "responses"
+        responses_dir.mkdir(parents=True)
+        (session_dir / "logs").mkdir()
+
+        for html_file in TEST_DATA_DIR.rglob("*.html"):
+            shutil.copy2(html_file, responses_dir / html_file.name)
+
+        _create_metadata_csv(responses_dir)
+
+        processor = ECIResponseDataProcessor(data_root=data_root, workers=workers)
+
+        with mock.patch.object(
+            processor, "find_latest_scrape_session", return_value=session_dir
+        ):
+            processor.run()
+
+        output_csv = next(session_dir.glob("eci_responses_*.csv"))
+        with open(output_csv, encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+        log_text = "".join(
+            log_file.read_text(encoding="utf-8")
+            for log_file in (session_dir / "logs").glob("*.log")
+        )
+
+        return rows, log_text
+
+    def test_same_rows_as_sequential_run(self, tmp_path: Path):
+        """Parallel parsing writes the same rows, in the same order."""
+
+        sequential_rows, _ = self._run_processor(tmp_path / "sequential", 1)
+        parallel_rows, log_text = self._run_processor(tmp_path / "parallel", 2)
+
+        assert parallel_rows == sequential_rows
+        assert len(parallel_rows) == len(list(TEST_DATA_DIR.rglob("*.html")))
+
+        # Worker log records end up in the session log of the parent
+        assert "Parsing with 2 worker processes" in log_text
+        for row in parallel_rows:
+            reg_num = row["registration_number"]
+            assert f"Successfully parsed response: {reg_num}" in log_text
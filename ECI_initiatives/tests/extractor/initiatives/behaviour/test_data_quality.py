@@ -7,10 +7,12 @@ Tests focus on:
  - JSON fields are valid
  - No duplicate registration numbers
  - CSV structure integrity
+ - Output of the example pages unchanged
 """
 
 # Standard library
 import csv
+import io
 import tempfile
 import shutil
 import json
@@ -458,3 +460,51 @@ class TestCSVStructure:
             reg_numbers = []
             for row in reader:
                 reg_numbers.append(row["registration_number"])
+
+
+class TestExpectedOutput:
+    """Tests comparing the output with the expected CSV of the example pages."""
+
+    def test_example_pages_give_expected_csv(self, program_root_dir, tmp_path):
+        """Every example page gives the expected row, field for field."""
+
+        from ECI_initiatives.data_pipeline.extractor.initiatives.processor import (
+            ECIDataProcessor,
+        )
+
+        test_data_dir = (
+            program_root_dir / "tests" / "data" / "example_htmls" / "initiatives"
+        )
+
+        session_dir = tmp_path / "2024-01-01_12-00-00"
+        (session_dir / "logs").mkdir(parents=True)
+
+        for test_file in test_data_dir.glob("*_en.html"):
+            year_dir = session_dir / "initiatives" / test_file.name[:4]
+            year_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copy(test_file, year_dir / test_file.name)
+
+        with patch.object(
+            ECIDataProcessor, "find_latest_scrape_session", return_value=session_dir
+        ):
+            processor = ECIDataProcessor(data_root=str(tmp_path), logger=None)
+            processor.run()
+
+        csv_file = next(session_dir.glob("eci_initiatives_*.csv"))
+
+        with open(csv_file, "r", encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            output = io.StringIO(newline="")
+            writer = csv.DictWriter(output, fieldnames=reader.fieldnames)
+            writer.writeheader()
+
+            for row in reader:
+                # Set from the clock at extraction time
+                row["created_timestamp"] = row["last_updated"] = ""
+                writer.writerow(row)
+
+        expected_csv = test_data_dir / "expected_eci_initiatives.csv"
+        with open(expected_csv, "r", encoding="utf-8", newline="") as f:
+            expected = f.read()
+
+        assert output.getvalue() == expected
@@ -0,0 +1,116 @@
+"""
+Behavioural tests for the document context shared by the response extractors.
+
+The context computes intermediate results (Answer section text, outcome
+classifier, submission paragraphs, Follow-up section) once per document.
+These tests check that extractors reuse them and that extractors used on
+their own still work.
+"""
+
+# Standard library
+from functools import cached_property
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Local
+from ECI_initiatives.data_pipeline.extractor.responses.parser.document_context import (
+    DocumentContext,
+)
+from ECI_initiatives.data_pipeline.extractor.responses.parser.extractors.classifiers.status_matcher import (
+    LegislativeOutcomeClassifier,
+)
+from ECI_initiatives.data_pipeline.extractor.responses.parser.extractors.outcome import (
+    LegislativeOutcomeExtractor,
+)
+from .test_base import BaseParserTest
+
+RESPONSE_HTML = """
+<html>
+    <body>
+        <h2 id="Submission-and-examination">Submission and examination</h2>
+        <p>The initiative was submitted to the Commission on 6 October 2017.</p>
+        <p>A public hearing took place at the European Parliament on 20 November 2017.</p>
+        <h2 id="Answer-of-the-European-Commission">Answer of the European Commission</h2>
+        <p>The Commission committed to table a legislative proposal.</p>
+        <h2 id="Follow-up">Follow-up</h2>
+        <p>A roadmap was published in March 2018.</p>
+    </body>
+</html>
+"""
+
+
+class TestDocumentContext(BaseParserTest):
+    """Tests for sharing intermediate results between extractors."""
+
+    def test_classifier_shared_between_outcome_fields(self):
+        """Status, commitment and rejection use one classifier per document."""
+
+        soup = self.create_soup(RESPONSE_HTML)
+        extractor = LegislativeOutcomeExtractor(registration_number="2017/000002")
+
+        with patch(
+            "ECI_initiatives.data_pipeline.extractor.responses.parser."
+            "document_context.LegislativeOutcomeClassifier",
+            wraps=LegislativeOutcomeClassifier,
+        ) as classifier_class:
+            extractor.extract_highest_status_reached(soup)
+            extractor.extract_proposal_commitment_stated(soup)
+            extractor.extract_proposal_rejected(soup)
+
+        assert classifier_class.call_count == 1
+
+    def test_submission_text_shared_with_parliament_hearing(self):
+        """The hearing date reuses the submission paragraphs of the context."""
+
+        soup = self.create_soup(RESPONSE_HTML)
+        context = DocumentContext(soup)
+
+        # Count how often the submission paragraphs are collected
+        collect = Mock(wraps=DocumentContext._submission_paragraphs.func)
+        counted = cached_property(collect)
+        counted.__set_name__(DocumentContext, "_submission_paragraphs")
+
+        self.parser.submission_data.set_document_context(context)
+        self.parser.parliament_activity.set_document_context(context)
+
+        try:
+            with patch.object(DocumentContext, "_submission_paragraphs", counted):
+                submission_text = self.parser.submission_data.extract_submission_text(
+                    soup
+                )
+                hearing_date = (
+                    self.parser.parliament_activity.extract_parliament_hearing_date(
+                        soup
+                    )
+                )
+        finally:
+            self.parser.submission_data.set_document_context(None)
+            self.parser.parliament_activity.set_document_context(None)
+
+        assert "public hearing took place" in submission_text
+        assert hearing_date == "2017-11-20"
+        assert collect.call_count == 1
+
+    def test_context_replaced_for_another_document(self):
+        """An extractor given a different soup starts a fresh context."""
+
+        extractor = LegislativeOutcomeExtractor(registration_number="2017/000002")
+        first = self.create_soup(RESPONSE_HTML)
+        second = self.create_soup(
+            RESPONSE_HTML.replace("committed to table", "decided not to submit")
+        )
+
+        assert extractor.extract_proposal_commitment_stated(first) is True
+        assert extractor.extract_proposal_commitment_stated(second) is False
+        assert extractor.document_context.soup is second
+
+    def test_parse_file_releases_context(self, tmp_path: Path):
+        """The parser drops the context once the file is parsed."""
+
+        html_path = tmp_path / "2017_000002_en.html"
+        html_path.write_text(RESPONSE_HTML, encoding="utf-8")
+
+        self.parser.parse_file(html_path, {"registration_number": "2017/000002"})
+
+        assert self.parser.legislative_outcome.document_context is None
+        assert self.parser.followup_activity.document_context is None
@@ -0,0 +1,79 @@
+"""
+Behavioural tests for the registry of precompiled extractor regex patterns.
+"""
+
+# Standard library
+import re
+
+# Third party
+import pytest
+
+# Local
+from ECI_initiatives.data_pipeline.extractor.responses.parser.consts import (
+    DEADLINE_PATTERNS,
+    DEADLINE_REGEXES,
+    LegislativeStatus,
+    NonLegislativeAction,
+    get_regex,
+    registered_names,
+)
+from ECI_initiatives.data_pipeline.extractor.responses.parser.consts.regex_registry import (
+    register_pattern,
+)
+
+TEXTS = [
+    "The Commission committed to come forward with a legislative proposal by the end of 2023.",
+    "The regulation was adopted and applies from 27 March 2021.",
+    "A public consultation will run until 12 October 2022; an impact assessment follows.",
+    "The Commission decided not to withdraw the proposal.",
+    "EFSA will provide a scientific opinion by May 2024.",
+    "Funding is available under Horizon Europe.",
+]
+
+
+class TestRegexRegistry:
+    """Tests for compiling the pattern tables once, by name."""
+
+    def test_tables_registered_by_name(self):
+        """Pattern tables can be looked up by name after import."""
+
+        assert get_regex("deadline") is DEADLINE_REGEXES
+        assert [regex.pattern for regex in DEADLINE_REGEXES] == DEADLINE_PATTERNS
+        assert all(regex.flags & re.IGNORECASE for regex in DEADLINE_REGEXES)
+
+        assert "legislative_status.adopted" in registered_names()
+        assert "non_legislative_action.funding_programme" in registered_names()
+
+    def test_unknown_and_duplicate_names_rejected(self):
+        """Names are unique and looking up a missing one fails clearly."""
+
+        with pytest.raises(KeyError, match="No regex pattern registered"):
+            get_regex("no_such_table")
+
+        with pytest.raises(ValueError, match="already registered"):
+            register_pattern("deadline", r"by\s+(\d{4})")
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_compiled_tables_match_pattern_strings(self, text):
+        """Compiled keyword tables match exactly where their patterns do."""
+
+        text_lower = text.lower()
+
+        for status in LegislativeStatus.ALL_STATUSES:
+            expected = any(
+                re.search(pattern, text_lower, re.IGNORECASE | re.DOTALL)
+                for pattern in status.action_patterns
+            )
+            assert bool(status.action_regex.search(text_lower)) == expected
+
+        for action_type in NonLegislativeAction.ALL_ACTION_TYPES:
+            expected = any(
+                re.search(keyword, text_lower) for keyword in action_type.keywords
+            )
+            assert bool(action_type.keywords_regex.search(text_lower)) == expected
+
+        expected = any(
+            re.search(word, text_lower)
+            for word in NonLegislativeAction.SKIP_WORDS_LEGISLATIVE
+        )
+        assert NonLegislativeAction.should_skip_for_legislative(text) == expected
@@ -4,6 +4,7 @@
 import csv
 import os
 import sys
+import threading
 import time
 from unittest.mock import Mock, patch, MagicMock, call
 
@@ -154,6 +155,198 @@ class TestPaginationHandling:
         # Assert
         mock_logger.warning.assert_called()
 
+    def test_listing_page_count_read_from_pagination(self, sample_listing_html):
+        """The total page count is read from the first page's pagination."""
+
+        from ECI_initiatives.data_pipeline.scraper.initiatives import data_parser
+
+        assert data_parser.parse_listing_page_count(sample_listing_html) == 13
+        assert data_parser.parse_listing_page_count("<html></html>") == 0
+
+    @staticmethod
+    def _fake_listing_page(driver, base_url, list_dir, current_page):
+        """Stand-in for scrape_single_listing_page returning one initiative."""
+
+        return [{"url": f"{base_url}/initiatives/details/{current_page}"}], (
+            f"page_{current_page:03d}.html"
+        )
+
+    def test_listing_pages_requested_directly(self, mock_driver):
+        """Pages 2..N are requested by URL in parallel, not by clicking Next."""
+
+        from ECI_initiatives.data_pipeline.scraper.initiatives import crawler
+
+        workers = []
+
+        def new_driver():
+            workers.append(Mock())
+            return workers[-1]
+
+        with patch.object(crawler, "logger"), patch.object(
+            crawler, "time"
+        ), patch.object(
+            crawler, "parse_listing_page_count", return_value=4
+        ), patch.object(
+            crawler, "scrape_single_listing_page", side_effect=self._fake_listing_page
+        ), patch.object(
+            crawler, "initialize_browser", side_effect=new_driver
+        ):
+            all_data, saved_paths = self.scrape_all_initiatives_on_all_pages(
+                mock_driver, BASE_URL, "/tmp", num_workers=2
+            )
+
+        requested = sorted(
+            get_call.args[0]
+            for worker in workers
+            for get_call in worker.get.call_args_list
+        )
+        assert requested == [
+            f"{FULL_FIND_INITIATIVE_URL}?page={index}" for index in (1, 2, 3)
+        ]
+        assert saved_paths == [f"page_{page:03d}.html" for page in (1, 2, 3, 4)]
+        assert len(all_data) == 4
+        mock_driver.find_element.assert_not_called()
+        for worker in workers:
+            worker.quit.assert_called_once()
+
+    def test_pagination_followed_when_page_query_ignored(self, mock_driver):
+        """If a direct page repeats page 1, Next is clicked instead."""
+
+        from ECI_initiatives.data_pipeline.scraper.initiatives import crawler
+
+        def same_page(driver, base_url, list_dir, current_page):
+            return self._fake_listing_page(driver, base_url, list_dir, 1)[0], (
+                f"page_{current_page:03d}.html"
+            )
+
+        with patch.object(crawler, "logger"), patch.object(
+            crawler, "time"
+        ), patch.object(
+            crawler, "parse_listing_page_count", return_value=2
+        ), patch.object(
+            crawler, "scrape_single_listing_page", side_effect=same_page
+        ), patch.object(
+            crawler, "initialize_browser"
+        ), patch.object(
+            crawler, "navigate_to_next_page", side_effect=[True, False]
+        ) as mock_navigate:
+            _, saved_paths = self.scrape_all_initiatives_on_all_pages(
+                mock_driver, BASE_URL, "/tmp"
+            )
+
+        assert saved_paths == ["page_001.html", "page_002.html"]
+        assert mock_navigate.call_count == 2
+
+    def test_listing_pages_reported_as_parsed(self, mock_driver):
+        """on_page gets every listing page, the first one before the others."""
+
+        from ECI_initiatives.data_pipeline.scraper.initiatives import crawler
+
+        reported = []
+
+        with patch.object(crawler, "logger"), patch.object(
+            crawler, "time"
+        ), patch.object(
+            crawler, "parse_listing_page_count", return_value=3
+        ), patch.object(
+            crawler, "scrape_single_listing_page", side_effect=self._fake_listing_page
+        ), patch.object(
+            crawler, "initialize_browser"
+        ):
+            self.scrape_all_initiatives_on_all_pages(
+                mock_driver, BASE_URL, "/tmp", num_workers=2, on_page=reported.append
+            )
+
+        assert reported[0] == [{"url": f"{BASE_URL}/initiatives/details/1"}]
+        assert sorted(page[0]["url"] for page in reported) == [
+            f"{BASE_URL}/initiatives/details/{page}" for page in (1, 2, 3)
+        ]
+
+
+class TestListingDownloadPipeline:
+    """Test that initiative pages download while the listing is crawled."""
+
+    @classmethod
+    def setup_class(cls):
+        """Import lazily to avoid log file creation at module load."""
+        from ECI_initiatives.data_pipeline.scraper.initiatives import (
+            __main__ as main_module,
+        )
+        from ECI_initiatives.data_pipeline.scraper.initiatives import downloader
+
+        cls.main_module = main_module
+        cls.downloader = downloader
+
+    def test_downloads_overlap_listing(self, tmp_path):
+        """Page 1 initiatives are downloaded before page 2 is listed."""
+
+        from ECI_initiatives.data_pipeline.scraper.scraper_shared.resume_journal import (
+            ResumeJournal,
+        )
+
+        first_downloaded = threading.Event()
+        page_1 = [
+            {"url": f"{BASE_URL}/initiatives/details/2024/000001_en", "datetime": ""}
+        ]
+        page_2 = [
+            {"url": f"{BASE_URL}/initiatives/details/2024/000002_en", "datetime": ""}
+        ]
+
+        def crawl(driver, base_url, list_dir, on_page):
+            on_page(page_1)
+            # The listing only goes on once the first page was downloaded
+            assert first_downloaded.wait(5)
+            on_page(page_2)
+            return page_1 + page_2, ["page_001.html", "page_002.html"]
+
+        def download(
+            driver, pages_dir, url, span=None, defer_retries=False, link_index=None
+        ):
+            first_downloaded.set()
+            return True
+
+        list_dir = tmp_path / "listings"
+        pages_dir = tmp_path / "initiatives"
+        list_dir.mkdir()
+        pages_dir.mkdir()
+        journal = ResumeJournal(str(pages_dir))
+
+        with patch.object(self.main_module, "logger"), patch.object(
+            self.downloader, "logger"
+        ), patch.object(self.downloader, "time"), patch.object(
+            self.main_module, "create_static_fetcher", return_value=None
+        ), patch.object(
+            self.main_module, "create_page_store", return_value=None
+        ), patch.object(
+            self.main_module, "initialize_browser"
+        ), patch.object(
+            self.main_module, "browser_sessions"
+        ), patch.object(
+            self.downloader, "initialize_browser"
+        ), patch.object(
+            self.downloader, "browser_sessions"
+        ), patch.object(
+            self.main_module, "scrape_all_initiatives_on_all_pages", side_effect=crawl
+        ), patch.object(
+            self.downloader, "download_single_initiative", side_effect=download
+        ):
+            catalog, saved_paths, failed_urls = (
+                self.main_module.scrape_and_download_initiatives(
+                    BASE_URL, str(list_dir), str(pages_dir), journal
+                )
+            )
+
+        assert failed_urls == []
+        assert all(row["datetime"] for row in catalog)
+        assert saved_paths == ["page_001.html", "page_002.html"]
+
+        with open(list_dir / "initiatives_list.csv", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["url"] for row in rows] == [row["url"] for row in catalog]
+
+        reopened = ResumeJournal(str(pages_dir))
+        assert reopened.listed and reopened.finished
+
 
 class TestErrorRecoveryAndResilience:
     """Test error handling and recovery mechanisms."""
@@ -207,15 +400,13 @@ class TestErrorRecoveryAndResilience:
         "ECI_initiatives.data_pipeline.scraper.initiatives.downloader.initialize_browser"
     )
     @patch("ECI_initiatives.data_pipeline.scraper.initiatives.downloader.time")
-    @patch("ECI_initiatives.data_pipeline.scraper.initiatives.downloader.random")
     def test_failed_downloads_recorded_properly(
-        self, mock_random, mock_sleep, mock_init_browser, mock_download, mock_logger
+        self, mock_sleep, mock_init_browser, mock_download, mock_logger
     ):
         """Verify that failed downloads are properly recorded and reported."""
 
         mock_driver = Mock()
         mock_init_browser.return_value = mock_driver
-        mock_random.uniform.return_value = 1.0
 
         # Simulate some successful and some failed downloads
         mock_download.side_effect = [True, False, True, False]
@@ -249,11 +440,11 @@ class TestErrorRecoveryAndResilience:
     @patch("ECI_initiatives.data_pipeline.scraper.initiatives.downloader.logger")
     @patch("ECI_initiatives.data_pipeline.scraper.initiatives.downloader.time")
     @patch(
-        "ECI_initiatives.data_pipeline.scraper.initiatives.downloader.random.uniform",
-        return_value=1.0,
+        "ECI_initiatives.data_pipeline.scraper.initiatives.downloader.page_readiness.wait",
+        return_value=0.0,
     )
     def test_rate_limiting_handling(
-        self, mock_uniform, mock_sleep, mock_logger, mock_driver
+        self, mock_ready, mock_sleep, mock_logger, mock_driver
     ):
         """Check that rate limiting is handled gracefully with appropriate retries."""
 
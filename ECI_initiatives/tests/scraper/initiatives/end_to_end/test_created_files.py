@@ -48,6 +48,10 @@ from unittest.mock import patch
 import pytest
 
 # Local imports (handled by conftest fixture)
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.page_io import (
+    is_page_file,
+    read_page,
+)
 from ECI_initiatives.tests.consts import (
     BASE_URL,
     REQUIRED_CSV_COLUMNS,
@@ -126,6 +130,9 @@ class TestCreatedFiles:
         ), patch(
             "ECI_initiatives.data_pipeline.scraper.initiatives.crawler.navigate_to_next_page",
             side_effect=mock_navigate_to_next_page_first_only,
+        ), patch(
+            "ECI_initiatives.data_pipeline.scraper.initiatives.crawler.parse_listing_page_count",
+            return_value=1,
         ):
             # Run the scraping function - saves to real ECI_initiatives/data/ directory
             timestamp = cls.scrape_eci_initiatives()
@@ -181,7 +188,7 @@ class TestCreatedFiles:
         assert os.path.exists(csv_file), "initiatives_list.csv not created"
 
         # Check HTML listing file exists (should be exactly 1 since we only scrape first page)
-        html_files = [f for f in os.listdir(self.listings_path) if f.endswith(".html")]
+        html_files = [f for f in os.listdir(self.listings_path) if is_page_file(f)]
         assert (
             len(html_files) == MAX_PAGES_E2E_TEST
         ), f"Expected 1 HTML listing file, found {len(html_files)}"
@@ -232,9 +239,7 @@ class TestCreatedFiles:
             for item in os.listdir(self.pages_path):
                 year_path = os.path.join(self.pages_path, item)
                 if os.path.isdir(year_path):
-                    html_files = [
-                        f for f in os.listdir(year_path) if f.endswith(".html")
-                    ]
+                    html_files = [f for f in os.listdir(year_path) if is_page_file(f)]
                     html_count += len(html_files)
 
         # Should have exactly 3 HTML files (one for each initiative)
@@ -249,15 +254,14 @@ class TestCreatedFiles:
             year_path = os.path.join(self.pages_path, item)
             if os.path.isdir(year_path):
                 for file in os.listdir(year_path):
-                    if file.endswith(".html"):
+                    if is_page_file(file):
                         html_files.append(os.path.join(year_path, file))
 
         assert len(html_files) > 0, "No HTML files found to test"
 
         # Test each HTML file
         for html_file in html_files:
-            with open(html_file, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = read_page(html_file)
 
             # Basic HTML validation
             assert len(content) > 100, f"HTML file too short: {html_file}"
@@ -277,14 +281,14 @@ class TestCreatedFiles:
     def test_file_naming_convention(self):
         """Test that files follow the expected naming conventions."""
         # Check listing HTML file naming
-        html_files = [f for f in os.listdir(self.listings_path) if f.endswith(".html")]
+        html_files = [f for f in os.listdir(self.listings_path) if is_page_file(f)]
         for html_file in html_files:
             assert html_file.startswith(
                 LISTING_HTML_PATTERN
             ), f"Listing HTML file naming incorrect: {html_file}"
-            assert html_file.endswith(
-                ".html"
-            ), f"Listing file should end with .html: {html_file}"
+            assert is_page_file(
+                html_file
+            ), f"Listing file should be an .html page: {html_file}"
 
         # Check initiative page file naming (should be <year>_<number>.html format)
         for item in os.listdir(self.pages_path):
@@ -296,14 +300,14 @@ class TestCreatedFiles:
                 ), f"Year directory name incorrect: {item}"
 
                 for file in os.listdir(year_path):
-                    if file.endswith(".html"):
+                    if is_page_file(file):
                         # File should be year_number.html format
                         assert (
                             "_" in file
                         ), f"Initiative file name should contain underscore: {file}"
-                        assert file.endswith(
-                            ".html"
-                        ), f"Initiative file should end with .html: {file}"
+                        assert is_page_file(
+                            file
+                        ), f"Initiative file should be an .html page: {file}"
 
 
 # Inject fixture into setup_class using pytest hook
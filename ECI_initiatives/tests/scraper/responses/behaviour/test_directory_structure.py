@@ -11,6 +11,10 @@ from unittest.mock import patch
 import pytest
 
 # Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.page_io import (
+    find_page,
+    is_page_file,
+)
 from ECI_initiatives.data_pipeline.scraper.responses.file_operations.page import (
     PageFileManager,
 )
@@ -73,11 +77,11 @@ class TestDirectoryStructure:
         # Assert - Check files are in correct year directories
         for year, reg_number in years_and_regs:
             expected_file = responses_dir / year / f"{reg_number}_en.html"
-            assert expected_file.exists(), f"Response file not found: {expected_file}"
+            assert find_page(expected_file), f"Response file not found: {expected_file}"
 
         # Assert - Verify no files are in the root responses directory
         files_in_root = [
-            f for f in responses_dir.iterdir() if f.is_file() and f.suffix == ".html"
+            f for f in responses_dir.iterdir() if f.is_file() and is_page_file(f.name)
         ]
         assert (
             len(files_in_root) == 0
@@ -239,4 +243,4 @@ class TestDirectoryStructure:
         for year in years:
             year_dir = responses_dir / year
             assert year_dir.exists()
-            assert (year_dir / "000001_en.html").exists()
+            assert find_page(year_dir / "000001_en.html")
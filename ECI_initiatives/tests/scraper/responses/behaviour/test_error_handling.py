@@ -50,9 +50,6 @@ class TestRetryMechanism:
                 "ECI_initiatives.data_pipeline.scraper.responses.downloader.initialize_browser"
             ) as mock_init_browser, patch(
                 "ECI_initiatives.data_pipeline.scraper.responses.downloader.time.sleep"
-            ), patch(
-                "ECI_initiatives.data_pipeline.scraper.responses.downloader.random.uniform",
-                return_value=0.1,
             ):
 
                 # Create mock WebDriver
@@ -100,23 +97,16 @@ class TestRetryMechanism:
             MagicMock configured to simulate browser behavior
 
         Note:
-            Each download attempt may access page_source multiple times
-            (for content retrieval and validation). The index calculation
-            accounts for this by dividing by 2.
+            Each download attempt reads page_source once; the same content
+            is used for the rate limiting check and the saved file.
         """
         page_source_call_count = 0
 
         def get_page_source():
             nonlocal page_source_call_count
 
-            # Calculate which response to return
-            # Divide by 2 because page_source is called twice per attempt:
-            # 1. _check_rate_limiting() reads it
-            # 2. Getting actual content reads it again
-
-            response_index = min(
-                len(response_sequence) - 1, page_source_call_count // 2
-            )
+            # One response per attempt
+            response_index = min(len(response_sequence) - 1, page_source_call_count)
             page_source_call_count += 1
 
             return response_sequence[response_index]
@@ -185,9 +175,6 @@ class TestRetryMechanism:
                 "ECI_initiatives.data_pipeline.scraper.responses.downloader.initialize_browser"
             ) as mock_init_browser, patch(
                 "ECI_initiatives.data_pipeline.scraper.responses.downloader.time.sleep"
-            ), patch(
-                "ECI_initiatives.data_pipeline.scraper.responses.downloader.random.uniform",
-                return_value=0.1,
             ):
 
                 # Track which download attempt we're on (not page_source calls)
@@ -13,6 +13,11 @@ import pytest
 from bs4 import BeautifulSoup
 
 # Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.page_io import (
+    find_page,
+    glob_pages,
+    read_page,
+)
 from ECI_initiatives.data_pipeline.scraper.responses.file_operations.page import (
     PageFileManager,
 )
@@ -100,10 +105,9 @@ class TestHTMLDownload:
 
         # Assert
         saved_file = temp_responses_dir / filename
-        assert saved_file.exists()
+        assert find_page(saved_file)
 
-        with open(saved_file, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = read_page(saved_file)
 
         # Verify Commission-specific content
         assert "Commission" in content
@@ -132,7 +136,7 @@ class TestHTMLDownload:
         # Verify file was not created
         year_dir = temp_responses_dir / "2019"
         if year_dir.exists():
-            html_files = list(year_dir.glob("*.html"))
+            html_files = glob_pages(year_dir, "*.html")
             assert len(html_files) == 0, "No HTML files should be saved"
 
     def test_rate_limit_retry_with_backoff(self, temp_responses_dir, rate_limit_html):
@@ -151,7 +155,7 @@ class TestHTMLDownload:
         # Verify file was not saved
         year_dir = temp_responses_dir / "2019"
         if year_dir.exists():
-            html_files = list(year_dir.glob("*.html"))
+            html_files = glob_pages(year_dir, "*.html")
             assert len(html_files) == 0
 
     def test_server_error_page_marked_failed(
@@ -173,7 +177,7 @@ class TestHTMLDownload:
         # Verify file was not saved
         year_dir = temp_responses_dir / "2019"
         if year_dir.exists():
-            html_files = list(year_dir.glob("*.html"))
+            html_files = glob_pages(year_dir, "*.html")
             assert len(html_files) == 0
 
     def test_max_retries_marks_as_failed(self):
@@ -230,10 +234,10 @@ class TestHTMLDownload:
                 # Verify error was logged
                 downloader.logger.error.assert_called_once()
 
-    def test_html_files_prettified(self, temp_responses_dir):
+    def test_html_files_saved_raw(self, temp_responses_dir):
         """
-        When saving HTML files, verify that the content is prettified
-        (well-formatted) for readability.
+        When saving HTML files, verify that the content is stored exactly
+        as received, without an extra prettify pass.
         """
 
         # Arrange
@@ -246,16 +250,9 @@ class TestHTMLDownload:
 
         # Assert
         saved_file = temp_responses_dir / filename
-        with open(saved_file, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Verify prettification (indentation and newlines)
-        assert "\n" in content, "Should contain newlines"
-        assert "  " in content or "\t" in content, "Should contain indentation"
+        content = read_page(saved_file)
 
-        # Count lines to verify it's been expanded
-        lines = content.split("\n")
-        assert len(lines) > 5, "Prettified HTML should have multiple lines"
+        assert content == ugly_html, "Page should be saved unmodified"
 
     def test_html_files_utf8_encoded(self, temp_responses_dir):
         """
@@ -283,8 +280,7 @@ class TestHTMLDownload:
 
         # Assert
         saved_file = temp_responses_dir / filename
-        with open(saved_file, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = read_page(saved_file)
 
         # Verify special characters are preserved
         assert "Diversité" in content
@@ -4,6 +4,7 @@ Test suite for extracting Commission response links from initiative HTML files.
 
 # Standard library
 from pathlib import Path
+from unittest.mock import patch
 
 # Third party
 import pytest
@@ -242,3 +243,81 @@ class TestLinkExtraction:
         assert (
             link_data["reg_number"] == "2019_000007"
         ), "Registration number should be extracted separately"
+
+    def test_index_matches_parsing_and_skips_it(
+        self,
+        temp_pages_dir,
+        initiative_html_with_response_link,
+        initiative_html_without_response_link,
+    ):
+        """
+        Pages recorded in the initiatives downloader's index give the same
+        links as parsing, without being parsed again; pages missing from the
+        index are still parsed.
+        """
+        from ECI_initiatives.data_pipeline.scraper.responses.html_parser import (
+            ResponseLinkExtractor,
+        )
+        from ECI_initiatives.data_pipeline.scraper.scraper_shared.response_link_index import (
+            ResponseLinkIndex,
+        )
+
+        # Arrange
+        year_dir = temp_pages_dir / "2019"
+        year_dir.mkdir()
+        pages = {
+            "2019_000007_en.html": initiative_html_with_response_link,
+            "2019_000008_en.html": initiative_html_without_response_link,
+            "2019_000009_en.html": initiative_html_with_response_link,
+        }
+        for name, html in pages.items():
+            (year_dir / name).write_text(html, encoding="utf-8")
+
+        parsed_links = _extract_response_links(str(temp_pages_dir))
+
+        # The third page is not in the index
+        index = ResponseLinkIndex(str(temp_pages_dir))
+        for name in list(pages)[:2]:
+            index.record_source(
+                f"https://example.com/{name}", f"2019/{name}", pages[name]
+            )
+
+        # Act
+        extractor = ResponseLinkExtractor()
+        original = extractor.extract_links_from_file
+        with patch.object(
+            extractor, "extract_links_from_file", side_effect=original
+        ) as mock_parse:
+            indexed_links = extractor.extract_links_from_directory(str(temp_pages_dir))
+
+        # Assert
+        assert indexed_links == parsed_links
+        assert [call.args[0] for call in mock_parse.call_args_list] == [
+            str(year_dir / "2019_000009_en.html")
+        ]
+
+    def test_response_urls_follow_base_url(self, temp_pages_dir):
+        """
+        With BASE_URL pointed at another server (e.g. the offline replay
+        server), links to the live site are rebased onto it.
+        """
+        from ECI_initiatives.data_pipeline.scraper.responses import html_parser
+
+        # Arrange
+        year_dir = temp_pages_dir / "2019"
+        year_dir.mkdir()
+        (year_dir / "2019_000007_en.html").write_text(
+            "<html><body><h1>Title</h1><a href="
+            '"https://citizens-initiative.europa.eu/initiatives/details/2019/000007/answer_en"'
+            ">Commission's answer and follow-up</a></body></html>",
+            encoding="utf-8",
+        )
+
+        # Act
+        with patch.object(html_parser, "BASE_URL", "http://127.0.0.1:8000"):
+            links = _extract_response_links(str(temp_pages_dir))
+
+        # Assert
+        assert [link["url"] for link in links] == [
+            "http://127.0.0.1:8000/initiatives/details/2019/000007/answer_en"
+        ]
@@ -0,0 +1,121 @@
+"""
+Test suite for the byte-level fast path of response link extraction.
+"""
+
+# Standard library
+from pathlib import Path
+from unittest.mock import patch
+
+# Third party
+import pytest
+
+# Local imports
+from ECI_initiatives.data_pipeline.scraper.responses.html_parser import (
+    ResponseLinkExtractor,
+)
+from ECI_initiatives.data_pipeline.scraper.responses.link_scan import (
+    NO_LINK,
+    scan_response_link,
+)
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.page_io import write_page
+
+EXAMPLE_HTMLS_DIR = (
+    Path(__file__).parent.parent.parent.parent / "data" / "example_htmls"
+)
+
+PAGE_TEMPLATE = """<html><body>
+<h1 class="ecl-page-header-core__title">Save &amp; protect  </h1>
+<a href="/abbr">Other link</a>
+{link}
+</body></html>"""
+
+
+class TestFastLinkScan:
+    """Test that the fast path agrees with full BeautifulSoup parsing."""
+
+    @pytest.mark.parametrize(
+        "html_file",
+        sorted(EXAMPLE_HTMLS_DIR.rglob("*.html")),
+        ids=lambda path: path.name,
+    )
+    def test_example_pages_match_parsing(self, html_file):
+        """Every example page gives the same link data with and without the fast path."""
+
+        fast = ResponseLinkExtractor(fast_scan=True)
+        full = ResponseLinkExtractor(fast_scan=False)
+
+        assert fast.extract_links_from_file(str(html_file)) == (
+            full.extract_links_from_file(str(html_file))
+        )
+
+    def test_page_with_link_not_parsed(self):
+        """The answer link and header title are found without BeautifulSoup."""
+
+        html_file = EXAMPLE_HTMLS_DIR / "initiatives" / "2012_000003_en.html"
+        extractor = ResponseLinkExtractor()
+
+        with patch.object(extractor, "_extract_links_with_soup") as mock_parse:
+            link_data = extractor.extract_links_from_file(str(html_file))
+
+        mock_parse.assert_not_called()
+        assert link_data["url"].startswith("https://")
+        assert link_data["title"]
+
+    @pytest.mark.parametrize("apostrophe", ["'", "&#39;", "&rsquo;", "’"], ids=repr)
+    def test_both_apostrophe_variants_recognized(self, apostrophe):
+        """Plain and typographic apostrophes, raw or escaped, are both links."""
+
+        link = f'<a href="/answer?a=1&amp;b=2">Commission{apostrophe}s answer and follow-up</a>'
+        page = PAGE_TEMPLATE.format(link=link).encode("utf-8")
+
+        assert scan_response_link(page) == ("/answer?a=1&b=2", "Save & protect")
+
+    def test_page_without_link_decided_without_parsing(self):
+        """A page without the link text is answered by the prefilter."""
+
+        page = PAGE_TEMPLATE.format(link="").encode("utf-8")
+
+        assert scan_response_link(page) == NO_LINK
+
+    @pytest.mark.parametrize(
+        "link",
+        [
+            '<a href="/answer"><span>Commission\'s answer and follow-up</span></a>',
+            '<a href="/answer">Commission\'s answer and follow-up',
+            '<a href="/answer"><!-- x -->Commission\'s answer and follow-up</a>',
+        ],
+        ids=["nested tag", "unclosed link", "comment"],
+    )
+    def test_unusual_markup_falls_back_to_parsing(self, tmp_path, link):
+        """Markup the scan cannot be sure about is parsed, with the same result."""
+
+        year_dir = tmp_path / "2019"
+        year_dir.mkdir()
+        page = PAGE_TEMPLATE.format(link=link)
+        (year_dir / "2019_000001_en.html").write_text(page, encoding="utf-8")
+        html_file = str(year_dir / "2019_000001_en.html")
+
+        assert scan_response_link(page.encode("utf-8")) is None
+
+        extractor = ResponseLinkExtractor()
+        assert extractor.extract_links_from_file(html_file) == (
+            ResponseLinkExtractor(fast_scan=False).extract_links_from_file(html_file)
+        )
+
+    def test_compressed_page_scanned(self, tmp_path):
+        """Pages stored gzip-compressed go through the fast path too."""
+
+        link = '<a href="/answer">Commission\'s answer and follow-up</a>'
+        (tmp_path / "2019").mkdir()
+        stored = write_page(
+            str(tmp_path / "2019" / "2019_000001_en.html"),
+            PAGE_TEMPLATE.format(link=link),
+        )
+        extractor = ResponseLinkExtractor()
+
+        with patch.object(extractor, "_extract_links_with_soup") as mock_parse:
+            link_data = extractor.extract_links_from_file(stored)
+
+        mock_parse.assert_not_called()
+        assert link_data["url"] == "/answer"
+        assert link_data["reg_number"] == "2019_000001"
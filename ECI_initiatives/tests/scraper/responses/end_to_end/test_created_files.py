@@ -30,9 +30,14 @@ from unittest.mock import patch
 
 # Third party
 import pytest
-from bs4 import BeautifulSoup
 
 # Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.page_io import (
+    glob_pages,
+    is_page_file,
+    logical_page_path,
+    read_page,
+)
 from ECI_initiatives.data_pipeline.scraper.responses import __main__ as responses_main
 from ECI_initiatives.data_pipeline.scraper.responses.downloader import (
     ResponseDownloader,
@@ -321,8 +326,8 @@ class TestCreatedFiles:
     def test_response_html_files_downloaded(self):
         """
         Verify HTML files contain valid
-        Commission response content, are prettified, and use UTF-8
-        encoding.
+        Commission response content, are stored as received, and use
+        UTF-8 encoding.
         """
         # Count HTML files in year directories
         html_files_found = []
@@ -330,7 +335,7 @@ class TestCreatedFiles:
         for year_dir in self.responses_dir.iterdir():
             if year_dir.is_dir() and year_dir.name.isdigit():
                 for file in year_dir.iterdir():
-                    if file.suffix == ".html":
+                    if is_page_file(file.name):
                         html_files_found.append(file)
 
         # Verify at least some HTML files were downloaded
@@ -347,12 +352,11 @@ class TestCreatedFiles:
         for html_file in html_files_found:
             # Check file naming pattern (YYYY_NNNNNN_en.html)
             assert re.match(
-                RESPONSE_PAGE_FILENAME_PATTERN, html_file.name
+                RESPONSE_PAGE_FILENAME_PATTERN, logical_page_path(html_file).name
             ), f"Invalid filename pattern: {html_file.name}"
 
             # Read file content
-            with open(html_file, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = read_page(html_file)
 
             # Verify content is substantial
             assert (
@@ -370,17 +374,6 @@ class TestCreatedFiles:
                 "Commission" in content
             ), f"No Commission content found in: {html_file.name}"
 
-            # Verify prettification by comparing with BeautifulSoup's prettify output
-            soup = BeautifulSoup(content, "html.parser")
-            prettified_content = soup.prettify()
-
-            # If the file was already prettified, it should match (or be very close to)
-            # the prettified version
-            # We strip whitespace from both to handle minor formatting differences
-            assert (
-                content.strip() == prettified_content.strip()
-            ), f"HTML file is not prettified: {html_file.name}"
-
             # Verify no error indicators
             content_lower = content.lower()
             assert (
@@ -418,7 +411,7 @@ class TestCreatedFiles:
         html_file_count = 0
         for year_dir in self.responses_dir.iterdir():
             if year_dir.is_dir() and year_dir.name.isdigit():
-                html_files = list(year_dir.glob("*.html"))
+                html_files = glob_pages(year_dir, "*.html")
                 html_file_count += len(html_files)
 
         # Verify HTML file count matches successful downloads
@@ -36,7 +36,7 @@ class TestBrowserInitialization:
         with patch(
             "ECI_initiatives.data_pipeline.scraper.responses_followup_website.browser.webdriver.Chrome"
         ) as mock_chrome, patch(
-            "ECI_initiatives.data_pipeline.scraper.responses_followup_website.browser.Options"
+            "ECI_initiatives.data_pipeline.scraper.scraper_shared.browser_factory.Options"
         ) as mock_options:
 
             mock_options_instance = MagicMock()
@@ -71,7 +71,7 @@ class TestBrowserInitialization:
         with patch(
             "ECI_initiatives.data_pipeline.scraper.responses_followup_website.browser.webdriver.Chrome"
         ) as mock_chrome, patch(
-            "ECI_initiatives.data_pipeline.scraper.responses_followup_website.browser.Options"
+            "ECI_initiatives.data_pipeline.scraper.scraper_shared.browser_factory.Options"
         ) as mock_options:
 
             mock_options_instance = MagicMock()
@@ -92,7 +92,7 @@ class TestBrowserInitialization:
         with patch(
             "ECI_initiatives.data_pipeline.scraper.responses_followup_website.browser.webdriver.Chrome"
         ) as mock_chrome, patch(
-            "ECI_initiatives.data_pipeline.scraper.responses_followup_website.browser.Options"
+            "ECI_initiatives.data_pipeline.scraper.scraper_shared.browser_factory.Options"
         ) as mock_options:
 
             mock_options_instance = MagicMock()
@@ -113,7 +113,7 @@ class TestBrowserInitialization:
         with patch(
             "ECI_initiatives.data_pipeline.scraper.responses_followup_website.browser.webdriver.Chrome"
         ) as mock_chrome, patch(
-            "ECI_initiatives.data_pipeline.scraper.responses_followup_website.browser.Options"
+            "ECI_initiatives.data_pipeline.scraper.scraper_shared.browser_factory.Options"
         ) as mock_options:
 
             mock_options_instance = MagicMock()
@@ -13,6 +13,10 @@ from unittest.mock import patch
 import pytest
 
 # Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.page_io import (
+    find_page,
+    is_page_file,
+)
 from ECI_initiatives.data_pipeline.scraper.responses_followup_website.file_operations.page import (
     PageFileManager,
 )
@@ -74,13 +78,13 @@ class TestDirectoryStructure:
         # Assert - Check files are in correct year directories
         for year, reg_number in years_and_regs:
             expected_file = temp_base_dir / year / f"{reg_number}_en.html"
-            assert (
-                expected_file.exists()
+            assert find_page(
+                expected_file
             ), f"Followup website file not found: {expected_file}"
 
         # Assert - Verify no files are in the root directory
         files_in_root = [
-            f for f in temp_base_dir.iterdir() if f.is_file() and f.suffix == ".html"
+            f for f in temp_base_dir.iterdir() if f.is_file() and is_page_file(f.name)
         ]
         assert len(files_in_root) == 0, "HTML files should not be in root directory"
 
@@ -47,9 +47,6 @@ class TestRetryMechanism:
                 "ECI_initiatives.data_pipeline.scraper.responses_followup_website.downloader.initialize_browser"
             ) as mock_init_browser, patch(
                 "ECI_initiatives.data_pipeline.scraper.responses_followup_website.downloader.time.sleep"
-            ), patch(
-                "ECI_initiatives.data_pipeline.scraper.responses_followup_website.downloader.random.uniform",
-                return_value=0.1,
             ):
 
                 mock_driver = self._create_mock_driver_with_response_sequence(
@@ -9,6 +9,11 @@ and proper UTF-8 encoding for multilingual content.
 import pytest
 
 # Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.page_io import (
+    find_page,
+    glob_pages,
+    read_page,
+)
 from ECI_initiatives.data_pipeline.scraper.responses_followup_website.file_operations.page import (
     PageFileManager,
 )
@@ -99,10 +104,9 @@ class TestHTMLDownload:
 
         # Assert
         saved_file = temp_followup_dir / filename
-        assert saved_file.exists()
+        assert find_page(saved_file)
 
-        with open(saved_file, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = read_page(saved_file)
 
         # Verify content is substantial
         assert len(content) > 1000, "Content should be substantial"
@@ -130,7 +134,7 @@ class TestHTMLDownload:
         # Verify file was not created
         year_dir = temp_followup_dir / "2019"
         if year_dir.exists():
-            html_files = list(year_dir.glob("*.html"))
+            html_files = glob_pages(year_dir, "*.html")
             assert len(html_files) == 0, "No HTML files should be saved"
 
     def test_rate_limit_detection(self, temp_followup_dir, rate_limit_html):
@@ -150,7 +154,7 @@ class TestHTMLDownload:
         # Verify file was not saved
         year_dir = temp_followup_dir / "2019"
         if year_dir.exists():
-            html_files = list(year_dir.glob("*.html"))
+            html_files = glob_pages(year_dir, "*.html")
             assert len(html_files) == 0
 
     def test_server_error_page_detected(self, temp_followup_dir, server_error_html):
@@ -172,13 +176,13 @@ class TestHTMLDownload:
         # Verify file was not saved
         year_dir = temp_followup_dir / "2019"
         if year_dir.exists():
-            html_files = list(year_dir.glob("*.html"))
+            html_files = glob_pages(year_dir, "*.html")
             assert len(html_files) == 0
 
-    def test_html_files_prettified(self, temp_followup_dir):
+    def test_html_files_saved_raw(self, temp_followup_dir):
         """
-        When saving HTML files, verify that the content is prettified
-        (well-formatted) for readability.
+        When saving HTML files, verify that the content is stored exactly
+        as received, without an extra prettify pass.
         """
 
         # Arrange
@@ -191,13 +195,9 @@ class TestHTMLDownload:
 
         # Assert
         saved_file = temp_followup_dir / filename
-        with open(saved_file, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = read_page(saved_file)
 
-        # Verify prettification
-        assert "\n" in content, "Should contain newlines"
-        lines = content.split("\n")
-        assert len(lines) > 5, "Prettified HTML should have multiple lines"
+        assert content == ugly_html, "Page should be saved unmodified"
 
     def test_html_files_utf8_encoded(self, temp_followup_dir):
         """
@@ -226,8 +226,7 @@ class TestHTMLDownload:
 
         # Assert
         saved_file = temp_followup_dir / filename
-        with open(saved_file, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = read_page(saved_file)
 
         # Verify special characters are preserved
         assert "Diversité" in content
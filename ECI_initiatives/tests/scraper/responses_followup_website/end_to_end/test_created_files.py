@@ -26,10 +26,13 @@ import random
 import tempfile
 import re
 
-# Third party
-from bs4 import BeautifulSoup
-
 # Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.page_io import (
+    find_page,
+    is_page_file,
+    logical_page_path,
+    read_page,
+)
 from ECI_initiatives.data_pipeline.scraper.responses_followup_website import (
     __main__ as followup_main,
 )
@@ -374,7 +377,7 @@ class TestFollowupWebsiteCreatedFiles:
     def test_followup_html_file_downloaded(self):
         """
         Verify HTML file was downloaded with valid content,
-        is prettified, and uses UTF-8 encoding.
+        is stored as received, and uses UTF-8 encoding.
         """
         # Count HTML files in year directories
         html_files_found = []
@@ -385,7 +388,7 @@ class TestFollowupWebsiteCreatedFiles:
 
                 for file in year_dir.iterdir():
 
-                    if file.suffix == ".html":
+                    if is_page_file(file.name):
                         html_files_found.append(file)
 
         # Verify exactly one HTML file was downloaded
@@ -397,7 +400,7 @@ class TestFollowupWebsiteCreatedFiles:
 
         # Check file naming pattern (YYYY_NNNNNN_en.html)
         assert re.match(
-            FOLLOWUP_WEBSITE_FILENAME_PATTERN, html_file.name
+            FOLLOWUP_WEBSITE_FILENAME_PATTERN, logical_page_path(html_file).name
         ), f"Invalid filename pattern: {html_file.name}"
 
         # Verify file is in correct year directory
@@ -407,8 +410,7 @@ class TestFollowupWebsiteCreatedFiles:
         ), f"File in wrong year directory. Expected {expected_year}, got {html_file.parent.name}"
 
         # Read file content
-        with open(html_file, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = read_page(html_file)
 
         # Verify content is substantial
         assert (
@@ -419,15 +421,6 @@ class TestFollowupWebsiteCreatedFiles:
         assert "<html" in content.lower(), f"No HTML tag found in: {html_file.name}"
         assert "</html>" in content.lower(), f"No closing HTML tag in: {html_file.name}"
 
-        # Verify prettification by checking indentation
-        soup = BeautifulSoup(content, "html.parser")
-        prettified_content = soup.prettify()
-
-        # Compare stripped versions (to handle minor formatting differences)
-        assert (
-            content.strip() == prettified_content.strip()
-        ), f"HTML file is not prettified: {html_file.name}"
-
         # Verify no error indicators
         content_lower = content.lower()
         assert (
@@ -452,13 +445,14 @@ class TestFollowupWebsiteCreatedFiles:
         expected_filename = f"{expected_reg_number}_en.html"
         expected_path = self.followup_website_dir / expected_year / expected_filename
 
-        # Check file exists at expected location
-        assert (
-            expected_path.exists()
-        ), f"File not found at expected location: {expected_path}"
+        # Check file exists at expected location (plain or compressed)
+        stored_path = find_page(expected_path)
+        assert stored_path, f"File not found at expected location: {expected_path}"
 
         # Verify it's a file, not a directory
-        assert expected_path.is_file(), f"Expected path is not a file: {expected_path}"
+        assert Path(
+            stored_path
+        ).is_file(), f"Expected path is not a file: {stored_path}"
 
     def test_download_count_accurate(self):
         """
@@ -0,0 +1,3 @@
+"""
+Tests for the scraper_shared library used by all ECI scrapers.
+"""
@@ -0,0 +1,3 @@
+"""
+Behaviour tests for shared scraper components.
+"""
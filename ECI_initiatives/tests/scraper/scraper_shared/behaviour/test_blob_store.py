@@ -0,0 +1,203 @@
+"""
+Test suite for the content-addressed raw HTML store.
+"""
+
+# Standard library
+import os
+from unittest.mock import Mock, patch
+
+# Third party
+import pytest
+
+# Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared import page_io
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.blob_store import (
+    BlobStore,
+    materialize_session,
+    page_fingerprint,
+)
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.const import (
+    BLOB_STORE_DIR_NAME,
+)
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.incremental import (
+    IncrementalStore,
+)
+
+PAGE_PATH = os.path.join("2019", "2019_000007_en.html")
+PAGE_URL = "https://citizens-initiative.europa.eu/initiatives/details/2019/000007_en"
+
+
+def _write(path: str, content: bytes) -> str:
+    """Write a binary file, creating parent directories."""
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+
+    return path
+
+
+@pytest.fixture
+def sessions_dir(tmp_path):
+    """Data directory with two session directories."""
+
+    for session in ("2025-01-01_10-00-00", "2025-02-01_10-00-00"):
+        os.makedirs(tmp_path / session / "initiatives")
+
+    return str(tmp_path)
+
+
+def _pages_dir(sessions_dir: str, session: str) -> str:
+    return os.path.join(sessions_dir, session, "initiatives")
+
+
+class TestFingerprint:
+    """Test the page digest the blob key is computed from."""
+
+    def test_exact_bytes_hashed(self, tmp_path):
+        """Pages differing in whitespace or line endings only differ."""
+
+        unix = _write(str(tmp_path / "a.html"), b"<p>a</p>\n<p>b</p>\n")
+        windows = _write(str(tmp_path / "b.html"), b"<p>a</p>  \r\n<p>b</p>\r\n")
+
+        assert page_fingerprint(unix) != page_fingerprint(windows)
+
+    def test_compressed_page_same_digest(self, tmp_path):
+        """The digest is computed from the decompressed bytes."""
+
+        plain = _write(str(tmp_path / "a.html"), b"<p>a</p>\r\n")
+        with patch.object(page_io, "PAGE_COMPRESSION", "gzip"):
+            compressed = page_io.write_page(str(tmp_path / "b.html"), "<p>a</p>\r\n")
+
+        assert compressed.endswith(".gz")
+
+        assert page_fingerprint(plain) == page_fingerprint(compressed)
+
+    def test_content_changes_detected(self, tmp_path):
+        """Different page text produces a different fingerprint."""
+
+        first = _write(str(tmp_path / "a.html"), b"<p>100 signatures</p>")
+        second = _write(str(tmp_path / "b.html"), b"<p>101 signatures</p>")
+
+        assert page_fingerprint(first) != page_fingerprint(second)
+
+
+class TestBlobStore:
+    """Test deduplication of page files across sessions."""
+
+    def test_identical_pages_share_one_blob(self, sessions_dir):
+        """The same page saved in two sessions is stored once."""
+
+        store = BlobStore(sessions_dir, logger=Mock())
+        first = _write(
+            os.path.join(_pages_dir(sessions_dir, "2025-01-01_10-00-00"), PAGE_PATH),
+            b"<html>same</html>\n",
+        )
+        second = _write(
+            os.path.join(_pages_dir(sessions_dir, "2025-02-01_10-00-00"), PAGE_PATH),
+            b"<html>same</html>\n",
+        )
+
+        first_digest = store.adopt(first)
+        second_digest = store.adopt(second)
+
+        assert first_digest == second_digest
+        assert os.path.samefile(first, second)
+        assert os.path.samefile(first, store.blob_path(first_digest))
+        assert store.new_blobs == 1
+        assert store.deduplicated == 1
+
+    def test_changed_page_gets_new_blob(self, sessions_dir):
+        """Changed content is kept as a separate blob."""
+
+        store = BlobStore(sessions_dir, logger=Mock())
+        first = _write(
+            os.path.join(_pages_dir(sessions_dir, "2025-01-01_10-00-00"), PAGE_PATH),
+            b"<html>old</html>",
+        )
+        second = _write(
+            os.path.join(_pages_dir(sessions_dir, "2025-02-01_10-00-00"), PAGE_PATH),
+            b"<html>new</html>",
+        )
+
+        store.adopt(first)
+        store.adopt(second)
+
+        assert not os.path.samefile(first, second)
+        assert store.new_blobs == 2
+
+    def test_adopting_twice_is_a_no_op(self, sessions_dir):
+        """Re-adopting a page already linked to its blob changes nothing."""
+
+        store = BlobStore(sessions_dir, logger=Mock())
+        page = _write(
+            os.path.join(_pages_dir(sessions_dir, "2025-01-01_10-00-00"), PAGE_PATH),
+            b"<html>page</html>",
+        )
+
+        store.adopt(page)
+        store.adopt(page)
+
+        assert store.new_blobs == 1
+        assert store.deduplicated == 0
+
+    def test_compressed_page_keeps_suffix(self, sessions_dir):
+        """A gzipped page is stored as a .gz blob, separate from plain copies."""
+
+        store = BlobStore(sessions_dir, logger=Mock())
+        pages_dir = _pages_dir(sessions_dir, "2025-02-01_10-00-00")
+        os.makedirs(os.path.join(pages_dir, "2019"))
+        with patch.object(page_io, "PAGE_COMPRESSION", "gzip"):
+            page = page_io.write_page(
+                os.path.join(pages_dir, PAGE_PATH), "<html>page</html>"
+            )
+
+        digest = store.adopt(page)
+
+        assert store.blob_path(digest, page).endswith(".html.gz")
+        assert os.path.samefile(page, store.blob_path(digest, page))
+
+    def test_store_kept_outside_session_globs(self, sessions_dir):
+        """Blobs live in the data directory, not inside any session."""
+
+        store = BlobStore(sessions_dir, logger=Mock())
+
+        assert store.root == os.path.join(sessions_dir, BLOB_STORE_DIR_NAME)
+        assert sorted([BLOB_STORE_DIR_NAME, "2025-01-01_10-00-00"])[-1] != (
+            BLOB_STORE_DIR_NAME
+        )
+
+
+class TestSessionIndex:
+    """Test the incremental manifest used as the session's thin index."""
+
+    def test_manifest_fingerprint_is_blob_digest(self, sessions_dir):
+        """Pages recorded by the incremental store are linked into the store."""
+
+        blob_store = BlobStore(sessions_dir, logger=Mock())
+        pages_dir = _pages_dir(sessions_dir, "2025-02-01_10-00-00")
+        page = _write(os.path.join(pages_dir, PAGE_PATH), b"<html>page</html>")
+
+        store = IncrementalStore(pages_dir, None, logger=Mock(), blob_store=blob_store)
+        store.record_download(PAGE_URL, PAGE_PATH)
+
+        digest = store.entries[PAGE_PATH].fingerprint
+        assert os.path.samefile(page, blob_store.blob_path(digest))
+
+    def test_session_rebuilt_from_manifest(self, sessions_dir):
+        """A session restored from blobs and manifest has all its pages back."""
+
+        blob_store = BlobStore(sessions_dir, logger=Mock())
+        pages_dir = _pages_dir(sessions_dir, "2025-02-01_10-00-00")
+        page = _write(os.path.join(pages_dir, PAGE_PATH), b"<html>page</html>")
+
+        store = IncrementalStore(pages_dir, None, logger=Mock(), blob_store=blob_store)
+        store.record_download(PAGE_URL, PAGE_PATH)
+        manifest_path = store.write_manifest()
+
+        os.remove(page)
+        written = materialize_session(manifest_path, blob_store)
+
+        assert written == 1
+        with open(page, "rb") as f:
+            assert f.read() == b"<html>page</html>"
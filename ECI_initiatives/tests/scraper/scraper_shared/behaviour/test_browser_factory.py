@@ -0,0 +1,158 @@
+"""
+Test suite for the resource-blocking browser factory.
+"""
+
+# Standard library
+import json
+from unittest.mock import Mock, call, patch
+
+# Third party
+import pytest
+
+# Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.browser_factory import (
+    BrowserFactory,
+    blocked_url_patterns,
+)
+
+PAGE_URL = "https://citizens-initiative.europa.eu/initiatives/details/2019/000007_en"
+
+
+def _event(method, **params):
+    """Performance log entry as returned by driver.get_log()."""
+
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+def _page_log(transferred, blocked_types=()):
+    """Network events of one page load."""
+
+    entries = [
+        _event("Network.loadingFinished", requestId="1", encodedDataLength=transferred)
+    ]
+    entries += [
+        _event("Network.loadingFailed", type=resource_type, blockedReason="inspector")
+        for resource_type in blocked_types
+    ]
+    return entries
+
+
+class TestBlockedPatterns:
+    """Test building the DevTools block list."""
+
+    def test_allowed_categories_not_blocked(self):
+        """Allowed categories are left out, extensions also match with queries."""
+
+        patterns = blocked_url_patterns(["stylesheet"])
+
+        assert "*.woff2" in patterns
+        assert "*.png?*" in patterns
+        assert "*google-analytics.com/*" in patterns
+        assert "*.css" not in patterns
+
+    def test_unknown_category_rejected(self):
+        """A typo in an allowlist fails loudly instead of blocking everything."""
+
+        with pytest.raises(ValueError):
+            blocked_url_patterns(["stylesheets"])
+
+
+class TestBrowserFactory:
+    """Test driver creation and the savings report."""
+
+    @patch(
+        "ECI_initiatives.data_pipeline.scraper.scraper_shared.browser_factory.webdriver.Chrome"
+    )
+    def test_driver_created_with_blocking(self, mock_chrome):
+        """Chrome gets the options, performance logging and the block list."""
+
+        factory = BrowserFactory(["--headless"], ["stylesheet"], logger=Mock())
+
+        driver = factory.create()
+
+        options = mock_chrome.call_args[1]["options"]
+        assert "--headless" in options.arguments
+        assert options.capabilities["goog:loggingPrefs"] == {"performance": "ALL"}
+        driver.execute_cdp_cmd.assert_any_call(
+            "Network.setBlockedURLs", {"urls": factory.blocked_patterns}
+        )
+
+    @patch(
+        "ECI_initiatives.data_pipeline.scraper.scraper_shared.browser_factory.webdriver.Chrome"
+    )
+    def test_blocking_disabled(self, mock_chrome):
+        """Without blocking no DevTools commands are sent."""
+
+        factory = BrowserFactory(block_resources=False, logger=Mock())
+
+        driver = factory.create()
+
+        driver.execute_cdp_cmd.assert_not_called()
+
+    def test_savings_measured_on_first_page(self):
+        """The first page is reloaded unblocked and the savings are reported."""
+
+        driver = Mock()
+        driver.current_url = PAGE_URL
+        driver.get_log.side_effect = [
+            _page_log(40_000, ["Image", "Image", "Font"]),
+            _page_log(440_000),
+            _page_log(50_000, ["Image"]),
+        ]
+        driver.execute_script.side_effect = [0.5, 1.5]
+        factory = BrowserFactory(measure_savings=True, logger=Mock())
+
+        factory.record_page(driver)
+        factory.record_page(driver)
+        factory.log_summary()
+
+        driver.get.assert_called_once_with(PAGE_URL)
+        # Blocking is switched off for the reload and back on afterwards
+        set_urls = [
+            c
+            for c in driver.execute_cdp_cmd.call_args_list
+            if c.args[0] == "Network.setBlockedURLs"
+        ]
+        assert set_urls == [
+            call("Network.setBlockedURLs", {"urls": []}),
+            call("Network.setBlockedURLs", {"urls": factory.blocked_patterns}),
+        ]
+
+        assert factory.pages == 2
+        assert factory.blocked_requests == {"Image": 3, "Font": 1}
+        assert factory.reference == (40_000, 0.5, 440_000, 1.5)
+
+        report = factory.logger.info.call_args[0][0]
+        assert "estimated 391 KB and 1.00s per page" in report
+        assert "2s over the run" in report
+
+    def test_savings_not_measured_by_default(self):
+        """No page is loaded again outside the rate controller by default."""
+
+        driver = Mock()
+        driver.get_log.side_effect = [
+            _page_log(40_000, ["Image", "Font"]),
+            _page_log(50_000, ["Image"]),
+        ]
+        factory = BrowserFactory(logger=Mock())
+
+        factory.record_page(driver)
+        factory.record_page(driver)
+        factory.log_summary()
+
+        driver.get.assert_not_called()
+        assert factory.reference is None
+        assert factory.blocked_requests == {"Image": 2, "Font": 1}
+        factory.logger.info.assert_called_once()
+
+    def test_driver_without_performance_log(self):
+        """Drivers without a performance log are not accounted for."""
+
+        driver = Mock()
+        factory = BrowserFactory(logger=Mock())
+
+        factory.record_page(driver)
+        factory.log_summary()
+
+        driver.get.assert_not_called()
+        factory.logger.info.assert_not_called()
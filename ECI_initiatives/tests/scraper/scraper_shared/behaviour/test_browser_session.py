@@ -0,0 +1,140 @@
+"""
+Test suite for the long-lived browser session pool.
+"""
+
+# Standard library
+from unittest.mock import Mock
+
+# Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.browser_session import (
+    BrowserSessionPool,
+)
+
+
+def _factory():
+    """Factory whose create() returns a new mock driver each time."""
+
+    factory = Mock()
+    factory.create.side_effect = lambda: Mock()
+    return factory
+
+
+class TestBrowserSessionPool:
+    """Test reuse, health checks and recycling of pooled drivers."""
+
+    def test_driver_quit_outside_keep_alive(self):
+        """Without keep_alive() a released driver is quit, as before."""
+
+        pool = BrowserSessionPool(logger=Mock())
+        driver = pool.acquire(_factory())
+
+        pool.release(driver)
+
+        driver.quit.assert_called_once()
+        assert pool.acquire(_factory()) is not driver
+
+    def test_driver_reused_across_phases(self):
+        """Inside keep_alive() the next phase gets the same warm driver."""
+
+        pool = BrowserSessionPool(logger=Mock())
+        factory = _factory()
+
+        with pool.keep_alive():
+            first = pool.acquire(factory)
+            pool.release(first)
+
+            second_factory = _factory()
+            second = pool.acquire(second_factory)
+
+            assert second is first
+            second_factory.configure.assert_called_once_with(first)
+            first.quit.assert_not_called()
+            pool.release(second)
+
+        first.quit.assert_called_once()
+        assert factory.create.call_count == 1
+        assert pool.reused == 1
+
+    def test_nested_keep_alive_keeps_drivers_until_outermost_exit(self):
+        """Several scrapers in one process share drivers until the end."""
+
+        pool = BrowserSessionPool(logger=Mock())
+
+        with pool.keep_alive():
+            with pool.keep_alive():
+                driver = pool.acquire(_factory())
+                pool.release(driver)
+
+            driver.quit.assert_not_called()
+
+        driver.quit.assert_called_once()
+
+    def test_idle_drivers_bounded_by_pool_size(self):
+        """Drivers beyond the pool size are quit on release."""
+
+        pool = BrowserSessionPool(pool_size=1, logger=Mock())
+        factory = _factory()
+
+        with pool.keep_alive():
+            first = pool.acquire(factory)
+            second = pool.acquire(factory)
+
+            pool.release(first)
+            pool.release(second)
+
+            first.quit.assert_not_called()
+            second.quit.assert_called_once()
+
+    def test_crashed_idle_driver_replaced_on_acquire(self):
+        """A warm driver that stopped answering is not handed out."""
+
+        pool = BrowserSessionPool(logger=Mock())
+        factory = _factory()
+
+        with pool.keep_alive():
+            dead = pool.acquire(factory)
+            pool.release(dead)
+            dead.execute_script.side_effect = Exception("chrome not reachable")
+
+            driver = pool.acquire(factory)
+
+        assert driver is not dead
+        assert pool.crashed == 1
+
+    def test_driver_recycled_after_page_limit(self):
+        """refresh() replaces a driver once it has served enough pages."""
+
+        pool = BrowserSessionPool(recycle_after_pages=2, logger=Mock())
+        driver = pool.acquire(_factory())
+
+        assert pool.refresh(driver) is driver
+        assert pool.refresh(driver) is driver
+
+        fresh = pool.refresh(driver)
+
+        assert fresh is not driver
+        driver.quit.assert_called_once()
+        assert pool.recycled == 1
+
+    def test_crashed_driver_replaced_on_refresh(self):
+        """refresh() replaces a driver that no longer answers."""
+
+        pool = BrowserSessionPool(logger=Mock())
+        driver = pool.acquire(_factory())
+        driver.execute_script.side_effect = Exception("chrome not reachable")
+
+        assert pool.refresh(driver) is not driver
+        assert pool.crashed == 1
+
+    def test_foreign_driver_left_alone(self):
+        """Drivers not started by the pool pass through and are quit."""
+
+        pool = BrowserSessionPool(logger=Mock())
+        driver = Mock()
+
+        assert pool.refresh(driver) is driver
+
+        with pool.keep_alive():
+            pool.release(driver)
+
+        driver.quit.assert_called_once()
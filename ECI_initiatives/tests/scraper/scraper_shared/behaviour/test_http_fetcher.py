@@ -0,0 +1,214 @@
+"""
+Test suite for the HTTP-first page fetcher with Selenium fallback.
+"""
+
+# Standard library
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Third party
+import pytest
+import urllib3
+
+# Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.http_fetcher import (
+    StaticPageFetcher,
+)
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.page_io import find_page
+from ECI_initiatives.data_pipeline.scraper.responses.css_selectors import (
+    ResponsePageSelectors,
+)
+from ECI_initiatives.data_pipeline.scraper.responses.downloader import (
+    ResponseDownloader,
+)
+
+TEST_DATA_DIR = Path(__file__).parent.parent.parent.parent / "data" / "example_htmls"
+
+
+def _mock_pool(body: bytes, status: int = 200, url: str = None, charset="utf-8"):
+    """Create a mock urllib3 pool returning a single canned response."""
+
+    response = Mock()
+    response.status = status
+    response.data = body
+    response.url = url
+    response.headers = {"Content-Type": f"text/html; charset={charset}"}
+
+    pool = Mock()
+    pool.request.return_value = response
+
+    return pool
+
+
+class TestStaticPageFetcher:
+    """Test content verification of pages fetched over plain HTTP."""
+
+    @pytest.fixture
+    def response_html(self):
+        """Server-rendered Commission response page."""
+        html_file = (
+            TEST_DATA_DIR / "responses" / "rejection" / "2012" / "2012_000005_en.html"
+        )
+        return html_file.read_bytes()
+
+    def test_page_with_required_selectors_is_returned(self, response_html):
+        """Pages containing all required selectors are served without browser."""
+
+        url = "https://citizens-initiative.europa.eu/initiatives/details/2012/000005_en"
+        fetcher = StaticPageFetcher(
+            [ResponsePageSelectors.MAIN_CONTENT],
+            logger=Mock(),
+            pool_manager=_mock_pool(response_html, url=url),
+        )
+
+        page = fetcher.fetch(url)
+
+        assert page is not None
+        assert page.final_url == url
+        assert "ecl-container" in page.page_source
+        assert fetcher.static_pages == 1
+        assert fetcher.browser_fallbacks == 0
+
+    def test_missing_selector_falls_back(self):
+        """Pages without the expected content require the browser."""
+
+        fetcher = StaticPageFetcher(
+            [ResponsePageSelectors.MAIN_CONTENT],
+            logger=Mock(),
+            pool_manager=_mock_pool(b"<html><body><div id='app'></div></body></html>"),
+        )
+
+        assert fetcher.fetch("https://example.com/page") is None
+        assert fetcher.browser_fallbacks == 1
+
+    @pytest.mark.parametrize("status", [301, 429, 503])
+    def test_non_200_status_falls_back(self, status):
+        """Any non-200 final status is left to the browser path."""
+
+        fetcher = StaticPageFetcher(
+            ["body"],
+            logger=Mock(),
+            pool_manager=_mock_pool(b"<html><body></body></html>", status=status),
+        )
+
+        assert fetcher.fetch("https://example.com/page") is None
+
+    @pytest.mark.parametrize("status", [404, 410])
+    def test_gone_status_reported(self, status):
+        """404 and 410 are browser fallbacks that tell the caller the URL is gone."""
+
+        fetcher = StaticPageFetcher(
+            ["body"],
+            logger=Mock(),
+            pool_manager=_mock_pool(b"<html><body></body></html>", status=status),
+        )
+
+        page = fetcher.fetch("https://example.com/page")
+
+        assert page.gone
+        assert fetcher.browser_fallbacks == 1
+
+    def test_rate_limit_page_falls_back(self):
+        """Rate limiting error pages served with status 200 are not accepted."""
+
+        error_html = (
+            TEST_DATA_DIR / "errors" / "429_too_many_requests_error.html"
+        ).read_bytes()
+        fetcher = StaticPageFetcher(
+            ["body"], logger=Mock(), pool_manager=_mock_pool(error_html)
+        )
+
+        assert fetcher.fetch("https://example.com/page") is None
+
+    def test_network_error_falls_back(self):
+        """Connection errors do not propagate to the caller."""
+
+        pool = Mock()
+        pool.request.side_effect = urllib3.exceptions.MaxRetryError(
+            None, "https://example.com/page"
+        )
+        fetcher = StaticPageFetcher(["body"], logger=Mock(), pool_manager=pool)
+
+        assert fetcher.fetch("https://example.com/page") is None
+
+    def test_body_decoded_with_declared_charset(self):
+        """Body is decoded using the charset from the Content-Type header."""
+
+        body = "<html><body><main>désagrément</main></body></html>".encode("latin-1")
+        fetcher = StaticPageFetcher(
+            ["main"],
+            logger=Mock(),
+            pool_manager=_mock_pool(body, charset="iso-8859-1"),
+        )
+
+        page = fetcher.fetch("https://example.com/page")
+
+        assert "désagrément" in page.page_source
+
+
+class TestDownloaderBrowserFallback:
+    """Test that downloaders only start Chrome when HTTP fetching is not enough."""
+
+    def test_static_page_saved_without_browser(self, tmp_path):
+        """A page served over HTTP is saved and no browser is initialized."""
+
+        html = "<html><body><div class='ecl-container'>Answer</div></body></html>" * 10
+        fetcher = StaticPageFetcher(
+            [ResponsePageSelectors.MAIN_CONTENT],
+            logger=Mock(),
+            pool_manager=_mock_pool(html.encode()),
+        )
+        downloader = ResponseDownloader(str(tmp_path), fetcher=fetcher)
+        downloader.logger = Mock()
+
+        with patch(
+            "ECI_initiatives.data_pipeline.scraper.responses.downloader.initialize_browser"
+        ) as mock_init_browser:
+
+            success, timestamp = downloader.download_single_response(
+                url="https://example.com/response",
+                year="2019",
+                reg_number="2019_000007",
+            )
+
+        assert success is True
+        assert timestamp != ""
+        mock_init_browser.assert_not_called()
+        assert find_page(tmp_path / "2019" / "2019_000007_en.html")
+
+    def test_incomplete_page_uses_browser(self, tmp_path):
+        """When the HTTP body lacks the selectors, Selenium downloads the page."""
+
+        fetcher = StaticPageFetcher(
+            [ResponsePageSelectors.MAIN_CONTENT],
+            logger=Mock(),
+            pool_manager=_mock_pool(b"<html><body></body></html>"),
+        )
+        downloader = ResponseDownloader(str(tmp_path), fetcher=fetcher)
+        downloader.logger = Mock()
+
+        mock_driver = Mock()
+        mock_driver.current_url = "https://example.com/response"
+        mock_driver.page_source = (
+            "<html><body><div class='ecl-container'>Answer</div></body></html>" * 10
+        )
+
+        with patch(
+            "ECI_initiatives.data_pipeline.scraper.responses.downloader.initialize_browser",
+            return_value=mock_driver,
+        ) as mock_init_browser, patch(
+            "ECI_initiatives.data_pipeline.scraper.responses.downloader.time.sleep"
+        ), patch.object(
+            downloader, "_wait_for_page_content"
+        ):
+
+            success, _ = downloader.download_single_response(
+                url="https://example.com/response",
+                year="2019",
+                reg_number="2019_000007",
+            )
+
+        assert success is True
+        mock_init_browser.assert_called_once()
+        mock_driver.get.assert_called_with("https://example.com/response")
+        assert fetcher.browser_fallbacks == 1
@@ -0,0 +1,396 @@
+"""
+Test suite for incremental scraping against the previous session.
+"""
+
+# Standard library
+import json
+import os
+from unittest.mock import Mock, patch
+
+# Third party
+import pytest
+
+# Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.const import (
+    INCREMENTAL_MANIFEST_FILENAME,
+)
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.http_fetcher import (
+    StaticPageFetcher,
+)
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.incremental import (
+    IncrementalStore,
+    find_previous_session_dir,
+)
+
+PAGE_PATH = os.path.join("2019", "2019_000007.html")
+PAGE_URL = "https://citizens-initiative.europa.eu/initiatives/details/2019/000007_en"
+
+
+def _write(path, content: str) -> None:
+    """Write a text file, creating parent directories."""
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+@pytest.fixture
+def sessions(tmp_path):
+    """Data directory with a previous session holding one initiative page."""
+
+    data_dir = tmp_path / "data"
+    previous_dir = data_dir / "2025-01-01_10-00-00" / "initiatives"
+    current_dir = data_dir / "2025-02-01_10-00-00" / "initiatives"
+
+    _write(str(previous_dir / PAGE_PATH), "<html>unchanged page</html>")
+    os.makedirs(current_dir)
+
+    return str(data_dir), str(previous_dir), str(current_dir)
+
+
+def _mock_pool(status: int, body: bytes = b"", headers: dict = None):
+    """Create a mock urllib3 pool returning a single canned response."""
+
+    response = Mock(status=status, data=body, url=None, headers=headers or {})
+    pool = Mock()
+    pool.request.return_value = response
+
+    return pool
+
+
+class TestPreviousSessionLookup:
+    """Test discovery of the session to compare against."""
+
+    def test_latest_earlier_session_found(self, sessions):
+        """The most recent session before the current one is used."""
+
+        data_dir, previous_dir, _ = sessions
+        os.makedirs(os.path.join(data_dir, "2024-12-01_10-00-00", "initiatives"))
+
+        found = find_previous_session_dir(
+            data_dir, "2025-02-01_10-00-00", "initiatives"
+        )
+
+        assert found == previous_dir
+
+    def test_sessions_without_pages_dir_skipped(self, sessions):
+        """Sessions that never downloaded this page type are ignored."""
+
+        data_dir, _, _ = sessions
+
+        found = find_previous_session_dir(data_dir, "2025-02-01_10-00-00", "responses")
+
+        assert found is None
+
+    def test_first_session_has_no_previous(self, sessions):
+        """The oldest session falls back to a full crawl."""
+
+        data_dir, _, _ = sessions
+
+        found = find_previous_session_dir(
+            data_dir, "2025-01-01_10-00-00", "initiatives"
+        )
+
+        assert found is None
+
+
+class TestIncrementalStore:
+    """Test carrying pages forward and the session manifest."""
+
+    def test_identical_download_hardlinked(self, sessions):
+        """A re-downloaded page identical to last run shares its file."""
+
+        _, previous_dir, current_dir = sessions
+        _write(os.path.join(current_dir, PAGE_PATH), "<html>unchanged page</html>")
+        store = IncrementalStore(current_dir, previous_dir, logger=Mock())
+
+        status = store.record_download(PAGE_URL, PAGE_PATH)
+
+        assert status == "unchanged"
+        assert os.path.samefile(
+            os.path.join(current_dir, PAGE_PATH), os.path.join(previous_dir, PAGE_PATH)
+        )
+
+    def test_changed_download_kept(self, sessions):
+        """A page that changed since last run keeps its new content."""
+
+        _, previous_dir, current_dir = sessions
+        _write(os.path.join(current_dir, PAGE_PATH), "<html>new signatures</html>")
+        store = IncrementalStore(current_dir, previous_dir, logger=Mock())
+
+        status = store.record_download(PAGE_URL, PAGE_PATH)
+
+        assert status == "refreshed"
+        with open(os.path.join(current_dir, PAGE_PATH), encoding="utf-8") as f:
+            assert f.read() == "<html>new signatures</html>"
+
+    def test_page_without_previous_copy_is_new(self, sessions):
+        """Pages missing from the previous session are recorded as new."""
+
+        _, previous_dir, current_dir = sessions
+        new_path = os.path.join("2025", "2025_000001.html")
+        _write(os.path.join(current_dir, new_path), "<html>new</html>")
+        store = IncrementalStore(current_dir, previous_dir, logger=Mock())
+
+        assert store.record_download(PAGE_URL, new_path) == "new"
+
+    def test_manifest_records_statuses(self, sessions):
+        """The manifest lists every page with its status and fingerprint."""
+
+        _, previous_dir, current_dir = sessions
+        _write(os.path.join(current_dir, PAGE_PATH), "<html>unchanged page</html>")
+        store = IncrementalStore(current_dir, previous_dir, logger=Mock())
+        store.record_download(PAGE_URL, PAGE_PATH, etag='"abc"')
+
+        manifest_path = store.write_manifest()
+
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        assert manifest["previous_session"] == previous_dir
+        assert manifest["counts"]["unchanged"] == 1
+        assert manifest["pages"][0]["url"] == PAGE_URL
+        assert manifest["pages"][0]["etag"] == '"abc"'
+        assert len(manifest["pages"][0]["fingerprint"]) == 64
+
+    def test_validators_from_previous_manifest(self, sessions):
+        """Conditional headers come from the previous session's manifest."""
+
+        _, previous_dir, current_dir = sessions
+        previous_store = IncrementalStore(previous_dir, None, logger=Mock())
+        previous_store.record_download(
+            PAGE_URL, PAGE_PATH, etag='"v1"', last_modified="Mon, 06 Jan 2025"
+        )
+        previous_store.write_manifest()
+
+        store = IncrementalStore(current_dir, previous_dir, logger=Mock())
+
+        assert store.conditional_headers(PAGE_PATH) == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 06 Jan 2025",
+        }
+        assert store.conditional_headers("2030/2030_000001.html") == {}
+
+    def test_carry_forward_links_previous_copy(self, sessions):
+        """Reused pages appear in the current session without a download."""
+
+        _, previous_dir, current_dir = sessions
+        store = IncrementalStore(current_dir, previous_dir, logger=Mock())
+
+        assert store.carry_forward(PAGE_URL, PAGE_PATH) is True
+        assert os.path.samefile(
+            os.path.join(current_dir, PAGE_PATH), os.path.join(previous_dir, PAGE_PATH)
+        )
+        assert store.entries[PAGE_PATH].status == "reused"
+
+
+class TestConditionalFetch:
+    """Test conditional HTTP requests issued by the fetcher."""
+
+    def test_not_modified_response(self):
+        """A 304 answer is reported as not modified, without a body check."""
+
+        pool = _mock_pool(304)
+        fetcher = StaticPageFetcher(["main"], logger=Mock(), pool_manager=pool)
+
+        page = fetcher.fetch(PAGE_URL, headers={"If-None-Match": '"v1"'})
+
+        assert page.not_modified
+        sent_headers = pool.request.call_args.kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"v1"'
+        assert "User-Agent" in sent_headers
+
+    def test_validators_captured_from_response(self):
+        """ETag and Last-Modified of a full response are kept for the manifest."""
+
+        pool = _mock_pool(
+            200,
+            b"<html><main>content</main></html>",
+            headers={"ETag": '"v2"', "Last-Modified": "Tue, 07 Jan 2025"},
+        )
+        fetcher = StaticPageFetcher(["main"], logger=Mock(), pool_manager=pool)
+
+        page = fetcher.fetch(PAGE_URL)
+
+        assert not page.not_modified
+        assert page.etag == '"v2"'
+        assert page.last_modified == "Tue, 07 Jan 2025"
+
+    def test_unchanged_initiative_not_saved_again(self, sessions):
+        """An initiative page reported unchanged is carried forward, not saved."""
+
+        from ECI_initiatives.data_pipeline.scraper.initiatives import downloader
+
+        _, previous_dir, current_dir = sessions
+        page_path = downloader.initiative_page_path(PAGE_URL)
+        _write(os.path.join(previous_dir, page_path), "<html>unchanged page</html>")
+        previous_store = IncrementalStore(previous_dir, None, logger=Mock())
+        previous_store.record_download(PAGE_URL, page_path, etag='"v1"')
+        previous_store.write_manifest()
+
+        store = IncrementalStore(current_dir, previous_dir, logger=Mock())
+        fetcher = StaticPageFetcher(
+            ["main"], logger=Mock(), pool_manager=_mock_pool(304)
+        )
+
+        with patch.object(downloader, "logger"), patch.object(
+            downloader, "save_initiative_page"
+        ) as mock_save:
+            success = downloader.download_static_initiative(
+                fetcher, current_dir, PAGE_URL, store
+            )
+
+        assert success is True
+        mock_save.assert_not_called()
+        assert os.path.isfile(os.path.join(current_dir, page_path))
+        assert not os.path.exists(
+            os.path.join(current_dir, INCREMENTAL_MANIFEST_FILENAME)
+        )
+
+
+class TestRedirectMap:
+    """Test the redirects carried between sessions in the manifest."""
+
+    OLD_URL = "https://ec.citizens-initiative.europa.eu/public/initiatives/successful/details/2019/000007"
+
+    def test_redirect_carried_to_next_session(self, sessions):
+        """A redirect seen in one session is followed directly in the next."""
+
+        _, previous_dir, current_dir = sessions
+        previous_store = IncrementalStore(previous_dir, None, logger=Mock())
+        previous_store.record_redirect(self.OLD_URL, PAGE_URL)
+        previous_store.write_manifest()
+
+        store = IncrementalStore(current_dir, previous_dir, logger=Mock())
+
+        assert store.resolve_redirect(self.OLD_URL) == PAGE_URL
+        assert store.resolve_redirect(PAGE_URL) == PAGE_URL
+
+        # Not visited this session, still kept for the next one
+        with open(store.write_manifest(), encoding="utf-8") as f:
+            redirects = json.load(f)["redirects"]
+
+        assert redirects[self.OLD_URL]["target"] == PAGE_URL
+
+    def test_stale_redirect_revalidated(self, sessions):
+        """Old redirects are not followed, so the original URL is checked again."""
+
+        _, previous_dir, current_dir = sessions
+        store = IncrementalStore(current_dir, previous_dir, logger=Mock())
+        store.record_redirect(self.OLD_URL, PAGE_URL)
+        store.redirects[self.OLD_URL].verified = "2000-01-01"
+
+        assert store.resolve_redirect(self.OLD_URL) == self.OLD_URL
+
+        # Loading the known target does not count as seeing the redirect
+        store.record_redirect(self.OLD_URL, PAGE_URL, verified=False)
+        assert store.redirects[self.OLD_URL].verified == "2000-01-01"
+
+        store.record_redirect(self.OLD_URL, PAGE_URL)
+        assert store.resolve_redirect(self.OLD_URL) == PAGE_URL
+
+        # A URL that no longer redirects is dropped
+        store.record_redirect(self.OLD_URL, self.OLD_URL)
+        assert self.OLD_URL not in store.redirects
+
+    def test_downloader_navigates_to_known_target(self, tmp_path):
+        """The response downloader fetches the known target, not the old URL."""
+
+        from ECI_initiatives.data_pipeline.scraper.responses.downloader import (
+            ResponseDownloader,
+        )
+        from ECI_initiatives.data_pipeline.scraper.scraper_shared.http_fetcher import (
+            StaticPage,
+        )
+
+        store = IncrementalStore(str(tmp_path), None, logger=Mock())
+        store.record_redirect(self.OLD_URL, PAGE_URL)
+        fetcher = Mock()
+        fetcher.fetch.return_value = StaticPage(
+            url=PAGE_URL,
+            final_url=PAGE_URL,
+            page_source="<html>" + "Commission response " * 100 + "</html>",
+            status=200,
+        )
+        downloader = ResponseDownloader(
+            str(tmp_path), fetcher=fetcher, incremental=store
+        )
+
+        success, _ = downloader.download_single_response(
+            self.OLD_URL, "2019", "2019_000007"
+        )
+
+        assert success
+        assert fetcher.fetch.call_args[0][0] == PAGE_URL
+        assert store.redirects_resolved == 1
+
+    def _browser_download(self, tmp_path, store, static_page, current_url):
+        """Download through a failed HTTP attempt and a mocked browser."""
+
+        from ECI_initiatives.data_pipeline.scraper.responses import downloader
+
+        fetcher = Mock()
+        fetcher.fetch.return_value = static_page
+        response_downloader = downloader.ResponseDownloader(
+            str(tmp_path), fetcher=fetcher, incremental=store
+        )
+        response_downloader.rate_controller = Mock(**{"reserve.return_value": 0})
+        response_downloader.page_readiness = Mock()
+        driver = Mock(
+            current_url=current_url,
+            page_source="<html>" + "Commission response " * 100 + "</html>",
+        )
+
+        with patch.object(response_downloader, "_initialize_driver"), patch.object(
+            response_downloader, "_wait_for_page_content"
+        ), patch.object(downloader, "browser_sessions") as mock_sessions, patch.object(
+            downloader, "browser_factory"
+        ), patch.object(
+            downloader, "time"
+        ):
+            mock_sessions.refresh.return_value = driver
+            success, _ = response_downloader.download_single_response(
+                self.OLD_URL, "2019", "2019_000007"
+            )
+
+        assert success
+        return driver
+
+    def test_browser_fallback_keeps_known_target(self, tmp_path):
+        """An incomplete HTTP copy does not drop the redirect."""
+
+        store = IncrementalStore(str(tmp_path), None, logger=Mock())
+        store.record_redirect(self.OLD_URL, PAGE_URL)
+
+        driver = self._browser_download(tmp_path, store, None, PAGE_URL)
+
+        driver.get.assert_called_once_with(PAGE_URL)
+        assert store.redirects[self.OLD_URL].target == PAGE_URL
+        assert store.redirects_resolved == 1
+
+    def test_gone_target_forgotten(self, tmp_path):
+        """A known target answering 404 is dropped and the original URL asked."""
+
+        from ECI_initiatives.data_pipeline.scraper.scraper_shared.http_fetcher import (
+            StaticPage,
+        )
+
+        store = IncrementalStore(str(tmp_path), None, logger=Mock())
+        store.record_redirect(self.OLD_URL, PAGE_URL)
+        gone = StaticPage(url=PAGE_URL, final_url=PAGE_URL, page_source="", status=404)
+
+        driver = self._browser_download(tmp_path, store, gone, PAGE_URL)
+
+        driver.get.assert_called_once_with(self.OLD_URL)
+        assert store.redirects[self.OLD_URL].target == PAGE_URL
+        assert store.redirects_resolved == 0
+
+    def test_target_redirecting_elsewhere_forgotten(self, tmp_path):
+        """A known target that redirects on is stale and dropped."""
+
+        store = IncrementalStore(str(tmp_path), None, logger=Mock())
+        store.record_redirect(self.OLD_URL, PAGE_URL)
+
+        self._browser_download(tmp_path, store, None, PAGE_URL + "?moved")
+
+        assert self.OLD_URL not in store.redirects
@@ -0,0 +1,209 @@
+"""
+Test suite for raw, optionally compressed page storage and the prettify export.
+"""
+
+# Standard library
+import gzip
+import os
+from dataclasses import asdict
+from pathlib import Path
+from unittest.mock import patch
+
+# Third party
+import pytest
+
+# Local imports
+from ECI_initiatives.data_pipeline.extractor.initiatives.initiatives_logger import (
+    InitiativesExtractorLogger,
+)
+from ECI_initiatives.data_pipeline.extractor.initiatives.parser import ECIHTMLParser
+from ECI_initiatives.data_pipeline.scraper.scraper_shared import page_io
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.page_io import (
+    canonical_html,
+    find_page,
+    glob_pages,
+    logical_page_path,
+    read_page,
+    write_page,
+)
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.prettify_export import (
+    export_prettified,
+    main,
+)
+
+from ECI_initiatives.tests.consts import INITIATIVES_HTML_DIR
+
+RAW_PAGE = (
+    "<html><head><title>Test</title></head>\r\n<body><p>Inhalt ä</p></body></html>"
+)
+
+
+def _compression(compression: str):
+    """Patch the configured page compression."""
+
+    return patch.object(page_io, "PAGE_COMPRESSION", compression)
+
+
+class TestRawStorage:
+    """Test that pages are stored exactly as received."""
+
+    def test_page_written_unmodified(self, tmp_path):
+        """Markup, line endings and non-ASCII text are kept as they are."""
+
+        path = tmp_path / "page.html"
+
+        with _compression(""):
+            write_page(str(path), RAW_PAGE)
+
+        assert path.read_bytes() == RAW_PAGE.encode("utf-8")
+
+    def test_extractor_output_independent_of_storage(self, tmp_path):
+        """An initiative page gives the same record stored plain and gzipped."""
+
+        source = Path(INITIATIVES_HTML_DIR) / "2024_000005_en.html"
+        content = source.read_text(encoding="utf-8")
+
+        paths = []
+        for compression in ("", "gzip"):
+            path = tmp_path / (compression or "plain") / source.name
+            path.parent.mkdir()
+            with _compression(compression):
+                paths.append(Path(write_page(path, content)))
+
+        parser = ECIHTMLParser(logger=InitiativesExtractorLogger().setup())
+
+        records = [asdict(parser.parse_html_file(path)) for path in paths]
+        for record in records:
+            # Set from the clock at parse time
+            del record["created_timestamp"], record["last_updated"]
+
+        assert records[0] == records[1]
+
+
+class TestCompressedStorage:
+    """Test transparent compression of stored pages."""
+
+    def test_gzip_page_read_back_transparently(self, tmp_path):
+        """A gzipped page is found and read through its plain .html path."""
+
+        path = tmp_path / "2019_000007_en.html"
+        page = RAW_PAGE * 50
+
+        with _compression("gzip"):
+            stored = write_page(path, page)
+
+        assert stored == str(path) + ".gz"
+        assert not path.exists()
+        assert os.path.getsize(stored) < len(page)
+        assert gzip.decompress(Path(stored).read_bytes()) == page.encode("utf-8")
+        assert find_page(path) == stored
+        assert read_page(path) == page.replace("\r\n", "\n")
+
+    def test_identical_pages_compress_identically(self, tmp_path):
+        """Compressed bytes do not depend on the time of writing."""
+
+        with _compression("gzip"):
+            first = write_page(tmp_path / "a.html", RAW_PAGE)
+            second = write_page(tmp_path / "b.html", RAW_PAGE)
+
+        assert Path(first).read_bytes() == Path(second).read_bytes()
+
+    def test_zstd_page_read_back_transparently(self, tmp_path):
+        """A zstd page is found and read through its plain .html path."""
+
+        pytest.importorskip("zstandard")
+        path = tmp_path / "2019_000007_en.html"
+
+        with _compression("zstd"):
+            stored = write_page(path, RAW_PAGE)
+
+        assert stored.endswith(".html.zst")
+        assert read_page(path) == RAW_PAGE.replace("\r\n", "\n")
+
+    def test_zstd_without_package_reported(self, tmp_path):
+        """Selecting zstd without the zstandard package fails clearly."""
+
+        with _compression("zstd"), patch.object(page_io, "zstandard", None):
+            with pytest.raises(RuntimeError, match="zstandard"):
+                write_page(tmp_path / "page.html", RAW_PAGE)
+
+    def test_glob_finds_every_form_once(self, tmp_path):
+        """Plain and compressed pages are globbed by the plain .html pattern."""
+
+        with _compression(""):
+            write_page(tmp_path / "2019_000007_en.html", RAW_PAGE)
+        with _compression("gzip"):
+            write_page(tmp_path / "2020_000001_en.html", RAW_PAGE)
+        (tmp_path / "notes.txt").write_text("not a page")
+
+        pages = glob_pages(tmp_path, "*_en.html")
+
+        assert [logical_page_path(page).name for page in pages] == [
+            "2019_000007_en.html",
+            "2020_000001_en.html",
+        ]
+
+    def test_rewrite_replaces_other_form(self, tmp_path):
+        """A page re-saved with another compression exists only once."""
+
+        path = tmp_path / "page.html"
+
+        with _compression(""):
+            write_page(path, RAW_PAGE)
+        with _compression("gzip"):
+            write_page(path, RAW_PAGE)
+
+        assert sorted(os.listdir(tmp_path)) == ["page.html.gz"]
+
+    def test_rewrite_leaves_hardlinked_copies_alone(self, tmp_path):
+        """Re-saving a page linked from another session replaces the link."""
+
+        path = tmp_path / "current.html"
+        linked = tmp_path / "previous.html"
+
+        with _compression(""):
+            write_page(path, "<html>old</html>")
+            os.link(path, linked)
+            write_page(path, "<html>new</html>")
+
+        assert linked.read_text() == "<html>old</html>"
+        assert path.read_text() == "<html>new</html>"
+
+
+class TestPrettifyExport:
+    """Test the offline export of indented copies."""
+
+    def test_pages_exported_next_to_source(self, tmp_path):
+        """Copies mirror the pages directory uncompressed, originals stay raw."""
+
+        pages_dir = tmp_path / "initiatives"
+        (pages_dir / "2024").mkdir(parents=True)
+        page = pages_dir / "2024" / "2024_000005_en.html"
+        with _compression("gzip"):
+            stored = write_page(page, RAW_PAGE)
+        (pages_dir / "notes.txt").write_text("not a page")
+
+        exported = export_prettified(str(pages_dir))
+
+        copy = tmp_path / "initiatives_prettified" / "2024" / "2024_000005_en.html"
+        assert exported == 1
+        assert copy.read_text(encoding="utf-8") == canonical_html(
+            RAW_PAGE.replace("\r\n", "\n")
+        )
+        assert gzip.decompress(Path(stored).read_bytes()) == RAW_PAGE.encode("utf-8")
+
+    def test_missing_directory_reported(self, tmp_path, capsys):
+        """The command fails cleanly on a wrong path."""
+
+        assert main([str(tmp_path / "missing")]) == 1
+        assert "Pages directory not found" in capsys.readouterr().err
+
+    def test_command_with_output_directory(self, tmp_path):
+        """--output selects the destination directory."""
+
+        pages_dir = tmp_path / "responses"
+        pages_dir.mkdir()
+        write_page(str(pages_dir / "page.html"), RAW_PAGE)
+
+        assert main([str(pages_dir), "--output", str(tmp_path / "out")]) == 0
+        assert os.path.isfile(tmp_path / "out" / "page.html")
@@ -0,0 +1,116 @@
+"""
+Test suite for event-driven page readiness detection.
+"""
+
+# Standard library
+from unittest.mock import Mock
+
+# Third party
+from selenium.common.exceptions import JavascriptException
+
+# Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.page_readiness import (
+    READINESS_SCRIPT,
+    PageReadinessWaiter,
+)
+
+PAGE_URL = "https://citizens-initiative.europa.eu/initiatives/details/2019/000007_en"
+
+
+def _state(ready_state="complete", quiet_for=1.0, missing=()):
+    """Page state as reported by the readiness script."""
+
+    return {"readyState": ready_state, "quietFor": quiet_for, "missing": list(missing)}
+
+
+def _waiter(timeout=2.0):
+    """Waiter with short intervals so tests run fast."""
+
+    return PageReadinessWaiter(
+        timeout=timeout, quiet_period=0.3, poll_interval=0.001, logger=Mock()
+    )
+
+
+class TestPageReadiness:
+    """Test waiting for a stable page instead of a fixed sleep."""
+
+    def test_returns_once_dom_is_stable(self):
+        """Loading and still-changing pages are polled until they settle."""
+
+        driver = Mock()
+        driver.execute_script.side_effect = [
+            _state(ready_state="interactive", quiet_for=0.0),
+            _state(quiet_for=0.1),
+            _state(quiet_for=0.4),
+        ]
+        waiter = _waiter()
+
+        waiter.wait(driver, PAGE_URL, ["ol.ecl-timeline"])
+
+        assert driver.execute_script.call_count == 3
+        driver.execute_script.assert_called_with(READINESS_SCRIPT, ["ol.ecl-timeline"])
+        assert [(page, timed_out) for page, _, timed_out in waiter.timings] == [
+            (PAGE_URL, False)
+        ]
+
+    def test_missing_selectors_keep_waiting(self):
+        """A quiet page is not ready while expected content is missing."""
+
+        driver = Mock()
+        driver.execute_script.side_effect = [
+            _state(missing=["ol.ecl-timeline"]),
+            _state(),
+        ]
+
+        _waiter().wait(driver, PAGE_URL, ["ol.ecl-timeline"])
+
+        assert driver.execute_script.call_count == 2
+
+    def test_hard_ceiling(self):
+        """A page that never settles is used once the ceiling is reached."""
+
+        driver = Mock()
+        driver.execute_script.return_value = _state(quiet_for=0.0)
+        waiter = _waiter(timeout=0.05)
+
+        elapsed = waiter.wait(driver, PAGE_URL)
+
+        assert 0.05 <= elapsed < 1.0
+        assert waiter.timings[0][2] is True
+
+    def test_replaced_document_rechecked(self):
+        """A script error while the page navigates (redirect) is retried."""
+
+        driver = Mock()
+        driver.execute_script.side_effect = [
+            JavascriptException("document unloaded while waiting for result"),
+            _state(),
+        ]
+
+        _waiter().wait(driver, PAGE_URL)
+
+        assert driver.execute_script.call_count == 2
+
+    def test_driver_without_scripts_not_waited_for(self):
+        """Drivers that cannot report the page state are not waited for."""
+
+        driver = Mock()
+        driver.execute_script.return_value = None
+        waiter = _waiter()
+
+        assert waiter.wait(driver, PAGE_URL) == 0.0
+        assert waiter.timings == []
+
+    def test_summary_logged(self):
+        """The run summary reports readiness times and ceiling hits."""
+
+        driver = Mock()
+        driver.execute_script.return_value = _state()
+        waiter = _waiter()
+
+        waiter.wait(driver, PAGE_URL)
+        waiter.log_summary()
+
+        summary = waiter.logger.info.call_args[0][0]
+        assert "1 pages" in summary
+        assert "0 reached" in summary
@@ -0,0 +1,151 @@
+"""
+Test suite for the single-pass page validator.
+"""
+
+# Standard library
+from unittest.mock import Mock
+
+# Third party
+import pytest
+
+# Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.const import (
+    ERROR_PAGE_INDICATORS,
+    RATE_LIMIT_INDICATORS,
+)
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.http_fetcher import (
+    StaticPageFetcher,
+)
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.page_validator import (
+    scan_page,
+)
+
+from .test_http_fetcher import _mock_pool
+
+VALID_PAGE = (
+    '<html><head><title>Initiative</title></head><body><div class="ecl-container">'
+    + "Content " * 20
+    + "</div></body></html>"
+)
+
+
+class TestScanPage:
+    """Test the report produced by scan_page()."""
+
+    def test_valid_page_not_malformed(self):
+        """A complete, balanced page passes all heuristics."""
+
+        report = scan_page(VALID_PAGE)
+
+        assert not report.malformed
+        assert report.rate_limit_indicators == ()
+        assert report.error_page_indicators == ()
+
+    def test_indicators_found_case_insensitively(self):
+        """Indicators are reported as configured whatever their case in the page."""
+
+        page = VALID_PAGE.replace("Content", RATE_LIMIT_INDICATORS[0].upper(), 1)
+
+        report = scan_page(page)
+
+        assert report.rate_limit_indicators == (RATE_LIMIT_INDICATORS[0],)
+        # Case-sensitive checks do not see it
+        assert report.exact_rate_limit_indicators == ()
+
+    def test_exact_indicators_keep_configured_case(self):
+        """Indicators in their configured case are in both lists."""
+
+        page = VALID_PAGE.replace("Content", RATE_LIMIT_INDICATORS[0], 1)
+
+        report = scan_page(page)
+
+        assert report.rate_limit_indicators == (RATE_LIMIT_INDICATORS[0],)
+        assert report.exact_rate_limit_indicators == (RATE_LIMIT_INDICATORS[0],)
+
+    def test_overlapping_indicators_all_found(self):
+        """An indicator inside another one is reported as well."""
+
+        report = scan_page(
+            VALID_PAGE.replace("Content", "HTTP 429 - Too Many Requests")
+        )
+
+        assert set(report.exact_rate_limit_indicators) == {
+            "HTTP 429",
+            "429 - Too Many Requests",
+            "Too Many Requests",
+        }
+
+    def test_error_page_indicators(self):
+        """Error page markers are reported separately from rate limiting."""
+
+        report = scan_page(VALID_PAGE.replace("Initiative", ERROR_PAGE_INDICATORS[0]))
+
+        assert report.error_page_indicators == (ERROR_PAGE_INDICATORS[0],)
+        assert report.rate_limit_indicators == ()
+
+    def test_malformed_heuristics(self):
+        """Unbalanced markup, stray quotes and a missing </html> are flagged."""
+
+        truncated = scan_page(VALID_PAGE[: -len("</body></html>")])
+        odd_quotes = scan_page(VALID_PAGE.replace("<body>", '<body class="x>'))
+        short = scan_page("<html></html>")
+
+        assert truncated.missing_html_close and truncated.malformed
+        assert odd_quotes.unmatched_quotes and odd_quotes.malformed
+        assert short.too_short and short.malformed
+
+    @pytest.mark.parametrize(
+        "text", ["Initiative citoyenne européenne", "Kelvin \u212a, €100 🌍", "ſ"]
+    )
+    def test_size_of_utf8_content(self, text):
+        """Size is the length of the UTF-8 encoded page."""
+
+        page = VALID_PAGE.replace("Content", text, 1)
+
+        report = scan_page(page)
+
+        assert report.length == len(page)
+        assert report.size == len(page.encode("utf-8"))
+
+    @pytest.mark.parametrize("page", [VALID_PAGE, VALID_PAGE.upper()])
+    def test_counts_match_plain_counts(self, page):
+        """Bracket and quote counts and <html> tags match separate scans."""
+
+        report = scan_page(page)
+
+        assert report.open_brackets == page.count("<")
+        assert report.close_brackets == page.count(">")
+        assert report.quotes == page.count('"')
+        assert report.has_html_open and report.has_html_close
+
+    def test_fetcher_attaches_report(self):
+        """Pages fetched over HTTP carry their report to the saver."""
+
+        fetcher = StaticPageFetcher(
+            [".ecl-container"],
+            logger=Mock(),
+            pool_manager=_mock_pool(VALID_PAGE.encode("utf-8")),
+        )
+
+        page = fetcher.fetch("https://example.com/page")
+
+        assert page is not None
+        assert page.report == scan_page(VALID_PAGE)
+
+    def test_fetcher_rate_limit_check_case_sensitive(self):
+        """The fetcher only falls back on indicators in their configured case."""
+
+        mentioned = VALID_PAGE.replace("Content", "too many requests", 1)
+        rate_limited = VALID_PAGE.replace("Content", "Too Many Requests", 1)
+
+        pages = []
+        for page in (mentioned, rate_limited):
+            fetcher = StaticPageFetcher(
+                [".ecl-container"],
+                logger=Mock(),
+                pool_manager=_mock_pool(page.encode("utf-8")),
+            )
+            pages.append(fetcher.fetch("https://example.com/page"))
+
+        assert pages[0] is not None
+        assert pages[1] is None
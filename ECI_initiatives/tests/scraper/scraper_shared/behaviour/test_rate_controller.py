@@ -0,0 +1,250 @@
+"""
+Test suite for the adaptive (AIMD) request rate controller.
+"""
+
+# Standard library
+import tempfile
+import threading
+from unittest.mock import Mock, patch
+
+# Third party
+import pytest
+
+# Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.http_fetcher import (
+    StaticPageFetcher,
+)
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.rate_controller import (
+    AdaptiveRateController,
+    is_rate_limit_error,
+)
+from ECI_initiatives.data_pipeline.scraper.responses.downloader import (
+    ResponseDownloader,
+)
+
+
+def _controller(rate: float = 1.0, **kwargs) -> AdaptiveRateController:
+    """Create a controller without jitter so that delays are predictable."""
+
+    return AdaptiveRateController(rate, jitter=0.0, logger=Mock(), **kwargs)
+
+
+class TestRequestSpacing:
+    """Test request slots shared by all workers."""
+
+    def test_first_slot_is_immediate(self):
+        """The first request does not wait."""
+
+        assert _controller().reserve() == pytest.approx(0.0, abs=0.01)
+
+    def test_consecutive_slots_are_spaced(self):
+        """Each reservation is pushed one interval after the previous one."""
+
+        controller = _controller(rate=0.5)
+
+        delays = [controller.reserve() for _ in range(3)]
+
+        assert delays[1] == pytest.approx(2.0, abs=0.05)
+        assert delays[2] == pytest.approx(4.0, abs=0.05)
+
+    def test_slots_shared_between_threads(self):
+        """Reservations from several threads never overlap."""
+
+        controller = _controller(rate=1.0)
+        delays = []
+        lock = threading.Lock()
+
+        def reserve():
+            delay = controller.reserve()
+            with lock:
+                delays.append(round(delay))
+
+        threads = [threading.Thread(target=reserve) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(delays) == [0, 1, 2, 3]
+
+
+class TestAIMD:
+    """Test additive increase and multiplicative decrease of the rate."""
+
+    def test_success_increases_rate_additively(self):
+        """Every successful page adds one step to the rate."""
+
+        controller = _controller(rate=1.0, increase_step=0.25)
+
+        controller.record_success()
+        controller.record_success()
+
+        assert controller.rate == pytest.approx(1.5)
+
+    def test_rate_capped_at_maximum(self):
+        """The rate never grows past max_rate."""
+
+        controller = _controller(rate=1.0, increase_step=1.0, max_rate=2.5)
+
+        for _ in range(5):
+            controller.record_success()
+
+        assert controller.rate == pytest.approx(2.5)
+
+    def test_rate_limiting_decreases_rate_multiplicatively(self):
+        """A rate limit signal halves the rate and delays the next slot."""
+
+        controller = _controller(rate=2.0, decrease_factor=0.5)
+        controller.reserve()
+
+        controller.record_rate_limited()
+
+        assert controller.rate == pytest.approx(1.0)
+        assert controller.rate_limit_events == 1
+        assert controller.reserve() == pytest.approx(1.0, abs=0.05)
+
+    def test_rate_floored_at_minimum(self):
+        """The rate never drops below min_rate."""
+
+        controller = _controller(rate=1.0, min_rate=0.4, decrease_factor=0.5)
+
+        with patch(
+            "ECI_initiatives.data_pipeline.scraper.scraper_shared.rate_controller.time.monotonic",
+            side_effect=[0.0, 100.0, 200.0],
+        ):
+            for _ in range(3):
+                controller.record_rate_limited()
+
+        assert controller.rate == pytest.approx(0.4)
+
+    def test_simultaneous_signals_cut_rate_once(self):
+        """Workers hitting the limit together only count as one event."""
+
+        controller = _controller(rate=2.0, decrease_factor=0.5)
+
+        for _ in range(4):
+            controller.record_rate_limited()
+
+        assert controller.rate == pytest.approx(1.0)
+        assert controller.rate_limit_events == 1
+
+    def test_rate_limited_retry_backs_off_through_rate(self):
+        """Retrying after rate limiting lowers the shared rate."""
+
+        controller = _controller(rate=2.0, decrease_factor=0.5)
+        controller.reserve()
+
+        delay = controller.retry_delay(0, rate_limited=True)
+
+        assert controller.rate == pytest.approx(1.0)
+        assert delay == pytest.approx(1.0, abs=0.05)
+
+    def test_other_errors_back_off_exponentially(self):
+        """Non rate limit errors keep the rate but wait longer each attempt."""
+
+        controller = _controller(rate=1.0)
+
+        delays = [
+            controller.retry_delay(attempt, rate_limited=False) for attempt in range(3)
+        ]
+
+        assert controller.rate == pytest.approx(1.0)
+        assert delays[2] >= 4.0
+
+    def test_deferred_backoff_keeps_slots_free(self):
+        """A retry queued behind other pages does not reserve a request slot."""
+
+        controller = _controller(rate=1.0)
+        controller.reserve()
+
+        delay = controller.backoff_delay(2, rate_limited=False)
+
+        assert delay == pytest.approx(4.0)
+        assert controller.requests == 1
+        assert controller.reserve() == pytest.approx(1.0, abs=0.05)
+
+    def test_rate_limit_error_detection(self):
+        """Error messages are matched against RATE_LIMIT_INDICATORS."""
+
+        assert is_rate_limit_error("Rate limiting detected: Too Many Requests")
+        assert is_rate_limit_error("server returned http 429")
+        assert not is_rate_limit_error("Connection timeout")
+
+
+class TestRateReporting:
+    """Test reporting of the rate the controller settled on."""
+
+    def test_summary_reports_settled_rate(self):
+        """The summary includes the final rate and backoff count."""
+
+        controller = _controller(rate=1.0, increase_step=0.5)
+        controller.reserve()
+        controller.record_success()
+
+        controller.log_summary()
+
+        message = controller.logger.info.call_args[0][0]
+        assert "1.50 req/s" in message
+        assert "0 rate limit backoffs" in message
+
+    def test_no_summary_without_requests(self):
+        """Nothing is logged when no request was made."""
+
+        controller = _controller()
+
+        controller.log_summary()
+
+        controller.logger.info.assert_not_called()
+
+
+class TestDownloaderIntegration:
+    """Test that downloaders and the HTTP fetcher feed the shared controller."""
+
+    def test_http_429_reported_to_controller(self):
+        """A 429 response over HTTP slows the shared rate down."""
+
+        response = Mock(status=429, data=b"", url=None, headers={})
+        pool = Mock()
+        pool.request.return_value = response
+
+        controller = _controller(rate=2.0)
+        fetcher = StaticPageFetcher(
+            ["main"], logger=Mock(), pool_manager=pool, rate_controller=controller
+        )
+
+        assert fetcher.fetch("https://example.com/page") is None
+        assert controller.rate == pytest.approx(1.0)
+
+    def test_parallel_workers_share_one_controller(self):
+        """Worker clones pace their requests through the parent's controller."""
+
+        controller = _controller()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            downloader = ResponseDownloader(
+                tmpdir, fetcher=Mock(), num_workers=2, rate_controller=controller
+            )
+            worker = downloader._open_worker()
+
+        assert worker is not downloader
+        assert worker.rate_controller is controller
+
+    def test_successful_download_increases_rate(self):
+        """Each downloaded page raises the shared rate by one step."""
+
+        controller = _controller(rate=1.0, increase_step=0.5)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            downloader = ResponseDownloader(tmpdir, rate_controller=controller)
+            downloader.download_single_response = Mock(
+                return_value=(True, "2024-01-01 00:00:00")
+            )
+
+            with patch(
+                "ECI_initiatives.data_pipeline.scraper.responses.downloader.time"
+            ):
+                downloader._download_link(
+                    downloader, {"url": "u", "year": "2019", "reg_number": "2019_1"}
+                )
+
+        assert controller.rate == pytest.approx(1.5)
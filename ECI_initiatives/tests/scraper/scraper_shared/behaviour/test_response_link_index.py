@@ -0,0 +1,108 @@
+"""
+Test suite for the side-car index of Commission response links.
+"""
+
+# Standard library
+from unittest.mock import Mock
+
+# Third party
+from bs4 import BeautifulSoup
+
+# Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.const import (
+    RESPONSE_LINK_INDEX_FILENAME,
+)
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.page_io import write_page
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.response_link_index import (
+    ResponseLinkIndex,
+    load_response_link_index,
+)
+
+PAGE_URL = "https://citizens-initiative.europa.eu/initiatives/details/2019/000007_en"
+PAGE_PATH = "2019/2019_000007_en.html"
+
+ANSWERED_PAGE = """<html><body>
+<h1 class="ecl-page-header-core__title">End the Cage Age</h1>
+<a href="/initiatives/details/2018/000004/end-cage-age_en">Commission’s answer and follow-up</a>
+</body></html>"""
+
+OPEN_PAGE = "<html><body><h1>Save bees</h1><a href='/x'>Read more</a></body></html>"
+
+
+class TestResponseLinkIndex:
+    """Test recording and reading index entries."""
+
+    def test_entry_recorded_from_dom(self, tmp_path):
+        """Title and response link are taken from the parsed page."""
+
+        index = ResponseLinkIndex(str(tmp_path))
+        index.record(PAGE_URL, PAGE_PATH, BeautifulSoup(ANSWERED_PAGE, "html.parser"))
+
+        entry = load_response_link_index(str(tmp_path))[PAGE_PATH]
+
+        assert entry["url"] == PAGE_URL
+        assert entry["title"] == "End the Cage Age"
+        assert (
+            entry["response_url"] == "/initiatives/details/2018/000004/end-cage-age_en"
+        )
+
+    def test_page_without_answer_indexed_with_empty_link(self, tmp_path):
+        """Pages without an answer are indexed too, so they are not parsed again."""
+
+        ResponseLinkIndex(str(tmp_path)).record_source(PAGE_URL, PAGE_PATH, OPEN_PAGE)
+
+        entry = load_response_link_index(str(tmp_path))[PAGE_PATH]
+
+        assert entry["response_url"] == ""
+        assert entry["title"] == "Save bees"
+
+    def test_last_entry_of_a_page_wins(self, tmp_path):
+        """A page saved again later in the session replaces its entry."""
+
+        index = ResponseLinkIndex(str(tmp_path))
+        index.record_source(PAGE_URL, PAGE_PATH, OPEN_PAGE)
+        index.record_source(PAGE_URL, PAGE_PATH, ANSWERED_PAGE)
+
+        entries = load_response_link_index(str(tmp_path))
+
+        assert len(entries) == 1
+        assert entries[PAGE_PATH]["response_url"]
+
+    def test_saved_page_read_back(self, tmp_path):
+        """Pages missing from the previous index are read back from the stored file."""
+
+        (tmp_path / "2019").mkdir()
+        write_page(tmp_path / PAGE_PATH, ANSWERED_PAGE)
+
+        ResponseLinkIndex(str(tmp_path)).record_saved_page(PAGE_URL, PAGE_PATH)
+
+        assert load_response_link_index(str(tmp_path))[PAGE_PATH]["response_url"]
+
+    def test_carried_forward_page_reuses_previous_entry(self, tmp_path):
+        """An unchanged page takes its entry from the previous session."""
+
+        previous_dir = tmp_path / "previous"
+        current_dir = tmp_path / "current"
+        ResponseLinkIndex(str(previous_dir)).record_source(
+            PAGE_URL, PAGE_PATH, ANSWERED_PAGE
+        )
+
+        index = ResponseLinkIndex(str(current_dir), str(previous_dir))
+        index.record_carried_forward(PAGE_URL, PAGE_PATH)
+
+        entry = load_response_link_index(str(current_dir))[PAGE_PATH]
+        assert entry["title"] == "End the Cage Age"
+
+    def test_torn_last_line_ignored(self, tmp_path):
+        """A line cut short by a crash only costs a re-parse of that page."""
+
+        ResponseLinkIndex(str(tmp_path)).record_source(PAGE_URL, PAGE_PATH, OPEN_PAGE)
+
+        with open(tmp_path / RESPONSE_LINK_INDEX_FILENAME, "a", encoding="utf-8") as f:
+            f.write('{"url": "https://exa')
+
+        logger = Mock()
+        entries = load_response_link_index(str(tmp_path), logger)
+
+        assert list(entries) == [PAGE_PATH]
+        logger.warning.assert_called_once()
@@ -0,0 +1,232 @@
+"""
+Test suite for the crash-safe resume journal.
+"""
+
+# Standard library
+import logging
+import os
+from unittest.mock import Mock, patch
+
+# Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.const import (
+    RESUME_JOURNAL_FILENAME,
+)
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.page_io import write_page
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.resume_journal import (
+    ResumeJournal,
+    find_unfinished_session,
+)
+
+PAGE_URL = "https://citizens-initiative.europa.eu/initiatives/details/2024/000001_en"
+
+
+class TestResumeJournal:
+    """Test recording and reloading completed URLs."""
+
+    def test_completed_urls_survive_reopen(self, tmp_path):
+        """A new journal object sees what an earlier run recorded."""
+
+        journal = ResumeJournal(str(tmp_path))
+        journal.record(PAGE_URL, "2025-02-01 10:00:00")
+
+        reopened = ResumeJournal(str(tmp_path))
+
+        assert reopened.is_completed(PAGE_URL)
+        assert reopened.completed[PAGE_URL] == "2025-02-01 10:00:00"
+        assert not reopened.finished
+
+    def test_listed_marker_survives_reopen(self, tmp_path):
+        """A complete listing is remembered, so --resume can reuse its CSV."""
+
+        journal = ResumeJournal(str(tmp_path))
+        assert not journal.listed
+
+        journal.mark_listed(42)
+
+        assert ResumeJournal(str(tmp_path)).listed
+
+    def test_record_is_fsynced(self, tmp_path):
+        """Every record is forced to disk before record() returns."""
+
+        journal = ResumeJournal(str(tmp_path))
+
+        with patch("os.fsync") as mock_fsync:
+            journal.record(PAGE_URL)
+
+        mock_fsync.assert_called_once()
+
+    def test_torn_last_line_ignored(self, tmp_path):
+        """A line cut short by a crash does not prevent resuming."""
+
+        journal = ResumeJournal(str(tmp_path))
+        journal.record(PAGE_URL)
+
+        with open(tmp_path / RESUME_JOURNAL_FILENAME, "a", encoding="utf-8") as f:
+            f.write('{"event": "completed", "url": "https://exa')
+
+        reopened = ResumeJournal(str(tmp_path), logger=Mock())
+
+        assert list(reopened.completed) == [PAGE_URL]
+        reopened.logger.warning.assert_called_once()
+
+
+class TestUnfinishedSessionLookup:
+    """Test discovery of the session --resume continues."""
+
+    def _session(self, data_dir, name, finished):
+        pages_dir = data_dir / name / "initiatives"
+        journal = ResumeJournal(str(pages_dir))
+        journal.record(PAGE_URL)
+        if finished:
+            journal.mark_finished()
+
+    def test_latest_unfinished_session_found(self, tmp_path):
+        """An interrupted latest session is reopened."""
+
+        self._session(tmp_path, "2025-01-01_10-00-00", finished=True)
+        self._session(tmp_path, "2025-02-01_10-00-00", finished=False)
+
+        found = find_unfinished_session(str(tmp_path), "initiatives")
+
+        assert found == "2025-02-01_10-00-00"
+
+    def test_finished_latest_session_not_resumed(self, tmp_path):
+        """Older interrupted sessions are not reopened once a later run finished."""
+
+        self._session(tmp_path, "2025-01-01_10-00-00", finished=False)
+        self._session(tmp_path, "2025-02-01_10-00-00", finished=True)
+
+        assert find_unfinished_session(str(tmp_path), "initiatives") is None
+
+    def test_sessions_without_journal_skipped(self, tmp_path):
+        """Directories without a journal (older sessions, stores) are ignored."""
+
+        self._session(tmp_path, "2025-01-01_10-00-00", finished=False)
+        os.makedirs(tmp_path / "2025-02-01_10-00-00" / "logs")
+
+        found = find_unfinished_session(str(tmp_path), "initiatives")
+
+        assert found == "2025-01-01_10-00-00"
+        assert find_unfinished_session(str(tmp_path / "missing"), "initiatives") is None
+
+
+class TestResumedInitiativeDownloads:
+    """Test that a resumed run only downloads the missing pages."""
+
+    @classmethod
+    def setup_class(cls):
+        """Import lazily to avoid log file creation at module load."""
+        from ECI_initiatives.data_pipeline.scraper.initiatives import downloader
+
+        cls.downloader = downloader
+
+    def test_only_missing_pages_downloaded(self, tmp_path):
+        """Journaled pages are skipped and keep their time, new ones are journaled."""
+
+        pages_dir = tmp_path / "initiatives"
+        done_url = PAGE_URL
+        lost_url = PAGE_URL.replace("000001", "000002")
+        todo_url = PAGE_URL.replace("000001", "000003")
+        rows = [{"url": url} for url in (done_url, lost_url, todo_url)]
+
+        # The interrupted run saved and journaled the first two pages,
+        # but the file of the second one is gone
+        os.makedirs(pages_dir / "2024")
+        write_page(pages_dir / "2024" / "2024_000001_en.html", "<html>done</html>")
+        journal = ResumeJournal(str(pages_dir))
+        journal.record(done_url, "2025-02-01 10:00:00")
+        journal.record(lost_url, "2025-02-01 10:00:01")
+
+        with patch.object(self.downloader, "logger"), patch.object(
+            self.downloader, "initialize_browser"
+        ), patch.object(
+            self.downloader, "download_single_initiative", return_value=True
+        ) as mock_download, patch.object(
+            self.downloader, "time"
+        ):
+            updated_data, failed_urls = self.downloader.download_initiatives(
+                str(pages_dir), rows, journal=ResumeJournal(str(pages_dir))
+            )
+
+        downloaded = [call.args[2] for call in mock_download.call_args_list]
+        assert downloaded == [lost_url, todo_url]
+        assert failed_urls == []
+        assert updated_data[0]["datetime"] == "2025-02-01 10:00:00"
+        assert ResumeJournal(str(pages_dir)).is_completed(todo_url)
+
+
+class TestResumedSessionSelection:
+    """Test that --resume selects the session at run time, not at import."""
+
+    @classmethod
+    def setup_class(cls):
+        """Import lazily to avoid log file creation at module load."""
+        from ECI_initiatives.data_pipeline.scraper.initiatives import __main__
+        from ECI_initiatives.data_pipeline.scraper.initiatives.scraper_logger import (
+            ScraperLogger,
+        )
+
+        cls.main_module = __main__
+        cls.ScraperLogger = ScraperLogger
+
+    def _open_session(self, tmp_path, resume):
+        with patch.object(self.main_module, "SCRIPT_DIR", str(tmp_path)), patch.object(
+            self.main_module, "logger"
+        ) as mock_logger, patch.object(self.main_module, "telemetry") as mock_telemetry:
+            session = self.main_module.open_session(resume)
+
+        return session, mock_logger, mock_telemetry
+
+    def test_new_session_without_resume(self, tmp_path):
+        """Without --resume, interrupted sessions are left alone."""
+
+        ResumeJournal(str(tmp_path / "data" / "2025-02-01_10-00-00" / "initiatives"))
+
+        session, mock_logger, _ = self._open_session(tmp_path, resume=False)
+
+        assert session == (self.main_module.START_SCRAPING, False)
+        mock_logger.move_to.assert_not_called()
+
+    def test_resume_moves_logs_into_unfinished_session(self, tmp_path):
+        """With --resume, logs and telemetry continue in the reopened session."""
+
+        pages_dir = tmp_path / "data" / "2025-02-01_10-00-00" / "initiatives"
+        ResumeJournal(str(pages_dir)).record(PAGE_URL)
+
+        session, mock_logger, mock_telemetry = self._open_session(tmp_path, resume=True)
+
+        log_dir = os.path.join(str(pages_dir.parent), "logs")
+        assert session == ("2025-02-01_10-00-00", True)
+        mock_logger.move_to.assert_called_once_with(log_dir)
+        assert mock_telemetry.log_dir == log_dir
+
+    def test_resume_without_unfinished_session(self, tmp_path):
+        """With nothing to resume, a new session is started."""
+
+        session, mock_logger, _ = self._open_session(tmp_path, resume=True)
+
+        assert session == (self.main_module.START_SCRAPING, False)
+        mock_logger.move_to.assert_not_called()
+
+    def test_log_file_moved_and_empty_session_removed(self, tmp_path):
+        """The log written so far moves along and the new session is cleaned up."""
+
+        new_log_dir = tmp_path / "2025-03-01_10-00-00" / "logs"
+        resumed_log_dir = tmp_path / "2025-02-01_10-00-00" / "logs"
+        os.makedirs(new_log_dir)
+
+        scraper_logger = object.__new__(self.ScraperLogger)
+        scraper_logger.logger = logging.getLogger("ECIScraperTest")
+        scraper_logger.logger.setLevel(logging.DEBUG)
+        scraper_logger.log_dir = str(new_log_dir)
+        scraper_logger._add_file_handler(str(new_log_dir / "scraper_initiatives.log"))
+        scraper_logger.info("before")
+
+        scraper_logger.move_to(str(resumed_log_dir))
+        scraper_logger.info("after")
+        scraper_logger.logger.removeHandler(scraper_logger.file_handler)
+        scraper_logger.file_handler.close()
+
+        log_text = (resumed_log_dir / "scraper_initiatives.log").read_text()
+        assert "before" in log_text and "after" in log_text
+        assert not (tmp_path / "2025-03-01_10-00-00").exists()
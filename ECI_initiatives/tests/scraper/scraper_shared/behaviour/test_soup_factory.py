@@ -0,0 +1,84 @@
+"""
+Test suite for the BeautifulSoup factory shared by the page parsers.
+"""
+
+# Standard library
+from unittest.mock import patch
+
+# Third party
+import pytest
+
+# Local imports
+from ECI_initiatives.data_pipeline.extractor.responses_followup_website.parser.extractors import (
+    FollowupWebsiteExtractor,
+)
+from ECI_initiatives.data_pipeline.scraper.scraper_shared import const, soup_factory
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.soup_factory import (
+    get_parser_backend,
+    make_soup,
+    set_parser_backend,
+)
+
+PAGE = "<html><body><p>Objective<ul><li>First</li></ul></p></body></html>"
+
+
+@pytest.fixture
+def restore_backend():
+    """Restore the configured backend after the test."""
+
+    backend = get_parser_backend()
+    yield
+    set_parser_backend(backend)
+
+
+class TestSoupFactory:
+    """Test the parser backend selection of make_soup()."""
+
+    def test_default_backend_is_html_parser(self):
+        """Runs parse pages with html.parser."""
+
+        assert const.HTML_PARSER_BACKEND == "html.parser"
+        assert get_parser_backend() == "html.parser"
+        assert make_soup(PAGE).builder.NAME == "html.parser"
+
+    def test_backend_argument_overrides_configured_backend(self):
+        """A backend passed to make_soup is used for that page only."""
+
+        pytest.importorskip("html5lib")
+
+        soup = make_soup(PAGE, "html5lib")
+
+        assert soup.builder.NAME == "html5lib"
+        assert get_parser_backend() == "html.parser"
+
+    def test_set_backend_used_by_extractors(self, restore_backend):
+        """Extractors parse with the backend set for the process."""
+
+        pytest.importorskip("lxml")
+
+        set_parser_backend("lxml")
+
+        extractor = FollowupWebsiteExtractor(PAGE)
+
+        assert extractor.soup.builder.NAME == "lxml"
+
+        # lxml closes the paragraph before the list, html.parser does not
+        assert extractor.soup.p.ul is None
+        assert make_soup(PAGE, "html.parser").p.ul is not None
+
+    def test_unknown_backend_rejected(self, restore_backend):
+        """Only the supported backends can be set."""
+
+        with pytest.raises(ValueError, match="Unknown HTML parser backend"):
+            set_parser_backend("html")
+
+        assert get_parser_backend() == "html.parser"
+
+    def test_missing_backend_package_rejected(self, restore_backend):
+        """A backend whose package is not installed cannot be set."""
+
+        with patch.object(soup_factory.builder_registry, "lookup", return_value=None):
+            with pytest.raises(ValueError, match="pip install lxml"):
+                set_parser_backend("lxml")
+
+        assert get_parser_backend() == "html.parser"
@@ -0,0 +1,148 @@
+"""
+Test suite for the per-page download telemetry.
+"""
+
+# Standard library
+import json
+from unittest.mock import Mock, patch
+
+# Third party
+import pytest
+
+# Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.http_fetcher import (
+    StaticPage,
+)
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.telemetry import (
+    ScrapeTelemetry,
+    percentile,
+)
+
+
+def _record(total, outcome="success", retries=0, size=100):
+    """Finished span with a single navigate phase."""
+
+    return {
+        "url": "https://example.com",
+        "outcome": outcome,
+        "source": "http",
+        "retries": retries,
+        "bytes": size,
+        "phases": {"navigate": total / 2},
+        "total": total,
+    }
+
+
+class TestScrapeTelemetry:
+    """Test span recording, summaries and the Prometheus export."""
+
+    def test_spans_written_as_json_lines(self, tmp_path):
+        """Every finished page is one JSON line in the logs directory."""
+
+        telemetry = ScrapeTelemetry("responses", str(tmp_path), logger=Mock())
+
+        span = telemetry.page("https://example.com/a")
+        with span.phase("navigate"):
+            pass
+        with span.phase("save"):
+            pass
+        span.retries = 2
+        span.bytes = 1234
+        span.finish(True)
+
+        telemetry.page("https://example.com/b").finish(False)
+
+        lines = (tmp_path / "telemetry_responses.jsonl").read_text().splitlines()
+        records = [json.loads(line) for line in lines]
+
+        assert [record["outcome"] for record in records] == ["success", "failed"]
+        assert set(records[0]["phases"]) == {"navigate", "save"}
+        assert records[0]["retries"] == 2
+        assert records[0]["bytes"] == 1234
+        assert records[0]["total"] >= sum(records[0]["phases"].values())
+
+    def test_summary_percentiles(self):
+        """p50/p95/p99 are interpolated over the pages of the run."""
+
+        telemetry = ScrapeTelemetry("initiatives", logger=Mock())
+
+        for total in range(1, 101):
+            telemetry.record(_record(float(total), retries=1))
+
+        summary = telemetry.summary()
+
+        assert summary["pages"] == 100
+        assert summary["retries"] == 100
+        assert summary["phases"]["total"]["quantiles"] == pytest.approx(
+            {0.5: 50.5, 0.95: 95.05, 0.99: 99.01}
+        )
+        assert percentile([], 0.5) == 0.0
+        assert summary["phases"]["navigate"]["count"] == 100
+
+    def test_prometheus_textfile_exported(self, tmp_path):
+        """The summary is written to logs/ and the textfile collector directory."""
+
+        log_dir = tmp_path / "logs"
+        textfile_dir = tmp_path / "textfile"
+        telemetry = ScrapeTelemetry(
+            "followup", str(log_dir), logger=Mock(), textfile_dir=str(textfile_dir)
+        )
+        telemetry.record(_record(1.0))
+        telemetry.record(_record(3.0, outcome="failed"))
+
+        telemetry.log_summary()
+
+        text = (textfile_dir / "metrics_followup.prom").read_text()
+        assert text == (log_dir / "metrics_followup.prom").read_text()
+        assert "# TYPE eci_scraper_page_seconds summary" in text
+        assert (
+            'eci_scraper_page_seconds{scraper="followup",phase="total",quantile="0.5"} 2.000000'
+            in text
+        )
+        assert (
+            'eci_scraper_page_seconds_count{scraper="followup",phase="total"} 2' in text
+        )
+        assert 'eci_scraper_pages{scraper="followup",outcome="failed"} 1' in text
+        assert not list(textfile_dir.glob("*.tmp"))
+
+    def test_downloader_records_http_page(self, tmp_path):
+        """A page served over HTTP is recorded with its phases and size."""
+
+        from ECI_initiatives.data_pipeline.scraper.responses.downloader import (
+            ResponseDownloader,
+        )
+
+        telemetry = ScrapeTelemetry("responses", logger=Mock())
+        fetcher = Mock()
+        fetcher.fetch.return_value = StaticPage(
+            url="https://example.com/r",
+            final_url="https://example.com/r",
+            page_source="<html>réponse</html>",
+            status=200,
+        )
+        downloader = ResponseDownloader(
+            str(tmp_path), fetcher=fetcher, telemetry=telemetry
+        )
+
+        with patch(
+            "ECI_initiatives.data_pipeline.scraper.responses.downloader.time"
+        ), patch(
+            "ECI_initiatives.data_pipeline.scraper.responses.downloader.save_response_html_file",
+            return_value="2019/2019_000007_en.html",
+        ):
+            downloader.download_all_responses(
+                [
+                    {
+                        "url": "https://example.com/r",
+                        "year": "2019",
+                        "reg_number": "2019_000007",
+                    }
+                ]
+            )
+
+        [record] = telemetry.records
+
+        assert record["outcome"] == "success"
+        assert record["source"] == "http"
+        assert record["bytes"] == len("<html>réponse</html>".encode("utf-8"))
+        assert {"rate_wait", "navigate", "save"} <= set(record["phases"])
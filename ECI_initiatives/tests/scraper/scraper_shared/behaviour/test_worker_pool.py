@@ -0,0 +1,314 @@
+"""
+Test suite for the parallel browser worker pool.
+"""
+
+# Standard library
+import threading
+import time
+from unittest.mock import Mock, patch
+
+# Third party
+import pytest
+
+# Local imports
+from ECI_initiatives.data_pipeline.scraper.scraper_shared.worker_pool import (
+    BrowserWorkerPool,
+    RetryLater,
+    WorkStream,
+)
+
+
+class TestBrowserWorkerPool:
+    """Test the bounded worker pool used by all downloaders."""
+
+    def test_results_keep_input_order(self):
+        """Results are returned in item order regardless of completion order."""
+
+        def process(worker, item):
+            time.sleep(0.01 * (5 - item))
+            return item * 10
+
+        pool = BrowserWorkerPool(3)
+        results = pool.map(list(range(5)), process, dict, Mock())
+
+        assert results == [0, 10, 20, 30, 40]
+
+    def test_each_worker_opened_and_closed_once(self):
+        """Every worker gets its own state, released at the end."""
+
+        open_worker = Mock(side_effect=lambda: Mock())
+        close_worker = Mock()
+
+        pool = BrowserWorkerPool(3)
+        pool.map(list(range(10)), lambda worker, item: item, open_worker, close_worker)
+
+        assert open_worker.call_count == 3
+        assert close_worker.call_count == 3
+
+    def test_workers_bounded_by_item_count(self):
+        """No more workers than items are started."""
+
+        open_worker = Mock(return_value={})
+
+        BrowserWorkerPool(8).map([1, 2], lambda worker, item: item, open_worker, Mock())
+
+        assert open_worker.call_count == 2
+
+    def test_single_worker_runs_in_calling_thread(self):
+        """With one worker the pool behaves like a plain loop."""
+
+        threads = []
+
+        def process(worker, item):
+            threads.append(threading.current_thread())
+            return item
+
+        BrowserWorkerPool(1).map([1, 2, 3], process, dict, Mock())
+
+        assert set(threads) == {threading.current_thread()}
+
+    def test_exception_propagates_and_workers_closed(self):
+        """A failing item stops the pool and is re-raised to the caller."""
+
+        close_worker = Mock()
+
+        def process(worker, item):
+            if item == 2:
+                raise RuntimeError("browser crashed")
+            return item
+
+        with pytest.raises(RuntimeError, match="browser crashed"):
+            BrowserWorkerPool(2).map(list(range(6)), process, dict, close_worker)
+
+        assert close_worker.call_count == 2
+
+    def test_results_reported_as_items_complete(self):
+        """on_result sees every item as soon as it is done."""
+
+        seen = []
+
+        BrowserWorkerPool(2).map(
+            [1, 2, 3],
+            lambda worker, item: item * 10,
+            dict,
+            Mock(),
+            on_result=lambda item, result: seen.append((item, result)),
+        )
+
+        assert sorted(seen) == [(1, 10), (2, 20), (3, 30)]
+
+    def test_retry_queued_behind_other_items(self):
+        """A failed item is taken up again once due, other items go first."""
+
+        processed = []
+
+        def process(worker, item):
+            processed.append(item)
+            if item == 0 and processed.count(0) == 1:
+                raise RetryLater(0.05)
+            return item * 10
+
+        started = time.monotonic()
+        results = BrowserWorkerPool(1).map(list(range(4)), process, dict, Mock())
+
+        assert results == [0, 10, 20, 30]
+        assert processed == [0, 1, 2, 3, 0]
+        assert time.monotonic() - started >= 0.05
+
+    def test_workers_wait_for_pending_retries(self):
+        """Workers keep running until the last parked item is done."""
+
+        attempts = {}
+
+        def process(worker, item):
+            attempts[item] = attempts.get(item, 0) + 1
+            if attempts[item] < 3:
+                raise RetryLater(0.01)
+            return item
+
+        results = BrowserWorkerPool(3).map(list(range(5)), process, dict, Mock())
+
+        assert results == list(range(5))
+        assert attempts == {item: 3 for item in range(5)}
+
+
+class TestWorkStream:
+    """Test consuming items while a producer is still adding them."""
+
+    def test_items_processed_while_producer_runs(self):
+        """Workers start on the first items before the last one is put."""
+
+        stream = WorkStream(maxsize=2)
+        first_done = threading.Event()
+
+        def process(worker, item):
+            if item == 0:
+                first_done.set()
+            return item * 10
+
+        def produce():
+            stream.put(0)
+            # The next item is only put once the first one was processed
+            assert first_done.wait(5)
+            for item in range(1, 5):
+                stream.put(item)
+            stream.close()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+
+        results = BrowserWorkerPool(3).consume(stream, process, dict, Mock())
+        producer.join()
+
+        assert results == [0, 10, 20, 30, 40]
+
+    def test_single_worker_consumes_in_calling_thread(self):
+        """With one worker the stream is processed in the calling thread."""
+
+        stream = WorkStream()
+        for item in range(3):
+            stream.put(item)
+        stream.close()
+
+        threads = []
+
+        def process(worker, item):
+            threads.append(threading.current_thread())
+            return item
+
+        assert BrowserWorkerPool(1).consume(stream, process, dict, Mock()) == [0, 1, 2]
+        assert set(threads) == {threading.current_thread()}
+
+    def test_retry_of_streamed_item(self):
+        """Items of a stream can be parked for a retry as well."""
+
+        stream = WorkStream()
+        for item in range(3):
+            stream.put(item)
+        stream.close()
+
+        processed = []
+
+        def process(worker, item):
+            processed.append(item)
+            if item == 1 and processed.count(1) == 1:
+                raise RetryLater(0.01)
+            return item
+
+        results = BrowserWorkerPool(1).consume(stream, process, dict, Mock())
+
+        assert results == [0, 1, 2]
+        assert processed == [0, 1, 2, 1]
+
+    def test_failure_releases_blocked_producer(self):
+        """A failing worker aborts the stream instead of blocking the producer."""
+
+        stream = WorkStream(maxsize=1)
+        accepted = []
+
+        def process(worker, item):
+            raise RuntimeError("browser crashed")
+
+        def produce():
+            for item in range(5):
+                accepted.append(stream.put(item))
+            stream.close()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+
+        with pytest.raises(RuntimeError, match="browser crashed"):
+            BrowserWorkerPool(2).consume(stream, process, dict, Mock())
+
+        producer.join(5)
+
+        assert not producer.is_alive()
+        assert False in accepted
+
+
+class TestParallelInitiativeDownloads:
+    """Test that parallel downloads merge into the same CSV rows."""
+
+    @classmethod
+    def setup_class(cls):
+        """Import lazily to avoid log file creation at module load."""
+        from ECI_initiatives.data_pipeline.scraper.initiatives import downloader
+
+        cls.downloader = downloader
+
+    def test_rows_stamped_in_listing_order(self):
+        """Each worker has its own browser and rows keep their order and datetime."""
+
+        rows = [
+            {"url": f"https://example.com/initiatives/details/2024/00000{i}_en"}
+            for i in range(6)
+        ]
+        failing_url = rows[3]["url"]
+
+        drivers = []
+
+        def new_driver():
+            driver = Mock()
+            drivers.append(driver)
+            return driver
+
+        def slow_download(
+            driver, pages_dir, url, span=None, defer_retries=False, link_index=None
+        ):
+            # Simulate page load time so that all workers pick up items
+            threading.Event().wait(0.05)
+            return url != failing_url
+
+        with patch.object(self.downloader, "logger"), patch.object(
+            self.downloader, "initialize_browser", side_effect=new_driver
+        ), patch.object(
+            self.downloader, "download_single_initiative", side_effect=slow_download
+        ), patch.object(
+            self.downloader, "time"
+        ):
+            updated_data, failed_urls = self.downloader.download_initiatives(
+                "/tmp", rows, num_workers=3
+            )
+
+        assert [row["url"] for row in updated_data] == [row["url"] for row in rows]
+        assert failed_urls == [failing_url]
+        assert all(row["datetime"] for row in updated_data if row["url"] != failing_url)
+        assert "datetime" not in rows[3]
+        assert len(drivers) == 3
+        for driver in drivers:
+            driver.quit.assert_called_once()
+
+    def test_rate_limited_page_retried_after_others(self):
+        """A rate limited page is retried once the other pages are done."""
+
+        rows = [
+            {"url": f"https://example.com/initiatives/details/2024/00000{i}_en"}
+            for i in range(3)
+        ]
+        flaky_url = rows[0]["url"]
+        calls = []
+
+        def flaky_download(
+            driver, pages_dir, url, span=None, defer_retries=False, link_index=None
+        ):
+            calls.append(url)
+            if url == flaky_url and span.retries == 0:
+                assert defer_retries
+                span.retries += 1
+                raise RetryLater(0.05)
+            return True
+
+        with patch.object(self.downloader, "logger"), patch.object(
+            self.downloader, "initialize_browser"
+        ), patch.object(
+            self.downloader, "download_single_initiative", side_effect=flaky_download
+        ), patch.object(
+            self.downloader, "time"
+        ):
+            updated_data, failed_urls = self.downloader.download_initiatives(
+                "/tmp", rows, num_workers=1
+            )
+
+        assert calls == [row["url"] for row in rows] + [flaky_url]
+        assert failed_urls == []
+        assert all(row["datetime"] for row in updated_data)
@@ -53,15 +53,20 @@ with DAG(
 
     # ========== STAGE 1: INITIATIVES ==========
 
+    # Retries continue the interrupted session instead of starting from page one
     scrape_initiatives = BashOperator(
         task_id="scrape_initiatives",
-        bash_command=f"cd {ECI_PROJECT_DIR} && {PYTHON_VENV} -m data_pipeline.scraper.initiatives",
+        bash_command=f"cd {ECI_PROJECT_DIR} && {PYTHON_VENV} -m data_pipeline.scraper.initiatives"
+        "{% if ti.try_number > 1 %} --resume{% endif %}",
         doc_md="""
         ### Scrape Initiatives Registry
         Downloads raw HTML pages from the ECI registry containing:
         - Initiative titles and descriptions
         - Signature counts by country
         - Registration and deadline dates
+
+        Retries run with `--resume` and only download the pages missing
+        from the interrupted session.
         """,
     )
 